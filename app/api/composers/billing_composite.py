@@ -3,10 +3,10 @@ from app.api.composers.order_composite import order_composer
 from app.api.composers.fast_order_composite import fast_order_composer
 from app.api.composers.expense_composite import expense_composer
 from app.crud.billing.services import BillingServices
+from app.crud.billing_rollups import BillingRollupRepository
 from app.crud.expenses.services import ExpenseServices
 from app.crud.fast_orders.services import FastOrderServices
 from app.crud.orders.services import OrderServices
-from app.crud.products.repositories import ProductRepository
 
 
 async def billing_composer(
@@ -16,9 +16,11 @@ async def billing_composer(
 ) -> BillingServices:
 
     billing_services = BillingServices(
-        product_repository=ProductRepository(order_services.organization_id),
         order_services=order_services,
         expenses_services=expense_services,
-        fast_order_services=fast_order_services
+        fast_order_services=fast_order_services,
+        billing_rollup_repository=BillingRollupRepository(
+            organization_id=order_services.organization_id
+        ),
     )
     return billing_services
@@ -1,47 +1,122 @@
+import asyncio
 import boto3
 import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from time import time
-from typing import Dict, Tuple
-from boto3.s3.transfer import S3Transfer
+from typing import Any, BinaryIO, Callable, Dict, Iterable, List, MutableMapping, Tuple
+from botocore.config import Config
 from urllib.parse import urlparse
 from app.core.configs import get_environment, get_logger
+from app.core.utils.bounded_cache import BoundedCache
 
 _env = get_environment()
 _logger = get_logger(__name__)
 
+# validade das URLs dos arquivos privados devolvidos nas expansões (`FileInDB`)
+PRIVATE_FILE_URL_EXPIRATION_SECONDS = 600
+
 
 class S3BucketManager:
     """
     Classe para gerenciamento de operações com o bucket S3.
+
+    Todas as instâncias usam o mesmo cliente do boto3 (thread-safe, com um pool de
+    `BUCKET_MAX_CONCURRENCY` conexões), criado no `lifespan` por `S3BucketManager.connect`.
+    Fora da API (scripts e testes) cada instância cria o seu cliente na primeira
+    operação que precisar dele. Uploads, downloads, listagens e remoções rodam em um
+    pool de threads do mesmo tamanho, então não bloqueiam o event loop e no máximo
+    `BUCKET_MAX_CONCURRENCY` transferências acontecem ao mesmo tempo por processo.
+
+    As URLs pré-assinadas ficam em um cache LRU limitado, compartilhado pelo
+    processo. Uma URL é renovada quando resta menos de `REFRESH_AHEAD_RATIO` da
+    validade pedida, então quem recebe uma URL do cache sempre tem tempo de usá-la.
     """
 
-    _presigned_cache: Dict[str, Tuple[str, float]] = {}
+    REFRESH_AHEAD_RATIO = 0.2
 
     @classmethod
-    def set_cache(cls, cache: Dict[str, Tuple[str, float]]) -> None:
+    def guaranteed_url_lifetime(cls, expiration: int) -> float:
+        """Tempo mínimo que resta a uma URL assinada com `expiration` quando é entregue."""
+        return expiration * cls.REFRESH_AHEAD_RATIO
+
+    # as URLs assinadas expiram sozinhas: não precisam ser invalidadas nos outros workers
+    _presigned_cache: MutableMapping[str, Tuple[str, float]] = BoundedCache(
+        name="file_urls",
+        maxsize=_env.FILE_URL_CACHE_MAX_SIZE,
+        ttl=max(_env.BUCKET_URL_EXPIRES_IN_SECONDS, PRIVATE_FILE_URL_EXPIRATION_SECONDS),
+        shared=False,
+    )
+
+    __shared_client = None
+    __executor: ThreadPoolExecutor | None = None
+
+    @classmethod
+    def set_cache(cls, cache: MutableMapping[str, Tuple[str, float]]) -> None:
         cls._presigned_cache = cache
 
-    def __init__(self, mode: str = "private"):
-        self.client = boto3.client(
-            "s3",
-            endpoint_url=_env.BUCKET_BASE_URL,
-            aws_access_key_id=_env.BUCKET_ACCESS_KEY_ID,
-            aws_secret_access_key=_env.BUCKET_SECRET_KEY,
-        )
-        self.resource = boto3.resource(
+    @classmethod
+    def connect(cls):
+        """Cria o cliente compartilhado pelo processo (chamado no `lifespan`)."""
+        client = cls.create_client()
+        cls.set_client(client=client)
+        return client
+
+    @classmethod
+    def disconnect(cls) -> None:
+        client = cls.__shared_client
+        cls.set_client(client=None)
+
+        if client is not None and hasattr(client, "close"):
+            client.close()
+
+        if cls.__executor is not None:
+            cls.__executor.shutdown(wait=True)
+            cls.__executor = None
+
+    @classmethod
+    def set_client(cls, client) -> None:
+        """
+        Troca o cliente compartilhado; nos testes recebe um substituto local
+        com a mesma interface do cliente S3 do boto3.
+        """
+        cls.__shared_client = client
+
+    @staticmethod
+    def create_client():
+        return boto3.client(
             "s3",
             endpoint_url=_env.BUCKET_BASE_URL,
             aws_access_key_id=_env.BUCKET_ACCESS_KEY_ID,
             aws_secret_access_key=_env.BUCKET_SECRET_KEY,
+            config=Config(
+                max_pool_connections=_env.BUCKET_MAX_CONCURRENCY,
+                connect_timeout=_env.BUCKET_TIMEOUT_SECONDS,
+                read_timeout=_env.BUCKET_TIMEOUT_SECONDS,
+                retries={"max_attempts": 3, "mode": "standard"},
+            ),
         )
 
+    def __init__(self, mode: str = "private"):
+        self.__client = None
+
         if mode == "private":
             self.bucket_name = _env.PRIVATE_BUCKET_NAME
 
         else:
             self.bucket_name = _env.PUBLIC_BUCKET_NAME
 
-    def upload_file(self, local_path: str, bucket_path: str) -> str:
+    @property
+    def client(self):
+        if S3BucketManager.__shared_client is not None:
+            return S3BucketManager.__shared_client
+
+        if self.__client is None:
+            self.__client = self.create_client()
+
+        return self.__client
+
+    async def upload_file(self, local_path: str, bucket_path: str) -> str:
         """
         Faz upload de um arquivo para o bucket S3.
 
@@ -56,12 +131,12 @@ class S3BucketManager:
             if content_type is None:
                 content_type = "application/octet-stream"
 
-            transfer = S3Transfer(self.client)
-            transfer.upload_file(
+            await self.__run(
+                self.client.upload_file,
                 local_path,
                 self.bucket_name,
                 bucket_path,
-                extra_args={"ContentType": content_type}
+                ExtraArgs={"ContentType": content_type},
             )
 
             file_url = f"{_env.BUCKET_BASE_URL}/{self.bucket_name}/{bucket_path}"
@@ -73,7 +148,36 @@ class S3BucketManager:
             _logger.error(f"Error uploading file: {error}")
             raise Exception("Error uploading file") from error
 
-    def download_file(self, bucket_path: str, local_path: str) -> None:
+    async def upload_fileobj(self, fileobj: BinaryIO, bucket_path: str, content_type: str) -> str:
+        """
+        Faz upload de um conteúdo em memória (ou de qualquer arquivo aberto) para o bucket S3.
+
+        :param fileobj: Arquivo aberto em modo binário.
+        :param bucket_path: Caminho no bucket onde o arquivo será armazenado.
+        :param content_type: Content-Type gravado no objeto.
+        :return: URL pública do arquivo.
+        """
+        try:
+            _logger.info(f"Uploading file to '{self.bucket_name}/{bucket_path}'...")
+
+            await self.__run(
+                self.client.upload_fileobj,
+                fileobj,
+                self.bucket_name,
+                bucket_path,
+                ExtraArgs={"ContentType": content_type},
+            )
+
+            file_url = f"{_env.BUCKET_BASE_URL}/{self.bucket_name}/{bucket_path}"
+
+            _logger.info(f"File uploaded successfully: {file_url}")
+            return file_url
+
+        except Exception as error:
+            _logger.error(f"Error uploading file: {error}")
+            raise Exception("Error uploading file") from error
+
+    async def download_file(self, bucket_path: str, local_path: str) -> None:
         """
         Faz download de um arquivo do bucket S3.
 
@@ -82,7 +186,7 @@ class S3BucketManager:
         """
         try:
             _logger.info(f"Downloading file from '{self.bucket_name}/{bucket_path}'...")
-            self.client.download_file(self.bucket_name, bucket_path, local_path)
+            await self.__run(self.client.download_file, self.bucket_name, bucket_path, local_path)
             _logger.info(f"File downloaded successfully to '{local_path}'.")
 
         except Exception as error:
@@ -97,43 +201,78 @@ class S3BucketManager:
         :param expiration: Tempo de expiração da URL em segundos (padrão: configurado no ambiente).
         :return: URL pré-assinada.
         """
+        urls = self.generate_presigned_urls(file_urls=[file_url], expiration=expiration)
+
+        if file_url not in urls:
+            raise Exception("Error generating presigned URL")
+
+        return urls[file_url]
+
+    def generate_presigned_urls(
+        self, file_urls: Iterable[str], expiration: int = None
+    ) -> Dict[str, str]:
+        """
+        Versão em lote de `generate_presigned_url`: devolve as URLs ainda válidas
+        do cache e assina as demais com um único cliente.
+
+        :param file_urls: URLs dos arquivos no bucket (repetidas são assinadas uma vez).
+        :param expiration: Tempo de expiração das URLs em segundos (padrão: configurado no ambiente).
+        :return: URL pré-assinada de cada arquivo. Arquivos que não puderam ser
+            assinados ficam de fora e o erro é registrado no log.
+        """
         expiration = expiration or _env.BUCKET_URL_EXPIRES_IN_SECONDS
-        try:
+        refresh_after = time() + expiration * self.REFRESH_AHEAD_RATIO
+        urls = {}
+        missing = []
+
+        for file_url in dict.fromkeys(file_urls):
             cached = self._presigned_cache.get(file_url)
-            now = time()
-            if cached and cached[1] > now:
-                _logger.info(f"Returning cached presigned URL for '{file_url}'")
-                return cached[0]
 
-            parsed_url = urlparse(file_url)
-            bucket_path = parsed_url.path.removeprefix(f"/{self.bucket_name}/")
+            if cached and cached[1] > refresh_after:
+                urls[file_url] = cached[0]
 
-            if not bucket_path:
-                raise ValueError("Invalid file URL. Could not extract the file path.")
+            else:
+                missing.append(file_url)
 
-            url = self.client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": self.bucket_name, "Key": bucket_path},
-                ExpiresIn=expiration,
-            )
-            self._presigned_cache[file_url] = (url, now + expiration)
-            return url
+        for file_url in missing:
+            try:
+                bucket_path = urlparse(file_url).path.removeprefix(f"/{self.bucket_name}/")
 
-        except Exception as error:
-            _logger.error(f"Error generating presigned URL: {error}")
-            raise Exception("Error generating presigned URL") from error
+                if not bucket_path:
+                    raise ValueError("Invalid file URL. Could not extract the file path.")
 
-    def list_files(self, prefix: str = "") -> list:
+                now = time()
+                url = self.client.generate_presigned_url(
+                    "get_object",
+                    Params={"Bucket": self.bucket_name, "Key": bucket_path},
+                    ExpiresIn=expiration,
+                )
+                self._presigned_cache[file_url] = (url, now + expiration)
+                urls[file_url] = url
+
+            except Exception as error:
+                _logger.error(f"Error generating presigned URL for '{file_url}': {error}")
+
+        return urls
+
+    async def list_files(self, prefix: str = "") -> List[str]:
         """
         Lista arquivos no bucket com base em um prefixo.
 
         :param prefix: Prefixo opcional para filtrar os arquivos.
         :return: Lista de caminhos de arquivos.
         """
+        def _list_files() -> List[str]:
+            paginator = self.client.get_paginator("list_objects_v2")
+            return [
+                obj["Key"]
+                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix)
+                for obj in page.get("Contents", [])
+            ]
+
         try:
             _logger.info(f"Listing files in bucket '{self.bucket_name}' with prefix '{prefix}'...")
-            bucket = self.resource.Bucket(self.bucket_name)
-            files = [obj.key for obj in bucket.objects.filter(Prefix=prefix)]
+            files = await self.__run(_list_files)
             _logger.info(f"Files found: {len(files)}")
             return files
 
@@ -141,7 +280,7 @@ class S3BucketManager:
             _logger.error(f"Error listing files: {error}")
             raise Exception("Error listing files") from error
 
-    def delete_file(self, bucket_path: str) -> None:
+    async def delete_file(self, bucket_path: str) -> None:
         """
         Remove um arquivo do bucket S3.
 
@@ -149,14 +288,14 @@ class S3BucketManager:
         """
         try:
             _logger.info(f"Deleting file from '{self.bucket_name}/{bucket_path}'...")
-            self.client.delete_object(Bucket=self.bucket_name, Key=bucket_path)
+            await self.__run(self.client.delete_object, Bucket=self.bucket_name, Key=bucket_path)
             _logger.info(f"File '{bucket_path}' deleted successfully.")
 
         except Exception as error:
             _logger.error(f"Error deleting file: {error}")
             raise Exception("Error deleting file") from error
 
-    def delete_file_by_url(self, file_url: str) -> None:
+    async def delete_file_by_url(self, file_url: str) -> None:
         """
         Remove um arquivo do bucket S3 com base na URL.
 
@@ -170,9 +309,20 @@ class S3BucketManager:
                 raise ValueError("Invalid file URL. Could not extract the file path.")
 
             _logger.info(f"Deleting file from '{self.bucket_name}/{bucket_path}'...")
-            self.client.delete_object(Bucket=self.bucket_name, Key=bucket_path)
+            await self.__run(self.client.delete_object, Bucket=self.bucket_name, Key=bucket_path)
             _logger.info(f"File '{bucket_path}' deleted successfully.")
 
         except Exception as error:
             _logger.error(f"Error deleting file: {error}")
             raise Exception("Error deleting file") from error
+
+    async def __run(self, function: Callable[..., Any], *args, **kwargs) -> Any:
+        """Executa uma chamada bloqueante do boto3 no pool de threads do bucket."""
+        if S3BucketManager.__executor is None:
+            S3BucketManager.__executor = ThreadPoolExecutor(
+                max_workers=_env.BUCKET_MAX_CONCURRENCY, thread_name_prefix="s3"
+            )
+
+        return await asyncio.get_running_loop().run_in_executor(
+            S3BucketManager.__executor, partial(function, *args, **kwargs)
+        )
@@ -1,8 +1,9 @@
 from fastapi import Request
 from app.core.configs import get_logger
+from app.core.utils.bounded_cache import BoundedCache
 
 logger = get_logger(__name__)
 
 
-def get_cached_plans(request: Request) -> dict:
+def get_cached_plans(request: Request) -> BoundedCache:
     return request.app.state.cached_plans
@@ -0,0 +1,38 @@
+"""
+Tags dos valores guardados no Redis, para invalidar de uma vez tudo o que
+depende de um mesmo dado (ver `RedisManager.invalidate_tags`).
+
+- `organization_month_tag`: dados calculados sobre o faturamento de um mês da
+  organização (ex.: métricas da home). Invalidada pelas escritas de pedidos,
+  pagamentos e despesas, via rollup de faturamento.
+- `PLAN_FEATURES_TAG`: features de plano de todas as organizações.
+"""
+
+from typing import Iterable, Tuple
+
+from app.api.dependencies.redis_manager import RedisManager
+from app.core.utils.utc_datetime import UTCDateTime
+
+PLAN_FEATURES_TAG = "plan_features"
+
+
+def organization_month_tag(organization_id: str, month: int, year: int) -> str:
+    return f"organization:{organization_id}:month:{year}-{month:02d}"
+
+
+async def invalidate_billing_periods(
+    organization_id: str, periods: Iterable[Tuple[int, int]]
+) -> int:
+    """
+    Invalida os valores dos meses `(year, month)` alterados e do mês atual, que
+    também mostra os pedidos recentes na home.
+    """
+    now = UTCDateTime.now()
+    periods = {*periods, (now.year, now.month)}
+
+    return await RedisManager().invalidate_tags(
+        tags=[
+            organization_month_tag(organization_id=organization_id, month=month, year=year)
+            for year, month in sorted(periods)
+        ]
+    )
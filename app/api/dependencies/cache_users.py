@@ -1,12 +1,13 @@
 from fastapi import Request
 from app.core.configs import get_logger
+from app.core.utils.bounded_cache import BoundedCache
 
 logger = get_logger(__name__)
 
 
-def get_cached_complete_users(request: Request) -> dict:
+def get_cached_complete_users(request: Request) -> BoundedCache:
     return request.app.state.cached_complete_users
 
 
-def get_cached_users(request: Request) -> dict:
+def get_cached_users(request: Request) -> BoundedCache:
     return request.app.state.cached_users
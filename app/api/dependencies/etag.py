@@ -0,0 +1,84 @@
+"""
+Requisições condicionais (`ETag` / `If-None-Match`) nas leituras do catálogo.
+
+A ETag é forte e combina a versão dos documentos da resposta (`search_version`
+dos serviços: quantidade e maior `updated_at`), a organização, a URL com a
+query string e uma janela de tempo, que vence antes das URLs assinadas dos
+arquivos que vão no corpo. Quando o cliente já tem a versão, o router responde 304 antes de montar
+o objeto completo.
+"""
+
+import hashlib
+from time import time
+from typing import List
+
+from fastapi import Depends, Request, Response
+
+from app.api.dependencies.bucket import PRIVATE_FILE_URL_EXPIRATION_SECONDS, S3BucketManager
+from app.api.dependencies.get_current_organization import check_current_organization
+
+# uma URL do cache pode chegar ao cliente com só esse tempo de validade restante
+URL_WINDOW_SECONDS = int(
+    S3BucketManager.guaranteed_url_lifetime(expiration=PRIVATE_FILE_URL_EXPIRATION_SECONDS)
+)
+
+
+class ConditionalRequest:
+    def __init__(self, request: Request, organization_id: str | None) -> None:
+        self.request = request
+        self.organization_id = organization_id
+        self.etag: str | None = None
+
+    def is_not_modified(self, version: str | None) -> bool:
+        """
+        Calcula a ETag de `version` e diz se ela está no `If-None-Match`.
+        Sem versão (documento inexistente) a resposta segue sem ETag.
+        """
+        self.etag = self.__build_etag(version=version) if version is not None else None
+
+        if self.etag is None:
+            return False
+
+        client_etags = self.__client_etags()
+        return "*" in client_etags or self.etag in client_etags
+
+    def not_modified(self) -> Response:
+        return Response(status_code=304, headers=self.__headers())
+
+    def apply(self, response: Response) -> Response:
+        if self.etag is not None and response.status_code == 200:
+            response.headers.update(self.__headers())
+
+        return response
+
+    def __build_etag(self, version: str) -> str:
+        # as URLs assinadas no corpo expiram: a ETag muda antes de qualquer uma delas
+        url_window = int(time() // URL_WINDOW_SECONDS)
+        query = sorted(self.request.query_params.multi_items())
+
+        raw = f"{self.organization_id}|{self.request.url.path}|{query}|{version}|{url_window}"
+        return f'"{hashlib.sha256(raw.encode()).hexdigest()[:32]}"'
+
+    def __client_etags(self) -> List[str]:
+        header = self.request.headers.get("if-none-match", "")
+
+        # o If-None-Match usa comparação fraca: `W/"x"` vale como `"x"`
+        return [
+            etag.strip().removeprefix("W/")
+            for etag in header.split(",")
+            if etag.strip()
+        ]
+
+    def __headers(self) -> dict:
+        return {
+            "ETag": self.etag,
+            "Cache-Control": "private, no-cache",
+            "Vary": "Authorization, X-Organization",
+        }
+
+
+async def conditional_request(
+    request: Request,
+    organization_id: str = Depends(check_current_organization),
+) -> ConditionalRequest:
+    return ConditionalRequest(request=request, organization_id=organization_id)
@@ -1,7 +1,16 @@
-
+import asyncio
 import json
-from app.api.dependencies.redis_manager import RedisManager
+from typing import Dict
+
+from app.api.dependencies.cache_tags import PLAN_FEATURES_TAG
+from app.api.dependencies.plan_feature_cache import (
+    PLAN_FEATURES_EXPIRATION_SECONDS,
+    plan_features_cache,
+    plan_features_key,
+    redis_manager,
+)
 from app.api.exceptions.authentication_exceptions import PaymentRequiredException
+from app.core.exceptions import NotFoundError
 from app.core.utils.features import Feature
 from app.crud.organization_plans.repositories import OrganizationPlanRepository
 from app.crud.plan_features.repositories import PlanFeatureRepository
@@ -9,33 +18,80 @@ from app.crud.plan_features.schemas import PlanFeatureInDB
 from app.core.configs import get_logger
 
 logger = get_logger(__name__)
-redis_manager = RedisManager()
+
+# carga em andamento por organização: misses simultâneos esperam a mesma carga
+_loading: Dict[str, asyncio.Future] = {}
 
 
 async def get_plan_feature(organization_id: str, feature_name: Feature) -> PlanFeatureInDB:
-    cache_key = f"organization:{organization_id}:plan_feature:{feature_name}"
+    plan_features = await get_plan_features(organization_id=organization_id)
+
+    plan_feature = plan_features.get(Feature(feature_name).value)
+
+    if plan_feature is None:
+        raise NotFoundError(message=f"PlanFeature with name {Feature(feature_name).value} not found")
+
+    return plan_feature
+
 
-    cached_value = redis_manager.get_value(cache_key)
+async def get_plan_features(organization_id: str) -> Dict[str, PlanFeatureInDB]:
+    plan_features = plan_features_cache.get(organization_id)
+
+    if plan_features is not None:
+        return plan_features
+
+    loading = _loading.get(organization_id)
+
+    if loading is None:
+        loading = asyncio.ensure_future(_load_plan_features(organization_id=organization_id))
+        _loading[organization_id] = loading
+        loading.add_done_callback(lambda _: _loading.pop(organization_id, None))
+
+    # o `shield` evita que o cancelamento de um request cancele a carga dos outros
+    return await asyncio.shield(loading)
+
+
+async def _load_plan_features(organization_id: str) -> Dict[str, PlanFeatureInDB]:
+    cache_key = plan_features_key(organization_id)
+    cached_value = await redis_manager.get_value(cache_key)
 
     if cached_value:
-        logger.info(f"Cached feature - {cache_key}")
-        return PlanFeatureInDB(**json.loads(cached_value))
+        logger.info(f"Cached features - {cache_key}")
+        plan_features = {
+            name: PlanFeatureInDB(**raw_feature)
+            for name, raw_feature in json.loads(cached_value).items()
+        }
 
-    organization_plan_repository = OrganizationPlanRepository(cache_plans={})
-    plan_feature_repository = PlanFeatureRepository()
+    else:
+        organization_plan_repository = OrganizationPlanRepository(cache_plans={})
+        plan_feature_repository = PlanFeatureRepository()
 
-    active_plan = await organization_plan_repository.select_active_plan(
-        organization_id=organization_id
-    )
+        active_plan = await organization_plan_repository.select_active_plan(
+            organization_id=organization_id
+        )
 
-    if not active_plan or not active_plan.has_paid_invoice:
-        raise PaymentRequiredException()
+        if not active_plan or not active_plan.has_paid_invoice:
+            raise PaymentRequiredException()
 
-    plan_feature = await plan_feature_repository.select_by_name(
-        name=feature_name,
-        plan_id=active_plan.plan_id
-    )
+        plan_features = {
+            plan_feature.name.value: plan_feature
+            for plan_feature in await plan_feature_repository.select_all(
+                plan_id=active_plan.plan_id
+            )
+        }
 
-    redis_manager.set_value(cache_key, plan_feature.model_dump_json(), expiration=3600)
+        await redis_manager.set_value(
+            cache_key,
+            json.dumps(
+                {
+                    name: plan_feature.model_dump(mode="json")
+                    for name, plan_feature in plan_features.items()
+                }
+            ),
+            expiration=PLAN_FEATURES_EXPIRATION_SECONDS,
+            tags=[PLAN_FEATURES_TAG],
+        )
 
-    return plan_feature
+    plan_features_cache[organization_id] = plan_features
+
+    return plan_features
@@ -9,6 +9,8 @@ class Links(GenericModel):
     previous: str | None = Field(default=None, example="/health")
     self: str = Field(example="/health")
     next: str | None = Field(default=None, example="/health")
+    previous_cursor: str | None = Field(default=None, example="/health?cursor=eyJmIjoi")
+    next_cursor: str | None = Field(default=None, example="/health?cursor=eyJmIjoi")
 
 
 class Pagination(GenericModel):
@@ -19,8 +21,8 @@ class Pagination(GenericModel):
     links: Links
 
 
-async def pagination_parameters(page: int = 1, pageSize: int = 15):
+async def pagination_parameters(page: int = 1, pageSize: int = 15, cursor: str | None = None):
     page_size = max(1, pageSize)
     page = max(1, page)
 
-    return {"page": page, "page_size": page_size}
+    return {"page": page, "page_size": page_size, "cursor": cursor}
@@ -1,14 +1,17 @@
 from math import ceil
+from typing import List
+from pydantic import BaseModel
 from starlette.requests import Request
 import re
 from app.api.exceptions.paginator import InvalidPageAccess
+from app.core.utils.page_cursor import CursorDirection, PageCursor
 
 
 _PAGE_REGEX = re.compile(r"page=\d+")
 
 
 class Paginator:
-    def __init__(self, request: Request, pagination: dict):
+    def __init__(self, request: Request, pagination: dict, sort_field: str = None):
         self._request = request
 
         page = int(pagination.get("page", 1))
@@ -16,6 +19,19 @@ class Paginator:
 
         self._page = page
         self._page_size = page_size
+        self._sort_field = sort_field
+        self._cursor = None
+        self._items: List[BaseModel] = []
+
+        if pagination.get("cursor") and sort_field:
+            try:
+                self._cursor = PageCursor.decode(pagination["cursor"])
+
+            except ValueError:
+                raise InvalidPageAccess("Invalid cursor")
+
+            if self._cursor.sort_field != sort_field:
+                raise InvalidPageAccess("Cursor does not match the current ordering")
 
         self.offset = int(page * page_size - page_size)
 
@@ -23,9 +39,19 @@ class Paginator:
         self._total = total
         self._pages = ceil(self._total / self._page_size)
 
-        if self._pages < self._page and self._page > 1:
+        if self._cursor is None and self._pages < self._page and self._page > 1:
             raise InvalidPageAccess("Invalid Page Access")
 
+    def set_items(self, items: List[BaseModel]):
+        """
+        Guarda a página retornada para montar os links `nextCursor`/`previousCursor`.
+        """
+        self._items = list(items or [])
+
+    @property
+    def cursor(self) -> PageCursor | None:
+        return self._cursor
+
     @property
     def page_size(self):
         return self._page_size
@@ -49,14 +75,69 @@ class Paginator:
         else:
             previous_url = None
 
+        links = {
+            "previous": previous_url,
+            "next": next_url,
+            "self": f"{url}?{query}"
+        }
+
+        if self._sort_field:
+            links["previous_cursor"], links["next_cursor"] = self.__cursor_links()
+
         return {
             "total": self._total,
             "page_size": self._page_size,
             "pages": self._pages,
             "page": self._page,
-            "links": {
-                "previous": previous_url,
-                "next": next_url,
-                "self": f"{url}?{query}"
-            },
+            "links": links,
         }
+
+    def __cursor_links(self):
+        if not self._items:
+            return None, None
+
+        is_full_page = len(self._items) >= self._page_size
+
+        if self._cursor is None:
+            has_next = self._page < self._pages
+            has_previous = self._page > 1
+
+        elif self._cursor.direction == CursorDirection.NEXT:
+            has_next = is_full_page
+            has_previous = True
+
+        else:
+            has_next = True
+            has_previous = is_full_page
+
+        previous_url = None
+        next_url = None
+
+        if has_previous:
+            previous_url = self.__build_cursor_url(
+                PageCursor.from_item(
+                    item=self._items[0],
+                    sort_field=self._sort_field,
+                    direction=CursorDirection.PREVIOUS,
+                )
+            )
+
+        if has_next:
+            next_url = self.__build_cursor_url(
+                PageCursor.from_item(
+                    item=self._items[-1],
+                    sort_field=self._sort_field,
+                    direction=CursorDirection.NEXT,
+                )
+            )
+
+        return previous_url, next_url
+
+    def __build_cursor_url(self, cursor: PageCursor | None) -> str | None:
+        if cursor is None:
+            return None
+
+        url = self._request.url.remove_query_params("page").include_query_params(
+            cursor=cursor.encode()
+        )
+        return f"{url.path}?{url.query}"
@@ -0,0 +1,41 @@
+"""
+Cache das features do plano de cada organização, em dois níveis:
+
+- L1: `BoundedCache` em memória com o conjunto inteiro de features da organização;
+- L2: uma única chave no Redis por organização (`organization:{id}:plan_features`).
+
+A invalidação remove a organização dos dois níveis (e do L1 dos outros workers
+pelo `cache_bus`).
+"""
+
+from app.api.dependencies.cache_tags import PLAN_FEATURES_TAG
+from app.api.dependencies.redis_manager import RedisManager
+from app.core.configs import get_environment
+from app.core.utils.bounded_cache import BoundedCache
+
+_env = get_environment()
+
+PLAN_FEATURES_EXPIRATION_SECONDS = 3600
+
+redis_manager = RedisManager()
+
+plan_features_cache = BoundedCache(
+    name="plan_features",
+    maxsize=_env.PLAN_CACHE_MAX_SIZE,
+    ttl=_env.PLAN_FEATURE_CACHE_TTL_SECONDS,
+)
+
+
+def plan_features_key(organization_id: str) -> str:
+    return f"organization:{organization_id}:plan_features"
+
+
+async def invalidate_plan_features(organization_id: str = None) -> None:
+    """Sem `organization_id` invalida as features de todas as organizações."""
+    plan_features_cache.invalidate(key=organization_id)
+
+    if organization_id:
+        await redis_manager.delete_value(plan_features_key(organization_id))
+
+    else:
+        await redis_manager.invalidate_tag(PLAN_FEATURES_TAG)
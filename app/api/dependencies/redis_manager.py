@@ -1,4 +1,9 @@
-import redis
+from time import monotonic
+from typing import AsyncIterator, Dict, Iterable, List
+
+import redis.asyncio as aioredis
+from redis.exceptions import ConnectionError, RedisError, TimeoutError
+
 from app.core.configs import get_environment, get_logger
 
 _env = get_environment()
@@ -7,88 +12,324 @@ _logger = get_logger(__name__)
 
 class RedisManager:
     """
-    Classe para gerenciamento de conexões e operações com o Redis.
+    Classe para operações com o Redis.
+
+    Todas as instâncias usam o mesmo cliente assíncrono (um pool de conexões por
+    processo), criado no `lifespan` por `RedisManager.connect`. Sem Redis (não
+    configurado, fora do ar ou estourando o timeout) as leituras retornam vazio e
+    as escritas são ignoradas: quem chama recalcula o valor no banco. Depois de
+    uma falha de conexão o Redis é ignorado por `FAILURE_COOLDOWN_SECONDS`, para
+    que cada request não espere o timeout de novo.
+
+    Valores gravados com `tags` entram no conjunto (`SADD`) de cada tag, e
+    `invalidate_tags` apaga de uma vez todas as chaves marcadas com elas.
     """
 
-    def __init__(self):
-        self.client = redis.Redis(
-            host=_env.REDIS_URL,
-            port=_env.REDIS_PORT,
-            username=_env.REDIS_USERNAME,
-            password=_env.REDIS_PASSWORD,
-            decode_responses=True,
+    FAILURE_COOLDOWN_SECONDS = 30
+    SCAN_BATCH_SIZE = 500
+    TAG_EXPIRATION_SECONDS = 86400
+
+    __shared_client: aioredis.Redis | None = None
+    __unavailable_until: float = 0
+
+    def __init__(self, client: aioredis.Redis | None = None):
+        self.__client = client
+
+    @property
+    def client(self) -> aioredis.Redis | None:
+        return self.__client or RedisManager.__shared_client
+
+    @classmethod
+    async def connect(cls) -> aioredis.Redis | None:
+        """
+        Cria o pool compartilhado; retorna `None` só sem `REDIS_URL`. O pool
+        conecta sob demanda: se o Redis não responder agora, ele é ignorado por
+        `FAILURE_COOLDOWN_SECONDS` e volta a ser usado quando subir.
+        """
+        if not _env.REDIS_URL:
+            return None
+
+        client = aioredis.Redis(
+            connection_pool=aioredis.ConnectionPool(
+                host=_env.REDIS_URL,
+                port=_env.REDIS_PORT or 6379,
+                username=_env.REDIS_USERNAME,
+                password=_env.REDIS_PASSWORD,
+                decode_responses=True,
+                max_connections=_env.REDIS_MAX_CONNECTIONS,
+                socket_timeout=_env.REDIS_TIMEOUT_SECONDS,
+                socket_connect_timeout=_env.REDIS_TIMEOUT_SECONDS,
+            )
         )
 
-    def set_value(self, key: str, value: str, expiration: int = None) -> bool:
+        cls.set_client(client=client)
+
+        try:
+            await client.ping()
+
+        except RedisError as error:
+            _logger.error(
+                f"Redis unavailable, retrying in {cls.FAILURE_COOLDOWN_SECONDS}s: {error}"
+            )
+            RedisManager.__unavailable_until = monotonic() + cls.FAILURE_COOLDOWN_SECONDS
+
+        return client
+
+    @classmethod
+    async def disconnect(cls) -> None:
+        if cls.__shared_client is not None:
+            await cls.__shared_client.aclose()
+
+        cls.set_client(client=None)
+
+    @classmethod
+    def set_client(cls, client: aioredis.Redis | None) -> None:
+        cls.__shared_client = client
+        cls.__unavailable_until = 0
+
+    async def set_value(
+        self, key: str, value: str, expiration: int = None, tags: Iterable[str] = ()
+    ) -> bool:
         """
         Define um valor no Redis.
 
         :param key: Chave do valor.
         :param value: Valor a ser armazenado.
         :param expiration: Tempo de expiração em segundos (opcional).
+        :param tags: Tags para invalidar o valor com `invalidate_tags` (opcional).
         :return: True se bem-sucedido, False caso contrário.
         """
+        client = self.__available_client()
+
+        if client is None:
+            return False
+
         try:
-            self.client.set(f"{_env.ENVIRONMENT}:{key}", value, ex=expiration)
+            if not tags:
+                await client.set(self.__key(key), value, ex=expiration)
+                return True
+
+            async with client.pipeline(transaction=False) as pipeline:
+                pipeline.set(self.__key(key), value, ex=expiration)
+
+                for tag in tags:
+                    pipeline.sadd(self.__tag_key(tag), self.__key(key))
+                    pipeline.expire(self.__tag_key(tag), self.TAG_EXPIRATION_SECONDS)
+
+                await pipeline.execute()
+
             return True
-        except Exception as error:
-            _logger.error(f"Error setting key '{key}': {error}")
+
+        except RedisError as error:
+            self.__handle_error(error=error, message=f"Error setting key '{key}'")
+            return False
+
+    async def set_values(self, values: Dict[str, str], expiration: int = None) -> bool:
+        """Define vários valores em uma única ida ao Redis (pipeline)."""
+        client = self.__available_client()
+
+        if client is None or not values:
             return False
 
-    def get_value(self, key: str) -> str:
+        try:
+            async with client.pipeline(transaction=False) as pipeline:
+                for key, value in values.items():
+                    pipeline.set(self.__key(key), value, ex=expiration)
+
+                await pipeline.execute()
+
+            return True
+
+        except RedisError as error:
+            self.__handle_error(error=error, message=f"Error setting {len(values)} keys")
+            return False
+
+    async def get_value(self, key: str) -> str | None:
         """
         Obtém um valor do Redis.
 
         :param key: Chave do valor.
         :return: Valor armazenado ou None se não encontrado.
         """
+        client = self.__available_client()
+
+        if client is None:
+            return None
+
         try:
-            return self.client.get(f"{_env.ENVIRONMENT}:{key}")
-        except Exception as error:
-            _logger.error(f"Error getting key '{key}': {error}")
+            return await client.get(self.__key(key))
+
+        except RedisError as error:
+            self.__handle_error(error=error, message=f"Error getting key '{key}'")
             return None
 
-    def delete_value(self, key: str) -> bool:
+    async def get_values(self, keys: Iterable[str]) -> List[str | None]:
+        """Obtém vários valores com um único `MGET`, na ordem de `keys`."""
+        keys = list(keys)
+        client = self.__available_client()
+
+        if client is None or not keys:
+            return [None] * len(keys)
+
+        try:
+            return await client.mget([self.__key(key) for key in keys])
+
+        except RedisError as error:
+            self.__handle_error(error=error, message=f"Error getting {len(keys)} keys")
+            return [None] * len(keys)
+
+    async def delete_value(self, key: str) -> bool:
         """
         Deleta um valor do Redis.
 
         :param key: Chave do valor.
         :return: True se a chave foi deletada, False caso contrário.
         """
+        return await self.delete_values(keys=[key]) > 0
+
+    async def delete_values(self, keys: Iterable[str]) -> int:
+        """Deleta várias chaves com um único `DEL`; retorna quantas existiam."""
+        keys = list(keys)
+        client = self.__available_client()
+
+        if client is None or not keys:
+            return 0
+
         try:
-            _logger.info(f"Deleting key '{key}' from Redis...")
-            return self.client.delete(f"{_env.ENVIRONMENT}:{key}") > 0
+            _logger.info(f"Deleting keys {keys} from Redis...")
+            return await client.delete(*[self.__key(key) for key in keys])
 
-        except Exception as error:
-            _logger.error(f"Error deleting key '{key}': {error}")
-            return False
+        except RedisError as error:
+            self.__handle_error(error=error, message=f"Error deleting keys {keys}")
+            return 0
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """
+        Apaga todas as chaves marcadas com `tags` e os conjuntos das tags.
+        Os membros são lidos com `SSCAN` e apagados em lotes de `SCAN_BATCH_SIZE`
+        chaves, enviados em um único pipeline por tag.
+
+        :return: Quantidade de chaves apagadas.
+        """
+        client = self.__available_client()
+
+        if client is None:
+            return 0
+
+        deleted = 0
+
+        try:
+            for tag in dict.fromkeys(tags):
+                tag_key = self.__tag_key(tag)
+
+                async with client.pipeline(transaction=False) as pipeline:
+                    async for batch in self.__batches(
+                        client.sscan_iter(tag_key, count=self.SCAN_BATCH_SIZE)
+                    ):
+                        pipeline.delete(*batch)
+
+                    pipeline.delete(tag_key)
+                    results = await pipeline.execute()
+
+                deleted += sum(results[:-1])
+
+            _logger.info(f"Invalidated {deleted} keys with tags {tags}")
+            return deleted
+
+        except RedisError as error:
+            self.__handle_error(error=error, message=f"Error invalidating tags {tags}")
+            return deleted
+
+    async def invalidate_tag(self, tag: str) -> int:
+        return await self.invalidate_tags(tags=[tag])
+
+    async def scan_keys(self, pattern: str = "*") -> AsyncIterator[str]:
+        """
+        Itera com `SCAN` (sem bloquear o Redis como o `KEYS`) as chaves deste
+        ambiente que combinam com `pattern`, sem o prefixo do ambiente.
+        """
+        client = self.__available_client()
+
+        if client is None:
+            return
+
+        prefix = self.__key("")
+
+        try:
+            async for key in client.scan_iter(
+                match=self.__key(pattern), count=self.SCAN_BATCH_SIZE
+            ):
+                yield key[len(prefix):]
+
+        except RedisError as error:
+            self.__handle_error(error=error, message=f"Error scanning keys '{pattern}'")
 
-    def list_keys(self, pattern: str = "*") -> list:
+    async def list_keys(self, pattern: str = "*") -> list:
         """
         Lista as chaves armazenadas no Redis com base em um padrão.
 
         :param pattern: Padrão opcional para filtragem.
         :return: Lista de chaves encontradas.
         """
-        try:
-            _logger.info(f"Listing keys with pattern '{pattern}'...")
-            return self.client.keys(pattern)
+        _logger.info(f"Listing keys with pattern '{pattern}'...")
+        return [key async for key in self.scan_keys(pattern=pattern)]
+
+    async def delete_pattern(self, pattern: str) -> int:
+        """Apaga, em lotes, as chaves encontradas por `scan_keys(pattern)`."""
+        deleted = 0
+
+        async for batch in self.__batches(self.scan_keys(pattern=pattern)):
+            deleted += await self.delete_values(keys=batch)
 
-        except Exception as error:
-            _logger.error(f"Error listing keys: {error}")
-            return []
+        return deleted
 
-    def increment_value(self, key: str, expiration: int) -> int:
+    async def increment_value(self, key: str, expiration: int) -> int:
         """
         Incrementa um valor no Redis e define um tempo de expiração se necessário.
         """
+        client = self.__available_client()
+
+        if client is None:
+            return 0
+
         try:
-            value = self.client.incr(f"{_env.ENVIRONMENT}:{key}")
+            value = await client.incr(self.__key(key))
             if value == 1:
-                self.client.expire(f"{_env.ENVIRONMENT}:{key}", expiration)
+                await client.expire(self.__key(key), expiration)
 
             return value
 
-        except Exception as error:
-            _logger.error(f"Error incrementing key '{key}': {error}")
+        except RedisError as error:
+            self.__handle_error(error=error, message=f"Error incrementing key '{key}'")
             return 0
+
+    def __key(self, key: str) -> str:
+        return f"{_env.ENVIRONMENT}:{key}"
+
+    def __tag_key(self, tag: str) -> str:
+        return self.__key(f"tag:{tag}")
+
+    async def __batches(self, keys: AsyncIterator[str]) -> AsyncIterator[List[str]]:
+        batch = []
+
+        async for key in keys:
+            batch.append(key)
+
+            if len(batch) >= self.SCAN_BATCH_SIZE:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def __available_client(self) -> aioredis.Redis | None:
+        if monotonic() < RedisManager.__unavailable_until:
+            return None
+
+        return self.client
+
+    def __handle_error(self, error: RedisError, message: str) -> None:
+        _logger.error(f"{message}: {error}")
+
+        if isinstance(error, (ConnectionError, TimeoutError)):
+            RedisManager.__unavailable_until = monotonic() + self.FAILURE_COOLDOWN_SECONDS
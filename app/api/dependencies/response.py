@@ -1,5 +1,6 @@
-from typing import List
+from typing import Any, List
 
+import orjson
 from fastapi import status
 from fastapi.encoders import jsonable_encoder
 from fastapi.responses import JSONResponse
@@ -8,11 +9,29 @@ from pydantic import BaseModel
 from app.api.shared_schemas.responses import ListResponseSchema, MessageResponse, Response
 
 
+class FastJSONResponse(JSONResponse):
+    """
+    `JSONResponse` que codifica com o orjson direto do `model_dump`, sem passar
+    antes pelo `jsonable_encoder`. A saída é a mesma do `JSONResponse` (compacta,
+    UTF-8, datas em ISO 8601 e enums pelo valor); só floats em notação científica
+    mudam de forma (`1e16` em vez de `1e+16`), com o mesmo valor.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            # tipos que o orjson não conhece (Decimal, set, ...) vão para o jsonable_encoder
+            return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+
+        except orjson.JSONEncodeError:
+            # ex.: inteiros acima de 64 bits
+            return super().render(jsonable_encoder(content))
+
+
 def build_response(
     status_code: status,
     message: str,
     data: BaseModel | List[BaseModel] | int | None = None,
-) -> JSONResponse:
+) -> FastJSONResponse:
     if isinstance(data, int):
         raw_response = Response(message=message, data=None)
         raw_response.data = data
@@ -23,15 +42,15 @@ def build_response(
     else:
         raw_response = MessageResponse(message=message)
 
-    return JSONResponse(
-        content=jsonable_encoder(raw_response.model_dump(by_alias=True, exclude_none=True)),
+    return FastJSONResponse(
+        content=raw_response.model_dump(by_alias=True, exclude_none=True),
         status_code=status_code
     )
 
 
 def build_list_response(
     status_code: status, message: str, pagination: dict, data: BaseModel | List[BaseModel] = None
-) -> JSONResponse:
+) -> FastJSONResponse:
     if data:
         raw_response = ListResponseSchema(
             message=message,
@@ -42,7 +61,7 @@ def build_list_response(
     else:
         raw_response = MessageResponse(message=message)
 
-    return JSONResponse(
-        content=jsonable_encoder(raw_response.model_dump(by_alias=True, exclude_none=True)),
+    return FastJSONResponse(
+        content=raw_response.model_dump(by_alias=True, exclude_none=True),
         status_code=status_code
     )
@@ -62,3 +62,13 @@ class PaymentRequiredException(HTTPException):
         super().__init__(
             status_code=status.HTTP_402_PAYMENT_REQUIRED, detail=detail
         )
+
+
+class ServiceUnavailableException(HTTPException):
+    def __init__(self, detail: str = None) -> None:
+        if not detail:
+            detail = "Service unavailable"
+
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail
+        )
@@ -65,7 +65,7 @@ async def get_customers(
     customer_services: CustomerServices = Depends(customer_composer),
 ):
     paginator = Paginator(
-        request=request, pagination=pagination
+        request=request, pagination=pagination, sort_field="name"
     )
 
     total = await customer_services.search_count(
@@ -78,10 +78,12 @@ async def get_customers(
         tags=tags,
         page=pagination["page"],
         page_size=pagination["page_size"],
+        cursor=paginator.cursor,
         expand=expand
     )
 
     paginator.set_total(total=total)
+    paginator.set_items(items=customers)
 
     if customers:
         return build_list_response(
@@ -60,7 +60,7 @@ async def get_expenses(
     expense_services: ExpenseServices = Depends(expense_composer),
 ):
     paginator = Paginator(
-        request=request, pagination=pagination
+        request=request, pagination=pagination, sort_field="expense_date"
     )
 
     total = await expense_services.search_count(
@@ -77,9 +77,11 @@ async def get_expenses(
         expand=expand,
         page=pagination["page"],
         page_size=pagination["page_size"],
+        cursor=paginator.cursor,
     )
 
     paginator.set_total(total=total)
+    paginator.set_items(items=expenses)
 
     if expenses:
         return build_list_response(
@@ -60,8 +60,7 @@ async def get_fast_orders(
         request=request, pagination=pagination
     )
 
-    total = await fast_order_services.search_count(day=day)
-    fast_orders = await fast_order_services.search_all(
+    total, fast_orders = await fast_order_services.search_page(
         day=day,
         expand=expand,
         page=pagination["page"],
@@ -20,6 +20,7 @@ EXAMPLE_FAST_ORDER = {
     "organization_id": "org_123",
     "total_amount": 3.0,
     "payments": [],
+    "payment_summary": {"total_paid": 0, "count": 0, "methods": {}},
     "created_at": "2024-01-01T00:00:00Z",
     "updated_at": "2024-01-01T00:00:00Z",
 }
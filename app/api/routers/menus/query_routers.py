@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Query, Request, Security, Response
 
 from app.api.composers import menu_composer
 from app.api.dependencies import build_response, decode_jwt
+from app.api.dependencies.etag import ConditionalRequest, conditional_request
 from app.api.dependencies.pagination_parameters import pagination_parameters
 from app.api.dependencies.paginator import Paginator
 from app.api.dependencies.response import build_list_response
@@ -26,12 +27,18 @@ async def get_menu_by_id(
     menu_id: str,
     current_user: UserInDB = Security(decode_jwt, scopes=[]),
     menu_services: MenuServices = Depends(menu_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    if conditional.is_not_modified(version=await menu_services.search_version(id=menu_id)):
+        return conditional.not_modified()
+
     menu_in_db = await menu_services.search_by_id(id=menu_id)
 
     if menu_in_db:
-        return build_response(
-            status_code=200, message="Menu found with success", data=menu_in_db
+        return conditional.apply(
+            build_response(
+                status_code=200, message="Menu found with success", data=menu_in_db
+            )
         )
 
     else:
@@ -54,7 +61,11 @@ async def get_menus(
     pagination: dict = Depends(pagination_parameters),
     current_user: UserInDB = Security(decode_jwt, scopes=[]),
     menu_services: MenuServices = Depends(menu_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    if conditional.is_not_modified(version=await menu_services.search_version()):
+        return conditional.not_modified()
+
     paginator = Paginator(
         request=request, pagination=pagination
     )
@@ -71,11 +82,13 @@ async def get_menus(
     paginator.set_total(total=total)
 
     if menus:
-        return build_list_response(
-            status_code=200,
-            message="Menus found with success",
-            pagination=paginator.pagination,
-            data=menus
+        return conditional.apply(
+            build_list_response(
+                status_code=200,
+                message="Menus found with success",
+                pagination=paginator.pagination,
+                data=menus
+            )
         )
 
     else:
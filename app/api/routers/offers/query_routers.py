@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Query, Security, Response, Request
 
 from app.api.composers import offer_composer
 from app.api.dependencies import build_response, decode_jwt
+from app.api.dependencies.etag import ConditionalRequest, conditional_request
 from app.api.dependencies.pagination_parameters import pagination_parameters
 from app.api.dependencies.paginator import Paginator
 from app.api.dependencies.response import build_list_response
@@ -30,7 +31,11 @@ async def get_offers_paginated(
     pagination: dict = Depends(pagination_parameters),
     current_user: UserInDB = Security(decode_jwt, scopes=[]),
     offer_services: OfferServices = Depends(offer_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    if conditional.is_not_modified(version=await offer_services.search_version(expand=expand)):
+        return conditional.not_modified()
+
     paginator = Paginator(request=request, pagination=pagination)
 
     total = await offer_services.search_count(query=query, is_visible=is_visible)
@@ -45,11 +50,13 @@ async def get_offers_paginated(
     paginator.set_total(total=total)
 
     if offers:
-        return build_list_response(
-            status_code=200,
-            message="Offers found with success",
-            pagination=paginator.pagination,
-            data=offers,
+        return conditional.apply(
+            build_list_response(
+                status_code=200,
+                message="Offers found with success",
+                pagination=paginator.pagination,
+                data=offers,
+            )
         )
 
     else:
@@ -68,12 +75,20 @@ async def get_offer_by_id(
     expand: List[str] = Query(default=[]),
     current_user: UserInDB = Security(decode_jwt, scopes=[]),
     offer_services: OfferServices = Depends(offer_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    version = await offer_services.search_version(id=offer_id, expand=expand)
+
+    if conditional.is_not_modified(version=version):
+        return conditional.not_modified()
+
     offer_in_db = await offer_services.search_by_id(id=offer_id, expand=expand)
 
     if offer_in_db:
-        return build_response(
-            status_code=200, message="Offer found with success", data=offer_in_db
+        return conditional.apply(
+            build_response(
+                status_code=200, message="Offer found with success", data=offer_in_db
+            )
         )
 
     else:
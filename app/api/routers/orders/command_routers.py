@@ -1,16 +1,23 @@
-from fastapi import APIRouter, Depends, Security
+from fastapi import APIRouter, BackgroundTasks, Depends, Form, Security, UploadFile
 
 from app.api.composers import order_composer
 from app.api.composers.pre_order_composite import pre_order_composer
 from app.api.dependencies import build_response, decode_jwt
 from app.api.shared_schemas.responses import MessageResponse
 from app.crud.orders import OrderServices, RequestOrder, UpdateOrder
-from app.crud.orders.schemas import OrderStatus
+from app.crud.orders.importer import detect_import_format
+from app.crud.orders.schemas import BulkUpdateOrderStatus, OrderImportFormat, OrderStatus
 from app.crud.pre_orders.schemas import PreOrderStatus
 from app.crud.pre_orders.services import PreOrderServices
 from app.crud.users import UserInDB
 
-from .schemas import CreateOrderResponse, DeleteOrderResponse, UpdateOrderResponse
+from .schemas import (
+    BulkUpdateOrderStatusResponse,
+    CreateOrderResponse,
+    DeleteOrderResponse,
+    ImportOrdersResponse,
+    UpdateOrderResponse,
+)
 
 router = APIRouter(tags=["Orders"])
 
@@ -40,6 +47,64 @@ async def create_orders(
         )
 
 
+@router.post(
+    "/orders/import",
+    responses={
+        201: {"model": ImportOrdersResponse},
+        403: {"model": MessageResponse},
+    },
+)
+async def import_orders(
+    file: UploadFile,
+    file_format: OrderImportFormat | None = Form(default=None, example=OrderImportFormat.CSV),
+    current_user: UserInDB = Security(decode_jwt, scopes=["order:create"]),
+    order_services: OrderServices = Depends(order_composer),
+):
+    report = await order_services.import_orders(
+        stream=file.file,
+        file_format=file_format
+        or detect_import_format(filename=file.filename, content_type=file.content_type),
+    )
+
+    return build_response(
+        status_code=201, message="Orders imported with success", data=report
+    )
+
+
+@router.patch(
+    "/orders/status",
+    responses={
+        200: {"model": BulkUpdateOrderStatusResponse},
+    },
+)
+async def update_orders_status(
+    bulk_update: BulkUpdateOrderStatus,
+    background_tasks: BackgroundTasks,
+    current_user: UserInDB = Security(decode_jwt, scopes=["order:create"]),
+    order_services: OrderServices = Depends(order_composer),
+    pre_order_services: PreOrderServices = Depends(pre_order_composer),
+):
+    report = await order_services.update_status_many(bulk_update=bulk_update)
+
+    if bulk_update.status in [OrderStatus.PREPARED, OrderStatus.DONE]:
+        order_ids = [change.id for change in report.changed]
+
+        if order_ids:
+            await pre_order_services.update_status_by_order_ids(
+                order_ids=order_ids,
+                new_status=PreOrderStatus(bulk_update.status.value),
+            )
+
+    if report.changed:
+        background_tasks.add_task(
+            order_services.send_status_notifications, report.changed
+        )
+
+    return build_response(
+        status_code=200, message="Orders updated with success", data=report
+    )
+
+
 @router.put(
     "/orders/{order_id}",
     responses={
@@ -83,23 +83,10 @@ async def get_orders(
     )
 
     paginator = Paginator(
-        request=request, pagination=pagination
+        request=request, pagination=pagination, sort_field=order_by or "order_date"
     )
 
-    total = await order_services.search_count(
-        customer_id=customer_id,
-        status=status,
-        delivery_type=delivery_type,
-        payment_status=payment_status,
-        start_date=start_order_date,
-        end_date=end_order_date,
-        tags=tags,
-        min_total_amount=min_total_amount,
-        max_total_amount=max_total_amount,
-        ignore_default_filters=has_user_filters,
-    )
-
-    orders = await order_services.search_all(
+    total, orders = await order_services.search_page(
         customer_id=customer_id,
         status=status,
         delivery_type=delivery_type,
@@ -113,10 +100,12 @@ async def get_orders(
         order_by=order_by,
         ignore_default_filters=has_user_filters,
         page=pagination["page"],
-        page_size=pagination["page_size"]
+        page_size=pagination["page_size"],
+        cursor=paginator.cursor,
     )
 
     paginator.set_total(total=total)
+    paginator.set_items(items=orders)
 
     if orders:
         return build_list_response(
@@ -3,7 +3,7 @@ from typing import List
 from pydantic import Field, ConfigDict
 
 from app.api.shared_schemas.responses import Response, ListResponseSchema
-from app.crud.orders.schemas import OrderInDB
+from app.crud.orders.schemas import BulkOrderStatusReport, OrderImportReport, OrderInDB
 
 EXAMPLE_ORDER = {
     "id": "ord_123",
@@ -36,6 +36,7 @@ EXAMPLE_ORDER = {
     "organization_id": "org_123",
     "total_amount": 10.0,
     "payments": [],
+    "payment_summary": {"total_paid": 0, "count": 0, "methods": {}},
     "payment_status": "PENDING",
     "created_at": "2024-01-01T00:00:00Z",
     "updated_at": "2024-01-01T00:00:00Z",
@@ -115,3 +116,45 @@ class DeleteOrderResponse(Response):
             }
         }
     )
+
+
+class ImportOrdersResponse(Response):
+    data: OrderImportReport | None = Field()
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "message": "Orders imported with success",
+                "data": {
+                    "total_rows": 3,
+                    "imported": 2,
+                    "failed": 1,
+                    "order_ids": ["ord_123", "ord_456"],
+                    "errors": [{"row": 3, "message": "Product #pro_123 not found"}],
+                },
+            }
+        }
+    )
+
+
+class BulkUpdateOrderStatusResponse(Response):
+    data: BulkOrderStatusReport | None = Field()
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "message": "Orders updated with success",
+                "data": {
+                    "changed": [
+                        {
+                            "id": "ord_123",
+                            "customer_id": "cus_123",
+                            "previous_status": "PREPARED",
+                            "status": "DONE",
+                        }
+                    ],
+                    "unchanged": ["ord_456"],
+                },
+            }
+        }
+    )
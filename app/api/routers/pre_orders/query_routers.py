@@ -35,7 +35,7 @@ async def get_pre_orders(
     pre_order_services: PreOrderServices = Depends(pre_order_composer),
 ):
     paginator = Paginator(
-        request=request, pagination=pagination
+        request=request, pagination=pagination, sort_field="created_at"
     )
 
     total = await pre_order_services.search_count(
@@ -48,10 +48,12 @@ async def get_pre_orders(
         code=code,
         expand=expand,
         page=pagination["page"],
-        page_size=pagination["page_size"]
+        page_size=pagination["page_size"],
+        cursor=paginator.cursor,
     )
 
     paginator.set_total(total=total)
+    paginator.set_items(items=pre_orders)
 
     if pre_orders:
         return build_list_response(
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Query, Request, Security, Response
 
 from app.api.composers import product_composer
 from app.api.dependencies import build_response, decode_jwt
+from app.api.dependencies.etag import ConditionalRequest, conditional_request
 from app.api.dependencies.pagination_parameters import pagination_parameters
 from app.api.dependencies.paginator import Paginator
 from app.api.dependencies.response import build_list_response
@@ -31,15 +32,23 @@ async def get_product_by_id(
     expand: List[str] = Query(default=[]),
     current_user: UserInDB = Security(decode_jwt, scopes=["product:get"]),
     product_services: ProductServices = Depends(product_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    version = await product_services.search_version(id=product_id, expand=expand)
+
+    if conditional.is_not_modified(version=version):
+        return conditional.not_modified()
+
     product_in_db = await product_services.search_by_id(
         id=product_id,
         expand=expand
     )
 
     if product_in_db:
-        return build_response(
-            status_code=200, message="Product found with success", data=product_in_db
+        return conditional.apply(
+            build_response(
+                status_code=200, message="Product found with success", data=product_in_db
+            )
         )
 
     else:
@@ -63,9 +72,13 @@ async def get_products(
     pagination: dict = Depends(pagination_parameters),
     current_user: UserInDB = Security(decode_jwt, scopes=["product:get"]),
     product_services: ProductServices = Depends(product_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    if conditional.is_not_modified(version=await product_services.search_version(expand=expand)):
+        return conditional.not_modified()
+
     paginator = Paginator(
-        request=request, pagination=pagination
+        request=request, pagination=pagination, sort_field="name"
     )
 
     total = await product_services.search_count(
@@ -77,17 +90,21 @@ async def get_products(
         tags=tags,
         expand=expand,
         page=pagination["page"],
-        page_size=pagination["page_size"]
+        page_size=pagination["page_size"],
+        cursor=paginator.cursor,
     )
 
     paginator.set_total(total=total)
+    paginator.set_items(items=products)
 
     if products:
-        return build_list_response(
-            status_code=200,
-            message="Products found with success",
-            pagination=paginator.pagination,
-            data=products
+        return conditional.apply(
+            build_list_response(
+                status_code=200,
+                message="Products found with success",
+                pagination=paginator.pagination,
+                data=products
+            )
         )
 
     else:
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Depends, Query, Security
 from app.api.composers import section_item_composer
 from app.api.dependencies.response import build_response
 from app.api.dependencies.auth import decode_jwt
+from app.api.dependencies.etag import ConditionalRequest, conditional_request
 from app.crud.users import UserInDB
 from app.crud.section_items.services import SectionItemServices
 from .schemas import GetSectionItemsResponse
@@ -23,13 +24,21 @@ async def get_section_items(
     expand: List[str] = Query(default=[]),
     current_user: UserInDB = Security(decode_jwt, scopes=["section:get"]),
     section_item_services: SectionItemServices = Depends(section_item_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    version = await section_item_services.search_version(expand=expand)
+
+    if conditional.is_not_modified(version=version):
+        return conditional.not_modified()
+
     section_items = await section_item_services.search_all(
         section_id=section_id, is_visible=is_visible, expand=expand
     )
 
-    return build_response(
-        status_code=200,
-        message="Section items found with success",
-        data=section_items,
+    return conditional.apply(
+        build_response(
+            status_code=200,
+            message="Section items found with success",
+            data=section_items,
+        )
     )
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Query, Security, Response
 
 from app.api.composers import section_composer
 from app.api.dependencies import build_response, decode_jwt
+from app.api.dependencies.etag import ConditionalRequest, conditional_request
 from app.api.shared_schemas.responses import MessageResponse
 from app.crud.users import UserInDB
 from app.crud.sections import SectionServices
@@ -24,15 +25,23 @@ async def get_section_by_id(
     expand: List[str] = Query(default=[]),
     current_user: UserInDB = Security(decode_jwt, scopes=["section:get"]),
     section_services: SectionServices = Depends(section_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    version = await section_services.search_version(id=section_id, expand=expand)
+
+    if conditional.is_not_modified(version=version):
+        return conditional.not_modified()
+
     section_in_db = await section_services.search_by_id(
         id=section_id,
         expand=expand
     )
 
     if section_in_db:
-        return build_response(
-            status_code=200, message="Section found with success", data=section_in_db
+        return conditional.apply(
+            build_response(
+                status_code=200, message="Section found with success", data=section_in_db
+            )
         )
 
     else:
@@ -52,7 +61,11 @@ async def get_sections(
     expand: List[str] = Query(default=[]),
     current_user: UserInDB = Security(decode_jwt, scopes=["section:get"]),
     section_services: SectionServices = Depends(section_composer),
+    conditional: ConditionalRequest = Depends(conditional_request),
 ):
+    if conditional.is_not_modified(version=await section_services.search_version(expand=expand)):
+        return conditional.not_modified()
+
     sections = await section_services.search_all(
         menu_id=menu_id,
         is_visible=is_visible,
@@ -60,8 +73,10 @@ async def get_sections(
     )
 
     if sections:
-        return build_response(
-            status_code=200, message="Sections found with success", data=sections
+        return conditional.apply(
+            build_response(
+                status_code=200, message="Sections found with success", data=sections
+            )
         )
 
     else:
@@ -55,7 +55,7 @@ async def get_tags(
     tags_services: TagServices = Depends(tag_composer),
 ):
     paginator = Paginator(
-        request=request, pagination=pagination
+        request=request, pagination=pagination, sort_field="name"
     )
 
     total = await tags_services.count_all(query=query)
@@ -63,9 +63,11 @@ async def get_tags(
         query=query,
         page=pagination["page"],
         page_size=pagination["page_size"],
+        cursor=paginator.cursor,
     )
 
     paginator.set_total(total=total)
+    paginator.set_items(items=tags)
 
     if tags:
         return build_list_response(
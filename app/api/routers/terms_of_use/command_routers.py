@@ -101,8 +101,7 @@ async def accepted_term_of_use(
     )
 
     if term_of_use_in_db:
-        if cached_users.get(current_user.user_id):
-            cached_users.pop(current_user.user_id)
+        cached_users.pop(current_user.user_id, None)
 
         return build_response(
             status_code=200,
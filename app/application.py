@@ -45,6 +45,7 @@ from app.api.routers.exception_handlers import (
 )
 from app.api.routers.exception_handlers.generic_errors import http_exception_handler
 from app.core.db.connection import lifespan
+from app.core.utils.bounded_cache import cache_stats
 from app.core.exceptions import UnprocessableEntity, NotFoundError, InvalidPassword
 from app.core.configs import get_environment
 
@@ -142,3 +143,15 @@ async def monitor_health_check(
         return build_response(status_code=200, message="I'm alive!", data=None)
 
     return build_response(status_code=400, message="Health check failed", data=None)
+
+
+@app.get("/health/caches", tags=["Health Check"])
+async def cache_stats(
+    access_token=Depends(get_access_token),
+):
+    if access_token:
+        return build_response(
+            status_code=200, message="Cache stats", data=cache_stats()
+        )
+
+    return build_response(status_code=400, message="Health check failed", data=None)
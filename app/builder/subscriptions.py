@@ -1,8 +1,9 @@
 from datetime import timedelta
-from typing import Dict, List
+from typing import List, MutableMapping
 from uuid import uuid4
 
 from app.api.dependencies.email_sender import send_email
+from app.api.dependencies.plan_feature_cache import invalidate_plan_features
 from app.api.dependencies.mercado_pago_integration import MercadoPagoIntegration
 from app.api.exceptions.authentication_exceptions import BadRequestException
 from app.api.shared_schemas.mercado_pago import MPPreferenceModel
@@ -35,7 +36,7 @@ class SubscriptionBuilder:
         plan_service: PlanServices,
         organization_plan_service: OrganizationPlanServices,
         coupon_service: CouponServices,
-        cache_plans: Dict[str, OrganizationPlanInDB]
+        cache_plans: MutableMapping[str, OrganizationPlanInDB]
     ) -> None:
         self.__invoice_service = invoice_service
         self.__organization_service = organization_service
@@ -121,7 +122,7 @@ class SubscriptionBuilder:
 
             send_email(email_to=[user.email], title=f"PedidoZ - Agora falta só mais um pouquinho!", message=message)
 
-        self.__clear_plan_cache(organization_id=organization_in_db.id)
+        await self.__clear_plan_cache(organization_id=organization_in_db.id)
 
         return ResponseSubscription(
             invoice_id=invoice_in_db.id,
@@ -232,7 +233,7 @@ class SubscriptionBuilder:
 
             send_email(email_to=[user.email], title=f"PedidoZ - Agora falta só mais um pouquinho!", message=message)
 
-        self.__clear_plan_cache(organization_id=organization_in_db.id)
+        await self.__clear_plan_cache(organization_id=organization_in_db.id)
 
         return ResponseSubscription(
             invoice_id=invoice_in_db.id,
@@ -439,7 +440,7 @@ class SubscriptionBuilder:
             id=invoice_in_db.id, updated_invoice=update_invoice
         )
 
-        self.__clear_plan_cache()
+        await self.__clear_plan_cache()
 
         return updated_invoice
 
@@ -503,9 +504,11 @@ class SubscriptionBuilder:
             if user.role == RoleEnum.OWNER:
                 return user
 
-    def __clear_plan_cache(self, organization_id: str = None) -> bool:
-        if organization_id and self.__cache_plans.get(organization_id):
-            self.__cache_plans.pop(organization_id)
+    async def __clear_plan_cache(self, organization_id: str = None) -> bool:
+        await invalidate_plan_features(organization_id=organization_id)
+
+        if organization_id:
+            self.__cache_plans.pop(organization_id, None)
             return True
 
         else:
@@ -49,12 +49,27 @@ class Environment(BaseSettings):
     PRIVATE_BUCKET_NAME: str | None = None
     PUBLIC_BUCKET_NAME: str | None = None
     BUCKET_URL_EXPIRES_IN_SECONDS: int = 300
+    BUCKET_MAX_CONCURRENCY: int = 10
+    BUCKET_TIMEOUT_SECONDS: int = 10
+    IMAGE_PROCESS_WORKERS: int = 2
 
     # REDIS
     REDIS_URL: str | None = None
     REDIS_PORT: int | None = None
     REDIS_USERNAME: str | None = None
     REDIS_PASSWORD: str | None = None
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_TIMEOUT_SECONDS: float = 0.5
+
+    # CACHE
+    ENTITY_CACHE_MAX_SIZE: int = 2048
+    ENTITY_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 2048
+    USER_CACHE_TTL_SECONDS: int = 600
+    PLAN_CACHE_MAX_SIZE: int = 2048
+    PLAN_CACHE_TTL_SECONDS: int = 600
+    PLAN_FEATURE_CACHE_TTL_SECONDS: int = 60
+    FILE_URL_CACHE_MAX_SIZE: int = 8192
 
     # Mercado Pago
     MERCADO_PAGO_ACCESS_TOKEN: str | None = None
@@ -0,0 +1,43 @@
+from mongoengine import get_db
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.core.configs import get_environment, get_logger
+
+_env = get_environment()
+_logger = get_logger(__name__)
+
+_async_client: AsyncMongoClient | None = None
+_async_database: AsyncDatabase | None = None
+
+
+async def start_async_database() -> AsyncDatabase:
+    """
+    Inicia o cliente async do MongoDB usando o mesmo banco da conexão do MongoEngine.
+    """
+    global _async_client, _async_database
+
+    _async_client = AsyncMongoClient(host=_env.DATABASE_HOST)
+    await _async_client.aconnect()
+
+    _async_database = _async_client[get_db().name]
+    _logger.info(f"Async MongoDB client connected on database {_async_database.name}")
+
+    return _async_database
+
+
+async def close_async_database() -> None:
+    global _async_client, _async_database
+
+    if _async_client is not None:
+        await _async_client.close()
+
+    _async_client = None
+    _async_database = None
+
+
+def get_async_database() -> AsyncDatabase | None:
+    """
+    Retorna o banco async ou None quando o cliente não foi iniciado (scripts e testes).
+    """
+    return _async_database
@@ -1,13 +1,19 @@
 from contextlib import asynccontextmanager
 from threading import Lock
 
+import redis.asyncio as aioredis
 from cachetools import TTLCache
 from fastapi import FastAPI
 from mongoengine import connect
 
 from app.api.dependencies.verify_token import ValidateToken
 from app.api.dependencies.bucket import S3BucketManager
+from app.api.dependencies.redis_manager import RedisManager
 from app.core.configs import get_environment, get_logger
+from app.core.db.async_connection import close_async_database, start_async_database
+from app.core.db.indexes import ensure_indexes
+from app.core.utils.bounded_cache import BoundedCache, cache_bus
+from app.core.utils.image_pipeline import shutdown_image_pool
 
 _env = get_environment()
 _logger = get_logger(__name__)
@@ -20,6 +26,35 @@ def start_database():
     connetion.server_info()
 
 
+async def start_cache_bus() -> aioredis.Redis | None:
+    """
+    Liga a invalidação dos caches entre workers; sem Redis ela fica só local.
+
+    O pub/sub fica bloqueado lendo o canal, então usa uma conexão própria, sem o
+    `socket_timeout` do pool do `RedisManager`.
+    """
+    if not _env.REDIS_URL:
+        return None
+
+    client = aioredis.Redis(
+        host=_env.REDIS_URL,
+        port=_env.REDIS_PORT,
+        username=_env.REDIS_USERNAME,
+        password=_env.REDIS_PASSWORD,
+        decode_responses=True,
+        socket_connect_timeout=2,
+    )
+
+    try:
+        await cache_bus.start(client=client)
+        return client
+
+    except Exception as error:
+        _logger.error(f"Cache invalidation over Redis disabled: {error}")
+        await client.aclose()
+        return None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> None: # type: ignore
     _logger.info("Connecting to MongoDB")
@@ -28,6 +63,8 @@ async def lifespan(app: FastAPI) -> None: # type: ignore
     app.state.jwks_cache_lock = Lock()
 
     start_database()
+    ensure_indexes()
+    await start_async_database()
 
     app.state.auth = ValidateToken(
         jwks_cache=app.state.jwks_key_cache,
@@ -36,12 +73,30 @@ async def lifespan(app: FastAPI) -> None: # type: ignore
     app.state.access_token = None
 
     # Caches
-    app.state.cached_complete_users = {}
-    app.state.cached_users = {}
-    app.state.cached_plans = {}
-    app.state.cached_file_urls = {}
-    S3BucketManager.set_cache(app.state.cached_file_urls)
+    app.state.cached_complete_users = BoundedCache(
+        name="complete_users", maxsize=_env.USER_CACHE_MAX_SIZE, ttl=_env.USER_CACHE_TTL_SECONDS
+    )
+    app.state.cached_users = BoundedCache(
+        name="users", maxsize=_env.USER_CACHE_MAX_SIZE, ttl=_env.USER_CACHE_TTL_SECONDS
+    )
+    app.state.cached_plans = BoundedCache(
+        name="plans", maxsize=_env.PLAN_CACHE_MAX_SIZE, ttl=_env.PLAN_CACHE_TTL_SECONDS
+    )
+
+    app.state.redis = await RedisManager.connect()
+    app.state.s3 = S3BucketManager.connect()
+    app.state.cache_bus_client = await start_cache_bus()
 
     _logger.info("Connection established")
 
     yield
+
+    if app.state.cache_bus_client is not None:
+        await cache_bus.stop()
+        await app.state.cache_bus_client.aclose()
+
+    await RedisManager.disconnect()
+    S3BucketManager.disconnect()
+    shutdown_image_pool()
+
+    await close_async_database()
@@ -0,0 +1,111 @@
+from typing import Dict, List, Tuple, Type
+
+from mongoengine import Document
+from pymongo.errors import OperationFailure
+from pydantic import BaseModel, Field
+
+from app.core.configs import get_logger
+from app.crud.additional_items.models import AdditionalItemModel
+from app.crud.billing_rollups.models import BillingRollupModel
+from app.crud.customers.models import CustomerModel
+from app.crud.expenses.models import ExpenseModel
+from app.crud.files.models import FileModel
+from app.crud.menus.models import MenuModel
+from app.crud.offers.models import OfferModel
+from app.crud.orders.models import OrderModel
+from app.crud.pre_orders.models import PreOrderModel
+from app.crud.product_additionals.models import ProductAdditionalModel
+from app.crud.products.models import ProductModel
+from app.crud.section_items.models import SectionItemModel
+from app.crud.sections.models import SectionModel
+from app.crud.tags.models import TagModel
+
+_logger = get_logger(__name__)
+
+INDEXED_DOCUMENTS: List[Type[Document]] = [
+    OrderModel,
+    CustomerModel,
+    ProductModel,
+    ExpenseModel,
+    TagModel,
+    PreOrderModel,
+    BillingRollupModel,
+    MenuModel,
+    OfferModel,
+    SectionModel,
+    SectionItemModel,
+    FileModel,
+    ProductAdditionalModel,
+    AdditionalItemModel,
+]
+
+IndexKey = Tuple[Tuple[str, int], ...]
+
+
+class IndexReport(BaseModel):
+    collection: str = Field(example="orders")
+    missing: List[IndexKey] = Field(default=[])
+    undeclared: List[str] = Field(default=[])
+    unused: List[str] = Field(default=[])
+
+
+def ensure_indexes(documents: List[Type[Document]] = INDEXED_DOCUMENTS) -> None:
+    """
+    Cria os indexes declarados no `meta` de cada documento.
+    O `createIndexes` do MongoDB é idempotente, então pode rodar a cada startup.
+    """
+    for document in documents:
+        document.ensure_indexes()
+        _logger.info(f"Indexes verified for {document._get_collection_name()}")
+
+
+def audit_indexes(documents: List[Type[Document]] = INDEXED_DOCUMENTS) -> List[IndexReport]:
+    """
+    Compara os indexes declarados com os existentes no banco e aponta os que
+    não tiveram nenhum acesso desde o último restart do MongoDB (`$indexStats`).
+    """
+    reports = []
+
+    for document in documents:
+        collection = document._get_collection()
+        existing = _existing_indexes(collection=collection)
+        declared = [
+            tuple(tuple(field) for field in spec["fields"])
+            for spec in document._meta.get("index_specs", [])
+        ]
+
+        report = IndexReport(collection=collection.name)
+        report.missing = [key for key in declared if key not in existing.values()]
+        report.undeclared = [
+            name for name, key in existing.items()
+            if name != "_id_" and key not in declared
+        ]
+
+        usage = _index_usage(collection=collection)
+        report.unused = [
+            name for name in existing
+            if name != "_id_" and usage.get(name) == 0
+        ]
+
+        reports.append(report)
+
+    return reports
+
+
+def _existing_indexes(collection) -> Dict[str, IndexKey]:
+    return {
+        name: tuple((field, int(direction)) for field, direction in info["key"])
+        for name, info in collection.index_information().items()
+    }
+
+
+def _index_usage(collection) -> Dict[str, int]:
+    try:
+        return {
+            stats["name"]: int(stats["accesses"]["ops"])
+            for stats in collection.aggregate([{"$indexStats": {}}])
+        }
+
+    except (OperationFailure, NotImplementedError) as error:
+        _logger.warning(f"Could not read $indexStats for {collection.name}: {error}")
+        return {}
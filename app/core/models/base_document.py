@@ -26,6 +26,18 @@ class BaseDocument(Document):
         self.updated_at = UTCDateTime.now()
         super().save(*args, **kwargs)
 
+    def update(self, query: dict = None, **kwargs) -> bool:
+        """
+        Atualiza com um único `find_one_and_update` (retornando o documento novo)
+        e recarrega os campos na instância, então o repositório monta a resposta
+        a partir do próprio model em vez de buscar o documento de novo.
+
+        `query` restringe o documento além do id (ex.: `organization_id` e
+        `is_active`), o que permite atualizar a partir de `Model(id=...)` sem
+        ler o documento antes. Retorna False quando nenhum documento casa.
+        """
+        return self.modify(query=query, **kwargs)
+
     def base_update(self):
         self.updated_at = UTCDateTime.now()
 
@@ -1,6 +1,11 @@
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Tuple, Type, TypeVar
+
 from pydantic import ConfigDict, BaseModel
 
+Model = TypeVar("Model", bound=BaseModel)
+
 
 def convert_field_to_camel_case(string: str) -> str:
     return "".join(
@@ -23,3 +28,22 @@ class GenericModel(BaseModel):
         json_encoders = {datetime: convert_datetime_to_realworld},
         from_attributes=True
     )
+
+
+@lru_cache(maxsize=None)
+def _shared_fields(schema: Type[BaseModel], source: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(name for name in schema.model_fields if name in source.model_fields)
+
+
+def construct_from(schema: Type[Model], source: BaseModel, **fields) -> Model:
+    """
+    Monta `schema` a partir de um modelo já validado (ex.: `OrderInDB` ->
+    `CompleteOrder`) com `model_construct`, sem validar de novo os produtos,
+    pagamentos e demais campos aninhados. Copia os campos em comum e aplica
+    `fields` por cima; só use com dados que vieram validados do banco.
+    """
+    attributes = source.__dict__
+    values = {name: attributes[name] for name in _shared_fields(schema, source.__class__)}
+    values.update(fields)
+
+    return schema.model_construct(**values)
@@ -0,0 +1,29 @@
+from mongoengine import ListField, StringField
+
+from app.core.models.base_document import BaseDocument
+from app.core.utils.search import build_search_tokens, normalize_search_text
+
+
+class SearchableDocument(BaseDocument):
+    """
+    Documento com busca pelo nome: mantém `search_name` (nome sem acentos e em
+    minúsculas) e `search_tokens` (as palavras do nome) sempre que o `name` é
+    salvo ou atualizado, para o filtro `query` usar o index de prefixo.
+    """
+
+    meta = {"abstract": True}
+
+    search_name = StringField(required=False)
+    search_tokens = ListField(StringField(), required=False)
+
+    def save(self, *args, **kwargs):
+        self.search_name = normalize_search_text(self.name)
+        self.search_tokens = build_search_tokens(self.name)
+        super().save(*args, **kwargs)
+
+    def update(self, **kwargs):
+        if kwargs.get("name"):
+            kwargs["search_name"] = normalize_search_text(kwargs["name"])
+            kwargs["search_tokens"] = build_search_tokens(kwargs["name"])
+
+        return super().update(**kwargs)
@@ -1,6 +1,427 @@
+import asyncio
+import re
+from typing import Any, Dict, List, Tuple, Type
+
+from mongoengine import Document, Q
+from mongoengine.queryset import QuerySet
+from pymongo.errors import BulkWriteError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.db.async_connection import get_async_database
+from app.core.utils.lean_rows import Schema, schema_projection, validate_rows
+from app.core.utils.page_cursor import CursorDirection, PageCursor
+from app.core.utils.search import build_search_tokens, normalize_search_text
 
 
 class Repository:
+    """
+    Base dos repositórios.
+
+    Os helpers abaixo executam as queries no driver async do MongoDB quando ele
+    foi iniciado no `lifespan`. Sem ele (scripts e testes com mongomock) a mesma
+    operação roda na collection do MongoEngine em uma threadpool, então nenhum
+    caminho bloqueia o event loop e os repositórios podem migrar um a um.
+
+    Repositórios por organização que definem `document` ganham `select_version`
+    (a versão usada nas ETags do catálogo).
+    """
+
+    document: Type[Document] | None = None
 
     def __init__(self) -> None:
         ...
+
+    async def count_documents(self, document: Type[Document], query: Dict[str, Any]) -> int:
+        database = get_async_database()
+
+        if database is not None:
+            return await database[document._get_collection_name()].count_documents(query)
+
+        return await run_in_threadpool(document._get_collection().count_documents, query)
+
+    async def find(
+        self,
+        document: Type[Document],
+        query: Dict[str, Any],
+        sort: List[Tuple[str, int]] = None,
+        skip: int = 0,
+        limit: int = 0,
+        projection: Dict[str, Any] = None,
+    ) -> List[dict]:
+        database = get_async_database()
+
+        if database is not None:
+            cursor = database[document._get_collection_name()].find(
+                query, projection, sort=sort, skip=skip, limit=limit
+            )
+            return await cursor.to_list()
+
+        def _find() -> List[dict]:
+            cursor = document._get_collection().find(
+                query, projection, sort=sort, skip=skip, limit=limit
+            )
+            return list(cursor)
+
+        return await run_in_threadpool(_find)
+
+    async def find_queryset(
+        self, objects: QuerySet, projection: Dict[str, Any] = None
+    ) -> List[dict]:
+        """
+        Equivalente async de `objects.as_pymongo()`: executa os filtros,
+        ordenação, skip e limit do QuerySet e devolve os documentos crus.
+        """
+        if objects._none or objects._empty:
+            return []
+
+        return await self.find(
+            document=objects._document,
+            query=objects._query,
+            sort=list(objects._ordering) if objects._ordering else None,
+            skip=objects._skip or 0,
+            limit=objects._limit or 0,
+            projection=projection,
+        )
+
+    async def select_lean(self, objects: QuerySet, schema: Type[Schema]) -> List[Schema]:
+        """
+        Leitura enxuta das listagens: busca só os campos de `schema` como dicts
+        e valida a página inteira de uma vez, sem criar um `Document` por linha.
+        """
+        rows = await self.find_queryset(
+            objects=objects, projection=schema_projection(schema)
+        )
+
+        return validate_rows(document=objects._document, schema=schema, rows=rows)
+
+    async def find_one(
+        self,
+        document: Type[Document],
+        query: Dict[str, Any],
+        projection: Dict[str, Any] = None,
+    ) -> dict | None:
+        database = get_async_database()
+
+        if database is not None:
+            return await database[document._get_collection_name()].find_one(
+                query, projection
+            )
+
+        return await run_in_threadpool(
+            document._get_collection().find_one, query, projection
+        )
+
+    async def update_one(
+        self,
+        document: Type[Document],
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+        upsert: bool = False,
+    ) -> int:
+        """Retorna quantos documentos casaram com `query` ou foram inseridos (0 ou 1)."""
+        database = get_async_database()
+
+        if database is not None:
+            result = await database[document._get_collection_name()].update_one(
+                query, update, upsert=upsert
+            )
+
+        else:
+            result = await run_in_threadpool(
+                document._get_collection().update_one, query, update, upsert=upsert
+            )
+
+        return result.matched_count or int(result.upserted_id is not None)
+
+    async def update_many(
+        self,
+        document: Type[Document],
+        query: Dict[str, Any],
+        update: Dict[str, Any],
+    ) -> int:
+        database = get_async_database()
+
+        if database is not None:
+            result = await database[document._get_collection_name()].update_many(
+                query, update
+            )
+
+        else:
+            result = await run_in_threadpool(
+                document._get_collection().update_many, query, update
+            )
+
+        return result.modified_count
+
+    async def insert_many(
+        self, document: Type[Document], rows: List[Dict[str, Any]]
+    ) -> Dict[int, str]:
+        """
+        Insere `rows` sem ordem (`ordered=False`), então uma linha com erro não
+        impede as outras. Retorna o erro de cada posição que não foi inserida.
+        """
+        if not rows:
+            return {}
+
+        database = get_async_database()
+
+        try:
+            if database is not None:
+                await database[document._get_collection_name()].insert_many(
+                    rows, ordered=False
+                )
+
+            else:
+                await run_in_threadpool(
+                    document._get_collection().insert_many, rows, ordered=False
+                )
+
+        except BulkWriteError as error:
+            return {
+                write_error["index"]: write_error.get("errmsg", "Write error")
+                for write_error in error.details.get("writeErrors", [])
+            }
+
+        return {}
+
+    async def aggregate(
+        self, document: Type[Document], pipeline: List[Dict[str, Any]]
+    ) -> List[dict]:
+        database = get_async_database()
+
+        if database is not None:
+            cursor = await database[document._get_collection_name()].aggregate(pipeline)
+            return await cursor.to_list()
+
+        def _aggregate() -> List[dict]:
+            return list(document._get_collection().aggregate(pipeline))
+
+        return await run_in_threadpool(_aggregate)
+
+    async def aggregate_queryset(
+        self, objects: QuerySet, pipeline: List[Dict[str, Any]]
+    ) -> List[dict]:
+        """
+        Equivalente async de `QuerySet.aggregate`: os filtros, ordenação, skip e
+        limit montados com o MongoEngine viram os primeiros estágios do pipeline.
+        """
+        return await self.aggregate(
+            document=objects._document,
+            pipeline=self.build_initial_pipeline(objects=objects) + list(pipeline),
+        )
+
+    async def aggregate_page(
+        self,
+        objects: QuerySet,
+        paged_objects: QuerySet,
+        pipeline: List[Dict[str, Any]],
+    ) -> Tuple[int, List[dict]]:
+        """
+        Conta os documentos de `objects` e busca a página de `paged_objects` ao
+        mesmo tempo. A página começa pelos `$match`, `$sort`, `$limit` e `$skip`
+        do QuerySet (que usam os índices) e só as linhas dela passam por
+        `pipeline`; nada fica preso ao limite de 16MB de um único documento.
+        """
+        if objects._none or objects._empty:
+            return 0, []
+
+        total, rows = await asyncio.gather(
+            self.count_documents(document=objects._document, query=objects._query),
+            self.aggregate_queryset(objects=paged_objects, pipeline=pipeline),
+        )
+
+        return total, rows
+
+    async def select_version(self, id: str = None) -> str | None:
+        """Versão dos documentos `document` da organização, ou só do documento `id`."""
+        query = {"organization_id": self.organization_id}
+
+        if id is not None:
+            query["_id"] = id
+
+        return await self.select_documents_version(document=self.document, query=query)
+
+    async def select_documents_version(
+        self, document: Type[Document], query: Dict[str, Any]
+    ) -> str | None:
+        """
+        Versão dos documentos de `query` (usada nas ETags): quantidade e maior
+        `updated_at`. Com o índice `(organization_id, updated_at)` a contagem
+        percorre só o índice e o documento mais recente sai de uma leitura
+        ordenada com `limit(1)`, sem varrer os documentos. Escritas e soft
+        deletes mudam o `updated_at`; deletes de verdade mudam a contagem.
+        Retorna `None` quando nenhum documento casa.
+        """
+        count, latest = await asyncio.gather(
+            self.count_documents(document=document, query=query),
+            self.find(
+                document=document,
+                query=query,
+                sort=[("updated_at", -1)],
+                limit=1,
+                projection={"_id": 0, "updated_at": 1},
+            ),
+        )
+
+        if not count:
+            return None
+
+        updated_at = latest[0].get("updated_at") if latest else None
+        updated_at = updated_at.isoformat() if updated_at else ""
+
+        return f"{count}@{updated_at}"
+
+    async def select_ranked(
+        self,
+        objects: QuerySet,
+        query: str,
+        page: int = None,
+        page_size: int = None,
+        sort_field: str = "name",
+    ) -> List[Document]:
+        rows = await self.select_ranked_rows(
+            objects=objects, query=query, page=page, page_size=page_size, sort_field=sort_field
+        )
+
+        return [objects._document._from_son(row) for row in rows]
+
+    async def select_ranked_lean(
+        self,
+        objects: QuerySet,
+        schema: Type[Schema],
+        query: str,
+        page: int = None,
+        page_size: int = None,
+        sort_field: str = "name",
+    ) -> List[Schema]:
+        """`select_ranked` na leitura enxuta (veja `select_lean`)."""
+        rows = await self.select_ranked_rows(
+            objects=objects,
+            query=query,
+            page=page,
+            page_size=page_size,
+            sort_field=sort_field,
+            projection=schema_projection(schema),
+        )
+
+        return validate_rows(document=objects._document, schema=schema, rows=rows)
+
+    async def select_ranked_rows(
+        self,
+        objects: QuerySet,
+        query: str,
+        page: int = None,
+        page_size: int = None,
+        sort_field: str = "name",
+        projection: Dict[str, Any] = None,
+    ) -> List[dict]:
+        """
+        Executa uma busca já filtrada com `search_filter` ordenando por
+        relevância: nome igual à busca, nome começando pela busca e depois os
+        que só têm palavras começando pelos termos, desempatando por `sort_field`.
+        """
+        search_name = normalize_search_text(query)
+
+        pipeline = [
+            {
+                "$addFields": {
+                    "search_rank": {
+                        "$cond": [
+                            {"$eq": ["$search_name", search_name]},
+                            0,
+                            {
+                                "$cond": [
+                                    {
+                                        "$regexMatch": {
+                                            "input": {"$ifNull": ["$search_name", ""]},
+                                            "regex": f"^{re.escape(search_name)}",
+                                        }
+                                    },
+                                    1,
+                                    2,
+                                ]
+                            },
+                        ]
+                    }
+                }
+            },
+            {"$sort": {"search_rank": 1, sort_field: 1, "_id": 1}},
+        ]
+
+        if page and page_size:
+            pipeline.append({"$skip": (page - 1) * page_size})
+            pipeline.append({"$limit": page_size})
+
+        pipeline.append({"$project": projection or {"search_rank": 0}})
+
+        return await self.aggregate_queryset(objects=objects, pipeline=pipeline)
+
+    @staticmethod
+    def search_filter(query: str) -> Q:
+        """
+        Cada palavra da busca precisa ser o começo de uma palavra do nome.
+        A comparação usa `search_tokens` normalizado, então acentos e
+        maiúsculas não importam e a entrada do usuário nunca vira regex.
+        """
+        search = Q()
+
+        for token in build_search_tokens(query):
+            search &= Q(search_tokens__startswith=token)
+
+        return search
+
+    @staticmethod
+    def build_initial_pipeline(objects: QuerySet) -> List[Dict[str, Any]]:
+        initial_pipeline = []
+
+        if objects._none or objects._empty:
+            initial_pipeline.append({"$limit": 1})
+            initial_pipeline.append({"$match": {"$expr": False}})
+
+        if objects._query:
+            initial_pipeline.append({"$match": objects._query})
+
+        if objects._ordering:
+            initial_pipeline.append({"$sort": dict(objects._ordering)})
+
+        if objects._limit is not None:
+            initial_pipeline.append({"$limit": objects._limit + (objects._skip or 0)})
+
+        if objects._skip is not None:
+            initial_pipeline.append({"$skip": objects._skip})
+
+        return initial_pipeline
+
+    @staticmethod
+    def apply_page_cursor(
+        objects: QuerySet,
+        cursor: PageCursor,
+        sort_field: str,
+        descending: bool,
+        page_size: int,
+    ) -> QuerySet:
+        """
+        Paginação por keyset: filtra a partir do `(sort_field, _id)` do cursor em
+        vez de usar `skip`, então o custo não cresce com a profundidade da página.
+        Para o cursor `previous` a ordenação é invertida; use `sort_page_rows`
+        para devolver as linhas na ordem original.
+        """
+        forward = cursor.direction == CursorDirection.NEXT
+        operator = "lt" if descending == forward else "gt"
+        sort_prefix = "-" if descending == forward else ""
+
+        objects = objects.filter(
+            Q(**{f"{sort_field}__{operator}": cursor.value})
+            | Q(**{sort_field: cursor.value, f"id__{operator}": cursor.id})
+        )
+
+        return objects.order_by(
+            f"{sort_prefix}{sort_field}", f"{sort_prefix}id"
+        ).limit(page_size)
+
+    @staticmethod
+    def sort_page_rows(rows: List[Any], cursor: PageCursor | None) -> List[Any]:
+        if cursor and cursor.direction == CursorDirection.PREVIOUS:
+            rows.reverse()
+
+        return rows
@@ -0,0 +1,105 @@
+"""
+Cache de entidades compartilhado pelo processo (tags, clientes, produtos e
+organizações), usado pelos repositórios no `select_by_id`/`select_by_ids`.
+
+Cada cache é um `BoundedCache` (LRU com expiração) com chave `(organization_id, id)`
+e é invalidado pelos métodos de escrita do próprio repositório; a invalidação
+chega aos outros workers pelo `cache_bus` quando o Redis está configurado.
+"""
+
+from typing import Generic, Iterable, List, Tuple, TypeVar
+
+from pydantic import BaseModel
+
+from app.core.configs import get_environment
+from app.core.utils.bounded_cache import BoundedCache, CacheStats
+
+Entity = TypeVar("Entity", bound=BaseModel)
+
+_env = get_environment()
+
+
+class EntityCache(Generic[Entity]):
+    def __init__(self, name: str, maxsize: int, ttl: float) -> None:
+        self.name = name
+        self.__entries = BoundedCache(name=name, maxsize=maxsize, ttl=ttl)
+
+    def get(self, organization_id: str, id: str) -> Entity | None:
+        entity = self.__entries.get((organization_id, id))
+
+        if entity is None:
+            return None
+
+        # quem chama pode alterar o modelo retornado (ex.: `organization.users`)
+        return entity.model_copy(deep=True)
+
+    def get_many(
+        self, organization_id: str, ids: Iterable[str]
+    ) -> Tuple[List[Entity], List[str]]:
+        """Retorna as entidades em cache e os ids que precisam ir ao banco."""
+        found, missing = [], []
+
+        for id in dict.fromkeys(ids):
+            entity = self.get(organization_id=organization_id, id=id)
+
+            if entity is None:
+                missing.append(id)
+
+            else:
+                found.append(entity)
+
+        return found, missing
+
+    def set(self, organization_id: str, entity: Entity) -> None:
+        self.__entries[(organization_id, entity.id)] = entity.model_copy(deep=True)
+
+    def set_many(self, organization_id: str, entities: Iterable[Entity]) -> None:
+        for entity in entities:
+            self.set(organization_id=organization_id, entity=entity)
+
+    def invalidate(self, organization_id: str, id: str = None) -> None:
+        """Remove a entidade `id` ou, sem `id`, todas as da organização."""
+        if id is not None:
+            self.__entries.invalidate(key=(organization_id, id))
+            return
+
+        for key in [key for key in self.__entries if key[0] == organization_id]:
+            self.__entries.invalidate(key=key)
+
+    def clear(self) -> None:
+        self.__entries.drop()
+        self.__entries.reset_stats()
+
+    def stats(self) -> CacheStats:
+        return self.__entries.stats()
+
+
+def _entity_cache(name: str) -> EntityCache:
+    return EntityCache(
+        name=name,
+        maxsize=_env.ENTITY_CACHE_MAX_SIZE,
+        ttl=_env.ENTITY_CACHE_TTL_SECONDS,
+    )
+
+
+tag_cache: EntityCache = _entity_cache(name="tags")
+customer_cache: EntityCache = _entity_cache(name="customers")
+product_cache: EntityCache = _entity_cache(name="products")
+# organizações não pertencem a outra organização: a chave usa o próprio id
+organization_cache: EntityCache = _entity_cache(name="organizations")
+
+ENTITY_CACHES: Tuple[EntityCache, ...] = (
+    tag_cache,
+    customer_cache,
+    product_cache,
+    organization_cache,
+)
+
+
+def entity_cache_stats() -> List[CacheStats]:
+    return [cache.stats() for cache in ENTITY_CACHES]
+
+
+def clear_entity_caches() -> None:
+    for cache in ENTITY_CACHES:
+        cache.clear()
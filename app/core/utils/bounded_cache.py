@@ -0,0 +1,308 @@
+"""
+Caches em memória com tamanho máximo, expiração e estatísticas, usados no lugar
+dos `dict`s que ficavam em `app.state` (usuários, planos e URLs de arquivos).
+
+`BoundedCache` se comporta como um `dict` (`get`, `[]`, `pop`, `clear`), então os
+serviços continuam iguais. A diferença é que remover uma chave (`pop`, `del`,
+`clear` ou `invalidate`) é uma invalidação: com o `cache_bus` ligado ao Redis
+(`lifespan`), a remoção é publicada e os outros workers descartam a mesma chave.
+"""
+
+import asyncio
+import json
+from collections.abc import MutableMapping
+from threading import Lock
+from typing import Any, Dict, Hashable, Iterator, List, Set
+from uuid import uuid4
+
+from cachetools import TTLCache
+from pydantic import Field
+
+from app.core.configs import get_environment, get_logger
+from app.core.models.base_schema import GenericModel
+
+_env = get_environment()
+_logger = get_logger(__name__)
+
+_MISSING = object()
+
+
+class CacheStats(GenericModel):
+    name: str = Field(example="plans")
+    size: int = Field(example=120)
+    max_size: int = Field(example=2048)
+    ttl_seconds: float = Field(example=300)
+    hits: int = Field(example=950)
+    misses: int = Field(example=50)
+    evictions: int = Field(default=0, example=3)
+    expirations: int = Field(default=0, example=12)
+    invalidations: int = Field(default=0, example=4)
+
+
+class _CountingTTLCache(TTLCache):
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.evictions = 0
+        self.expirations = 0
+
+    def popitem(self):
+        # só é chamado pelo cachetools quando o cache está cheio (LRU)
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def expire(self, time=None):
+        expired = super().expire(time)
+        self.expirations += len(expired)
+        return expired
+
+
+class BoundedCache(MutableMapping):
+    def __init__(
+        self,
+        name: str,
+        maxsize: int,
+        ttl: float,
+        shared: bool = True,
+        bus: "CacheInvalidationBus" = None,
+    ) -> None:
+        """
+        :param shared: publica as invalidações para os outros workers pelo `bus`
+            (por padrão o `cache_bus` do processo).
+        """
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.__entries = _CountingTTLCache(maxsize=maxsize, ttl=ttl)
+        self.__lock = Lock()
+        self.__bus = (bus or cache_bus) if shared else None
+
+        if self.__bus is not None:
+            self.__bus.register(cache=self)
+
+    def __getitem__(self, key: Hashable) -> Any:
+        with self.__lock:
+            try:
+                value = self.__entries[key]
+
+            except KeyError:
+                self.misses += 1
+                raise
+
+            self.hits += 1
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self.__lock:
+            self.__entries[key] = value
+
+    def __delitem__(self, key: Hashable) -> None:
+        if not self.invalidate(key=key):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        with self.__lock:
+            return iter(list(self.__entries))
+
+    def __len__(self) -> int:
+        with self.__lock:
+            self.__entries.expire()
+            return len(self.__entries)
+
+    def __contains__(self, key: object) -> bool:
+        with self.__lock:
+            return key in self.__entries
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        # a invalidação é publicada mesmo sem a chave aqui: outro worker pode tê-la
+        value = self.__take(key=key)
+        self.__publish(key=key)
+
+        if value is _MISSING:
+            if default is _MISSING:
+                raise KeyError(key)
+
+            return default
+
+        return value
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def invalidate(self, key: Hashable = None) -> bool:
+        """
+        Remove `key` (ou tudo, sem `key`) aqui e nos outros workers.
+        Retorna se havia algo para remover neste worker.
+        """
+        removed = self.drop(key=key)
+        self.__publish(key=key)
+
+        return removed
+
+    def drop(self, key: Hashable = None) -> bool:
+        """Remove `key` (ou tudo) só deste worker, sem publicar."""
+        if key is not None:
+            return self.__take(key=key) is not _MISSING
+
+        with self.__lock:
+            removed = len(self.__entries) > 0
+            self.__entries.clear()
+
+            if removed:
+                self.invalidations += 1
+
+            return removed
+
+    def __take(self, key: Hashable) -> Any:
+        with self.__lock:
+            value = self.__entries.pop(key, _MISSING)
+
+            if value is not _MISSING:
+                self.invalidations += 1
+
+            return value
+
+    def reset_stats(self) -> None:
+        with self.__lock:
+            self.hits = self.misses = self.invalidations = 0
+            self.__entries.evictions = self.__entries.expirations = 0
+
+    def stats(self) -> CacheStats:
+        with self.__lock:
+            self.__entries.expire()
+
+            return CacheStats(
+                name=self.name,
+                size=len(self.__entries),
+                max_size=int(self.__entries.maxsize),
+                ttl_seconds=self.__entries.ttl,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.__entries.evictions,
+                expirations=self.__entries.expirations,
+                invalidations=self.invalidations,
+            )
+
+    def __publish(self, key: Hashable = None) -> None:
+        if self.__bus is not None:
+            self.__bus.publish(cache_name=self.name, key=key)
+
+
+class CacheInvalidationBus:
+    """
+    Propaga as invalidações dos `BoundedCache` entre workers por Redis pub/sub.
+    Sem Redis (`start` não chamado ou falhou) as invalidações ficam só locais.
+    """
+
+    RECONNECT_DELAY_SECONDS = 5
+
+    def __init__(self) -> None:
+        self.channel = f"{_env.ENVIRONMENT}:cache:invalidate"
+        self.worker_id = uuid4().hex
+        self.__caches: Dict[str, BoundedCache] = {}
+        self.__client = None
+        self.__listener: asyncio.Task | None = None
+        self.__pending: Set[asyncio.Task] = set()
+
+    def register(self, cache: BoundedCache) -> None:
+        self.__caches[cache.name] = cache
+
+    def caches(self) -> List[BoundedCache]:
+        return list(self.__caches.values())
+
+    async def start(self, client) -> None:
+        """Assina o canal de invalidação com um cliente `redis.asyncio`."""
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(self.channel)
+
+        self.__client = client
+        self.__listener = asyncio.create_task(self.__listen(pubsub=pubsub))
+
+    async def stop(self) -> None:
+        if self.__listener:
+            self.__listener.cancel()
+            await asyncio.gather(self.__listener, return_exceptions=True)
+
+        if self.__pending:
+            await asyncio.gather(*self.__pending, return_exceptions=True)
+
+        self.__client = None
+        self.__listener = None
+
+    def publish(self, cache_name: str, key: Hashable = None) -> None:
+        if self.__client is None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+
+        except RuntimeError:
+            # chamado fora do event loop (threadpool): fica só local
+            return
+
+        message = json.dumps({"origin": self.worker_id, "cache": cache_name, "key": key})
+        task = loop.create_task(self.__send(message=message))
+        self.__pending.add(task)
+        task.add_done_callback(self.__pending.discard)
+
+    def apply(self, message: str | bytes) -> bool:
+        """Aplica uma invalidação recebida; ignora as publicadas por este worker."""
+        payload = json.loads(message)
+
+        if payload.get("origin") == self.worker_id:
+            return False
+
+        cache = self.__caches.get(payload.get("cache"))
+
+        if cache is None:
+            return False
+
+        key = payload.get("key")
+        # chaves compostas (tuplas) chegam como listas no JSON
+        cache.drop(key=tuple(key) if isinstance(key, list) else key)
+
+        return True
+
+    async def __send(self, message: str) -> None:
+        try:
+            await self.__client.publish(self.channel, message)
+
+        except Exception as error:
+            _logger.error(f"Error publishing cache invalidation: {error}")
+
+    async def __listen(self, pubsub) -> None:
+        try:
+            while True:
+                try:
+                    async for message in pubsub.listen():
+                        if message.get("type") != "message":
+                            continue
+
+                        try:
+                            self.apply(message=message["data"])
+
+                        except Exception as error:
+                            _logger.error(f"Error applying cache invalidation: {error}")
+
+                except Exception as error:
+                    # o redis-py reconecta e refaz a inscrição no próximo `listen`
+                    _logger.error(f"Cache invalidation listener lost Redis: {error}")
+                    await asyncio.sleep(self.RECONNECT_DELAY_SECONDS)
+
+        except asyncio.CancelledError:
+            pass
+
+        finally:
+            try:
+                await pubsub.aclose()
+
+            except Exception:
+                pass
+
+
+cache_bus = CacheInvalidationBus()
+
+
+def cache_stats() -> List[CacheStats]:
+    return [cache.stats() for cache in cache_bus.caches()]
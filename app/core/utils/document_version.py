@@ -0,0 +1,18 @@
+import asyncio
+from typing import Awaitable
+
+
+async def combine_versions(
+    primary: Awaitable[str | None], *dependencies: Awaitable[str | None]
+) -> str | None:
+    """
+    Junta a versão dos documentos principais com a das expansões (ver
+    `Repository.select_documents_version`). Retorna `None` quando não há
+    documento principal, para a resposta seguir sem ETag.
+    """
+    versions = await asyncio.gather(primary, *dependencies)
+
+    if versions[0] is None:
+        return None
+
+    return "|".join(version or "-" for version in versions)
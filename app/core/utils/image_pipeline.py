@@ -0,0 +1,213 @@
+"""
+Processamento das imagens enviadas em `/files`.
+
+Cada upload é decodificado uma única vez, em um processo do pool (decodificar e
+redimensionar uma foto de 20 MP segura a CPU por centenas de milissegundos, o que
+travaria o event loop). Em JPEGs o decode já acontece na escala reduzida (`draft`)
+da maior variante, e todas as variantes saem dessa mesma imagem, codificadas em
+memória para irem direto ao bucket, sem arquivos temporários.
+
+O `content_hash` é o SHA-256 dos pixels da imagem normalizada (orientada, reduzida
+e em RGB), da qual todas as variantes derivam: duas imagens com o mesmo hash geram
+exatamente os mesmos arquivos, então o `FileServices` reaproveita o que já existe.
+"""
+
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import List, Tuple
+
+from PIL import Image, ImageFile, ImageOps, UnidentifiedImageError
+from pydantic import Field
+
+from app.core.configs import get_environment, get_logger
+from app.core.models.base_schema import GenericModel
+
+_env = get_environment()
+_logger = get_logger(__name__)
+
+MAX_FILE_SIZE_MB = 25
+ALLOWED_IMAGE_FORMATS = {"jpeg", "png", "jpg", "webp", "svg"}
+MAX_MEGA_PIXELS = 60
+
+
+class InvalidImageError(ValueError):
+    """Imagem recusada na validação; a mensagem vai para o cliente no 400."""
+
+
+class ImagePoolUnavailableError(RuntimeError):
+    """O pool de processos quebrou de novo logo após ser recriado (503)."""
+
+
+class ImageVariant(GenericModel):
+    name: str = Field(example="thumbnail")
+    width: int = Field(example=160)
+    height: int = Field(example=120)
+    format: str = Field(example="JPEG")
+    extension: str = Field(example="jpeg")
+    content_type: str = Field(example="image/jpeg")
+    quality: int = Field(default=85, example=85)
+
+
+class EncodedImage(GenericModel):
+    variant: str = Field(example="thumbnail")
+    extension: str = Field(example="jpeg")
+    content_type: str = Field(example="image/jpeg")
+    content: bytes
+
+
+class ProcessedImage(GenericModel):
+    content_hash: str = Field(example="9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08")
+    images: List[EncodedImage]
+
+
+# a primeira variante é a imagem principal do arquivo (`File.url`)
+IMAGE_VARIANTS: Tuple[ImageVariant, ...] = (
+    ImageVariant(name="catalog", width=640, height=480, format="JPEG", extension="jpeg", content_type="image/jpeg"),
+    ImageVariant(name="thumbnail", width=160, height=120, format="JPEG", extension="jpeg", content_type="image/jpeg", quality=80),
+    ImageVariant(name="webp", width=640, height=480, format="WEBP", extension="webp", content_type="image/webp", quality=80),
+)
+
+
+def validate_image_size(size_bytes: int) -> None:
+    if size_bytes / (1024 * 1024) > MAX_FILE_SIZE_MB:
+        raise InvalidImageError(f"File exceeds {MAX_FILE_SIZE_MB} MB limit")
+
+
+def process_image(
+    content: bytes, variants: Tuple[ImageVariant, ...] = IMAGE_VARIANTS
+) -> ProcessedImage:
+    """
+    Valida `content` e gera as `variants` a partir de uma única decodificação.
+    Roda no processo do pool; levanta `InvalidImageError` para imagens recusadas.
+    """
+    validate_image_size(size_bytes=len(content))
+    largest_side = max(max(variant.width, variant.height) for variant in variants)
+
+    ImageFile.LOAD_TRUNCATED_IMAGES = False
+
+    try:
+        with Image.open(BytesIO(content)) as image:
+            image_format = (image.format or "").lower()
+
+            if image_format not in ALLOWED_IMAGE_FORMATS:
+                raise InvalidImageError("Invalid image format")
+
+            # valida megapixels antes de decodificar para evitar explosão de memória
+            width, height = image.size
+            if (width * height) / 1_000_000 > MAX_MEGA_PIXELS:
+                raise InvalidImageError("Image too large (pixels)")
+
+            # decodifica (em JPEG já na escala do `draft`) e reduz até a maior
+            # variante; o quadrado vale para qualquer orientação do EXIF
+            image.thumbnail((largest_side, largest_side), reducing_gap=3.0)
+            image = ImageOps.exif_transpose(image)
+
+    except UnidentifiedImageError:
+        raise InvalidImageError("Invalid image format")
+
+    except OSError:
+        raise InvalidImageError("Invalid image file")
+
+    # Converte para RGB se necessário (evita canal alfa virar fundo preto)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+
+    return ProcessedImage(
+        content_hash=hash_image(image=image),
+        images=[encode_variant(image=image, variant=variant) for variant in variants],
+    )
+
+
+def hash_image(image: Image.Image) -> str:
+    content_hash = hashlib.sha256(f"{image.mode}:{image.width}x{image.height}:".encode())
+    content_hash.update(image.tobytes())
+
+    return content_hash.hexdigest()
+
+
+def encode_variant(image: Image.Image, variant: ImageVariant) -> EncodedImage:
+    size = (variant.width, variant.height)
+
+    # Redimensiona mantendo proporção e depois pad para tamanho exato
+    resized = ImageOps.contain(image, size)
+    resized = ImageOps.pad(resized, size, color="white")
+
+    save_options = {"quality": variant.quality}
+    if variant.format == "JPEG":
+        save_options["optimize"] = True
+
+    buffer = BytesIO()
+    resized.save(buffer, format=variant.format, **save_options)
+
+    return EncodedImage(
+        variant=variant.name,
+        extension=variant.extension,
+        content_type=variant.content_type,
+        content=buffer.getvalue(),
+    )
+
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def get_image_pool() -> ProcessPoolExecutor:
+    global _pool
+
+    if _pool is None:
+        # `spawn`: o processo da API tem threads (boto3, Mongo) que não sobrevivem a um fork
+        _pool = ProcessPoolExecutor(
+            max_workers=_env.IMAGE_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    return _pool
+
+
+def shutdown_image_pool() -> None:
+    global _pool
+
+    if _pool is not None:
+        _pool.shutdown(wait=True, cancel_futures=True)
+        _pool = None
+
+
+def discard_image_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Descarta um pool quebrado (um processo morreu, por exemplo pelo OOM killer):
+    um `ProcessPoolExecutor` quebrado recusa qualquer tarefa nova, então o
+    próximo `get_image_pool` cria outro.
+    """
+    global _pool
+
+    # outro upload pode já ter trocado o pool
+    if _pool is pool:
+        _pool = None
+
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def process_image_upload(
+    content: bytes, variants: Tuple[ImageVariant, ...] = IMAGE_VARIANTS
+) -> ProcessedImage:
+    """
+    `process_image` no pool de processos, sem bloquear o event loop. Se o pool
+    quebrar, ele é recriado e o upload é processado mais uma vez; se quebrar de
+    novo, levanta `ImagePoolUnavailableError`.
+    """
+    for attempt in range(2):
+        pool = get_image_pool()
+
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                pool, process_image, content, variants
+            )
+
+        except BrokenProcessPool as error:
+            _logger.error(f"Image process pool broken (attempt {attempt + 1}): {str(error)}")
+            discard_image_pool(pool=pool)
+
+    raise ImagePoolUnavailableError("Image processing is temporarily unavailable")
@@ -0,0 +1,58 @@
+"""
+Leitura enxuta das listagens: as linhas chegam do driver como `dict` e são
+validadas direto nos schemas, sem montar um `Document` do MongoEngine por linha.
+
+A página inteira é validada de uma vez por um `TypeAdapter(List[schema])`
+criado uma única vez por schema.
+"""
+
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple, Type, TypeVar
+
+from mongoengine import Document
+from pydantic import BaseModel, TypeAdapter
+
+Schema = TypeVar("Schema", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[Schema]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+@lru_cache(maxsize=None)
+def schema_projection(schema: Type[BaseModel]) -> Dict[str, int]:
+    """
+    Projeção com os campos do schema. Os schemas aceitam campos extras, então
+    sem ela campos internos (`search_tokens`, ...) iriam parar na resposta.
+    """
+    return {field: 1 for field in schema.model_fields if field != "id"}
+
+
+@lru_cache(maxsize=None)
+def _row_defaults(
+    document: Type[Document], schema: Type[BaseModel]
+) -> Tuple[Tuple[str, Any], ...]:
+    # o Document preenche os defaults dos campos que faltam no banco
+    # (documentos antigos); a leitura crua precisa fazer o mesmo
+    return tuple(
+        (name, field.default)
+        for name, field in document._fields.items()
+        if name in schema.model_fields and name != "id" and field.default is not None
+    )
+
+
+def validate_rows(
+    document: Type[Document], schema: Type[Schema], rows: List[dict]
+) -> List[Schema]:
+    defaults = _row_defaults(document, schema)
+
+    for row in rows:
+        if "_id" in row:
+            row["id"] = row.pop("_id")
+
+        for name, default in defaults:
+            if name not in row:
+                row[name] = default() if callable(default) else default
+
+    return list_adapter(schema).validate_python(rows)
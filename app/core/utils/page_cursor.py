@@ -0,0 +1,82 @@
+import base64
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.core.utils.utc_datetime import UTCDateTime
+
+
+class CursorDirection(str, Enum):
+    NEXT = "next"
+    PREVIOUS = "previous"
+
+
+class PageCursor(BaseModel):
+    """
+    Cursor opaco para paginação por keyset: guarda o valor do campo de ordenação
+    e o `_id` do último (ou primeiro) item da página.
+    """
+
+    sort_field: str = Field(example="order_date")
+    value: Any = Field(example="2024-01-01T00:00:00Z")
+    id: str = Field(example="ord_123")
+    direction: CursorDirection = Field(default=CursorDirection.NEXT)
+
+    def encode(self) -> str:
+        value_type = None
+        value = self.value
+
+        if isinstance(value, datetime):
+            value_type = "datetime"
+            value = UTCDateTime.validate_datetime(value).isoformat()
+
+        raw = json.dumps(
+            {
+                "f": self.sort_field,
+                "v": value,
+                "t": value_type,
+                "id": self.id,
+                "d": self.direction.value,
+            },
+            separators=(",", ":"),
+        )
+
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "PageCursor":
+        try:
+            padding = "=" * (-len(token) % 4)
+            raw = json.loads(base64.urlsafe_b64decode(token + padding))
+
+            value = raw["v"]
+
+            if raw.get("t") == "datetime":
+                value = UTCDateTime.validate_datetime(value)
+
+            return cls(
+                sort_field=raw["f"],
+                value=value,
+                id=raw["id"],
+                direction=raw.get("d", CursorDirection.NEXT.value),
+            )
+
+        except Exception as error:
+            raise ValueError("Invalid cursor") from error
+
+    @classmethod
+    def from_item(
+        cls, item: BaseModel, sort_field: str, direction: CursorDirection
+    ) -> "PageCursor | None":
+        value = getattr(item, sort_field, None)
+
+        if value is None or not getattr(item, "id", None):
+            return None
+
+        if isinstance(value, Enum):
+            value = value.value
+
+        return cls(sort_field=sort_field, value=value, id=item.id, direction=direction)
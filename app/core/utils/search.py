@@ -0,0 +1,25 @@
+import re
+import unicodedata
+from typing import List
+
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_search_text(value: str) -> str:
+    """
+    Texto da busca por nome: sem acentos, em minúsculas e com espaços simples
+    (`"  Pão de Queijo "` vira `"pao de queijo"`).
+    """
+    if not value:
+        return ""
+
+    normalized = unicodedata.normalize("NFKD", value)
+    without_accents = "".join(char for char in normalized if not unicodedata.combining(char))
+    words = _NON_WORD.sub(" ", without_accents.casefold()).split()
+
+    return " ".join(words)
+
+
+def build_search_tokens(value: str) -> List[str]:
+    """Palavras normalizadas de `value`, sem repetição e na ordem original."""
+    return list(dict.fromkeys(normalize_search_text(value).split()))
@@ -15,7 +15,12 @@ class AdditionalItemModel(BaseDocument):
     unit_cost = FloatField(required=True)
     consumption_factor = FloatField(required=True)
 
-    meta = {"collection": "additional_items"}
+    meta = {
+        "collection": "additional_items",
+        "indexes": [
+            ("organization_id", "updated_at"),
+        ],
+    }
 
     def update(self, **kwargs):
         self.base_update()
@@ -14,6 +14,8 @@ _logger = get_logger(__name__)
 
 
 class AdditionalItemRepository(Repository):
+    document = AdditionalItemModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -38,14 +40,15 @@ class AdditionalItemRepository(Repository):
 
     async def update(self, item: AdditionalItemInDB) -> AdditionalItemInDB:
         try:
-            model: AdditionalItemModel = AdditionalItemModel.objects(
-                id=item.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            model = AdditionalItemModel(id=item.id)
             data = item.model_dump()
             for field in ["id", "organization_id", "created_at", "_id"]:
                 data.pop(field, None)
-            model.update(**data)
-            return await self.select_by_id(id=item.id)
+            if not model.update(
+                query={"is_active": True, "organization_id": self.organization_id}, **data
+            ):
+                raise NotFoundError(message="Additional item not found")
+            return self._to_schema(model)
         except ValidationError:
             raise NotFoundError(message="Additional item not found")
         except Exception as error:
@@ -64,6 +67,22 @@ class AdditionalItemRepository(Repository):
             if raise_404:
                 raise NotFoundError(message=f"AdditionalItem #{id} not found")
 
+    async def select_by_ids(self, ids: List[str]) -> List[AdditionalItemInDB]:
+        try:
+            results = []
+            objects = AdditionalItemModel.objects(
+                id__in=ids, is_active=True, organization_id=self.organization_id
+            )
+
+            for model in objects:
+                results.append(self._to_schema(model))
+
+            return results
+
+        except Exception as error:
+            _logger.error(f"Error on select_by_ids: {error}")
+            raise NotFoundError(message="Additional items not found")
+
     async def select_all(self, additional_id: str) -> List[AdditionalItemInDB]:
         try:
             results = []
@@ -1,4 +1,4 @@
-from typing import Dict
+from typing import MutableMapping
 
 from app.api.shared_schemas.terms_of_use import FilterTermOfUse
 from app.api.shared_schemas.token import TokenData
@@ -17,7 +17,7 @@ class AuthenticationServices:
             user_repository: UserRepository,
             organization_repository: OrganizationRepository,
             terms_of_use_services: TermOfUseServices,
-            cached_complete_users: Dict[str, CompleteUserInDB]
+            cached_complete_users: MutableMapping[str, CompleteUserInDB]
         ) -> None:
         self.__user_repository = user_repository
         self.__organization_repository = organization_repository
@@ -0,0 +1,126 @@
+"""
+Implementação em Python dos relatórios de faturamento.
+
+O BillingServices calcula os relatórios com agregações no MongoDB; estas
+funções mantêm o cálculo original, percorrendo os pedidos em memória, e servem
+de referência para os testes de equivalência e para o benchmark.
+"""
+
+from typing import Dict, List
+
+from app.builder.order_calculator import OrderCalculator
+from app.crud.expenses.schemas import ExpenseInDB
+from app.crud.orders.schemas import OrderInDB
+from app.crud.shared_schemas.payment import PaymentMethod
+
+from .schemas import Billing, DailySale, ProductProfit, SellingProduct
+
+
+def monthly_billing(
+    month: int, year: int, orders: List[OrderInDB], expenses: List[ExpenseInDB]
+) -> Billing:
+    billing = Billing(month=month, year=year)
+
+    for order in orders:
+        billing.total_amount += order.total_amount
+        billing.payment_received += order.payment_summary.total_paid
+
+        for method, amount in order.payment_summary.methods.items():
+            if method == PaymentMethod.CASH:
+                billing.cash_received += amount
+
+            elif method == PaymentMethod.PIX:
+                billing.pix_received += amount
+
+            elif method == PaymentMethod.CREDIT_CARD:
+                billing.credit_card_received += amount
+
+            elif method == PaymentMethod.DEBIT_CARD:
+                billing.debit_card_received += amount
+
+            elif method == PaymentMethod.ZELLE:
+                billing.zelle_received += amount
+
+        if order.payment_summary.total_paid < order.total_amount:
+            billing.pending_payments += round(
+                (order.total_amount - order.payment_summary.total_paid), 2
+            )
+
+    for expense in expenses:
+        billing.total_expanses += expense.total_paid
+
+    billing.round_numbers()
+
+    return billing
+
+
+def best_selling_products(orders: List[OrderInDB], limit: int = 5) -> List[SellingProduct]:
+    selling_products: Dict[str, SellingProduct] = {}
+
+    for order in orders:
+        for order_product in order.products:
+            if order_product.product_id not in selling_products:
+                selling_products[order_product.product_id] = SellingProduct(
+                    product_id=order_product.product_id,
+                    product_name=order_product.name,
+                )
+
+            product_category = selling_products[order_product.product_id]
+            product_category.quantity += 1
+
+    selling_products = list(selling_products.values())
+
+    selling_products.sort(key=lambda c: c.quantity, reverse=True)
+
+    return selling_products[:limit]
+
+
+async def products_profit(
+    orders: List[OrderInDB], order_calculator: OrderCalculator, limit: int = 10
+) -> List[ProductProfit]:
+    products_profiting: Dict[str, ProductProfit] = {}
+
+    for order in orders:
+        products = await order_calculator.get_totals_per_product(order=order)
+
+        for product in products.values():
+            if product["product_id"] not in products_profiting:
+                products_profiting[product["product_id"]] = ProductProfit(
+                    product_id=product["product_id"], product_name=product["name"]
+                )
+
+            product_profit = products_profiting[product["product_id"]]
+
+            product_profit.total_amount += product["total_amount"]
+            product_profit.total_profit += product["total_amount"] - product["total_cost"]
+            product_profit.quantity += product["quantity"]
+
+    products_profiting = list(products_profiting.values())
+
+    products_profiting.sort(key=lambda c: c.total_profit, reverse=True)
+
+    return products_profiting[:limit]
+
+
+async def daily_sales(
+    orders: List[OrderInDB], last_day: int, order_calculator: OrderCalculator
+) -> List[DailySale]:
+    sales: Dict[int, DailySale] = {}
+
+    for i in range(1, last_day + 1):
+        sales[i] = DailySale(day=i)
+
+    for order in orders:
+        total = await order_calculator.calculate(
+            delivery_value=0,
+            additional=order.additional,
+            discount=order.discount,
+            products=order.products,
+        )
+        sales[order.order_date.day].total_amount += total
+
+    sales = list(sales.values())
+
+    sales.sort(key=lambda c: c.day)
+
+    return sales
@@ -1,19 +1,14 @@
-import json
 from datetime import timedelta
 from typing import Dict, List, Tuple
 
 from app.api.dependencies.get_plan_feature import get_plan_feature
-from app.api.dependencies.redis_manager import RedisManager
 from app.api.exceptions.authentication_exceptions import UnauthorizedException
-from app.builder.order_calculator import OrderCalculator
 from app.core.utils.features import Feature
 from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.billing_rollups import BillingRollupRepository
 from app.crud.expenses.services import ExpenseServices
 from app.crud.fast_orders.services import FastOrderServices
-from app.crud.orders.schemas import PaymentInOrder
 from app.crud.orders.services import OrderServices
-from app.crud.products.repositories import ProductRepository
-from app.crud.shared_schemas.payment import PaymentMethod
 
 from .schemas import Billing, DailySale, ExpanseCategory, ProductProfit, SellingProduct
 
@@ -22,16 +17,15 @@ class BillingServices:
 
     def __init__(
         self,
-        product_repository: ProductRepository,
         order_services: OrderServices,
         fast_order_services: FastOrderServices,
         expenses_services: ExpenseServices,
+        billing_rollup_repository: BillingRollupRepository,
     ) -> None:
         self.order_services = order_services
         self.fast_order_services = fast_order_services
         self.expenses_services = expenses_services
-        self.redis_manager = RedisManager()
-        self.order_calculator = OrderCalculator(product_repository=product_repository)
+        self.billing_rollup_repository = billing_rollup_repository
 
     async def get_billing_for_dashboard(self, month: int, year: int) -> Billing:
         await self.__verify_plan_feature()
@@ -60,71 +54,33 @@ class BillingServices:
 
         start_date, end_date = self.__get_start_and_end_date(month=month, year=year)
 
-        orders = await self.order_services.search_all_without_filters(
+        rows = await self.order_services.search_best_selling_products(
             start_date=start_date,
             end_date=end_date,
+            limit=5,
         )
 
-        selling_products: Dict[str, SellingProduct] = {}
-
-        for order in orders:
-            for order_product in order.products:
-                if order_product.product_id not in selling_products:
-                    selling_products[order_product.product_id] = SellingProduct(
-                        product_id=order_product.product_id,
-                        product_name=order_product.name,
-                    )
-
-                product_category = selling_products[order_product.product_id]
-                product_category.quantity += 1
-
-        selling_products = list(selling_products.values())
-
-        selling_products.sort(key=lambda c: c.quantity, reverse=True)
-
-        return selling_products[:5]
+        return [SellingProduct(**row) for row in rows]
 
     async def get_products_profit(self, month: int, year: int) -> List[ProductProfit]:
         await self.__verify_plan_feature()
 
         start_date, end_date = self.__get_start_and_end_date(month=month, year=year)
 
-        orders = await self.order_services.search_all_without_filters(
+        rows = await self.order_services.search_products_profit(
             start_date=start_date,
             end_date=end_date,
+            limit=10,
         )
 
-        products_profiting: Dict[str, ProductProfit] = {}
-
-        for order in orders:
-            products = await self.order_calculator.get_totals_per_product(order=order)
-
-            for product in products.values():
-                if product["product_id"] not in products_profiting:
-                    products_profiting[product["product_id"]] = ProductProfit(
-                        product_id=product["product_id"], product_name=product["name"]
-                    )
-
-                product_profit = products_profiting[product["product_id"]]
-
-                product_profit.total_amount += product["total_amount"]
-                product_profit.total_profit += (
-                    product["total_amount"] - product["total_cost"]
-                )
-                product_profit.quantity += product["quantity"]
-
-        products_profiting = list(products_profiting.values())
-
-        products_profiting.sort(key=lambda c: c.total_profit, reverse=True)
-
-        return products_profiting[:10]
+        return [ProductProfit(**row) for row in rows]
 
     async def get_daily_sales(self, month: int, year: int) -> List[DailySale]:
         await self.__verify_plan_feature()
 
         start_date, end_date = self.__get_start_and_end_date(month=month, year=year)
 
-        orders = await self.order_services.search_all_without_filters(
+        rows = await self.order_services.search_daily_sales(
             start_date=start_date,
             end_date=end_date,
         )
@@ -134,20 +90,10 @@ class BillingServices:
         for i in range(1, end_date.day + 1):
             daily_sales[i] = DailySale(day=i)
 
-        for order in orders:
-            total = await self.order_calculator.calculate(
-                delivery_value=0,
-                additional=order.additional,
-                discount=order.discount,
-                products=order.products,
-            )
-            daily_sales[order.order_date.day].total_amount += total
-
-        daily_sales = list(daily_sales.values())
-
-        daily_sales.sort(key=lambda c: c.day)
+        for row in rows:
+            daily_sales[row["day"]].total_amount = round(row["total_amount"], 2)
 
-        return daily_sales
+        return list(daily_sales.values())
 
     async def get_expanses_categories(
         self, month: int, year: int
@@ -201,79 +147,49 @@ class BillingServices:
         return year, month
 
     async def __generate_monthly_billing(self, month: int, year: int) -> Billing:
-        start_date, end_date = self.__get_start_and_end_date(month=month, year=year)
-
-        key = f"billing:{self.order_services.organization_id}:month:{month}:year:{year}"
-
-        cached_billing = self.redis_manager.get_value(key=key)
-
-        if cached_billing:
-            cached_billing = json.loads(cached_billing)
-
-            return Billing(**cached_billing)
-
-        orders = await self.order_services.search_all_without_filters(
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        expenses = await self.expenses_services.search_all(
-            start_date=start_date, end_date=end_date, query=None, expand=[]
+        rollup = await self.billing_rollup_repository.select_by_period(
+            month=month, year=year
         )
 
-        billing = Billing(month=month, year=year)
-
-        for order in orders:
-            billing.total_amount += order.total_amount
-            total_paid = 0
-
-            self.__process_payments(
-                billing=billing,
-                payments=order.payments,
-                total_paid=total_paid,
-                total_amount=order.total_amount,
-            )
-
-        for expense in expenses:
-            billing.total_expanses += expense.total_paid
+        if rollup is None:
+            return await self.rebuild_monthly_billing(month=month, year=year)
 
+        billing = Billing(month=month, year=year, **rollup)
         billing.round_numbers()
 
-        self.redis_manager.set_value(
-            key=key, value=billing.model_dump_json(), expiration=1800
-        )
-
         return billing
 
-    def __process_payments(
-        self,
-        billing: Billing,
-        payments: List[PaymentInOrder],
-        total_paid: float,
-        total_amount: float,
-    ) -> None:
-
-        for payment in payments:
-            total_paid += payment.amount
-            billing.payment_received += payment.amount
-
-            if payment.method == PaymentMethod.CASH:
-                billing.cash_received += payment.amount
+    async def rebuild_monthly_billing(self, month: int, year: int) -> Billing:
+        """
+        Recalcula o mês a partir dos pedidos e despesas e grava o rollup
+        (veja `BillingRollupRepository.rebuild`). Depois disso o mês é mantido
+        pelos `$inc` das escritas.
+        """
+        start_date = UTCDateTime(year, month, 1)
+        end_date = UTCDateTime(year + month // 12, month % 12 + 1, 1)
 
-            elif payment.method == PaymentMethod.PIX:
-                billing.pix_received += payment.amount
+        async def build_values() -> dict:
+            summary = await self.order_services.search_billing_summary(
+                start_date=start_date,
+                end_date=end_date,
+            )
 
-            elif payment.method == PaymentMethod.CREDIT_CARD:
-                billing.credit_card_received += payment.amount
+            total_expanses = await self.expenses_services.search_total_paid(
+                start_date=start_date, end_date=end_date
+            )
 
-            elif payment.method == PaymentMethod.DEBIT_CARD:
-                billing.debit_card_received += payment.amount
+            return Billing(
+                month=month, year=year, total_expanses=total_expanses, **summary
+            ).model_dump()
 
-            elif payment.method == PaymentMethod.ZELLE:
-                billing.zelle_received += payment.amount
+        billing = Billing(
+            **await self.billing_rollup_repository.rebuild(
+                month=month, year=year, build_values=build_values
+            )
+        )
+        billing.round_numbers()
 
-        if total_paid < total_amount:
-            billing.pending_payments += round((total_amount - total_paid), 2)
+        return billing
 
     def __get_start_and_end_date(
         self, month: int, year: int
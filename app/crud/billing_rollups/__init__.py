@@ -0,0 +1,2 @@
+from .repositories import BillingRollupRepository
+from .schemas import BillingContribution
@@ -0,0 +1,27 @@
+from mongoengine import DateTimeField, FloatField, IntField, StringField
+
+from app.core.models.base_document import BaseDocument
+
+
+class BillingRollupModel(BaseDocument):
+    organization_id = StringField(required=True)
+    month = IntField(required=True, min_value=1, max_value=12)
+    year = IntField(required=True)
+    total_amount = FloatField(default=0)
+    total_expanses = FloatField(default=0)
+    payment_received = FloatField(default=0)
+    cash_received = FloatField(default=0)
+    pix_received = FloatField(default=0)
+    credit_card_received = FloatField(default=0)
+    debit_card_received = FloatField(default=0)
+    zelle_received = FloatField(default=0)
+    pending_payments = FloatField(default=0)
+    built_at = DateTimeField(required=False)
+    revision = IntField(default=0)  # somado a cada `$inc`: o rebuild só grava se não mudou
+
+    meta = {
+        "collection": "billing_rollups",
+        "indexes": [
+            {"fields": ("organization_id", "year", "month"), "unique": True},
+        ],
+    }
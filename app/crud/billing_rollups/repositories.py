@@ -0,0 +1,219 @@
+from typing import Awaitable, Callable, Dict, Iterable, List, Tuple
+
+from pymongo.errors import DuplicateKeyError
+
+from app.api.dependencies.cache_tags import invalidate_billing_periods
+from app.core.configs import get_logger
+from app.core.models.base_document import generate_prefixed_id
+from app.core.repositories.base_repository import Repository
+from app.core.utils.utc_datetime import UTCDateTime
+
+from .models import BillingRollupModel
+from .schemas import ROLLUP_FIELDS, BillingContribution
+
+_logger = get_logger(__name__)
+
+# recálculos de um mês que recebe `$inc` enquanto é recalculado
+REBUILD_ATTEMPTS = 3
+
+
+class BillingRollupRepository(Repository):
+    """
+    Faturamento mensal por organização mantido com `$inc` a cada escrita de
+    pedido, pagamento ou despesa, para o dashboard ler um único documento.
+    Cada escrita também invalida os valores em cache dos meses que ela altera.
+
+    Todo `$inc` soma 1 no `revision` do mês; `rebuild` só grava o mês
+    recalculado se o `revision` não mudou desde antes do recálculo. Um `$inc`
+    que falha tira o mês de `built_at`, e a próxima leitura o recalcula.
+    """
+
+    def __init__(self, organization_id: str) -> None:
+        super().__init__()
+        self.organization_id = organization_id
+
+    async def apply(
+        self,
+        before: BillingContribution | None = None,
+        after: BillingContribution | None = None,
+    ) -> None:
+        """
+        Aplica a diferença entre a contribuição antiga e a nova. Quando a data
+        muda de mês, remove do mês antigo e soma no novo.
+        """
+        await self.__apply(contributions=((before, -1), (after, 1)))
+
+    async def apply_many(self, contributions: List[BillingContribution]) -> None:
+        """Soma várias contribuições novas com um único `$inc` por mês."""
+        await self.__apply(contributions=[(contribution, 1) for contribution in contributions])
+
+    async def select_by_period(self, month: int, year: int) -> dict | None:
+        rollup = await self.find_one(
+            document=BillingRollupModel,
+            query={
+                "organization_id": self.organization_id,
+                "year": year,
+                "month": month,
+                "built_at": {"$ne": None},
+            },
+        )
+
+        if not rollup:
+            return None
+
+        return {field: rollup.get(field, 0) for field in ROLLUP_FIELDS}
+
+    async def rebuild(
+        self, month: int, year: int, build_values: Callable[[], Awaitable[dict]]
+    ) -> dict:
+        """
+        Recalcula o mês com `build_values` (a partir dos pedidos e despesas) e o
+        grava com `save`, condicionado ao `revision` lido antes do recálculo. Se
+        um `$inc` chegou no meio, o valor recalculado pode ter perdido ou contado
+        duas vezes aquela escrita, então o mês é recalculado de novo.
+        """
+        for _ in range(REBUILD_ATTEMPTS):
+            revision = await self.__select_revision(month=month, year=year)
+            values = await build_values()
+
+            if await self.save(month=month, year=year, values=values, revision=revision):
+                return values
+
+        _logger.warning(
+            f"Billing rollup {month:02d}/{year} of {self.organization_id} changed during every rebuild"
+        )
+        return values
+
+    async def save(
+        self, month: int, year: int, values: dict, revision: int | None = None
+    ) -> bool:
+        """
+        Grava o mês inteiro recalculado e o marca como pronto para leitura. Com
+        `revision`, só grava se o rollup ainda estiver nele; retorna se gravou.
+        """
+        now = UTCDateTime.now()
+        query = {"organization_id": self.organization_id, "year": year, "month": month}
+        insert_fields = self.__insert_fields(now=now)
+
+        if revision is not None:
+            # rollups antigos não têm o campo; `$in` não o copia para o upsert
+            query["revision"] = {"$in": [revision] if revision else [0, None]}
+            insert_fields["revision"] = revision
+
+        try:
+            return bool(
+                await self.update_one(
+                    document=BillingRollupModel,
+                    query=query,
+                    update={
+                        "$set": {
+                            **{field: values.get(field, 0) for field in ROLLUP_FIELDS},
+                            "built_at": now,
+                            "updated_at": now,
+                        },
+                        "$setOnInsert": insert_fields,
+                    },
+                    upsert=True,
+                )
+            )
+
+        except DuplicateKeyError:
+            # o mês existe em outro `revision` (ou foi criado agora por outra escrita)
+            return False
+
+    async def select_periods(self) -> List[tuple]:
+        rollups = await self.find(
+            document=BillingRollupModel,
+            query={"organization_id": self.organization_id},
+            projection={"year": 1, "month": 1},
+        )
+        return [(rollup["year"], rollup["month"]) for rollup in rollups]
+
+    async def __apply(
+        self, contributions: Iterable[Tuple[BillingContribution | None, int]]
+    ) -> None:
+        deltas: Dict[tuple, Dict[str, float]] = {}
+
+        for contribution, signal in contributions:
+            if contribution is None:
+                continue
+
+            period = deltas.setdefault((contribution.year, contribution.month), {})
+
+            for field, value in contribution.values.items():
+                period[field] = period.get(field, 0) + signal * value
+
+        for (year, month), values in deltas.items():
+            values = {field: value for field, value in values.items() if value}
+
+            if not values:
+                continue
+
+            try:
+                await self.__increment(month=month, year=year, values=values)
+
+            except Exception as error:
+                # O rollup pode ser reconstruído, então não derruba a escrita principal
+                _logger.error(f"Error on apply billing rollup: {str(error)}")
+                await self.__mark_for_rebuild(month=month, year=year)
+
+        try:
+            if deltas:
+                await invalidate_billing_periods(
+                    organization_id=self.organization_id, periods=deltas.keys()
+                )
+
+        except Exception as error:
+            _logger.error(f"Error on invalidate billing periods: {str(error)}")
+
+    async def __increment(self, month: int, year: int, values: Dict[str, float]) -> None:
+        now = UTCDateTime.now()
+        query = {"organization_id": self.organization_id, "year": year, "month": month}
+        update = {
+            "$inc": {**values, "revision": 1},
+            "$set": {"updated_at": now},
+            "$setOnInsert": self.__insert_fields(now=now),
+        }
+
+        try:
+            await self.update_one(
+                document=BillingRollupModel, query=query, update=update, upsert=True
+            )
+
+        except DuplicateKeyError:
+            # outra escrita criou o mês ao mesmo tempo: agora o `$inc` casa com ele
+            await self.update_one(document=BillingRollupModel, query=query, update=update)
+
+    async def __mark_for_rebuild(self, month: int, year: int) -> None:
+        """
+        Tira o mês de leitura depois de um `$inc` perdido. Somar no `revision`
+        também faz um `rebuild` em andamento descartar o seu recálculo.
+        """
+        try:
+            await self.update_one(
+                document=BillingRollupModel,
+                query={"organization_id": self.organization_id, "year": year, "month": month},
+                update={
+                    "$set": {"built_at": None, "updated_at": UTCDateTime.now()},
+                    "$inc": {"revision": 1},
+                },
+            )
+
+        except Exception as error:
+            _logger.error(f"Error on mark billing rollup for rebuild: {str(error)}")
+
+    async def __select_revision(self, month: int, year: int) -> int:
+        rollup = await self.find_one(
+            document=BillingRollupModel,
+            query={"organization_id": self.organization_id, "year": year, "month": month},
+            projection={"revision": 1},
+        )
+
+        return (rollup or {}).get("revision") or 0
+
+    def __insert_fields(self, now: UTCDateTime) -> dict:
+        return {
+            "_id": generate_prefixed_id("bil"),
+            "is_active": True,
+            "created_at": now,
+        }
@@ -0,0 +1,63 @@
+from typing import Dict
+
+from pydantic import BaseModel, Field
+
+from app.core.models.base_schema import GenericModel
+from app.crud.shared_schemas.payment import PaymentMethod
+
+ROLLUP_FIELDS = [
+    "total_amount",
+    "total_expanses",
+    "payment_received",
+    "cash_received",
+    "pix_received",
+    "credit_card_received",
+    "debit_card_received",
+    "zelle_received",
+    "pending_payments",
+]
+
+
+class BillingContribution(GenericModel):
+    """
+    Quanto um pedido ou uma despesa soma no faturamento do seu mês.
+    A diferença entre o antes e o depois de uma escrita vira o `$inc` do rollup.
+    """
+
+    month: int = Field(example=1, gt=0, lt=13)
+    year: int = Field(example=2024)
+    values: Dict[str, float] = Field(default={})
+
+    @classmethod
+    def from_order(cls, order) -> "BillingContribution":
+        """Aceita tanto o `OrderModel` quanto o `OrderInDB`/`FastOrderInDB`."""
+        payment_summary = order.payment_summary or {}
+        total_amount = order.total_amount
+
+        if isinstance(payment_summary, BaseModel):
+            payment_summary = payment_summary.model_dump(mode="json")
+
+        total_paid = payment_summary.get("total_paid", 0)
+
+        values = {
+            "total_amount": total_amount,
+            "payment_received": total_paid,
+            "pending_payments": (
+                round(total_amount - total_paid, 2) if total_paid < total_amount else 0
+            ),
+        }
+
+        for method, amount in payment_summary.get("methods", {}).items():
+            field = f"{PaymentMethod(method).value.lower()}_received"
+            values[field] = values.get(field, 0) + amount
+
+        return cls(month=order.order_date.month, year=order.order_date.year, values=values)
+
+    @classmethod
+    def from_expense(cls, expense) -> "BillingContribution":
+        """Aceita tanto o `ExpenseModel` quanto o `ExpenseInDB`."""
+        return cls(
+            month=expense.expense_date.month,
+            year=expense.expense_date.year,
+            values={"total_expanses": expense.total_paid},
+        )
@@ -24,7 +24,7 @@ class CouponRepository(Repository):
 
             coupon_model.save()
 
-            return await self.select_by_id(id=coupon_model.id)
+            return CouponInDB.model_validate(coupon_model)
 
         except NotUniqueError:
             _logger.warning(f"Coupon with name {coupon.name} is not unique")
@@ -36,15 +36,13 @@ class CouponRepository(Repository):
 
     async def update(self, coupon: CouponInDB) -> CouponInDB:
         try:
-            coupon_model: CouponModel = CouponModel.objects(
-                id=coupon.id,
-                is_active=True,
-            ).first()
+            coupon_model = CouponModel(id=coupon.id)
             coupon.name = coupon.name.upper()
 
-            coupon_model.update(**coupon.model_dump())
+            if not coupon_model.update(query={"is_active": True}, **coupon.model_dump()):
+                raise NotFoundError(message=f"Coupon #{coupon.id} not found")
 
-            return await self.select_by_id(id=coupon.id)
+            return CouponInDB.model_validate(coupon_model)
 
         except Exception as error:
             _logger.error(f"Error on update_coupon: {str(error)}")
@@ -67,7 +65,7 @@ class CouponRepository(Repository):
 
                 coupon_model.save()
 
-                return await self.select_by_id(id=coupon_id)
+                return CouponInDB.model_validate(coupon_model)
 
             else:
                 raise UnprocessableEntity(message="Coupon usage limit exceeded")
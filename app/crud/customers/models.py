@@ -1,10 +1,10 @@
 from mongoengine import StringField, ListField, DictField, DateTimeField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.searchable_document import SearchableDocument
 from app.core.utils.utc_datetime import UTCDateTime
 
 
-class CustomerModel(BaseDocument):
+class CustomerModel(SearchableDocument):
     organization_id = StringField(required=True)
     name = StringField(max_length=100, required=True)
     international_code = StringField(required=False, default=None)
@@ -17,7 +17,15 @@ class CustomerModel(BaseDocument):
     date_of_birth = DateTimeField(required=False)
 
     meta = {
-        "collection": "customers"
+        "collection": "customers",
+        "indexes": [
+            # `id` desempata a ordenação por nome (paginação por página e por cursor)
+            ("organization_id", "is_active", "name", "id"),
+            # filtro `query` (prefixo das palavras do nome normalizado)
+            ("organization_id", "is_active", "search_tokens"),
+            ("organization_id", "is_active", "international_code", "ddd", "phone_number"),
+            ("organization_id", "is_active", "email"),
+        ],
     }
 
     def update(self, **kwargs):
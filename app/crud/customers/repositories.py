@@ -3,6 +3,8 @@ from mongoengine.errors import NotUniqueError
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
+from app.core.repositories.entity_cache import customer_cache
+from app.core.utils.page_cursor import PageCursor
 from app.core.utils.utc_datetime import UTCDateTime
 
 from .models import CustomerModel
@@ -82,14 +84,20 @@ class CustomerRepository(Repository):
                 )
 
         try:
-            customer_model: CustomerModel = CustomerModel.objects(
-                id=customer.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            customer_model = CustomerModel(id=customer.id)
             customer.name = customer.name.strip().title()
 
-            customer_model.update(**customer.model_dump())
+            if not customer_model.update(
+                query={"is_active": True, "organization_id": self.organization_id},
+                **customer.model_dump(),
+            ):
+                raise NotFoundError(
+                    message=f"Cliente com o ID #{customer.id} não foi encontrado"
+                )
+
+            customer_cache.invalidate(organization_id=self.organization_id, id=customer.id)
 
-            return await self.select_by_id(id=customer.id)
+            return CustomerInDB.model_validate(customer_model)
 
         except Exception as error:
             _logger.error(f"Error on update_customer: {str(error)}")
@@ -103,7 +111,7 @@ class CustomerRepository(Repository):
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if tags:
                 objects = objects.filter(tags__in=tags)
@@ -115,13 +123,21 @@ class CustomerRepository(Repository):
             return 0
 
     async def select_by_id(self, id: str, raise_404: bool = True) -> CustomerInDB:
+        customer_in_db = customer_cache.get(organization_id=self.organization_id, id=id)
+
+        if customer_in_db:
+            return customer_in_db
+
         try:
             customer_model: CustomerModel = CustomerModel.objects(
                 id=id, is_active=True, organization_id=self.organization_id
             ).first()
 
             if customer_model:
-                return CustomerInDB.model_validate(customer_model)
+                customer_in_db = CustomerInDB.model_validate(customer_model)
+                customer_cache.set(organization_id=self.organization_id, entity=customer_in_db)
+
+                return customer_in_db
 
             elif raise_404:
                 raise NotFoundError(
@@ -137,18 +153,24 @@ class CustomerRepository(Repository):
             _logger.error(f"Error on select_by_id: {str(error)}")
 
     async def select_by_ids(self, ids: List[str]) -> List[CustomerInDB]:
+        customers, missing_ids = customer_cache.get_many(
+            organization_id=self.organization_id, ids=ids
+        )
+
+        if not missing_ids:
+            return customers
+
         try:
-            customers: List[CustomerInDB] = []
             objects = CustomerModel.objects(
-                id__in=ids,
+                id__in=missing_ids,
                 is_active=True,
                 organization_id=self.organization_id,
             )
 
-            for customer_model in objects:
-                customers.append(CustomerInDB.model_validate(customer_model))
+            loaded = await self.select_lean(objects=objects, schema=CustomerInDB)
+            customer_cache.set_many(organization_id=self.organization_id, entities=loaded)
 
-            return customers
+            return customers + loaded
 
         except Exception as error:
             _logger.error(f"Error on select_by_ids: {str(error)}")
@@ -232,28 +254,49 @@ class CustomerRepository(Repository):
             raise NotFoundError(message=f"Cliente com o nome {name} não foi encontrado")
 
     async def select_all(
-        self, query: str, tags: List[str] = [], page: int = None, page_size: int = None
+        self,
+        query: str,
+        tags: List[str] = [],
+        page: int = None,
+        page_size: int = None,
+        cursor: PageCursor = None,
     ) -> List[CustomerInDB]:
         try:
-            customers = []
-
             objects = CustomerModel.objects(
                 is_active=True, organization_id=self.organization_id
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if tags:
                 objects = objects.filter(tags__in=tags)
 
-            skip = (page - 1) * page_size
-            objects = objects.order_by("name").skip(skip).limit(page_size)
+            if cursor:
+                objects = self.apply_page_cursor(
+                    objects=objects,
+                    cursor=cursor,
+                    sort_field="name",
+                    descending=False,
+                    page_size=page_size,
+                )
 
-            for customer_model in objects:
-                customers.append(CustomerInDB.model_validate(customer_model))
+            elif query:
+                return await self.select_ranked_lean(
+                    objects=objects,
+                    schema=CustomerInDB,
+                    query=query,
+                    page=page,
+                    page_size=page_size,
+                )
 
-            return customers
+            else:
+                skip = (page - 1) * page_size
+                objects = objects.order_by("name", "id").skip(skip).limit(page_size)
+
+            customers = await self.select_lean(objects=objects, schema=CustomerInDB)
+
+            return self.sort_page_rows(rows=customers, cursor=cursor)
 
         except Exception as error:
             _logger.error(f"Error on select_all: {str(error)}")
@@ -267,6 +310,7 @@ class CustomerRepository(Repository):
 
             if customer_model:
                 customer_model.delete()
+                customer_cache.invalidate(organization_id=self.organization_id, id=id)
 
                 return CustomerInDB.model_validate(customer_model)
 
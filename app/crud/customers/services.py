@@ -3,6 +3,7 @@ from typing import List
 from app.api.dependencies.get_plan_feature import get_plan_feature
 from app.api.exceptions.authentication_exceptions import UnauthorizedException
 from app.core.utils.features import Feature
+from app.core.utils.page_cursor import PageCursor
 from app.crud.tags.repositories import TagRepository
 
 from .repositories import CustomerRepository
@@ -84,13 +85,15 @@ class CustomerServices:
         tags: List[str] = [],
         expand: List[str] = [],
         page: int = None,
-        page_size: int = None
+        page_size: int = None,
+        cursor: PageCursor = None,
     ) -> List[CompleteCustomerInDB]:
         customers = await self.__repository.select_all(
             query=query,
             tags=tags,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
         )
         all_customers = []
 
@@ -1,10 +1,10 @@
 from mongoengine import StringField, DateTimeField, FloatField, ListField, DictField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.searchable_document import SearchableDocument
 from app.core.utils.utc_datetime import UTCDateTime
 
 
-class ExpenseModel(BaseDocument):
+class ExpenseModel(SearchableDocument):
     organization_id = StringField(required=True)
     name = StringField(max_length=120, required=True)
     expense_date = DateTimeField(required=True)
@@ -13,7 +13,14 @@ class ExpenseModel(BaseDocument):
     tags = ListField(StringField(), required=False)
 
     meta = {
-        "collection": "expenses"
+        "collection": "expenses",
+        "indexes": [
+            ("organization_id", "is_active", "-expense_date"),
+            # select_count_by_date (limite do plano)
+            ("organization_id", "is_active", "created_at"),
+            # filtro `query` (prefixo das palavras do nome normalizado)
+            ("organization_id", "is_active", "search_tokens"),
+        ],
     }
 
     def update(self, **kwargs):
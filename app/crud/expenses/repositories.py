@@ -4,7 +4,9 @@ from typing import List
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
+from app.core.utils.page_cursor import PageCursor
 from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.billing_rollups import BillingContribution, BillingRollupRepository
 
 from .models import ExpenseModel
 from .schemas import Expense, ExpenseInDB
@@ -16,6 +18,7 @@ class ExpenseRepository(Repository):
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
+        self.__billing_rollups = BillingRollupRepository(organization_id=organization_id)
 
     async def create(self, expense: Expense, total_paid: float) -> ExpenseInDB:
         try:
@@ -33,6 +36,10 @@ class ExpenseRepository(Repository):
                 f"Expense {expense.name} saved for organization {self.organization_id}"
             )
 
+            await self.__billing_rollups.apply(
+                after=BillingContribution.from_expense(expense=expense_model)
+            )
+
             return ExpenseInDB.model_validate(expense_model)
 
         except Exception as error:
@@ -46,9 +53,17 @@ class ExpenseRepository(Repository):
             ).first()
             expense.name = expense.name.title()
 
+            before = BillingContribution.from_expense(expense=expense_model)
+
             expense_model.update(**expense.model_dump())
 
-            return await self.select_by_id(id=expense.id)
+            expense_in_db = ExpenseInDB.model_validate(expense_model)
+
+            await self.__billing_rollups.apply(
+                before=before, after=BillingContribution.from_expense(expense=expense_in_db)
+            )
+
+            return expense_in_db
 
         except Exception as error:
             _logger.error(f"Error on update_expense: {str(error)}")
@@ -85,7 +100,7 @@ class ExpenseRepository(Repository):
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if start_date:
                 objects = objects.filter(expense_date__gte=start_date)
@@ -123,15 +138,11 @@ class ExpenseRepository(Repository):
         tags: List[str] = None,
         page: int = None,
         page_size: int = None,
+        cursor: PageCursor = None,
     ) -> List[ExpenseInDB]:
         try:
-            expenses = []
-
             query_filter = {"is_active": True, "organization_id": self.organization_id}
 
-            if query:
-                query_filter["name__iregex"] = query
-
             if start_date:
                 query_filter["expense_date__gte"] = start_date
 
@@ -141,21 +152,55 @@ class ExpenseRepository(Repository):
             if tags:
                 query_filter["tags__in"] = tags
 
-            objects = ExpenseModel.objects(**query_filter).order_by("-expense_date")
+            objects = ExpenseModel.objects(**query_filter)
+
+            if query:
+                objects = objects.filter(self.search_filter(query=query))
+
+            if cursor:
+                objects = self.apply_page_cursor(
+                    objects=objects,
+                    cursor=cursor,
+                    sort_field="expense_date",
+                    descending=True,
+                    page_size=page_size,
+                )
+
+            else:
+                objects = objects.order_by("-expense_date")
 
-            if page and page_size:
-                skip = (page - 1) * page_size
-                objects = objects.skip(skip).limit(page_size)
+                if page and page_size:
+                    skip = (page - 1) * page_size
+                    objects = objects.skip(skip).limit(page_size)
 
-            for expense_model in objects:
-                expenses.append(ExpenseInDB.model_validate(expense_model))
+            expenses = await self.select_lean(objects=objects, schema=ExpenseInDB)
 
-            return expenses
+            return self.sort_page_rows(rows=expenses, cursor=cursor)
 
         except Exception as error:
             _logger.error(f"Error on select_all: {str(error)}")
             raise NotFoundError(message=f"Expenses not found")
 
+    async def select_total_paid(self, start_date: date, end_date: date) -> float:
+        try:
+            objects = ExpenseModel.objects(
+                is_active=True,
+                organization_id=self.organization_id,
+                expense_date__gte=start_date,
+                expense_date__lt=end_date,
+            )
+
+            rows = await self.aggregate_queryset(
+                objects=objects,
+                pipeline=[{"$group": {"_id": None, "total_paid": {"$sum": "$total_paid"}}}],
+            )
+
+            return rows[0]["total_paid"] if rows else 0
+
+        except Exception as error:
+            _logger.error(f"Error on select_total_paid: {str(error)}")
+            return 0
+
     async def delete_by_id(self, id: str) -> ExpenseInDB:
         try:
             expense_model: ExpenseModel = ExpenseModel.objects(
@@ -165,6 +210,10 @@ class ExpenseRepository(Repository):
             if expense_model:
                 expense_model.delete()
 
+                await self.__billing_rollups.apply(
+                    before=BillingContribution.from_expense(expense=expense_model)
+                )
+
                 return ExpenseInDB.model_validate(expense_model)
 
             raise NotFoundError(message=f"Expense #{id} not found")
@@ -8,6 +8,7 @@ from app.api.exceptions.authentication_exceptions import (
 )
 from app.core.utils.features import Feature
 from app.core.utils.get_start_and_end_day_of_month import get_start_and_end_day_of_month
+from app.core.utils.page_cursor import PageCursor
 from app.crud.shared_schemas.payment import Payment
 from app.crud.tags.repositories import TagRepository
 
@@ -118,7 +119,8 @@ class ExpenseServices:
         tags: List[str] = [],
         expand: List[str] = [],
         page: int = None,
-        page_size: int = None
+        page_size: int = None,
+        cursor: PageCursor = None,
     ) -> List[ExpenseInDB | CompleteExpense]:
         expenses = await self.__expense_repository.select_all(
             query=query,
@@ -126,7 +128,8 @@ class ExpenseServices:
             end_date=end_date,
             tags=tags,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
         )
 
         if not expand:
@@ -157,6 +160,11 @@ class ExpenseServices:
 
         return complete_expenses
 
+    async def search_total_paid(self, start_date: date, end_date: date) -> float:
+        return await self.__expense_repository.select_total_paid(
+            start_date=start_date, end_date=end_date
+        )
+
     async def delete_by_id(self, id: str) -> ExpenseInDB:
         expense_in_db = await self.__expense_repository.delete_by_id(id=id)
         return expense_in_db
@@ -1,12 +1,15 @@
-from typing import List
+from typing import List, Tuple
 
+from mongoengine.queryset import QuerySet
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.billing_rollups import BillingContribution, BillingRollupRepository
 from app.crud.orders.models import OrderModel
+from app.crud.orders.repositories import OrderRepository
 from app.crud.orders.schemas import (
     Delivery,
     DeliveryType,
@@ -24,6 +27,8 @@ class FastOrderRepository(Repository):
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.__organization_id = organization_id
+        self.__billing_rollups = BillingRollupRepository(organization_id=organization_id)
+        self.__order_repository = OrderRepository(organization_id=organization_id)
 
     async def create(self, fast_order: FastOrder, total_amount: float) -> FastOrderInDB:
         try:
@@ -35,7 +40,13 @@ class FastOrderRepository(Repository):
 
             order_model.save()
 
-            return await self.select_by_id(id=order_model.id)
+            fast_order_in_db = self.__from_order_model(order_model=order_model)
+
+            await self.__billing_rollups.apply(
+                after=BillingContribution.from_order(order=fast_order_in_db)
+            )
+
+            return fast_order_in_db
 
         except Exception as error:
             _logger.error(f"Error on create_fast_order: {str(error)}")
@@ -43,24 +54,52 @@ class FastOrderRepository(Repository):
 
     async def update(self, fast_order_id: str, fast_order: dict) -> OrderInDB:
         try:
-            order_model: OrderModel = OrderModel.objects(
+            fields = {
+                field: value
+                for field, value in fast_order.items()
+                if field in OrderModel._fields and field != "updated_at"
+            }
+
+            if fields.get("total_amount") is not None:
+                fields["total_amount"] = round(fields["total_amount"], 2)
+
+            fields["updated_at"] = UTCDateTime.now()
+
+            # find_one_and_update devolvendo o documento anterior (delta do faturamento)
+            previous: OrderModel = OrderModel.objects(
                 id=fast_order_id,
                 is_active=True,
                 is_fast_order=True,
                 organization_id=self.__organization_id,
-            ).first()
+            ).modify(new=False, **fields)
 
-            for field, value in fast_order.items():
-                if hasattr(order_model, field):
-                    setattr(order_model, field, value)
+            if previous is None:
+                raise NotFoundError(message=f"FastOrder #{fast_order_id} not found")
 
-            order_model.total_amount = round(order_model.total_amount, 2)
-            order_model.save()
+            before = BillingContribution.from_order(order=previous)
+
+            fast_order = previous.to_mongo().to_dict()
+            fast_order.update(fields)
+            fast_order["id"] = fast_order.pop("_id")
+
+            if (fast_order.get("payment_summary") or {}).get("count"):
+                fast_order["payments"] = await self.__order_repository.select_payments(
+                    order_id=fast_order_id
+                )
+
+            fast_order_in_db = self.__from_order_model(order_model=fast_order)
+
+            await self.__billing_rollups.apply(
+                before=before, after=BillingContribution.from_order(order=fast_order_in_db)
+            )
 
-            return await self.select_by_id(id=fast_order_id)
+            return fast_order_in_db
+
+        except NotFoundError:
+            raise
 
         except Exception as error:
-            _logger.error(f"Error on update_fast_order: {str(error)}")
+            _logger.error(f"Error on update_fast_order: {error}")
             raise UnprocessableEntity(message="Error on update fast order")
 
     async def select_by_id(self, id: str) -> OrderInDB:
@@ -93,21 +132,10 @@ class FastOrderRepository(Repository):
         end_date: UTCDateTime = None,
     ) -> int:
         try:
-            objects = OrderModel.objects(
-                is_active=True,
-                is_fast_order=True,
-                organization_id=self.__organization_id,
+            objects = self.__build_filtered_objects(
+                day=day, start_date=start_date, end_date=end_date
             )
 
-            if day:
-                objects = objects(order_date=day)
-
-            if start_date:
-                objects = objects.filter(order_date__gte=start_date)
-
-            if end_date:
-                objects = objects.filter(order_date__lt=end_date)
-
             return max(objects.count(), 0)
 
         except Exception as error:
@@ -125,34 +153,51 @@ class FastOrderRepository(Repository):
         try:
             fast_orders = []
 
-            objects = OrderModel.objects(
-                is_active=True,
-                is_fast_order=True,
-                organization_id=self.__organization_id,
+            objects = self.__build_filtered_objects(
+                day=day, start_date=start_date, end_date=end_date
             )
 
-            if day:
-                objects = objects(order_date=day)
+            objects = self.__paginate(objects=objects, page=page, page_size=page_size)
+
+            for order_model in objects.aggregate(OrderModel.get_payment_summary()):
+                fast_orders.append(self.__from_order_model(order_model=order_model))
+
+            return fast_orders
 
-            if start_date:
-                objects = objects.filter(order_date__gte=start_date)
+        except Exception as error:
+            _logger.error(f"Error on select_all: {str(error)}")
+            raise NotFoundError(message=f"Fast Orders not found")
 
-            if end_date:
-                objects = objects.filter(order_date__lt=end_date)
+    async def select_page(
+        self,
+        page: int,
+        page_size: int,
+        day: UTCDateTime = None,
+        start_date: UTCDateTime = None,
+        end_date: UTCDateTime = None,
+    ) -> Tuple[int, List[FastOrderInDB]]:
+        try:
+            fast_orders = []
 
-            objects = objects.order_by("-order_date")
+            objects = self.__build_filtered_objects(
+                day=day, start_date=start_date, end_date=end_date
+            )
 
-            if page and page_size:
-                skip = (page - 1) * page_size
-                objects = objects.skip(skip).limit(page_size)
+            total, order_models = await self.aggregate_page(
+                objects=objects,
+                paged_objects=self.__paginate(
+                    objects=objects, page=page, page_size=page_size
+                ),
+                pipeline=OrderModel.get_payment_summary(),
+            )
 
-            for order_model in objects.aggregate(OrderModel.get_payments()):
+            for order_model in order_models:
                 fast_orders.append(self.__from_order_model(order_model=order_model))
 
-            return fast_orders
+            return total, fast_orders
 
         except Exception as error:
-            _logger.error(f"Error on select_all: {str(error)}")
+            _logger.error(f"Error on select_page: {str(error)}")
             raise NotFoundError(message=f"Fast Orders not found")
 
     async def delete_by_id(self, id: str) -> FastOrderInDB:
@@ -167,12 +212,50 @@ class FastOrderRepository(Repository):
             if order_model:
                 order_model.delete()
 
+                await self.__billing_rollups.apply(
+                    before=BillingContribution.from_order(order=order_model)
+                )
+
                 return self.__from_order_model(order_model=order_model)
 
         except Exception as error:
             _logger.error(f"Error on delete_by_id: {str(error)}")
             raise NotFoundError(message=f"FastOrder #{id} not found")
 
+    def __build_filtered_objects(
+        self,
+        day: UTCDateTime = None,
+        start_date: UTCDateTime = None,
+        end_date: UTCDateTime = None,
+    ) -> QuerySet:
+        objects = OrderModel.objects(
+            is_active=True,
+            is_fast_order=True,
+            organization_id=self.__organization_id,
+        )
+
+        if day:
+            objects = objects(order_date=day)
+
+        if start_date:
+            objects = objects.filter(order_date__gte=start_date)
+
+        if end_date:
+            objects = objects.filter(order_date__lt=end_date)
+
+        return objects
+
+    def __paginate(
+        self, objects: QuerySet, page: int = None, page_size: int = None
+    ) -> QuerySet:
+        objects = objects.order_by("-order_date")
+
+        if page and page_size:
+            skip = (page - 1) * page_size
+            objects = objects.skip(skip).limit(page_size)
+
+        return objects
+
     def __build_order_model(
         self,
         fast_order: FastOrder,
@@ -209,7 +292,8 @@ class FastOrderRepository(Repository):
                 is_active=order_model["is_active"],
                 order_date=order_model["order_date"],
                 organization_id=order_model["organization_id"],
-                payments=order_model["payments"],
+                payments=order_model.get("payments", []),
+                payment_summary=order_model.get("payment_summary") or {},
                 products=order_model["products"],
                 total_amount=order_model["total_amount"],
                 updated_at=order_model["updated_at"],
@@ -229,6 +313,7 @@ class FastOrderRepository(Repository):
                 payments=(
                     order_model.payments if hasattr(order_model, "payments") else []
                 ),
+                payment_summary=order_model.payment_summary or {},
                 products=order_model.products,
                 total_amount=order_model.total_amount,
                 updated_at=order_model.updated_at,
@@ -5,7 +5,7 @@ from pydantic import Field, model_validator
 from app.core.models import DatabaseModel
 from app.core.models.base_schema import GenericModel
 from app.core.utils.utc_datetime import UTCDateTime, UTCDateTimeType
-from app.crud.orders.schemas import PaymentInOrder
+from app.crud.orders.schemas import PaymentInOrder, PaymentSummary
 
 
 class RequestedProduct(GenericModel):
@@ -114,3 +114,11 @@ class FastOrderInDB(FastOrder, DatabaseModel):
     total_amount: float = Field(example=12.2)
     is_active: bool = Field(example=True, exclude=True)
     payments: List[PaymentInOrder] = Field(default=[])
+    payment_summary: PaymentSummary = Field(default=PaymentSummary())
+
+    @model_validator(mode="after")
+    def validate_payment_summary(self) -> "FastOrderInDB":
+        if self.payments:
+            self.payment_summary = PaymentSummary.from_payments(payments=self.payments)
+
+        return self
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Tuple
 
 from app.api.exceptions.authentication_exceptions import (
     BadRequestException,
@@ -181,6 +181,23 @@ class FastOrderServices:
         )
         return orders
 
+    async def search_page(
+        self,
+        page: int,
+        page_size: int,
+        expand: List[str] = [],
+        day: UTCDateTime = None,
+        start_date: UTCDateTime = None,
+        end_date: UTCDateTime = None,
+    ) -> Tuple[int, List[FastOrderInDB]]:
+        return await self.__fast_order_repository.select_page(
+            day=day,
+            start_date=start_date,
+            end_date=end_date,
+            page=page,
+            page_size=page_size
+        )
+
     async def delete_by_id(self, id: str) -> FastOrderInDB:
         fast_order_in_db = await self.__fast_order_repository.delete_by_id(id=id)
         return fast_order_in_db
@@ -1,4 +1,4 @@
-from mongoengine import StringField
+from mongoengine import DictField, IntField, StringField
 
 from app.core.models.base_document import BaseDocument
 from app.core.utils.utc_datetime import UTCDateTime
@@ -9,9 +9,17 @@ class FileModel(BaseDocument):
     type = StringField(required=True)
     organization_id = StringField(required=True)
     purpose = StringField(required=True)
+    variants = DictField(default={})  # URLs das outras versões da imagem (ex.: thumbnail, webp)
+    content_hash = StringField(required=False)  # SHA-256 da imagem normalizada
+    reference_count = IntField(default=1)  # uploads que reaproveitam este arquivo
 
     meta = {
-        "collection": "files"
+        "collection": "files",
+        "indexes": [
+            ("organization_id", "updated_at"),
+            # deduplicação dos uploads (`add_reference_by_content_hash`)
+            ("organization_id", "content_hash"),
+        ],
     }
 
     def update(self, **kwargs):
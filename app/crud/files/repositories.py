@@ -1,15 +1,23 @@
+from typing import Iterable, List
+
+from app.api.dependencies.bucket import PRIVATE_FILE_URL_EXPIRATION_SECONDS, S3BucketManager
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
 from app.core.utils.utc_datetime import UTCDateTime
 
 from .models import FileModel
-from .schemas import File, FileInDB
+from .schemas import File, FileInDB, FilePurpose
 
 _logger = get_logger(__name__)
 
+# tentativas de `delete_by_id` quando uploads somam referências no meio da devolução
+DELETE_REFERENCE_ATTEMPTS = 5
+
 
 class FileRepository(Repository):
+    document = FileModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -51,34 +59,113 @@ class FileRepository(Repository):
                 _logger.error(f"Error on select_by_id: {str(error)}")
                 raise NotFoundError(message=f"File #{id} not found")
 
+    async def add_reference_by_content_hash(self, content_hash: str, purpose: FilePurpose) -> FileInDB | None:
+        """
+        Reaproveita o arquivo da organização com a mesma imagem: se existir, soma
+        uma referência (atomicamente, no mesmo `findAndModify`) e o retorna.
+        """
+        file_model: FileModel = FileModel.objects(
+            organization_id=self.organization_id,
+            content_hash=content_hash,
+            purpose=purpose,
+            is_active=True,
+        ).modify(new=True, inc__reference_count=1, updated_at=UTCDateTime.now())
+
+        if file_model:
+            _logger.info(
+                f"File {file_model.id} reused for organization {self.organization_id}"
+            )
+            return FileInDB.model_validate(file_model)
+
     async def select_by_ids(self, ids: list[str]) -> dict[str, FileInDB]:
         try:
-            files = {}
-
             if not ids:
-                return files
+                return {}
 
             objects = FileModel.objects(
                 id__in=ids, is_active=True, organization_id=self.organization_id
             )
 
-            for file_model in objects:
-                files[str(file_model.id)] = FileInDB.model_validate(file_model)
-
-            return files
+            return {file.id: file for file in self.validate_presigned(file_models=objects)}
 
         except Exception as error:
             _logger.error(f"Error on select_by_ids: {str(error)}")
             return {}
 
+    @staticmethod
+    async def select_by_organizations(file_ids: dict[str, str]) -> dict[str, FileInDB]:
+        """
+        Busca o arquivo de várias organizações (`{organization_id: file_id}`) em
+        uma query e com as URLs assinadas em lote. Retorna por `organization_id`.
+        """
+        try:
+            if not file_ids:
+                return {}
+
+            objects = FileModel.objects(
+                id__in=list(file_ids.values()),
+                is_active=True,
+                organization_id__in=list(file_ids),
+            )
+
+            return {
+                file.organization_id: file
+                for file in FileRepository.validate_presigned(file_models=objects)
+                if file_ids.get(file.organization_id) == file.id
+            }
+
+        except Exception as error:
+            _logger.error(f"Error on select_by_organizations: {str(error)}")
+            return {}
+
+    @staticmethod
+    def validate_presigned(file_models: Iterable[FileModel]) -> List[FileInDB]:
+        """
+        Valida os arquivos sem assinar um por um e assina todas as URLs de uma
+        vez; arquivos cuja URL não pôde ser assinada ficam de fora.
+        """
+        files = [
+            FileInDB.model_validate(file_model, context={"presign": False})
+            for file_model in file_models
+        ]
+        urls = S3BucketManager(mode="private").generate_presigned_urls(
+            file_urls=[url for file in files for url in file.file_urls()],
+            expiration=PRIVATE_FILE_URL_EXPIRATION_SECONDS,
+        )
+
+        return [file for file in files if file.apply_presigned_urls(urls=urls)]
+
     async def delete_by_id(self, id: str, raise_404: bool = True) -> FileInDB:
+        """
+        Devolve uma referência do arquivo e o apaga quando era a última. As duas
+        operações são condicionais ao `reference_count`: se um upload somar uma
+        referência entre elas (`add_reference_by_content_hash`), nenhuma casa e
+        a devolução é refeita.
+        """
         try:
-            file_model: FileModel = FileModel.objects(
+            objects = FileModel.objects(
                 id=id, is_active=True, organization_id=self.organization_id
-            ).first()
-            file_model.delete(soft_delete=False)
+            )
 
-            return FileInDB.model_validate(file_model)
+            for _ in range(DELETE_REFERENCE_ATTEMPTS):
+                # outros uploads ainda usam o arquivo: só devolve uma referência
+                file_model: FileModel = objects.filter(reference_count__gt=1).modify(
+                    new=True, dec__reference_count=1, updated_at=UTCDateTime.now()
+                )
+
+                if file_model:
+                    return FileInDB.model_validate(file_model)
+
+                # última referência (documentos antigos não têm o campo)
+                file_model = objects.filter(reference_count__not__gt=1).modify(remove=True)
+
+                if file_model:
+                    return FileInDB.model_validate(file_model)
+
+                if not objects.count():
+                    break
+
+            raise NotFoundError(message=f"File #{id} not found")
 
         except Exception as error:
             if raise_404:
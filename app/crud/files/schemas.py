@@ -1,7 +1,8 @@
 from enum import Enum
+from typing import Dict, List
 from pydantic import Field
 
-from app.api.dependencies.bucket import S3BucketManager
+from app.api.dependencies.bucket import PRIVATE_FILE_URL_EXPIRATION_SECONDS, S3BucketManager
 from app.core.models import DatabaseModel
 from app.core.models.base_schema import GenericModel
 
@@ -15,17 +16,45 @@ class File(GenericModel):
     purpose: FilePurpose = Field(example=FilePurpose.PRODUCT)
     type: str = Field(example="txt")
     url: str = Field(example="www.tigris.com.br")
+    variants: Dict[str, str] = Field(
+        default={},
+        example={"thumbnail": "www.tigris.com.br/thumbnail", "webp": "www.tigris.com.br/webp"},
+    )
+    content_hash: str | None = Field(default=None, example="9f86d081884c7d659a2f")
 
 
 class FileInDB(File, DatabaseModel):
     organization_id: str = Field(example="org_123")
+    reference_count: int = Field(default=1, example=1)
 
     def model_post_init(self, __context):
-        s3_manager = S3BucketManager(mode="private")
-        presigned_url = s3_manager.generate_presigned_url(
-            file_url=self.url,
-            expiration=600
-        )
-        self.url = presigned_url
+        # `FileRepository` valida listas com `{"presign": False}` e assina as URLs em lote
+        if (__context or {}).get("presign", True):
+            s3_manager = S3BucketManager(mode="private")
+            presigned_urls = s3_manager.generate_presigned_urls(
+                file_urls=self.file_urls(),
+                expiration=PRIVATE_FILE_URL_EXPIRATION_SECONDS
+            )
+
+            if not self.apply_presigned_urls(urls=presigned_urls):
+                raise Exception("Error generating presigned URL")
 
         return super().model_post_init(__context)
+
+    def file_urls(self) -> List[str]:
+        return [self.url, *self.variants.values()]
+
+    def apply_presigned_urls(self, urls: Dict[str, str]) -> bool:
+        """
+        Troca a URL e as variantes pelas versões assinadas em `urls`. Variantes sem
+        assinatura são removidas; retorna `False` se a URL principal não foi assinada.
+        """
+        if self.url not in urls:
+            return False
+
+        self.url = urls[self.url]
+        self.variants = {
+            name: urls[url] for name, url in self.variants.items() if url in urls
+        }
+
+        return True
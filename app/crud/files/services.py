@@ -1,12 +1,19 @@
-import os
-import shutil
+import asyncio
+from io import BytesIO
 from uuid import uuid4
-from tempfile import NamedTemporaryFile
 from fastapi import UploadFile
 from app.api.dependencies.bucket import S3BucketManager
-from app.api.exceptions.authentication_exceptions import BadRequestException
-from app.core.utils.image_validator import validate_image_file
-from app.core.utils.resize_image import resize_image
+from app.api.exceptions.authentication_exceptions import (
+    BadRequestException,
+    ServiceUnavailableException,
+)
+from app.core.utils.image_pipeline import (
+    ImagePoolUnavailableError,
+    InvalidImageError,
+    ProcessedImage,
+    process_image_upload,
+    validate_image_size,
+)
 from .schemas import File, FileInDB, FilePurpose
 from .repositories import FileRepository
 
@@ -23,40 +30,43 @@ class FileServices:
     async def create(self, purpose: FilePurpose, file: UploadFile) -> FileInDB:
         file_id = str(uuid4())
 
-        if purpose in {FilePurpose.PRODUCT, FilePurpose.ORGANIZATION, FilePurpose.OFFER}:
-            validated_file = await self.validate_image(file=file, size=(640, 480))
-
-        else:
+        if purpose not in {FilePurpose.PRODUCT, FilePurpose.ORGANIZATION, FilePurpose.OFFER}:
             raise BadRequestException(detail="Purpose not recognized")
 
-        file_extension = validated_file.filename.split(".")[-1].lower()
-
-        validated_file.file.seek(0)
+        processed_image = await self.process_image(file=file)
 
-        tmp_path = None
-        try:
-            with NamedTemporaryFile(mode="wb", suffix=f".{file_extension}", delete=False) as buffer:
-                tmp_path = buffer.name
-                shutil.copyfileobj(validated_file.file, buffer, length=1024 * 1024)
+        # a mesma imagem já foi enviada nesta organização: reaproveita arquivo e objetos
+        file_in_db = await self.__file_repository.add_reference_by_content_hash(
+            content_hash=processed_image.content_hash,
+            purpose=purpose,
+        )
 
-            file_url = self.__s3_manager.upload_file(
-                local_path=tmp_path,
-                bucket_path=f"organization/{self.__file_repository.organization_id}/files/{file_id}.{file_extension}",
+        if file_in_db:
+            return file_in_db
+
+        images = processed_image.images
+
+        # a primeira imagem é a principal; as outras são enviadas como `{id}_{variante}`
+        bucket_path = f"organization/{self.__file_repository.organization_id}/files/{file_id}"
+        urls = await asyncio.gather(*[
+            self.__s3_manager.upload_fileobj(
+                fileobj=BytesIO(image.content),
+                bucket_path=(
+                    f"{bucket_path}.{image.extension}"
+                    if index == 0
+                    else f"{bucket_path}_{image.variant}.{image.extension}"
+                ),
+                content_type=image.content_type,
             )
-
-        finally:
-
-            try:
-                await validated_file.close()
-            except Exception:
-                pass
-            if tmp_path and os.path.exists(tmp_path):
-                os.remove(tmp_path)
+            for index, image in enumerate(images)
+        ])
 
         file_schema = File(
             purpose=purpose,
-            type=file_extension,
-            url=file_url,
+            type=images[0].extension,
+            url=urls[0],
+            variants={image.variant: url for image, url in zip(images[1:], urls[1:])},
+            content_hash=processed_image.content_hash,
         )
 
         return await self.__file_repository.create(file=file_schema)
@@ -69,12 +79,26 @@ class FileServices:
         file_in_db = await self.__file_repository.delete_by_id(id=id)
         return file_in_db
 
-    async def validate_image(self, file: UploadFile, size: tuple):
-        image_type = await validate_image_file(image=file)
+    async def process_image(self, file: UploadFile) -> ProcessedImage:
+        """
+        Lê o upload uma vez e gera as variantes no pool de processos
+        (veja `app.core.utils.image_pipeline`).
+        """
+        try:
+            file.file.seek(0, 2)
+            validate_image_size(size_bytes=file.file.tell())
+            file.file.seek(0)
 
-        file_image = await resize_image(
-            upload_image=file,
-            size=size
-        )
+            return await process_image_upload(content=await file.read())
+
+        except InvalidImageError as error:
+            raise BadRequestException(detail=str(error))
+
+        except ImagePoolUnavailableError as error:
+            raise ServiceUnavailableException(detail=str(error))
 
-        return file_image
+        finally:
+            try:
+                await file.close()
+            except Exception:
+                pass
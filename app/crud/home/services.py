@@ -1,6 +1,7 @@
 import json
 from typing import List
 
+from app.api.dependencies.cache_tags import organization_month_tag
 from app.api.dependencies.redis_manager import RedisManager
 from app.api.exceptions.authentication_exceptions import UnauthorizedException
 from app.core.utils.utc_datetime import UTCDateTime
@@ -23,18 +24,19 @@ class HomeServices:
         customer_services: CustomerServices,
         calendar_services: CalendarServices,
         billing_services: BillingServices,
+        redis_manager: RedisManager | None = None,
     ) -> None:
         self.order_services = order_services
         self.product_services = product_services
         self.customer_services = customer_services
         self.calendar_services = calendar_services
         self.billing_services = billing_services
-        self.redis_manager = RedisManager()
+        self.redis_manager = redis_manager or RedisManager()
 
     async def get_home_metrics(self) -> HomeMetric:
         key = f"metrics:organizations:{self.order_services.organization_id}"
 
-        raw_metric = self.redis_manager.get_value(key=key)
+        raw_metric = await self.redis_manager.get_value(key=key)
 
         if raw_metric:
             raw_metric = json.loads(raw_metric)
@@ -55,8 +57,17 @@ class HomeServices:
         home_metric.products_count = await self.product_services.search_count()
         home_metric.orders_today = len(orders)
 
-        self.redis_manager.set_value(
-            key=key, expiration=900, value=home_metric.model_dump_json()
+        await self.redis_manager.set_value(
+            key=key,
+            expiration=900,
+            value=home_metric.model_dump_json(),
+            tags=[
+                organization_month_tag(
+                    organization_id=self.order_services.organization_id,
+                    month=now.month,
+                    year=now.year,
+                )
+            ],
         )
 
         return home_metric
@@ -46,14 +46,14 @@ class InviteRepository(Repository):
 
     async def update(self, invite: InviteInDB) -> InviteInDB:
         try:
-            invite_model: InviteModel = InviteModel.objects(
-                id=invite.id,
-            ).first()
+            invite_model = InviteModel(id=invite.id)
 
             invite.user_email = invite.user_email.lower()
-            invite_model.update(**invite.model_dump())
 
-            return await self.select_by_id(id=invite.id)
+            if not invite_model.update(**invite.model_dump()):
+                raise NotFoundError(message=f"Invite #{invite.id} not found")
+
+            return InviteInDB.model_validate(invite_model)
 
         except Exception as error:
             _logger.error(f"Error on update_invite: {str(error)}")
@@ -30,14 +30,12 @@ class InvoiceRepository(Repository):
 
     async def update(self, invoice: InvoiceInDB) -> InvoiceInDB:
         try:
-            invoice_model: InvoiceModel = InvoiceModel.objects(
-                id=invoice.id,
-                is_active=True,
-            ).first()
+            invoice_model = InvoiceModel(id=invoice.id)
 
-            invoice_model.update(**invoice.model_dump())
+            if not invoice_model.update(query={"is_active": True}, **invoice.model_dump()):
+                raise NotFoundError(message=f"Invoice #{invoice.id} not found")
 
-            return await self.select_by_id(id=invoice.id)
+            return InvoiceInDB.model_validate(invoice_model)
 
         except Exception as error:
             _logger.error(f"Error on update_invoice: {str(error)}")
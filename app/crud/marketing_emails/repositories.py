@@ -18,7 +18,7 @@ class MarketingEmailRepository(Repository):
             )
             marketing_email_model.save()
 
-            return await self.select_by_id(id=marketing_email_model.id)
+            return MarketingEmailInDB.model_validate(marketing_email_model)
 
         except NotUniqueError:
             _logger.warning(f"MarketingEmail with email {marketing_email.email} is not unique")
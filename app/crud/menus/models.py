@@ -1,10 +1,10 @@
 from mongoengine import StringField, BooleanField, DictField, ListField, IntField, FloatField
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.searchable_document import SearchableDocument
 from app.core.utils.utc_datetime import UTCDateTime
 
 
-class MenuModel(BaseDocument):
+class MenuModel(SearchableDocument):
     organization_id = StringField(required=True)
     name = StringField(required=True)
     slug = StringField(required=False)
@@ -24,7 +24,12 @@ class MenuModel(BaseDocument):
     unit_tax = FloatField(required=False)
 
     meta = {
-        "collection": "menus"
+        "collection": "menus",
+        "indexes": [
+            # filtro `query` (prefixo das palavras do nome normalizado)
+            ("organization_id", "is_active", "search_tokens"),
+            ("organization_id", "updated_at"),
+        ],
     }
 
     def update(self, **kwargs):
@@ -12,6 +12,8 @@ _logger = get_logger(__name__)
 
 
 class MenuRepository(Repository):
+    document = MenuModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -54,18 +56,20 @@ class MenuRepository(Repository):
             raise UnprocessableEntity("Um catálogo com esse nome já existe")
 
         try:
-            menu_model: MenuModel = MenuModel.objects(
-                id=menu.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            menu_model = MenuModel(id=menu.id)
             menu.name = menu.name.title()
             menu.slug = slugify(menu.name)
 
             if not menu.slug:
                 raise UnprocessableEntity("Nome de catálogo inválido")
 
-            menu_model.update(**menu.model_dump())
+            if not menu_model.update(
+                query={"is_active": True, "organization_id": self.organization_id},
+                **menu.model_dump(),
+            ):
+                raise NotFoundError(message=f"Menu #{menu.id} not found")
 
-            return await self.select_by_id(id=menu.id)
+            return MenuInDB.model_validate(menu_model)
 
         except Exception as error:
             _logger.error(f"Error on update_menu: {str(error)}")
@@ -79,10 +83,7 @@ class MenuRepository(Repository):
             )
 
             if query:
-                slug_query = slugify(query)
-
-                if slug_query:
-                    objects = objects.filter(slug__icontains=slug_query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if is_visible is not None:
                 objects = objects.filter(is_visible=is_visible)
@@ -149,18 +150,22 @@ class MenuRepository(Repository):
             )
 
             if query:
-                slug_query = slugify(query)
-                if slug_query:
-                    objects = objects.filter(slug__icontains=slug_query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if is_visible is not None:
                 objects = objects.filter(is_visible=is_visible)
 
-            objects = objects.order_by("name")
+            if query:
+                objects = await self.select_ranked(
+                    objects=objects, query=query, page=page, page_size=page_size
+                )
+
+            else:
+                objects = objects.order_by("name")
 
-            if page and page_size:
-                skip = (page - 1) * page_size
-                objects = objects.skip(skip).limit(page_size)
+                if page and page_size:
+                    skip = (page - 1) * page_size
+                    objects = objects.skip(skip).limit(page_size)
 
             for menu_model in objects:
                 menus.append(MenuInDB.model_validate(menu_model))
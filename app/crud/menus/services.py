@@ -49,6 +49,10 @@ class MenuServices:
         menu_in_db = await self.__menu_repository.select_by_id(id=id)
         return menu_in_db
 
+    async def search_version(self, id: str = None) -> str | None:
+        """Versão do menu (ou dos menus, sem `id`), para a ETag."""
+        return await self.__menu_repository.select_version(id=id)
+
     async def search_all(
         self,
         query: str,
@@ -26,7 +26,7 @@ class MessageRepository(Repository):
 
             message_model.save()
 
-            return await self.select_by_id(id=message_model.id)
+            return MessageInDB.model_validate(message_model)
 
         except Exception as error:
             _logger.error(f"Error on create_message: {str(error)}")
@@ -34,13 +34,15 @@ class MessageRepository(Repository):
 
     async def update(self, message: MessageInDB) -> MessageInDB:
         try:
-            message_model: MessageModel = MessageModel.objects(
-                id=message.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            message_model = MessageModel(id=message.id)
 
-            message_model.update(**message.model_dump())
+            if not message_model.update(
+                query={"is_active": True, "organization_id": self.organization_id},
+                **message.model_dump(),
+            ):
+                raise NotFoundError(message=f"Message with ID #{message.id} not found")
 
-            return await self.select_by_id(id=message.id)
+            return MessageInDB.model_validate(message_model)
 
         except Exception as error:
             _logger.error(f"Error on update_message: {str(error)}")
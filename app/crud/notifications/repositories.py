@@ -29,7 +29,7 @@ class NotificationRepository(Repository):
                 **notification.model_dump(exclude={"channels"}),
             )
             notification_model.save()
-            return await self.select_by_id(notification_model.id)
+            return NotificationInDB.model_validate(notification_model)
         except Exception as error:
             _logger.error(f"Error on create notification: {str(error)}")
             raise UnprocessableEntity(message="Error on create notification")
@@ -91,7 +91,7 @@ class NotificationRepository(Repository):
                 raise NotFoundError(message=f"Notification with ID #{id} not found")
 
             notification_model.update(read=True)
-            return await self.select_by_id(id)
+            return NotificationInDB.model_validate(notification_model)
         except NotFoundError:
             raise
         except Exception as error:
@@ -7,11 +7,11 @@ from mongoengine import (
     DateTimeField,
 )
 
-from app.core.models.base_document import BaseDocument
+from app.core.models.searchable_document import SearchableDocument
 from app.core.utils.utc_datetime import UTCDateTime
 
 
-class OfferModel(BaseDocument):
+class OfferModel(SearchableDocument):
     organization_id = StringField(required=True)
     name = StringField(required=True)
     description = StringField(required=True)
@@ -24,7 +24,12 @@ class OfferModel(BaseDocument):
     is_visible = BooleanField(default=True)
 
     meta = {
-        "collection": "offers"
+        "collection": "offers",
+        "indexes": [
+            # filtro `query` (prefixo das palavras do nome normalizado)
+            ("organization_id", "is_active", "search_tokens"),
+            ("organization_id", "updated_at"),
+        ],
     }
 
     def update(self, **kwargs):
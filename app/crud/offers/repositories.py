@@ -14,6 +14,8 @@ _logger = get_logger(__name__)
 
 
 class OfferRepository(Repository):
+    document = OfferModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -41,14 +43,16 @@ class OfferRepository(Repository):
 
     async def update(self, offer: OfferInDB) -> OfferInDB:
         try:
-            offer_model: OfferModel = OfferModel.objects(
-                id=offer.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            offer_model = OfferModel(id=offer.id)
             offer.name = offer.name.title()
 
-            offer_model.update(**offer.model_dump())
+            if not offer_model.update(
+                query={"is_active": True, "organization_id": self.organization_id},
+                **offer.model_dump(),
+            ):
+                raise NotFoundError(message=f"Offer not found")
 
-            return await self.select_by_id(id=offer.id)
+            return OfferInDB.model_validate(offer_model)
 
         except ValidationError:
             raise NotFoundError(message=f"Offer not found")
@@ -112,7 +116,7 @@ class OfferRepository(Repository):
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if is_visible is not None:
                 objects = objects.filter(is_visible=is_visible)
@@ -139,12 +143,17 @@ class OfferRepository(Repository):
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if is_visible is not None:
                 objects = objects.filter(is_visible=is_visible)
 
-            if page is not None and page_size is not None:
+            if query:
+                objects = await self.select_ranked(
+                    objects=objects, query=query, page=page, page_size=page_size
+                )
+
+            elif page is not None and page_size is not None:
                 skip = (page - 1) * page_size
                 objects = objects.order_by("name").skip(skip).limit(page_size)
 
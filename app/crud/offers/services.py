@@ -1,6 +1,8 @@
 from typing import List
 
 from app.api.exceptions.authentication_exceptions import BadRequestException
+from app.core.models.base_schema import construct_from
+from app.core.utils.document_version import combine_versions
 from app.crud.files.repositories import FileRepository
 from app.crud.files.schemas import FilePurpose, FileInDB
 from app.crud.products.repositories import ProductRepository
@@ -140,6 +142,17 @@ class OfferServices:
     async def search_count(self, query: str = None, is_visible: bool = None) -> int:
         return await self.__offer_repository.select_count(query=query, is_visible=is_visible)
 
+    async def search_version(self, id: str = None, expand: List[str] = []) -> str | None:
+        """Versão da oferta (ou das ofertas, sem `id`) e das expansões, para a ETag."""
+        dependencies = []
+
+        if "file" in expand:
+            dependencies.append(self.__file_repository.select_version())
+
+        return await combine_versions(
+            self.__offer_repository.select_version(id=id), *dependencies
+        )
+
     async def __build_complete_offer(self, offers: List[OfferInDB], expand: List[str]) -> List[CompleteOffer]:
         complete_offers = []
 
@@ -160,15 +173,16 @@ class OfferServices:
             complete_offer_products = []
 
             for product in offer.products:
-                offer_product = CompleteOfferProduct(**product.model_dump())
+                offer_product = construct_from(CompleteOfferProduct, product)
 
                 if "file" in expand and product.file_id:
                     offer_product.file = files_map.get(product.file_id)
 
                 complete_offer_products.append(offer_product)
 
-            complete_offer = CompleteOffer.model_validate(offer)
-            complete_offer.products = complete_offer_products
+            complete_offer = construct_from(
+                CompleteOffer, offer, products=complete_offer_products
+            )
 
             if "file" in expand and offer.file_id:
                 complete_offer.file = files_map.get(offer.file_id)
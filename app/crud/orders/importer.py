@@ -0,0 +1,157 @@
+"""
+Leitura dos arquivos de importação de pedidos (CSV ou NDJSON).
+
+O arquivo é lido em blocos de `chunk_size` linhas numa threadpool, então nem o
+arquivo inteiro fica em memória nem a leitura bloqueia o event loop. Cada linha
+vira um `dict` no formato do `RequestOrder` ou o erro de leitura daquela linha.
+
+No CSV cada linha é um pedido. `products` aceita `pro_1:2;pro_2` (produto e
+quantidade, padrão 1) ou um JSON com o formato do `RequestOrder`, `tags` aceita
+`tag_1;tag_2` e a entrega pode vir em `delivery` (JSON) ou nas colunas
+`delivery_type`, `delivery_value`, `delivery_at` e `address` (JSON).
+"""
+
+import codecs
+import csv
+import json
+from itertools import islice
+from typing import AsyncIterator, BinaryIO, Iterator, List, Tuple
+
+from pydantic import ValidationError
+from starlette.concurrency import run_in_threadpool
+
+from .schemas import OrderImportFormat
+
+ImportRow = Tuple[int, dict | ValueError]
+
+_DELIVERY_COLUMNS = ("delivery_type", "delivery_value", "delivery_at")
+
+
+def _parse_json_cell(column: str, value: str):
+    try:
+        return json.loads(value)
+
+    except json.JSONDecodeError:
+        raise ValueError(f"{column}: invalid JSON")
+
+
+def _parse_products(value: str) -> list:
+    if value.startswith("["):
+        return _parse_json_cell(column="products", value=value)
+
+    products = []
+
+    for product in value.split(";"):
+        product_id, _, quantity = product.strip().partition(":")
+
+        if product_id:
+            products.append({"product_id": product_id, "quantity": quantity or 1})
+
+    return products
+
+
+def _parse_csv_row(row: dict) -> dict:
+    row = {
+        column.strip(): value.strip()
+        for column, value in row.items()
+        if column and value and value.strip()
+    }
+
+    if "products" in row:
+        row["products"] = _parse_products(row["products"])
+
+    if "tags" in row:
+        row["tags"] = (
+            _parse_json_cell(column="tags", value=row["tags"])
+            if row["tags"].startswith("[")
+            else [tag.strip() for tag in row["tags"].split(";") if tag.strip()]
+        )
+
+    if "delivery" in row:
+        row["delivery"] = _parse_json_cell(column="delivery", value=row["delivery"])
+
+    else:
+        delivery = {column: row.pop(column) for column in _DELIVERY_COLUMNS if column in row}
+
+        if "address" in row:
+            delivery["address"] = _parse_json_cell(column="address", value=row.pop("address"))
+
+        row["delivery"] = delivery
+
+    return row
+
+
+def _iter_csv_rows(stream: BinaryIO) -> Iterator[ImportRow]:
+    lines = codecs.iterdecode(stream, "utf-8-sig")
+    reader = csv.DictReader(lines)
+
+    for row in reader:
+        # linha 1 é o cabeçalho, como na planilha
+        line = reader.line_num
+
+        try:
+            yield line, _parse_csv_row(row=row)
+
+        except ValueError as error:
+            yield line, error
+
+
+def _iter_ndjson_rows(stream: BinaryIO) -> Iterator[ImportRow]:
+    for line, content in enumerate(codecs.iterdecode(stream, "utf-8-sig"), start=1):
+        if not content.strip():
+            continue
+
+        try:
+            row = json.loads(content)
+
+        except json.JSONDecodeError:
+            yield line, ValueError("Invalid JSON")
+            continue
+
+        if not isinstance(row, dict):
+            yield line, ValueError("Each line must be a JSON object")
+            continue
+
+        yield line, row
+
+
+def iter_order_rows(stream: BinaryIO, file_format: OrderImportFormat) -> Iterator[ImportRow]:
+    if file_format == OrderImportFormat.CSV:
+        return _iter_csv_rows(stream=stream)
+
+    return _iter_ndjson_rows(stream=stream)
+
+
+async def read_order_chunks(
+    stream: BinaryIO, file_format: OrderImportFormat, chunk_size: int
+) -> AsyncIterator[List[ImportRow]]:
+    rows = iter_order_rows(stream=stream, file_format=file_format)
+
+    while True:
+        chunk = await run_in_threadpool(lambda: list(islice(rows, chunk_size)))
+
+        if not chunk:
+            break
+
+        yield chunk
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """`products.0.quantity: Input should be greater than 0; delivery: Field required`"""
+    messages = []
+
+    for detail in error.errors():
+        location = ".".join(str(part) for part in detail["loc"])
+        messages.append(f"{location}: {detail['msg']}" if location else detail["msg"])
+
+    return "; ".join(messages)
+
+
+def detect_import_format(filename: str | None, content_type: str | None) -> OrderImportFormat:
+    filename = (filename or "").lower()
+    content_type = (content_type or "").lower()
+
+    if filename.endswith((".ndjson", ".jsonl")) or "ndjson" in content_type:
+        return OrderImportFormat.NDJSON
+
+    return OrderImportFormat.CSV
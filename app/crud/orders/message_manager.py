@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
+from app.core.configs import get_logger
 from app.crud.customers.repositories import CustomerRepository
 from app.crud.customers.schemas import CustomerInDB
 from app.crud.messages.schemas import Message, MessageType, Origin
 from app.crud.messages.services import MessageServices
 from app.crud.organizations.repositories import OrganizationRepository
 
-from .schemas import OrderInDB, OrderStatus
+from .schemas import OrderInDB, OrderStatus, OrderStatusChange
+
+_logger = get_logger(__name__)
 
 
 class OrderMessageManager:
@@ -69,7 +72,68 @@ class OrderMessageManager:
         if not getattr(organization, "enable_order_notifications", False):
             return
 
-        if order.status == OrderStatus.PREPARED:
+        await self.__message_services.create(
+            message=self.__build_message(
+                status=order.status, customer=customer, organization=organization
+            )
+        )
+
+    async def send_status_updates(
+        self, *, changes: List[OrderStatusChange], organization_id: str
+    ) -> None:
+        """
+        Versão em lote do `send_status_update`: busca os clientes de todas as
+        mudanças numa consulta e a organização uma vez só, e envia as mensagens
+        em sequência.
+        """
+        changes = [
+            change
+            for change in changes
+            if change.status != change.previous_status
+            and change.status in (OrderStatus.PREPARED, OrderStatus.DONE)
+            and change.customer_id
+        ]
+
+        if not changes:
+            return
+
+        organization = await self.__organization_repository.select_by_id(
+            id=organization_id
+        )
+
+        if not getattr(organization, "enable_order_notifications", False):
+            return
+
+        customers = {
+            customer.id: customer
+            for customer in await self.__customer_repository.select_by_ids(
+                ids=list({change.customer_id for change in changes})
+            )
+        }
+
+        for change in changes:
+            customer = customers.get(change.customer_id)
+
+            if not customer or not (
+                customer.international_code and customer.ddd and customer.phone_number
+            ):
+                continue
+
+            try:
+                await self.__message_services.create(
+                    message=self.__build_message(
+                        status=change.status, customer=customer, organization=organization
+                    )
+                )
+
+            except Exception as error:
+                # uma mensagem com erro não impede as outras do lote
+                _logger.error(f"Error on send_status_updates for {change.id}: {error}")
+
+    def __build_message(
+        self, *, status: OrderStatus, customer: CustomerInDB, organization
+    ) -> Message:
+        if status == OrderStatus.PREPARED:
             title = "*Seu pedido esta pronto!*"
             body = "Informamos que seu pedido esta pronto."
         else:
@@ -87,7 +151,7 @@ class OrderMessageManager:
             "_Está é uma mensagem automática gerada pela PedidoZ, por favor não responda!_"
         )
 
-        message = Message(
+        return Message(
             international_code=customer.international_code,
             ddd=customer.ddd,
             phone_number=customer.phone_number,
@@ -95,5 +159,3 @@ class OrderMessageManager:
             origin=Origin.ORDERS,
             message=text_message,
         )
-
-        await self.__message_services.create(message=message)
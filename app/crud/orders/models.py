@@ -33,8 +33,22 @@ class OrderModel(BaseDocument):
     reason_id = StringField(required=False)
     is_fast_order = BooleanField(required=False, default=False)
     order_date = DateTimeField(required=True)
+    payment_summary = DictField(required=False)
 
-    meta = {"collection": "orders"}
+    meta = {
+        "collection": "orders",
+        "indexes": [
+            # select_all / select_count / fast orders
+            ("organization_id", "is_active", "is_fast_order", "-order_date"),
+            # select_recent
+            ("organization_id", "is_active", "is_fast_order", "-created_at"),
+            # select_all_without_filters (billing, calendario)
+            ("organization_id", "is_active", "-order_date"),
+            # select_count_by_date (limite do plano)
+            ("organization_id", "is_active", "created_at"),
+            ("organization_id", "customer_id"),
+        ],
+    }
 
     @staticmethod
     def get_payments():
@@ -77,6 +91,19 @@ class OrderModel(BaseDocument):
 
         return pipeline
 
+    @staticmethod
+    def get_payment_summary():
+        """
+        Pipeline das listagens e relatórios: usa o `payment_summary` mantido
+        pelo PaymentServices no lugar do `$lookup` em `payments`.
+        """
+        pipeline = [
+            {"$addFields": {"id": "$_id"}},
+            {"$project": {"_id": 0}},
+        ]
+
+        return pipeline
+
     def update(self, **kwargs):
         self.base_update()
         if kwargs.get("updated_at"):
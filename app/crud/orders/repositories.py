@@ -1,24 +1,108 @@
-from typing import List
+from typing import Dict, List, Tuple
 
 from mongoengine import Q
+from mongoengine.queryset import QuerySet
 from pydantic_core import ValidationError
 
 from app.core.configs import get_logger
+from app.core.models.base_document import generate_prefixed_id
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
+from app.core.utils.lean_rows import validate_rows
+from app.core.utils.page_cursor import PageCursor
 from app.core.utils.utc_datetime import UTCDateTime
-from app.crud.shared_schemas.payment import PaymentStatus
+from app.crud.billing_rollups import BillingContribution, BillingRollupRepository
+from app.crud.shared_schemas.payment import Payment, PaymentMethod, PaymentStatus
 
 from .models import OrderModel
-from .schemas import DeliveryType, Order, OrderInDB, OrderStatus
+from .schemas import (
+    DeliveryType,
+    Order,
+    OrderInDB,
+    OrderStatus,
+    OrderStatusChange,
+    PaymentSummary,
+)
 
 _logger = get_logger(__name__)
 
 
+def _round(expression: dict) -> dict:
+    return {"$round": [expression, 2]}
+
+
+def _product_lines_pipeline(keep_orders_without_products: bool = False) -> List[dict]:
+    """
+    Quebra os pedidos em uma linha por produto com `line_amount` e `line_cost`
+    já incluindo os adicionais, multiplicados pela quantidade do produto. Com
+    `keep_orders_without_products`, um pedido sem produtos vira uma linha zerada
+    (ele ainda soma `additional - discount` no total do pedido).
+    """
+    additional = "$products.additionals"
+
+    return [
+        {
+            "$unwind": {
+                "path": "$products",
+                "includeArrayIndex": "product_index",
+                "preserveNullAndEmptyArrays": keep_orders_without_products,
+            }
+        },
+        {"$unwind": {"path": additional, "preserveNullAndEmptyArrays": True}},
+        {
+            "$group": {
+                "_id": {"order_id": "$_id", "product_index": "$product_index"},
+                "order_date": {"$first": "$order_date"},
+                "additional": {"$first": "$additional"},
+                "discount": {"$first": "$discount"},
+                "product_id": {"$first": "$products.product_id"},
+                "name": {"$first": "$products.name"},
+                "quantity": {"$first": "$products.quantity"},
+                "unit_price": {"$first": "$products.unit_price"},
+                "unit_cost": {"$first": "$products.unit_cost"},
+                "additionals_amount": {
+                    "$sum": {
+                        "$multiply": [
+                            {"$ifNull": [f"{additional}.unit_price", 0]},
+                            {"$ifNull": [f"{additional}.quantity", 0]},
+                        ]
+                    }
+                },
+                "additionals_cost": {
+                    "$sum": {
+                        "$multiply": [
+                            {"$ifNull": [f"{additional}.unit_cost", 0]},
+                            {"$ifNull": [f"{additional}.consumption_factor", 1]},
+                            {"$ifNull": [f"{additional}.quantity", 0]},
+                        ]
+                    }
+                },
+            }
+        },
+        {
+            "$addFields": {
+                "line_amount": {
+                    "$multiply": [
+                        {"$add": [{"$ifNull": ["$unit_price", 0]}, "$additionals_amount"]},
+                        {"$ifNull": ["$quantity", 0]},
+                    ]
+                },
+                "line_cost": {
+                    "$multiply": [
+                        {"$add": [{"$ifNull": ["$unit_cost", 0]}, "$additionals_cost"]},
+                        {"$ifNull": ["$quantity", 0]},
+                    ]
+                },
+            }
+        },
+    ]
+
+
 class OrderRepository(Repository):
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
+        self.__billing_rollups = BillingRollupRepository(organization_id=organization_id)
 
     async def create(self, order: Order, total_amount: float) -> OrderInDB:
         try:
@@ -37,47 +121,261 @@ class OrderRepository(Repository):
             )
             order_model.save()
 
-            return await self.select_by_id(id=order_model.id)
+            # pedido novo ainda não tem pagamentos: a resposta sai do próprio model
+            order_in_db = OrderInDB.model_validate(order_model)
+
+            await self.__billing_rollups.apply(
+                after=BillingContribution.from_order(order=order_in_db)
+            )
+
+            return order_in_db
 
         except Exception as error:
             _logger.error(f"Error on create_order: {str(error)}")
             raise UnprocessableEntity(message="Error on create new order")
 
+    async def create_many(
+        self, orders: List[Tuple[Order, float]]
+    ) -> Tuple[List[str], Dict[int, str]]:
+        """
+        Insere vários pedidos já validados (pedido e total) com um único
+        `insert_many` sem ordem. Retorna o id gerado de cada pedido e o erro
+        das posições que não foram gravadas.
+        """
+        now = UTCDateTime.now()
+        order_ids: List[str] = []
+        order_models: List[OrderModel] = []
+
+        for order, total_amount in orders:
+            order_model = OrderModel(
+                id=generate_prefixed_id("ord"),
+                total_amount=round(total_amount, 2),
+                organization_id=self.organization_id,
+                payment_status=PaymentStatus.PENDING,
+                payment_summary=PaymentSummary().model_dump(mode="json"),
+                is_fast_order=False,
+                created_at=now,
+                updated_at=now,
+                **order.model_dump(),
+            )
+            order_model.description = (
+                order_model.description.strip() if order_model.description else None
+            )
+
+            order_ids.append(order_model.id)
+            order_models.append(order_model)
+
+        errors = await self.insert_many(
+            document=OrderModel,
+            rows=[order_model.to_mongo().to_dict() for order_model in order_models],
+        )
+
+        await self.__billing_rollups.apply_many(
+            contributions=[
+                BillingContribution.from_order(order=order_model)
+                for index, order_model in enumerate(order_models)
+                if index not in errors
+            ]
+        )
+
+        return order_ids, errors
+
+    async def update_status_many(
+        self, order_ids: List[str], status: OrderStatus
+    ) -> List[OrderStatusChange]:
+        """
+        Muda o status de vários pedidos com um único `update_many`. Só os
+        pedidos que de fato mudam são lidos e atualizados. O status de
+        pagamento fica de fora: ele segue os pagamentos (`payment_summary`).
+        """
+        query = {
+            "_id": {"$in": order_ids},
+            "organization_id": self.organization_id,
+            "is_active": True,
+            "status": {"$ne": status.value},
+        }
+
+        rows = await self.find(
+            document=OrderModel,
+            query=query,
+            projection={"status": 1, "customer_id": 1},
+        )
+
+        if not rows:
+            return []
+
+        await self.update_many(
+            document=OrderModel,
+            query={**query, "_id": {"$in": [row["_id"] for row in rows]}},
+            update={"$set": {"status": status.value, "updated_at": UTCDateTime.now()}},
+        )
+
+        return [
+            OrderStatusChange(
+                id=row["_id"],
+                customer_id=row.get("customer_id"),
+                previous_status=row["status"],
+                status=status,
+            )
+            for row in rows
+        ]
+
     async def update(self, order_id: str, order: dict) -> OrderInDB:
+        """
+        Atualiza o pedido com um único `find_one_and_update` que devolve o
+        documento anterior: ele serve de base para o delta do faturamento e,
+        com os campos alterados por cima, para a resposta. Os pagamentos só são
+        buscados quando o pedido tem algum.
+        """
         try:
-            order_model: OrderModel = OrderModel.objects(
+            fields = {field: value for field, value in order.items() if field != "updated_at"}
+
+            if "description" in fields:
+                fields["description"] = (
+                    fields["description"].strip() if fields["description"] else None
+                )
+
+            if fields.get("total_amount") is not None:
+                fields["total_amount"] = round(fields["total_amount"], 2)
+
+            fields["updated_at"] = UTCDateTime.now()
+
+            previous: OrderModel = OrderModel.objects(
                 id=order_id,
                 is_active=True,
                 organization_id=self.organization_id,
-            ).first()
+            ).modify(new=False, **fields)
 
-            order_model.update(**order)
-            order_model.description = (
-                order_model.description.strip() if order_model.description else None
-            )
-            order_model.total_amount = round(order_model.total_amount, 2)
+            if previous is None:
+                raise NotFoundError(message=f"Order #{order_id} not found")
 
-            order_model.save()
+            before = BillingContribution.from_order(order=previous)
 
-            return await self.select_by_id(id=order_id)
+            order_in_db = await self.__merge_update(order_model=previous, fields=fields)
 
-        except ValidationError:
+            await self.__billing_rollups.apply(
+                before=before, after=BillingContribution.from_order(order=order_in_db)
+            )
+
+            return order_in_db
+
+        except (NotFoundError, ValidationError):
             raise NotFoundError(message=f"Order #{order_id} not found")
 
         except Exception as error:
             _logger.error(f"Error on update_order: {error}")
             raise UnprocessableEntity(message="Error on update order")
 
+    async def apply_payment(
+        self,
+        order_id: str,
+        before: Payment | None = None,
+        after: Payment | None = None,
+    ) -> None:
+        """
+        Soma no `payment_summary` do pedido a diferença entre o pagamento antigo
+        e o novo com um único `$inc`, sem reler os pagamentos: escritas
+        concorrentes no mesmo pedido não sobrescrevem o resumo uma da outra.
+
+        Depois grava o status de pagamento e arredonda os valores somados, só se
+        o resumo ainda estiver como este `$inc` o deixou. Se outro `$inc` chegou
+        no meio, é a escrita dele que grava o status.
+        """
+        try:
+            deltas: Dict[str, float] = {}
+
+            for payment, signal in ((before, -1), (after, 1)):
+                if payment is None:
+                    continue
+
+                for field, value in (
+                    ("total_paid", payment.amount),
+                    ("count", 1),
+                    (f"methods.{PaymentMethod(payment.method).value}", payment.amount),
+                ):
+                    field = f"payment_summary.{field}"
+                    deltas[field] = deltas.get(field, 0) + signal * value
+
+            deltas = {field: value for field, value in deltas.items() if value}
+
+            if not deltas:
+                return
+
+            previous: OrderModel = OrderModel.objects(
+                id=order_id,
+                is_active=True,
+                organization_id=self.organization_id,
+            ).modify(
+                new=False,
+                __raw__={"$inc": deltas, "$set": {"updated_at": UTCDateTime.now()}},
+            )
+
+            if previous is None:
+                raise NotFoundError(message=f"Order #{order_id} not found")
+
+            before_contribution = BillingContribution.from_order(order=previous)
+
+            # o resumo como o `$inc` o deixou, com a mesma soma feita pelo Mongo; o
+            # total e a contagem entram sempre, pois o status depende deles
+            summary = previous.to_mongo().to_dict().get("payment_summary") or {}
+            incremented = {
+                field: self.__summary_value(summary=summary, field=field) + value
+                for field, value in {
+                    "payment_summary.total_paid": 0,
+                    "payment_summary.count": 0,
+                    **deltas,
+                }.items()
+            }
+            rounded = {field: round(value, 2) for field, value in incremented.items()}
+            # métodos zerados saem do resumo, como no `PaymentSummary.from_payments`
+            removed = [
+                field for field, value in rounded.items() if ".methods." in field and not value
+            ]
+            payment_summary = self.__summary_with(summary=summary, fields=rounded)
+
+            update = {
+                "$set": {
+                    **{field: value for field, value in rounded.items() if field not in removed},
+                    "payment_status": payment_summary.payment_status(
+                        total_amount=previous.total_amount
+                    ).value,
+                }
+            }
+
+            if removed:
+                update["$unset"] = {field: "" for field in removed}
+
+            if not await self.update_one(
+                document=OrderModel, query={"_id": order_id, **incremented}, update=update
+            ):
+                payment_summary = self.__summary_with(summary=summary, fields=incremented)
+
+            previous.payment_summary = payment_summary.model_dump(mode="json")
+
+            await self.__billing_rollups.apply(
+                before=before_contribution,
+                after=BillingContribution.from_order(order=previous),
+            )
+
+        except NotFoundError:
+            raise
+
+        except Exception as error:
+            _logger.error(f"Error on apply_payment: {error}")
+            raise UnprocessableEntity(message="Error on apply payment to order")
+
     async def select_count_by_date(
         self, start_date: UTCDateTime, end_date: UTCDateTime
     ) -> int:
         try:
-            count = OrderModel.objects(
+            objects = OrderModel.objects(
                 is_active=True,
                 organization_id=self.organization_id,
                 created_at__gte=start_date,
                 created_at__lte=end_date,
-            ).count()
+            )
+
+            count = await self.count_documents(OrderModel, objects._query)
 
             return count if count else 0
 
@@ -99,47 +397,20 @@ class OrderRepository(Repository):
         ignore_default_filters: bool = False,
     ) -> int:
         try:
-            objects = OrderModel.objects(
-                is_active=True,
-                is_fast_order=False,
-                organization_id=self.organization_id,
+            objects = self.__build_filtered_objects(
+                customer_id=customer_id,
+                status=status,
+                payment_status=payment_status,
+                delivery_type=delivery_type,
+                tags=tags,
+                start_date=start_date,
+                end_date=end_date,
+                min_total_amount=min_total_amount,
+                max_total_amount=max_total_amount,
+                ignore_default_filters=ignore_default_filters,
             )
 
-            if not ignore_default_filters:
-                objects = objects.filter(
-                    Q(status__ne=OrderStatus.DONE.value)
-                    | Q(payment_status__ne=PaymentStatus.PAID.value)
-                )
-
-            if customer_id:
-                objects = objects.filter(customer_id=customer_id)
-
-            if status:
-                objects = objects.filter(status=status.value)
-
-
-            if payment_status:
-                objects = objects.filter(payment_status__in=payment_status)
-
-            if delivery_type:
-                objects = objects.filter(delivery__delivery_type=delivery_type.value)
-
-            if start_date:
-                objects = objects.filter(order_date__gte=start_date)
-
-            if end_date:
-                objects = objects.filter(order_date__lt=end_date)
-
-            if tags:
-                objects = objects.filter(tags__in=tags)
-
-            if min_total_amount:
-                objects = objects.filter(total_amount__gte=min_total_amount)
-
-            if max_total_amount:
-                objects = objects.filter(total_amount__lte=max_total_amount)
-
-            return max(objects.count(), 0)
+            return max(await self.count_documents(OrderModel, objects._query), 0)
 
         except Exception as error:
             _logger.error(f"Error on select_count_by_date: {str(error)}")
@@ -156,7 +427,9 @@ class OrderRepository(Repository):
             if fast_order is not None:
                 objects = objects.filter(is_fast_order=fast_order)
 
-            order_model = list(objects.aggregate(OrderModel.get_payments()))
+            order_model = await self.aggregate_queryset(
+                objects=objects, pipeline=OrderModel.get_payments()
+            )
 
             if order_model:
                 return self.__from_order_model(order_model=order_model[0])
@@ -185,67 +458,93 @@ class OrderRepository(Repository):
         ignore_default_filters: bool = False,
         page: int = None,
         page_size: int = None,
+        cursor: PageCursor = None,
     ) -> List[OrderInDB]:
         try:
-            orders = []
-
-            objects = OrderModel.objects(
-                is_active=True,
-                is_fast_order=False,
-                organization_id=self.organization_id,
+            objects = self.__build_filtered_objects(
+                customer_id=customer_id,
+                status=status,
+                payment_status=payment_status,
+                delivery_type=delivery_type,
+                tags=tags,
+                start_date=start_date,
+                end_date=end_date,
+                min_total_amount=min_total_amount,
+                max_total_amount=max_total_amount,
+                ignore_default_filters=ignore_default_filters,
             )
 
-            if not ignore_default_filters:
-                objects = objects.filter(
-                    Q(status__ne=OrderStatus.DONE.value) |
-                    Q(payment_status__ne=PaymentStatus.PAID.value)
-                )
-
-            if customer_id:
-                objects = objects.filter(customer_id=customer_id)
-
-            if status:
-                objects = objects.filter(status=status.value)
-
-            if payment_status:
-                objects = objects.filter(payment_status__in=payment_status)
-
-            if delivery_type:
-                objects = objects.filter(delivery__delivery_type=delivery_type.value)
-
-            if start_date:
-                objects = objects.filter(order_date__gte=start_date)
-
-            if end_date:
-                objects = objects.filter(order_date__lt=end_date)
-
-            if tags:
-                objects = objects.filter(tags__in=tags)
+            objects = self.__paginate(
+                objects=objects,
+                order_by=order_by,
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+            )
 
-            if min_total_amount:
-                objects = objects.filter(total_amount__gte=min_total_amount)
+            orders = await self.select_lean(objects=objects, schema=OrderInDB)
 
-            if max_total_amount:
-                objects = objects.filter(total_amount__lte=max_total_amount)
+            return self.sort_page_rows(rows=orders, cursor=cursor)
 
-            if not order_by:
-                order_by = "order_date"
+        except Exception as error:
+            _logger.error(f"Error on select_all: {str(error)}")
+            raise NotFoundError(message=f"Orders not found")
 
-            objects = objects.order_by(f"-{order_by}")
+    async def select_page(
+        self,
+        customer_id: str,
+        status: OrderStatus,
+        payment_status: List[PaymentStatus],
+        delivery_type: DeliveryType,
+        tags: List[str],
+        start_date: UTCDateTime,
+        end_date: UTCDateTime,
+        min_total_amount: float,
+        max_total_amount: float,
+        page: int,
+        page_size: int,
+        order_by: str = None,
+        ignore_default_filters: bool = False,
+        cursor: PageCursor = None,
+    ) -> Tuple[int, List[OrderInDB]]:
+        """
+        Retorna o total de pedidos do filtro e a página pedida, buscados ao
+        mesmo tempo (`aggregate_page`), no lugar de `select_count` + `select_all`.
+        """
+        try:
+            objects = self.__build_filtered_objects(
+                customer_id=customer_id,
+                status=status,
+                payment_status=payment_status,
+                delivery_type=delivery_type,
+                tags=tags,
+                start_date=start_date,
+                end_date=end_date,
+                min_total_amount=min_total_amount,
+                max_total_amount=max_total_amount,
+                ignore_default_filters=ignore_default_filters,
+            )
 
-            if page and page_size:
-                skip = (page - 1) * page_size
-                objects = objects.skip(skip).limit(page_size)
+            paged_objects = self.__paginate(
+                objects=objects,
+                order_by=order_by,
+                page=page,
+                page_size=page_size,
+                cursor=cursor,
+            )
 
-            objects = objects.aggregate(OrderModel.get_payments())
+            total, order_models = await self.aggregate_page(
+                objects=objects,
+                paged_objects=paged_objects,
+                pipeline=OrderModel.get_payment_summary(),
+            )
 
-            for order_model in objects:
-                orders.append(self.__from_order_model(order_model=order_model))
+            orders = validate_rows(document=OrderModel, schema=OrderInDB, rows=order_models)
 
-            return orders
+            return total, self.sort_page_rows(rows=orders, cursor=cursor)
 
         except Exception as error:
-            _logger.error(f"Error on select_all: {str(error)}")
+            _logger.error(f"Error on select_page: {str(error)}")
             raise NotFoundError(message=f"Orders not found")
 
     async def select_all_without_filters(
@@ -255,8 +554,6 @@ class OrderRepository(Repository):
         Este metodo retorna todos os pedidos normais e rapidos
         """
         try:
-            orders = []
-
             objects = OrderModel.objects(
                 is_active=True,
                 organization_id=self.organization_id,
@@ -270,23 +567,203 @@ class OrderRepository(Repository):
 
             order_by = "order_date"
 
-            objects = objects.order_by(f"-{order_by}").aggregate(
-                OrderModel.get_payments()
+            return await self.select_lean(
+                objects=objects.order_by(f"-{order_by}"), schema=OrderInDB
+            )
+
+        except Exception as error:
+            _logger.error(f"Error on select_all_without_filters: {str(error)}")
+            raise NotFoundError(message=f"Orders not found")
+
+    async def select_billing_summary(
+        self, start_date: UTCDateTime, end_date: UTCDateTime
+    ) -> dict:
+        """
+        Soma os valores do faturamento do mês no MongoDB (`$group`) a partir do
+        `payment_summary` de cada pedido, retornando uma única linha.
+        """
+        try:
+            paid = {"$ifNull": ["$payment_summary.total_paid", 0]}
+
+            pipeline = [
+                {
+                    "$group": {
+                        "_id": None,
+                        "total_amount": {"$sum": "$total_amount"},
+                        "payment_received": {"$sum": paid},
+                        **{
+                            f"{method.value.lower()}_received": {
+                                "$sum": {
+                                    "$ifNull": [
+                                        f"$payment_summary.methods.{method.value}", 0
+                                    ]
+                                }
+                            }
+                            for method in PaymentMethod
+                        },
+                        "pending_payments": {
+                            "$sum": {
+                                "$cond": [
+                                    {"$lt": [paid, "$total_amount"]},
+                                    _round({"$subtract": ["$total_amount", paid]}),
+                                    0,
+                                ]
+                            }
+                        },
+                    }
+                },
+                {"$project": {"_id": 0}},
+            ]
+
+            rows = await self.aggregate_queryset(
+                objects=self.__billing_objects(start_date=start_date, end_date=end_date),
+                pipeline=pipeline,
+            )
+
+            return rows[0] if rows else {}
+
+        except Exception as error:
+            _logger.error(f"Error on select_billing_summary: {str(error)}")
+            raise NotFoundError(message=f"Orders not found")
+
+    async def select_daily_sales(
+        self, start_date: UTCDateTime, end_date: UTCDateTime
+    ) -> List[dict]:
+        """
+        Total vendido por dia do mês (sem taxa de entrega), com as mesmas regras
+        do `OrderCalculator.calculate`. Retorna apenas os dias com pedidos.
+        """
+        try:
+            pipeline = _product_lines_pipeline(keep_orders_without_products=True) + [
+                {
+                    "$group": {
+                        "_id": "$_id.order_id",
+                        "order_date": {"$first": "$order_date"},
+                        "additional": {"$first": "$additional"},
+                        "discount": {"$first": "$discount"},
+                        "products_amount": {"$sum": "$line_amount"},
+                    }
+                },
+                {
+                    "$project": {
+                        "day": {"$dayOfMonth": "$order_date"},
+                        "total_amount": _round(
+                            {
+                                "$max": [
+                                    {
+                                        "$subtract": [
+                                            {
+                                                "$add": [
+                                                    {"$ifNull": ["$additional", 0]},
+                                                    "$products_amount",
+                                                ]
+                                            },
+                                            {"$ifNull": ["$discount", 0]},
+                                        ]
+                                    },
+                                    0,
+                                ]
+                            }
+                        ),
+                    }
+                },
+                {"$group": {"_id": "$day", "total_amount": {"$sum": "$total_amount"}}},
+                {"$project": {"_id": 0, "day": "$_id", "total_amount": 1}},
+                {"$sort": {"day": 1}},
+            ]
+
+            return await self.aggregate_queryset(
+                objects=self.__billing_objects(start_date=start_date, end_date=end_date),
+                pipeline=pipeline,
+            )
+
+        except Exception as error:
+            _logger.error(f"Error on select_daily_sales: {str(error)}")
+            raise NotFoundError(message=f"Orders not found")
+
+    async def select_products_profit(
+        self, start_date: UTCDateTime, end_date: UTCDateTime, limit: int
+    ) -> List[dict]:
+        """
+        Faturamento, custo e quantidade por produto, com as mesmas regras do
+        `OrderCalculator.get_totals_per_product`, ordenado pelo lucro.
+        """
+        try:
+            pipeline = _product_lines_pipeline() + [
+                {
+                    "$group": {
+                        "_id": "$product_id",
+                        "product_name": {"$first": "$name"},
+                        "total_amount": {"$sum": "$line_amount"},
+                        "total_cost": {"$sum": "$line_cost"},
+                        "quantity": {"$sum": "$quantity"},
+                    }
+                },
+                {
+                    "$project": {
+                        "_id": 0,
+                        "product_id": "$_id",
+                        "product_name": 1,
+                        "total_amount": 1,
+                        "total_profit": {"$subtract": ["$total_amount", "$total_cost"]},
+                        "quantity": 1,
+                    }
+                },
+                {"$sort": {"total_profit": -1, "product_id": 1}},
+                {"$limit": limit},
+            ]
+
+            return await self.aggregate_queryset(
+                objects=self.__billing_objects(start_date=start_date, end_date=end_date),
+                pipeline=pipeline,
             )
 
-            for order_model in objects:
-                orders.append(self.__from_order_model(order_model=order_model))
+        except Exception as error:
+            _logger.error(f"Error on select_products_profit: {str(error)}")
+            raise NotFoundError(message=f"Orders not found")
 
-            return orders
+    async def select_best_selling_products(
+        self, start_date: UTCDateTime, end_date: UTCDateTime, limit: int
+    ) -> List[dict]:
+        """
+        Produtos que mais aparecem nos pedidos do período (uma vez por item do
+        pedido, como no relatório original).
+        """
+        try:
+            pipeline = [
+                {"$unwind": "$products"},
+                {
+                    "$group": {
+                        "_id": "$products.product_id",
+                        "product_name": {"$first": "$products.name"},
+                        "quantity": {"$sum": 1},
+                    }
+                },
+                {
+                    "$project": {
+                        "_id": 0,
+                        "product_id": "$_id",
+                        "product_name": 1,
+                        "quantity": 1,
+                    }
+                },
+                {"$sort": {"quantity": -1, "product_id": 1}},
+                {"$limit": limit},
+            ]
+
+            return await self.aggregate_queryset(
+                objects=self.__billing_objects(
+                    start_date=start_date, end_date=end_date
+                ).order_by("-order_date"),
+                pipeline=pipeline,
+            )
 
         except Exception as error:
-            _logger.error(f"Error on select_all_without_filters: {str(error)}")
+            _logger.error(f"Error on select_best_selling_products: {str(error)}")
             raise NotFoundError(message=f"Orders not found")
 
     async def select_recent(self, limit: int) -> List[OrderInDB]:
         try:
-            orders = []
-
             objects = OrderModel.objects(
                 is_active=True,
                 organization_id=self.organization_id,
@@ -295,15 +772,10 @@ class OrderRepository(Repository):
 
             objects = objects.limit(limit)
 
-            objects = objects.order_by(f"-created_at").aggregate(
-                OrderModel.get_payments()
+            return await self.select_lean(
+                objects=objects.order_by("-created_at"), schema=OrderInDB
             )
 
-            for order_model in objects:
-                orders.append(self.__from_order_model(order_model=order_model))
-
-            return orders
-
         except Exception as error:
             _logger.error(f"Error on select_recent: {str(error)}")
             raise NotFoundError(message=f"Orders not found")
@@ -319,6 +791,11 @@ class OrderRepository(Repository):
 
             if order_model:
                 order_model.delete()
+
+                await self.__billing_rollups.apply(
+                    before=BillingContribution.from_order(order=order_model)
+                )
+
                 return self.__from_order_model(order_model=order_model)
 
         except ValidationError:
@@ -328,6 +805,149 @@ class OrderRepository(Repository):
             _logger.error(f"Error on delete_by_id: {str(error)}")
             raise NotFoundError(message=f"Pedido #{id} não encontrado")
 
+    def __billing_objects(
+        self, start_date: UTCDateTime, end_date: UTCDateTime
+    ) -> QuerySet:
+        objects = OrderModel.objects(
+            is_active=True,
+            organization_id=self.organization_id,
+        )
+
+        if start_date:
+            objects = objects.filter(order_date__gte=start_date)
+
+        if end_date:
+            objects = objects.filter(order_date__lt=end_date)
+
+        return objects
+
+    def __build_filtered_objects(
+        self,
+        customer_id: str,
+        status: OrderStatus,
+        payment_status: List[PaymentStatus],
+        delivery_type: DeliveryType,
+        tags: List[str],
+        start_date: UTCDateTime,
+        end_date: UTCDateTime,
+        min_total_amount: float,
+        max_total_amount: float,
+        ignore_default_filters: bool = False,
+    ) -> QuerySet:
+        objects = OrderModel.objects(
+            is_active=True,
+            is_fast_order=False,
+            organization_id=self.organization_id,
+        )
+
+        if not ignore_default_filters:
+            objects = objects.filter(
+                Q(status__ne=OrderStatus.DONE.value) |
+                Q(payment_status__ne=PaymentStatus.PAID.value)
+            )
+
+        if customer_id:
+            objects = objects.filter(customer_id=customer_id)
+
+        if status:
+            objects = objects.filter(status=status.value)
+
+        if payment_status:
+            objects = objects.filter(payment_status__in=payment_status)
+
+        if delivery_type:
+            objects = objects.filter(delivery__delivery_type=delivery_type.value)
+
+        if start_date:
+            objects = objects.filter(order_date__gte=start_date)
+
+        if end_date:
+            objects = objects.filter(order_date__lt=end_date)
+
+        if tags:
+            objects = objects.filter(tags__in=tags)
+
+        if min_total_amount:
+            objects = objects.filter(total_amount__gte=min_total_amount)
+
+        if max_total_amount:
+            objects = objects.filter(total_amount__lte=max_total_amount)
+
+        return objects
+
+    def __paginate(
+        self,
+        objects: QuerySet,
+        order_by: str = None,
+        page: int = None,
+        page_size: int = None,
+        cursor: PageCursor = None,
+    ) -> QuerySet:
+        if not order_by:
+            order_by = "order_date"
+
+        if cursor:
+            return self.apply_page_cursor(
+                objects=objects,
+                cursor=cursor,
+                sort_field=order_by,
+                descending=True,
+                page_size=page_size,
+            )
+
+        objects = objects.order_by(f"-{order_by}")
+
+        if page and page_size:
+            skip = (page - 1) * page_size
+            objects = objects.skip(skip).limit(page_size)
+
+        return objects
+
+    async def select_payments(self, order_id: str) -> List[dict]:
+        """Pagamentos ativos do pedido no formato do `$lookup` do `get_payments`."""
+        # import local: o pacote `payments` importa este módulo
+        from app.crud.payments.models import PaymentModel
+
+        payments = await self.find(
+            document=PaymentModel,
+            query={"order_id": order_id, "is_active": True},
+        )
+
+        return [{**payment, "id": payment["_id"]} for payment in payments]
+
+    async def __merge_update(self, order_model: OrderModel, fields: dict) -> OrderInDB:
+        order = order_model.to_mongo().to_dict()
+        order.update(fields)
+        order["id"] = order.pop("_id")
+
+        if PaymentSummary.model_validate(order.get("payment_summary") or {}).count:
+            order["payments"] = await self.select_payments(order_id=order["id"])
+
+        return OrderInDB.model_validate(order)
+
+    @staticmethod
+    def __summary_value(summary: dict, field: str) -> float:
+        _, name, *method = field.split(".")
+
+        if method:
+            return (summary.get("methods") or {}).get(method[0], 0)
+
+        return summary.get(name, 0)
+
+    @staticmethod
+    def __summary_with(summary: dict, fields: Dict[str, float]) -> PaymentSummary:
+        summary = {**summary, "methods": dict(summary.get("methods") or {})}
+
+        for field, value in fields.items():
+            _, name, *method = field.split(".")
+
+            if method:
+                summary["methods"][method[0]] = value
+            else:
+                summary[name] = value
+
+        return PaymentSummary.model_validate(summary)
+
     def __from_order_model(self, order_model: dict | OrderModel) -> OrderInDB:
         try:
             order_in_db = OrderInDB(**order_model)
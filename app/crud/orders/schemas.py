@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import List, Optional, Type
+from typing import Dict, List, Optional, Type
 
 from pydantic import Field, model_validator
 
@@ -36,6 +36,41 @@ class PaymentInOrder(GenericModel, DatabaseModel):
     amount: float = Field(example=10, gt=0)
 
 
+class PaymentSummary(GenericModel):
+    total_paid: float = Field(default=0, example=10)
+    count: int = Field(default=0, example=1)
+    methods: Dict[PaymentMethod, float] = Field(
+        default={}, example={PaymentMethod.CASH: 10}
+    )
+
+    @classmethod
+    def from_payments(cls, payments: List["PaymentInOrder"]) -> "PaymentSummary":
+        summary = cls()
+
+        for payment in payments:
+            summary.total_paid += payment.amount
+            summary.count += 1
+            summary.methods[payment.method] = (
+                summary.methods.get(payment.method, 0) + payment.amount
+            )
+
+        summary.total_paid = round(summary.total_paid, 2)
+        summary.methods = {
+            method: round(amount, 2) for method, amount in summary.methods.items()
+        }
+
+        return summary
+
+    def payment_status(self, total_amount: float) -> PaymentStatus:
+        if not self.count:
+            return PaymentStatus.PENDING
+
+        if round(total_amount, 2) <= round(self.total_paid, 2):
+            return PaymentStatus.PAID
+
+        return PaymentStatus.PARTIALLY_PAID
+
+
 class Delivery(GenericModel):
     delivery_type: DeliveryType = Field(
         default=DeliveryType.WITHDRAWAL, example=DeliveryType.WITHDRAWAL
@@ -211,16 +246,70 @@ class UpdateOrder(GenericModel):
         return self
 
 
+class BulkUpdateOrderStatus(GenericModel):
+    order_ids: List[str] = Field(min_length=1, max_length=500, example=["ord_123", "ord_456"])
+    status: OrderStatus = Field(example=OrderStatus.DONE)
+
+    @model_validator(mode="after")
+    def validate_model(self) -> "BulkUpdateOrderStatus":
+        self.order_ids = list(dict.fromkeys(self.order_ids))
+
+        return self
+
+
+class OrderStatusChange(GenericModel):
+    id: str = Field(example="ord_123")
+    customer_id: str | None = Field(default=None, example="cus_123")
+    previous_status: OrderStatus = Field(example=OrderStatus.PREPARED)
+    status: OrderStatus = Field(example=OrderStatus.DONE)
+
+
+class BulkOrderStatusReport(GenericModel):
+    changed: List[OrderStatusChange] = Field(default=[])
+    # não encontrados ou que já estavam com o status pedido
+    unchanged: List[str] = Field(default=[], example=["ord_789"])
+
+
 class OrderInDB(Order, DatabaseModel):
     organization_id: str = Field(example="66bae5c2e59a0787e2c903e3")
     total_amount: float = Field(example=12.2)
     is_active: bool = Field(example=True, exclude=True)
     payments: List[PaymentInOrder] = Field(default=[])
+    payment_summary: PaymentSummary = Field(default=PaymentSummary())
     payment_status: PaymentStatus = Field(
         default=PaymentStatus.PENDING, example=PaymentStatus.PENDING
     )
 
+    @model_validator(mode="after")
+    def validate_payment_summary(self) -> "OrderInDB":
+        if self.payments:
+            self.payment_summary = PaymentSummary.from_payments(payments=self.payments)
+
+        return self
+
 
 class CompleteOrder(OrderInDB):
     customer: CustomerInDB | None = Field(default=None)
     tags: List[TagInDB] | List[str] = Field(default=[])
+
+
+class OrderImportFormat(str, Enum):
+    CSV = "CSV"
+    NDJSON = "NDJSON"
+
+
+class OrderImportError(GenericModel):
+    row: int = Field(example=3)
+    message: str = Field(example="Product #pro_123 not found")
+
+
+class OrderImportReport(GenericModel):
+    total_rows: int = Field(default=0, example=3)
+    imported: int = Field(default=0, example=2)
+    failed: int = Field(default=0, example=1)
+    order_ids: List[str] = Field(default=[], example=["ord_123", "ord_456"])
+    errors: List[OrderImportError] = Field(default=[])
+
+    def add_error(self, row: int, message: str) -> None:
+        self.failed += 1
+        self.errors.append(OrderImportError(row=row, message=message))
@@ -1,38 +1,61 @@
-from typing import List
+from typing import BinaryIO, Dict, List, Tuple
+
+from pydantic import ValidationError
 
 from app.api.dependencies.get_plan_feature import get_plan_feature
 from app.api.exceptions.authentication_exceptions import UnauthorizedException, BadRequestException
 from app.builder.order_calculator import OrderCalculator
 from app.core.configs import get_logger
+from app.core.exceptions import NotFoundError
+from app.core.models.base_schema import construct_from
 from app.core.utils.features import Feature
 from app.core.utils.get_start_and_end_day_of_month import get_start_and_end_day_of_month
+from app.core.utils.page_cursor import PageCursor
 from app.core.utils.utc_datetime import UTCDateTime
 from app.crud.customers.repositories import CustomerRepository
+from app.crud.customers.schemas import CustomerInDB
 from app.crud.organizations.repositories import OrganizationRepository
 from app.crud.products.repositories import ProductRepository
+from app.crud.products.schemas import ProductInDB
 from app.crud.shared_schemas.payment import PaymentStatus
 from app.crud.tags.repositories import TagRepository
+from app.crud.tags.schemas import TagInDB
 from app.crud.additional_items.repositories import AdditionalItemRepository
+from app.crud.additional_items.schemas import AdditionalItemInDB
 from app.crud.product_additionals.repositories import ProductAdditionalRepository
+from app.crud.product_additionals.schemas import ProductAdditionalInDB
 from app.crud.messages.services import MessageServices
 
 from .repositories import OrderRepository
 from .schemas import (
+    BulkOrderStatusReport,
+    BulkUpdateOrderStatus,
     CompleteOrder,
     DeliveryType,
     Order,
     OrderInDB,
+    OrderImportFormat,
+    OrderImportReport,
     OrderStatus,
+    OrderStatusChange,
     RequestedProduct,
     RequestOrder,
     StoredProduct,
     StoredAdditionalItem,
     UpdateOrder,
 )
+from .importer import ImportRow, format_validation_error, read_order_chunks
 from .message_manager import OrderMessageManager
 
 logger = get_logger(__name__)
 
+# produtos por id, grupos de adicionais por produto e itens adicionais por id
+ProductCatalog = Tuple[
+    Dict[str, ProductInDB],
+    Dict[str, List[ProductAdditionalInDB]],
+    Dict[str, AdditionalItemInDB],
+]
+
 
 class OrderServices:
 
@@ -56,9 +79,6 @@ class OrderServices:
         self.__product_additional_repository = product_additional_repository
         self.organization_id = self.__order_repository.organization_id
 
-        self.__cache_tags = {}
-        self.__cache_customers = {}
-
         self.__order_calculator = OrderCalculator(
             product_repository=self.__product_repository
         )
@@ -100,30 +120,94 @@ class OrderServices:
             id=self.__order_repository.organization_id
         )
 
-        total_amount = await self.__order_calculator.calculate(
-            additional=order.additional,
-            delivery_value=order.delivery.delivery_value if order.delivery.delivery_value is not None else 0,
-            discount=order.discount,
-            products=products
+        order, total_amount = await self.__build_order(
+            order=order, products=products, organization_tax=organization.tax
         )
 
-        total_tax = 0
-
-        if organization.tax:
-            total_tax = round(total_amount * (organization.tax / 100), 2)
-            total_amount += total_tax
-
-        order.products = []
-        order = Order.model_validate(order)
-        order.products = products
-        order.tax = total_tax
-
         order_in_db = await self.__order_repository.create(
             order=order, total_amount=total_amount
         )
 
         return await self.__build_complete_order(order_in_db)
 
+    async def import_orders(
+        self,
+        stream: BinaryIO,
+        file_format: OrderImportFormat,
+        chunk_size: int = 500,
+    ) -> OrderImportReport:
+        """
+        Importa pedidos de um arquivo CSV ou NDJSON em blocos de `chunk_size`
+        linhas: cada bloco é validado com as mesmas regras do `create`, com
+        produtos, tags e clientes buscados em lote, e gravado com um único
+        `insert_many`. O limite do plano é verificado uma vez para o arquivo;
+        as linhas além dele entram no relatório de erros.
+        """
+        plan_feature = await get_plan_feature(
+            organization_id=self.__order_repository.organization_id,
+            feature_name=Feature.MAX_ORDERS,
+        )
+
+        start_date, end_date = get_start_and_end_day_of_month()
+
+        quantity = await self.__order_repository.select_count_by_date(
+            start_date=start_date, end_date=end_date
+        )
+
+        if not plan_feature or (
+            plan_feature.value != "-" and (quantity + 1) >= int(plan_feature.value)
+        ):
+            raise UnauthorizedException(
+                detail=f"Maximum number of orders reached, Max value: {plan_feature.value}"
+            )
+
+        remaining = (
+            None if plan_feature.value == "-" else int(plan_feature.value) - quantity - 1
+        )
+
+        organization = await self.__organization_repository.select_by_id(
+            id=self.__order_repository.organization_id
+        )
+
+        report = OrderImportReport()
+
+        async for chunk in read_order_chunks(
+            stream=stream, file_format=file_format, chunk_size=chunk_size
+        ):
+            report.total_rows += len(chunk)
+
+            orders = await self.__validate_import_chunk(
+                chunk=chunk, organization_tax=organization.tax, report=report
+            )
+
+            if remaining is not None:
+                for line, _, _ in orders[remaining:]:
+                    report.add_error(row=line, message="Maximum number of orders reached")
+
+                orders = orders[:remaining]
+
+            if not orders:
+                continue
+
+            order_ids, errors = await self.__order_repository.create_many(
+                orders=[(order, total_amount) for _, order, total_amount in orders]
+            )
+
+            for index, (line, _, _) in enumerate(orders):
+                if index in errors:
+                    report.add_error(row=line, message="Error on create new order")
+                    continue
+
+                report.imported += 1
+                report.order_ids.append(order_ids[index])
+
+            if remaining is not None:
+                remaining -= len(orders) - len(errors)
+
+        report.errors.sort(key=lambda error: error.row)
+
+        return report
+
     async def update(self, id: str, updated_order: UpdateOrder) -> CompleteOrder:
         order_in_db = await self.search_by_id(id=id)
         updated_fields = {}
@@ -215,11 +299,30 @@ class OrderServices:
                 order=order_in_db,
                 previous_status=previous_status,
                 organization_id=self.__order_repository.organization_id,
-                customer_cache=self.__cache_customers,
             )
 
         return await self.__build_complete_order(order_in_db)
 
+    async def update_status_many(
+        self, bulk_update: BulkUpdateOrderStatus
+    ) -> BulkOrderStatusReport:
+        changes = await self.__order_repository.update_status_many(
+            order_ids=bulk_update.order_ids,
+            status=bulk_update.status,
+        )
+        changed_ids = {change.id for change in changes}
+
+        return BulkOrderStatusReport(
+            changed=changes,
+            unchanged=[id for id in bulk_update.order_ids if id not in changed_ids],
+        )
+
+    async def send_status_notifications(self, changes: List[OrderStatusChange]) -> None:
+        await self.__order_message_manager.send_status_updates(
+            changes=changes,
+            organization_id=self.__order_repository.organization_id,
+        )
+
     async def search_by_id(self, id: str, expand: List[str] = []) -> CompleteOrder:
         order_in_db = await self.__order_repository.select_by_id(id=id)
 
@@ -267,7 +370,8 @@ class OrderServices:
         order_by: str = None,
         ignore_default_filters: bool = False,
         page: int = None,
-        page_size: int = None
+        page_size: int = None,
+        cursor: PageCursor = None,
     ) -> List[CompleteOrder]:
 
         orders = await self.__order_repository.select_all(
@@ -283,32 +387,76 @@ class OrderServices:
             order_by=order_by,
             ignore_default_filters=ignore_default_filters,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
         )
 
-        if "customers" in expand:
-            customer_ids = {
-                order.customer_id
-                for order in orders
-                if order.customer_id and order.customer_id not in self.__cache_customers
-            }
+        return await self.__build_complete_orders(orders=orders, expand=expand)
 
-            if customer_ids:
-                customers = await self.__customer_repository.select_by_ids(
-                    list(customer_ids)
-                )
+    async def search_page(
+        self,
+        status: OrderStatus,
+        payment_status: List[PaymentStatus],
+        delivery_type: DeliveryType,
+        customer_id: str,
+        start_date: UTCDateTime,
+        end_date: UTCDateTime,
+        tags: List[str],
+        min_total_amount: float,
+        max_total_amount: float,
+        expand: List[str],
+        page: int,
+        page_size: int,
+        order_by: str = None,
+        ignore_default_filters: bool = False,
+        cursor: PageCursor = None,
+    ) -> Tuple[int, List[CompleteOrder]]:
+        total, orders = await self.__order_repository.select_page(
+            customer_id=customer_id,
+            status=status,
+            payment_status=payment_status,
+            delivery_type=delivery_type,
+            start_date=start_date,
+            end_date=end_date,
+            min_total_amount=min_total_amount,
+            max_total_amount=max_total_amount,
+            tags=tags,
+            order_by=order_by,
+            ignore_default_filters=ignore_default_filters,
+            page=page,
+            page_size=page_size,
+            cursor=cursor,
+        )
+
+        return total, await self.__build_complete_orders(orders=orders, expand=expand)
 
-                for customer in customers:
-                    self.__cache_customers[customer.id] = customer
+    async def search_billing_summary(
+        self, start_date: UTCDateTime, end_date: UTCDateTime
+    ) -> dict:
+        return await self.__order_repository.select_billing_summary(
+            start_date=start_date, end_date=end_date
+        )
 
-        complete_orders = []
+    async def search_daily_sales(
+        self, start_date: UTCDateTime, end_date: UTCDateTime
+    ) -> List[dict]:
+        return await self.__order_repository.select_daily_sales(
+            start_date=start_date, end_date=end_date
+        )
 
-        for order in orders:
-            complete_orders.append(
-                await self.__build_complete_order(order_in_db=order, expand=expand)
-            )
+    async def search_products_profit(
+        self, start_date: UTCDateTime, end_date: UTCDateTime, limit: int
+    ) -> List[dict]:
+        return await self.__order_repository.select_products_profit(
+            start_date=start_date, end_date=end_date, limit=limit
+        )
 
-        return complete_orders
+    async def search_best_selling_products(
+        self, start_date: UTCDateTime, end_date: UTCDateTime, limit: int
+    ) -> List[dict]:
+        return await self.__order_repository.select_best_selling_products(
+            start_date=start_date, end_date=end_date, limit=limit
+        )
 
     async def search_all_without_filters(
         self,
@@ -322,99 +470,71 @@ class OrderServices:
             end_date=end_date,
         )
 
-        if "customers" in expand:
-            customer_ids = {
-                order.customer_id
-                for order in orders
-                if order.customer_id and order.customer_id not in self.__cache_customers
-            }
-
-            if customer_ids:
-                customers = await self.__customer_repository.select_by_ids(
-                    list(customer_ids)
-                )
-
-                for customer in customers:
-                    self.__cache_customers[customer.id] = customer
-
-        complete_orders = []
-
-        for order in orders:
-            complete_orders.append(
-                await self.__build_complete_order(order_in_db=order, expand=expand)
-            )
-
-        return complete_orders
+        return await self.__build_complete_orders(orders=orders, expand=expand)
 
     async def search_recent(
         self, limit: int = 10, expand: List[str] = []
     ) -> List[CompleteOrder]:
         orders = await self.__order_repository.select_recent(limit=limit)
 
+        return await self.__build_complete_orders(orders=orders, expand=expand)
+
+    async def delete_by_id(self, id: str) -> CompleteOrder:
+        order_in_db = await self.__order_repository.delete_by_id(id=id)
+        return await self.__build_complete_order(order_in_db)
+
+    async def __build_complete_orders(
+        self, orders: List[OrderInDB], expand: List[str] = []
+    ) -> List[CompleteOrder]:
+        customers, tags = {}, {}
+
+        # clientes e tags vêm em lote (e do cache compartilhado dos repositórios)
         if "customers" in expand:
-            customer_ids = {
-                order.customer_id
-                for order in orders
-                if order.customer_id and order.customer_id not in self.__cache_customers
-            }
+            customer_ids = {order.customer_id for order in orders if order.customer_id}
 
             if customer_ids:
-                customers = await self.__customer_repository.select_by_ids(
-                    list(customer_ids)
-                )
+                customers = {
+                    customer.id: customer
+                    for customer in await self.__customer_repository.select_by_ids(
+                        list(customer_ids)
+                    )
+                }
 
-                for customer in customers:
-                    self.__cache_customers[customer.id] = customer
+        if "tags" in expand:
+            tag_ids = {tag for order in orders for tag in order.tags}
 
-        complete_orders = []
+            if tag_ids:
+                tags = {
+                    tag.id: tag
+                    for tag in await self.__tag_repository.select_by_ids(ids=list(tag_ids))
+                }
 
-        for order in orders:
-            complete_orders.append(
-                await self.__build_complete_order(order_in_db=order, expand=expand)
+        return [
+            await self.__build_complete_order(
+                order_in_db=order, expand=expand, customers=customers, tags=tags
             )
-
-        return complete_orders
-
-    async def delete_by_id(self, id: str) -> CompleteOrder:
-        order_in_db = await self.__order_repository.delete_by_id(id=id)
-        return await self.__build_complete_order(order_in_db)
+            for order in orders
+        ]
 
     async def __build_complete_order(
-        self, order_in_db: OrderInDB, expand: List[str] = []
+        self,
+        order_in_db: OrderInDB,
+        expand: List[str] = [],
+        customers: Dict[str, CustomerInDB] = None,
+        tags: Dict[str, TagInDB] = None,
     ) -> CompleteOrder:
-        complete_order = CompleteOrder(
-            id=order_in_db.id,
-            organization_id=order_in_db.organization_id,
-            customer_id=order_in_db.customer_id,
-            status=order_in_db.status,
-            payment_status=order_in_db.payment_status,
-            products=order_in_db.products,
-            tags=order_in_db.tags,
-            delivery=order_in_db.delivery,
-            preparation_date=order_in_db.preparation_date,
-            order_date=order_in_db.order_date,
-            reason_id=order_in_db.reason_id,
-            total_amount=order_in_db.total_amount,
-            description=order_in_db.description,
-            additional=order_in_db.additional,
-            discount=order_in_db.discount,
-            payments=order_in_db.payments,
-            tax=order_in_db.tax,
-            is_active=order_in_db.is_active,
-            created_at=order_in_db.created_at,
-            updated_at=order_in_db.updated_at,
-        )
+        # o pedido já foi validado na leitura: só copia os campos
+        complete_order = construct_from(CompleteOrder, order_in_db)
 
         if "customers" in expand:
             if order_in_db.customer_id is not None:
-                if order_in_db.customer_id not in self.__cache_customers:
+                if customers is not None:
+                    customer = customers.get(order_in_db.customer_id)
+
+                else:
                     customer = await self.__customer_repository.select_by_id(
                         id=order_in_db.customer_id, raise_404=False
                     )
-                    self.__cache_customers[order_in_db.customer_id] = customer
-
-                else:
-                    customer = self.__cache_customers[order_in_db.customer_id]
 
                 if customer:
                     complete_order.customer = customer
@@ -423,27 +543,177 @@ class OrderServices:
             complete_order.tags = []
 
             for tag in order_in_db.tags:
-                if tag not in self.__cache_tags:
+                if tags is not None:
+                    tag_in_db = tags.get(tag)
+
+                else:
                     tag_in_db = await self.__tag_repository.select_by_id(
                         id=tag, raise_404=False
                     )
-                    self.__cache_tags[tag] = tag_in_db
-
-                else:
-                    tag_in_db = self.__cache_tags[tag]
 
                 if tag_in_db:
                     complete_order.tags.append(tag_in_db)
 
         return complete_order
 
+    async def __build_order(
+        self, order: RequestOrder, products: List[StoredProduct], organization_tax: float
+    ) -> Tuple[Order, float]:
+        total_amount = await self.__order_calculator.calculate(
+            additional=order.additional,
+            delivery_value=order.delivery.delivery_value if order.delivery.delivery_value is not None else 0,
+            discount=order.discount,
+            products=products
+        )
+
+        total_tax = 0
+
+        if organization_tax:
+            total_tax = round(total_amount * (organization_tax / 100), 2)
+            total_amount += total_tax
+
+        order.products = []
+        order = Order.model_validate(order)
+        order.products = products
+        order.tax = total_tax
+
+        return order, total_amount
+
+    async def __validate_import_chunk(
+        self,
+        chunk: List[ImportRow],
+        organization_tax: float,
+        report: OrderImportReport,
+    ) -> List[Tuple[int, Order, float]]:
+        """
+        Valida um bloco da importação. As linhas inválidas vão para `report` e
+        as válidas voltam com o número da linha, o pedido e o total.
+        """
+        requests: List[Tuple[int, RequestOrder]] = []
+
+        for line, row in chunk:
+            if isinstance(row, ValueError):
+                report.add_error(row=line, message=str(row))
+                continue
+
+            try:
+                requests.append((line, RequestOrder.model_validate(row)))
+
+            except ValidationError as error:
+                report.add_error(row=line, message=format_validation_error(error))
+
+        if not requests:
+            return []
+
+        customer_ids = list(
+            {order.customer_id for _, order in requests if order.customer_id is not None}
+        )
+        tag_ids = list({tag for _, order in requests for tag in order.tags})
+
+        customers = set()
+        tags = set()
+
+        if customer_ids:
+            customers = {
+                customer.id
+                for customer in await self.__customer_repository.select_by_ids(ids=customer_ids)
+            }
+
+        if tag_ids:
+            tags = {tag.id for tag in await self.__tag_repository.select_by_ids(ids=tag_ids)}
+
+        catalog = await self.__load_catalog(
+            raw_products=[product for _, order in requests for product in order.products]
+        )
+
+        orders = []
+
+        for line, order in requests:
+            missing_tag = next((tag for tag in order.tags if tag not in tags), None)
+
+            if missing_tag:
+                report.add_error(row=line, message=f"Tag #{missing_tag} not found")
+                continue
+
+            if order.customer_id is not None and order.customer_id not in customers:
+                report.add_error(row=line, message=f"Customer #{order.customer_id} not found")
+                continue
+
+            try:
+                products = self.__build_products(raw_products=order.products, catalog=catalog)
+
+            except NotFoundError as error:
+                report.add_error(row=line, message=error.message)
+                continue
+
+            except BadRequestException as error:
+                report.add_error(row=line, message=error.detail)
+                continue
+
+            order, total_amount = await self.__build_order(
+                order=order, products=products, organization_tax=organization_tax
+            )
+            orders.append((line, order, total_amount))
+
+        return orders
+
     async def __validate_products(self, raw_products: List[RequestedProduct]) -> List[StoredProduct]:
+        catalog = await self.__load_catalog(raw_products=raw_products)
+
+        return self.__build_products(raw_products=raw_products, catalog=catalog)
+
+    async def __load_catalog(self, raw_products: List[RequestedProduct]) -> ProductCatalog:
+        """
+        Busca produtos, grupos de adicionais e itens de uma vez só (no máximo
+        três consultas, não importa quantas linhas o pedido ou o lote tenha).
+        """
+        product_ids = list(dict.fromkeys(product.product_id for product in raw_products))
+        products_with_additionals = list(
+            dict.fromkeys(
+                product.product_id for product in raw_products if product.additionals
+            )
+        )
+        item_ids = list(
+            dict.fromkeys(
+                additional.item_id
+                for product in raw_products
+                for additional in product.additionals
+            )
+        )
+
+        products_in_db = {}
+        groups_by_product = {}
+        items_in_db = {}
+
+        if product_ids:
+            products_in_db = {
+                product.id: product
+                for product in await self.__product_repository.select_by_ids(ids=product_ids)
+            }
+
+        if products_with_additionals:
+            groups_by_product = await self.__product_additional_repository.select_by_product_ids(
+                product_ids=products_with_additionals
+            )
+            items_in_db = {
+                item.id: item
+                for item in await self.__additional_item_repository.select_by_ids(ids=item_ids)
+            }
+
+        return products_in_db, groups_by_product, items_in_db
+
+    def __build_products(
+        self, raw_products: List[RequestedProduct], catalog: ProductCatalog
+    ) -> List[StoredProduct]:
+        """Valida cada linha na ordem recebida usando o que foi carregado em `catalog`."""
         products = []
+        products_in_db, groups_by_product, items_in_db = catalog
 
         for product in raw_products:
-            product_in_db = await self.__product_repository.select_by_id(
-                id=product.product_id
-            )
+            product_in_db = products_in_db.get(product.product_id)
+
+            if not product_in_db:
+                raise NotFoundError(message=f"Product #{product.product_id} not found")
 
             stored_product = StoredProduct(
                 product_id=product.product_id,
@@ -454,17 +724,16 @@ class OrderServices:
                 observation=product.observation,
             )
 
-            additionals_group = await self.__product_additional_repository.select_by_product_id(
-                product_id=product.product_id
-            )
+            additionals_group = groups_by_product.get(product.product_id, [])
 
             group_map = {grp.id: grp for grp in additionals_group}
             group_counts = {grp.id: 0 for grp in additionals_group}
 
             for additional in product.additionals:
-                item_in_db = await self.__additional_item_repository.select_by_id(
-                    id=additional.item_id
-                )
+                item_in_db = items_in_db.get(additional.item_id)
+
+                if not item_in_db:
+                    raise NotFoundError(message=f"AdditionalItem #{additional.item_id} not found")
 
                 if item_in_db.additional_id not in group_map:
                     raise BadRequestException(
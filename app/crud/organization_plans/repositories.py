@@ -1,7 +1,8 @@
-from typing import Dict, List
+from typing import List, MutableMapping
 
 from mongoengine import Q
 
+from app.api.dependencies.plan_feature_cache import invalidate_plan_features
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
@@ -15,7 +16,7 @@ _logger = get_logger(__name__)
 
 class OrganizationPlanRepository(Repository):
 
-    def __init__(self, cache_plans: Dict[str, OrganizationPlanInDB]):
+    def __init__(self, cache_plans: MutableMapping[str, OrganizationPlanInDB]):
         super().__init__()
         self.__cache_plans = cache_plans
 
@@ -23,7 +24,7 @@ class OrganizationPlanRepository(Repository):
         self, organization_plan: OrganizationPlan, organization_id: str
     ) -> OrganizationPlanInDB:
         try:
-            self.clear_cache(organization_id=organization_id)
+            await self.clear_cache(organization_id=organization_id)
 
             organization_plan_model = OrganizationPlanModel(
                 organization_id=organization_id,
@@ -47,23 +48,24 @@ class OrganizationPlanRepository(Repository):
         self, organization_plan: OrganizationPlanInDB
     ) -> OrganizationPlanInDB:
         try:
-            self.clear_cache()
+            await self.clear_cache()
 
-            organization_plan_model: OrganizationPlanModel = (
-                OrganizationPlanModel.objects(
-                    id=organization_plan.id,
-                    organization_id=organization_plan.organization_id,
-                    is_active=True,
-                ).first()
-            )
+            organization_plan_model = OrganizationPlanModel(id=organization_plan.id)
 
-            organization_plan_model.update(
+            if not organization_plan_model.update(
+                query={
+                    "organization_id": organization_plan.organization_id,
+                    "is_active": True,
+                },
                 **organization_plan.model_dump(
                     exclude=["active_plan", "has_paid_invoice"]
+                ),
+            ):
+                raise NotFoundError(
+                    message=f"OrganizationPlan #{organization_plan.id} not found"
                 )
-            )
 
-            return await self.select_by_id(id=organization_plan.id)
+            return OrganizationPlanInDB.model_validate(organization_plan_model)
 
         except Exception as error:
             _logger.error(f"Error on update_organization_plan: {str(error)}")
@@ -108,7 +110,7 @@ class OrganizationPlanRepository(Repository):
 
     async def delete_by_id(self, id: str, organization_id) -> OrganizationPlanInDB:
         try:
-            self.clear_cache(organization_id=organization_id)
+            await self.clear_cache(organization_id=organization_id)
 
             organization_plan_model: OrganizationPlanModel = (
                 OrganizationPlanModel.objects(
@@ -125,8 +127,10 @@ class OrganizationPlanRepository(Repository):
 
     async def select_active_plan(self, organization_id: str) -> OrganizationPlanInDB:
         try:
-            if self.__cache_plans.get(organization_id) and self.__cache_plans[organization_id].calculate_active_plan():
-                return self.__cache_plans[organization_id]
+            cached_plan = self.__cache_plans.get(organization_id)
+
+            if cached_plan and cached_plan.calculate_active_plan():
+                return cached_plan
 
             pipeline = [
                 {"$match": {"is_active": True, "organization_id": organization_id}},
@@ -205,13 +209,11 @@ class OrganizationPlanRepository(Repository):
 
         return []
 
-    def clear_cache(self, organization_id: str = None) -> bool:
-        if organization_id:
-            if self.__cache_plans.get(organization_id):
-                self.__cache_plans.pop(organization_id)
-                return True
+    async def clear_cache(self, organization_id: str = None) -> bool:
+        await invalidate_plan_features(organization_id=organization_id)
 
-            return False
+        if organization_id:
+            return self.__cache_plans.pop(organization_id, None) is not None
 
         self.__cache_plans.clear()
         return True
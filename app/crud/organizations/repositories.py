@@ -7,6 +7,7 @@ from pydantic_core import ValidationError
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
+from app.core.repositories.entity_cache import organization_cache
 from app.core.utils.slugify import slugify
 from app.core.utils.utc_datetime import UTCDateTime
 
@@ -59,20 +60,29 @@ class OrganizationRepository(Repository):
             organization_model.slug = slugify(organization_model.name.strip())
 
             organization_model.save()
+            organization_cache.invalidate(organization_id=organization_id, id=organization_id)
 
-            return await self.select_by_id(id=organization_id)
+            return OrganizationInDB.model_validate(organization_model)
 
         except Exception as error:
             _logger.error(f"Error on update_organization: {str(error)}")
             raise UnprocessableEntity(message="Error on update organization")
 
     async def select_by_id(self, id: str) -> OrganizationInDB:
+        organization_in_db = organization_cache.get(organization_id=id, id=id)
+
+        if organization_in_db:
+            return organization_in_db
+
         try:
             organization_model: OrganizationModel = OrganizationModel.objects(
                 id=id, is_active=True
             ).first()
 
-            return OrganizationInDB.model_validate(organization_model)
+            organization_in_db = OrganizationInDB.model_validate(organization_model)
+            organization_cache.set(organization_id=id, entity=organization_in_db)
+
+            return organization_in_db
 
         except ValidationError:
             raise NotFoundError(message=f"Organization #{id} not found")
@@ -107,6 +117,7 @@ class OrganizationRepository(Repository):
                 id=id, is_active=True
             ).first()
             organization_model.delete()
+            organization_cache.invalidate(organization_id=id, id=id)
 
             return OrganizationInDB.model_validate(organization_model)
 
@@ -1,5 +1,5 @@
 from datetime import timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, MutableMapping, Optional
 from uuid import uuid4
 
 from app.api.dependencies.email_sender import send_email
@@ -8,9 +8,10 @@ from app.api.exceptions.authentication_exceptions import UnauthorizedException,
 from app.core.utils.features import Feature
 from app.core.utils.utc_datetime import UTCDateTime
 from app.core.exceptions import NotFoundError, UnprocessableEntity
+from app.core.models.base_schema import construct_from
 from app.crud.addresses import AddressServices
 from app.crud.files.repositories import FileRepository
-from app.crud.files.schemas import FilePurpose
+from app.crud.files.schemas import FileInDB, FilePurpose
 from app.crud.invoices import InvoiceServices
 from app.crud.invoices.schemas import Invoice, InvoiceStatus
 from app.crud.messages.repositories import MessageRepository
@@ -24,7 +25,7 @@ from app.crud.users.schemas import CompleteUserInDB, UserInDB
 from app.crud.plans import PlanServices
 from app.crud.shared_schemas.address import Address
 
-from .schemas import CompleteOrganization, Organization, OrganizationInDB, RoleEnum, UpdateOrganization, UserOrganization
+from .schemas import CompleteOrganization, CompleteUserOrganization, Organization, OrganizationInDB, RoleEnum, UpdateOrganization, UserOrganization
 from .repositories import OrganizationRepository
 from app.crud.organization_plans.repositories import OrganizationPlanRepository
 from app.core.configs import get_logger
@@ -40,7 +41,7 @@ class OrganizationServices:
         user_repository: UserRepository,
         organization_plan_repository: OrganizationPlanRepository,
         address_services: AddressServices,
-        cached_complete_users: Dict[str, CompleteUserInDB],
+        cached_complete_users: MutableMapping[str, CompleteUserInDB],
         plan_services: Optional[PlanServices] = None,
         organization_plan_services: Optional[OrganizationPlanServices] = None,
         invoice_services: Optional[InvoiceServices] = None,
@@ -136,7 +137,7 @@ class OrganizationServices:
                 )
             )
 
-            self.__organization_plan_repository.clear_cache(organization_id=organization_id)
+            await self.__organization_plan_repository.clear_cache(organization_id=organization_id)
             return True
 
         except NotFoundError:
@@ -145,7 +146,7 @@ class OrganizationServices:
         except Exception as error:
             logger.error(f"Error provisioning Premium trial for organization {organization_id}: {str(error)}")
 
-        self.__organization_plan_repository.clear_cache(organization_id=organization_id)
+        await self.__organization_plan_repository.clear_cache(organization_id=organization_id)
         return False
 
     async def check_if_can_add_more_users(self, organization_id: str) -> None:
@@ -222,10 +223,20 @@ class OrganizationServices:
         if not expand:
             return organizations
 
+        # os arquivos de todas as organizações vêm em uma query, com as URLs assinadas em lote
+        files = None
+        if "file" in expand:
+            files = await FileRepository.select_by_organizations(file_ids={
+                organization.id: organization.file_id
+                for organization in organizations
+                if organization.file_id
+            })
+
         for organization in organizations:
             complete_organizations.append(await self.__build_complete_organization(
                 organization=organization,
-                expand=expand
+                expand=expand,
+                files=files
             ))
 
         return complete_organizations
@@ -247,8 +258,21 @@ class OrganizationServices:
 
         return organization_in_db
 
-    async def __build_complete_organization(self, organization: OrganizationInDB, expand: List[str] = []) -> CompleteOrganization:
-        complete_organization = CompleteOrganization.model_validate(organization)
+    async def __build_complete_organization(
+        self,
+        organization: OrganizationInDB,
+        expand: List[str] = [],
+        files: Dict[str, FileInDB] | None = None
+    ) -> CompleteOrganization:
+        complete_organization = construct_from(
+            CompleteOrganization,
+            organization,
+            users=(
+                [construct_from(CompleteUserOrganization, user) for user in organization.users]
+                if organization.users is not None
+                else None
+            ),
+        )
 
         if "users" in expand:
             for user in complete_organization.users:
@@ -264,7 +288,10 @@ class OrganizationServices:
             )
             complete_organization.plan = organization_plan
 
-        if "file" in expand:
+        if "file" in expand and files is not None:
+            complete_organization.file = files.get(organization.id)
+
+        elif "file" in expand:
             file_repository = FileRepository(organization_id=organization.id)
             complete_organization.file = await file_repository.select_by_id(
                 id=complete_organization.file_id,
@@ -520,11 +547,8 @@ class OrganizationServices:
         return True
 
     def clear_user_cache(self, user_id: str) -> bool:
-        if self.__cached_complete_users.get(user_id):
-            self.__cached_complete_users.pop(user_id)
-            return True
-
-        return False
+        # o `pop` invalida também nos outros workers, mesmo sem o usuário aqui
+        return self.__cached_complete_users.pop(user_id, None) is not None
 
     async def __subscribe_user_to_marketing(self, user: UserInDB, description: str) -> bool:
         if not self.__marketing_email_services:
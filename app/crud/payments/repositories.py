@@ -36,13 +36,15 @@ class PaymentRepository(Repository):
 
     async def update(self, payment: PaymentInDB) -> PaymentInDB:
         try:
-            payment_model: PaymentModel = PaymentModel.objects(
-                id=payment.id, is_active=True, organization_id=self.__organization_id
-            ).first()
+            payment_model = PaymentModel(id=payment.id)
 
-            payment_model.update(**payment.model_dump())
+            if not payment_model.update(
+                query={"is_active": True, "organization_id": self.__organization_id},
+                **payment.model_dump(),
+            ):
+                raise NotFoundError(message=f"Payment #{payment.id} not found")
 
-            return await self.select_by_id(id=payment.id)
+            return PaymentInDB.model_validate(payment_model)
 
         except Exception as error:
             _logger.error(f"Error on update_payment: {str(error)}")
@@ -1,14 +1,15 @@
 from typing import List
 
 from app.api.exceptions.authentication_exceptions import BadRequestException
+from app.core.configs import get_logger
 from app.core.exceptions.users import UnprocessableEntity
 from app.crud.orders.repositories import OrderRepository
-from app.crud.orders.schemas import OrderInDB
 from app.crud.shared_schemas.payment import PaymentStatus
 
 from .schemas import Payment, PaymentInDB, UpdatePayment
 from .repositories import PaymentRepository
 
+_logger = get_logger(__name__)
 
 
 class PaymentServices:
@@ -29,24 +30,24 @@ class PaymentServices:
 
         payment_in_db = await self.__payment_repository.create(payment=payment)
 
-        await self.update_payment_status(order_in_db=order_in_db)
+        await self.__apply_to_order(order_id=payment_in_db.order_id, after=payment_in_db)
 
         return payment_in_db
 
     async def update(self, id: str, updated_payment: UpdatePayment) -> PaymentInDB:
         payment_in_db = await self.search_by_id(id=id)
+        previous_payment = payment_in_db.model_copy()
 
         is_updated = payment_in_db.validate_updated_fields(update_payment=updated_payment)
 
         if is_updated:
             payment_in_db = await self.__payment_repository.update(payment=payment_in_db)
 
-        order_in_db = await self.__order_repository.select_by_id(
-            id=payment_in_db.id,
-            fast_order=None
-        )
-
-        await self.update_payment_status(order_in_db=order_in_db)
+            await self.__apply_to_order(
+                order_id=payment_in_db.order_id,
+                before=previous_payment,
+                after=payment_in_db,
+            )
 
         return payment_in_db
 
@@ -60,46 +61,31 @@ class PaymentServices:
 
     async def delete_by_id(self, id: str) -> PaymentInDB:
         payment_in_db = await self.search_by_id(id=id)
-        order_in_db = await self.__order_repository.select_by_id(
-            id=payment_in_db.order_id,
-            fast_order=None
-        )
+        await self.__order_repository.select_by_id(id=payment_in_db.order_id, fast_order=None)
 
         payment_in_db = await self.__payment_repository.delete_by_id(id=id)
 
-        await self.update_payment_status(order_in_db=order_in_db)
+        await self.__apply_to_order(order_id=payment_in_db.order_id, before=payment_in_db)
 
         return payment_in_db
 
-    async def update_payment_status(self, order_in_db: OrderInDB) -> None:
-        payments = await self.search_all(order_id=order_in_db.id)
-
-        payment_status = self.__calculate_payment_status(
-            total_amount=order_in_db.total_amount,
-            payment_details=payments
-        )
-
-        if order_in_db.payment_status != payment_status:
-            try:
-                await self.__order_repository.update(
-                    order_id=order_in_db.id,
-                    order={"payment_status": payment_status}
-                )
-
-            except UnprocessableEntity:
-                ...
-
-    def __calculate_payment_status(self, total_amount: float, payment_details: List[Payment]) -> PaymentStatus:
-        if payment_details:
-            total_paid = 0
-
-            for payment in payment_details:
-                total_paid += payment.amount
-
-            if round(total_amount, 2) <= round(total_paid, 2):
-                return PaymentStatus.PAID
-
-            else:
-                return PaymentStatus.PARTIALLY_PAID
-
-        return PaymentStatus.PENDING
+    async def __apply_to_order(
+        self,
+        order_id: str,
+        before: PaymentInDB | None = None,
+        after: PaymentInDB | None = None,
+    ) -> None:
+        """
+        Leva a escrita do pagamento para o `payment_summary` e o status do
+        pedido. O pagamento já foi gravado, então uma falha aqui não derruba a
+        requisição: ela fica no log, e o `backfill_payment_summary` refaz o resumo.
+        """
+        try:
+            await self.__order_repository.apply_payment(
+                order_id=order_id, before=before, after=after
+            )
+
+        except UnprocessableEntity as error:
+            _logger.error(
+                f"Payment summary of order #{order_id} not updated: {error.message}"
+            )
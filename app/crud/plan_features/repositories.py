@@ -1,5 +1,6 @@
 from typing import List
 
+from app.api.dependencies.plan_feature_cache import invalidate_plan_features
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
@@ -33,6 +34,7 @@ class PlanFeatureRepository(Repository):
             )
 
             plan_feature_model.save()
+            await invalidate_plan_features()
 
             return PlanFeatureInDB.model_validate(plan_feature_model)
 
@@ -65,8 +67,9 @@ class PlanFeatureRepository(Repository):
             plan_feature_model.update(
                 **plan_feature.model_dump(exclude=["display_name"])
             )
+            await invalidate_plan_features()
 
-            return await self.select_by_id(id=plan_feature.id)
+            return PlanFeatureInDB.model_validate(plan_feature_model)
 
         except Exception as error:
             _logger.error(f"Error on update_plan_feature: {str(error)}")
@@ -132,6 +135,7 @@ class PlanFeatureRepository(Repository):
                 id=id, is_active=True
             ).first()
             plan_feature_model.delete()
+            await invalidate_plan_features()
 
             return PlanFeatureInDB.model_validate(plan_feature_model)
 
@@ -32,14 +32,12 @@ class PlanRepository(Repository):
 
     async def update(self, plan: PlanInDB) -> PlanInDB:
         try:
-            plan_model: PlanModel = PlanModel.objects(
-                id=plan.id,
-                is_active=True,
-            ).first()
+            plan_model = PlanModel(id=plan.id)
 
-            plan_model.update(**plan.model_dump())
+            if not plan_model.update(query={"is_active": True}, **plan.model_dump()):
+                raise NotFoundError(message=f"Plan #{plan.id} not found")
 
-            return await self.select_by_id(id=plan.id)
+            return PlanInDB.model_validate(plan_model)
 
         except Exception as error:
             _logger.error(f"Error on update_plan: {str(error)}")
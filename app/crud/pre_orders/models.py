@@ -21,7 +21,13 @@ class PreOrderModel(BaseDocument):
     order_id = StringField(required=False)
 
     meta = {
-        "collection": "pre_orders"
+        "collection": "pre_orders",
+        "indexes": [
+            # `-id` desempata a ordenação por data (paginação por página e por cursor)
+            ("organization_id", "is_active", "-created_at", "-id"),
+            ("organization_id", "is_active", "status", "-created_at"),
+            ("organization_id", "is_active", "order_id"),
+        ],
     }
 
     def update(self, **kwargs):
@@ -4,6 +4,8 @@ from pydantic import ValidationError
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
+from app.core.utils.page_cursor import PageCursor
+from app.core.utils.utc_datetime import UTCDateTime
 
 from .models import PreOrderModel
 from .schemas import PreOrderInDB, PreOrderStatus
@@ -18,22 +20,25 @@ class PreOrderRepository(Repository):
 
     async def update_status(self, pre_order_id: str, new_status: PreOrderStatus, order_id: str | None = None) -> PreOrderInDB:
         try:
-            pre_order_model: PreOrderModel = PreOrderModel.objects(
-                id=pre_order_id,
-                is_active=True,
-                organization_id=self.organization_id
-            ).first()
+            fields = {}
 
             if new_status:
-                pre_order_model.status = new_status
+                fields["status"] = new_status
 
             if order_id is not None:
-                pre_order_model.order_id = order_id
+                fields["order_id"] = order_id
 
-            if new_status or order_id is not None:
-                pre_order_model.save()
+            if not fields:
+                return await self.select_by_id(id=pre_order_id)
 
-            return await self.select_by_id(id=pre_order_id)
+            # um único find_one_and_update já devolve o pré-pedido atualizado
+            pre_order_model: PreOrderModel = PreOrderModel.objects(
+                id=pre_order_id,
+                is_active=True,
+                organization_id=self.organization_id
+            ).modify(new=True, updated_at=UTCDateTime.now(), **fields)
+
+            return PreOrderInDB.model_validate(pre_order_model)
 
         except ValidationError:
             raise NotFoundError(message=f"PreOrder not found")
@@ -42,6 +47,24 @@ class PreOrderRepository(Repository):
             _logger.error(f"Error on update_pre_order: {error}")
             raise UnprocessableEntity(message="Error on update PreOrder")
 
+    async def update_status_by_order_ids(
+        self, order_ids: List[str], new_status: PreOrderStatus
+    ) -> int:
+        try:
+            return await self.update_many(
+                document=PreOrderModel,
+                query={
+                    "order_id": {"$in": order_ids},
+                    "is_active": True,
+                    "organization_id": self.organization_id,
+                },
+                update={"$set": {"status": new_status.value, "updated_at": UTCDateTime.now()}},
+            )
+
+        except Exception as error:
+            _logger.error(f"Error on update_status_by_order_ids: {error}")
+            raise UnprocessableEntity(message="Error on update PreOrder")
+
     async def select_by_id(self, id: str, raise_404: bool = True) -> PreOrderInDB:
         try:
             pre_order_model: PreOrderModel = PreOrderModel.objects(
@@ -104,11 +127,10 @@ class PreOrderRepository(Repository):
         status: PreOrderStatus = None,
         code: str = None,
         page: int = None,
-        page_size: int = None
+        page_size: int = None,
+        cursor: PageCursor = None,
         ) -> List[PreOrderInDB]:
         try:
-            pre_orders = []
-
             objects = PreOrderModel.objects(
                 is_active=True,
                 organization_id=self.organization_id
@@ -120,14 +142,22 @@ class PreOrderRepository(Repository):
             if code is not None:
                 objects = objects.filter(code__iregex=code)
 
-            if page and page_size:
+            if cursor:
+                objects = self.apply_page_cursor(
+                    objects=objects,
+                    cursor=cursor,
+                    sort_field="created_at",
+                    descending=True,
+                    page_size=page_size,
+                )
+
+            elif page and page_size:
                 skip = (page - 1) * page_size
-                objects = objects.order_by("-created_at").skip(skip).limit(page_size)
+                objects = objects.order_by("-created_at", "-id").skip(skip).limit(page_size)
 
-            for pre_order_model in objects:
-                pre_orders.append(PreOrderInDB.model_validate(pre_order_model))
+            pre_orders = await self.select_lean(objects=objects, schema=PreOrderInDB)
 
-            return pre_orders
+            return self.sort_page_rows(rows=pre_orders, cursor=cursor)
 
         except Exception as error:
             _logger.error(f"Error on select_all: {error}")
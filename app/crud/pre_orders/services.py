@@ -4,6 +4,7 @@ from typing import List
 from typing import TYPE_CHECKING
 from app.crud.messages.schemas import Message, MessageType, Origin
 from app.core.utils.utc_datetime import UTCDateTime
+from app.core.utils.page_cursor import PageCursor
 from app.crud.customers.schemas import Customer
 from app.crud.orders.schemas import (
     RequestOrder,
@@ -56,6 +57,13 @@ class PreOrderServices:
 
         return pre_order_in_db
 
+    async def update_status_by_order_ids(
+        self, order_ids: List[str], new_status: PreOrderStatus
+    ) -> int:
+        return await self.__pre_order_repository.update_status_by_order_ids(
+            order_ids=order_ids, new_status=new_status
+        )
+
     async def reject_pre_order(self, pre_order_id: str) -> PreOrderInDB:
         return await self.update_status(
             pre_order_id=pre_order_id,
@@ -195,13 +203,15 @@ class PreOrderServices:
             code: str = None,
             expand: List[str] = [],
             page: int = None,
-            page_size: int = None
+            page_size: int = None,
+            cursor: PageCursor = None,
         ) -> List[PreOrderInDB]:
         pre_orders = await self.__pre_order_repository.select_all(
             status=status,
             code=code,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
         )
 
         return pre_orders
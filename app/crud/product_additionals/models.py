@@ -14,7 +14,10 @@ class ProductAdditionalModel(BaseDocument):
     position = IntField(required=True)
 
     meta = {
-        "collection": "product_additionals"
+        "collection": "product_additionals",
+        "indexes": [
+            ("organization_id", "updated_at"),
+        ],
     }
 
     def update(self, **kwargs):
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 
 from pydantic import ValidationError
 
@@ -14,6 +14,8 @@ _logger = get_logger(__name__)
 
 
 class ProductAdditionalRepository(Repository):
+    document = ProductAdditionalModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -45,9 +47,7 @@ class ProductAdditionalRepository(Repository):
 
     async def update(self, product_additional: ProductAdditionalInDB) -> ProductAdditionalInDB:
         try:
-            model: ProductAdditionalModel = ProductAdditionalModel.objects(
-                id=product_additional.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            model = ProductAdditionalModel(id=product_additional.id)
 
             data = product_additional.model_dump()
             data.pop("items", None)
@@ -57,9 +57,12 @@ class ProductAdditionalRepository(Repository):
 
             data["updated_at"] = product_additional.updated_at
 
-            model.update(**data)
+            if not model.update(
+                query={"is_active": True, "organization_id": self.organization_id}, **data
+            ):
+                raise NotFoundError(message="ProductAdditional not found")
 
-            return await self.select_by_id(id=product_additional.id)
+            return self._to_schema(model)
         except ValidationError:
             raise NotFoundError(message="ProductAdditional not found")
 
@@ -118,6 +121,29 @@ class ProductAdditionalRepository(Repository):
             _logger.error(f"Error on select_by_product_id: {error}")
             raise NotFoundError(message="Product additionals not found")
 
+    async def select_by_product_ids(
+        self, product_ids: List[str]
+    ) -> Dict[str, List[ProductAdditionalInDB]]:
+        try:
+            results: Dict[str, List[ProductAdditionalInDB]] = {}
+            objects = ProductAdditionalModel.objects(
+                is_active=True,
+                organization_id=self.organization_id,
+                product_id__in=product_ids,
+            ).order_by("position")
+
+            for model in objects:
+                product_additional = self._to_schema(model)
+                results.setdefault(product_additional.product_id, []).append(
+                    product_additional
+                )
+
+            return results
+
+        except Exception as error:
+            _logger.error(f"Error on select_by_product_ids: {error}")
+            raise NotFoundError(message="Product additionals not found")
+
     async def select_by_ids(self, ids: List[str]) -> List[ProductAdditionalInDB]:
         try:
             results = []
@@ -2,6 +2,7 @@ from typing import List
 
 from typing import TYPE_CHECKING
 
+from app.core.utils.document_version import combine_versions
 from app.crud.additional_items.repositories import AdditionalItemRepository
 from app.crud.additional_items.schemas import AdditionalItem, CompleteAdditionalItem
 from app.crud.files.repositories import FileRepository
@@ -139,6 +140,14 @@ class ProductAdditionalServices:
             await self.__item_repository.delete_by_additional_id(additional_id=additional.id)
             await self.__repository.delete_by_id(id=additional.id)
 
+    async def search_version(self) -> str | None:
+        """Versão dos adicionais, dos seus itens e dos arquivos, para a ETag."""
+        return await combine_versions(
+            self.__repository.select_version(),
+            self.__item_repository.select_version(),
+            self.__file_repository.select_version(),
+        )
+
     async def __build_complete_items(self, items: List[AdditionalItem]) -> List[AdditionalItem]:
         complete_items: List[CompleteAdditionalItem] = []
 
@@ -1,9 +1,9 @@
 from mongoengine import StringField, FloatField, ListField
-from app.core.models.base_document import BaseDocument
+from app.core.models.searchable_document import SearchableDocument
 from app.core.utils.utc_datetime import UTCDateTime
 
 
-class ProductModel(BaseDocument):
+class ProductModel(SearchableDocument):
     organization_id = StringField(required=True)
     name = StringField(required=True)
     description = StringField(required=True)
@@ -14,7 +14,14 @@ class ProductModel(BaseDocument):
     file_id = StringField(required=False)
 
     meta = {
-        "collection": "products"
+        "collection": "products",
+        "indexes": [
+            # `id` desempata a ordenação por nome (paginação por página e por cursor)
+            ("organization_id", "is_active", "name", "id"),
+            # filtro `query` (prefixo das palavras do nome normalizado)
+            ("organization_id", "is_active", "search_tokens"),
+            ("organization_id", "updated_at"),
+        ],
     }
 
     def update(self, **kwargs):
@@ -3,6 +3,8 @@ from typing import List
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
+from app.core.repositories.entity_cache import product_cache
+from app.core.utils.page_cursor import PageCursor
 from app.core.utils.utc_datetime import UTCDateTime
 
 from .models import ProductModel
@@ -12,6 +14,8 @@ _logger = get_logger(__name__)
 
 
 class ProductRepository(Repository):
+    document = ProductModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -39,14 +43,18 @@ class ProductRepository(Repository):
 
     async def update(self, product: ProductInDB) -> ProductInDB:
         try:
-            product_model: ProductModel = ProductModel.objects(
-                id=product.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            product_model = ProductModel(id=product.id)
             product.name = product.name.strip().title()
 
-            product_model.update(**product.model_dump())
+            if not product_model.update(
+                query={"is_active": True, "organization_id": self.organization_id},
+                **product.model_dump(),
+            ):
+                raise NotFoundError(message=f"Product #{product.id} not found")
 
-            return await self.select_by_id(id=product.id)
+            product_cache.invalidate(organization_id=self.organization_id, id=product.id)
+
+            return ProductInDB.model_validate(product_model)
 
         except Exception as error:
             _logger.error(f"Error on update_product: {str(error)}")
@@ -60,7 +68,7 @@ class ProductRepository(Repository):
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if tags:
                 objects = objects.filter(tags__in=tags)
@@ -72,44 +80,96 @@ class ProductRepository(Repository):
             return 0
 
     async def select_by_id(self, id: str, raise_404: bool = True) -> ProductInDB:
+        product_in_db = product_cache.get(organization_id=self.organization_id, id=id)
+
+        if product_in_db:
+            return product_in_db
+
         try:
             product_model: ProductModel = ProductModel.objects(
                 id=id, is_active=True, organization_id=self.organization_id
             ).first()
 
-            return ProductInDB.model_validate(product_model)
+            product_in_db = ProductInDB.model_validate(product_model)
+            product_cache.set(organization_id=self.organization_id, entity=product_in_db)
+
+            return product_in_db
 
         except Exception as error:
             _logger.error(f"Error on select_by_id: {str(error)}")
             if raise_404:
                 raise NotFoundError(message=f"Product #{id} not found")
 
+    async def select_by_ids(self, ids: List[str]) -> List[ProductInDB]:
+        products, missing_ids = product_cache.get_many(
+            organization_id=self.organization_id, ids=ids
+        )
+
+        if not missing_ids:
+            return products
+
+        try:
+            objects = ProductModel.objects(
+                id__in=missing_ids,
+                is_active=True,
+                organization_id=self.organization_id,
+            )
+
+            loaded = await self.select_lean(objects=objects, schema=ProductInDB)
+            product_cache.set_many(organization_id=self.organization_id, entities=loaded)
+
+            return products + loaded
+
+        except Exception as error:
+            _logger.error(f"Error on select_by_ids: {str(error)}")
+            raise NotFoundError(message="Products not found")
+
     async def select_all(
-        self, query: str, tags: List[str] = [], page: int = None, page_size: int = None
+        self,
+        query: str,
+        tags: List[str] = [],
+        page: int = None,
+        page_size: int = None,
+        cursor: PageCursor = None,
     ) -> List[ProductInDB]:
         try:
-            products = []
-
             objects = ProductModel.objects(
                 is_active=True, organization_id=self.organization_id
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
+                objects = objects.filter(self.search_filter(query=query))
 
             if tags:
                 objects = objects.filter(tags__in=tags)
 
-            if page is not None and page_size is not None:
+            if cursor:
+                objects = self.apply_page_cursor(
+                    objects=objects,
+                    cursor=cursor,
+                    sort_field="name",
+                    descending=False,
+                    page_size=page_size,
+                )
+
+            elif query:
+                return await self.select_ranked_lean(
+                    objects=objects,
+                    schema=ProductInDB,
+                    query=query,
+                    page=page,
+                    page_size=page_size,
+                )
+
+            elif page is not None and page_size is not None:
                 skip = (page - 1) * page_size
-                objects = objects.order_by("name").skip(skip).limit(page_size)
+                objects = objects.order_by("name", "id").skip(skip).limit(page_size)
             else:
-                objects = objects.order_by("name")
+                objects = objects.order_by("name", "id")
 
-            for product_model in objects:
-                products.append(ProductInDB.model_validate(product_model))
+            products = await self.select_lean(objects=objects, schema=ProductInDB)
 
-            return products
+            return self.sort_page_rows(rows=products, cursor=cursor)
 
         except Exception as error:
             _logger.error(f"Error on select_all: {str(error)}")
@@ -123,6 +183,7 @@ class ProductRepository(Repository):
 
             if product_model:
                 product_model.delete()
+                product_cache.invalidate(organization_id=self.organization_id, id=id)
 
                 return ProductInDB.model_validate(product_model)
 
@@ -1,7 +1,9 @@
 from typing import List
 from app.api.dependencies.get_plan_feature import get_plan_feature
 from app.api.exceptions.authentication_exceptions import UnauthorizedException, BadRequestException
+from app.core.utils.document_version import combine_versions
 from app.core.utils.features import Feature
+from app.core.utils.page_cursor import PageCursor
 from app.crud.files.schemas import FilePurpose, FileInDB
 from app.crud.tags.repositories import TagRepository
 from app.crud.files.repositories import FileRepository
@@ -94,13 +96,15 @@ class ProductServices:
             tags: List[str] = [],
             expand: List[str] = [],
             page: int = None,
-            page_size: int = None
+            page_size: int = None,
+            cursor: PageCursor = None,
         ) -> List[ProductInDB]:
         products = await self.__product_repository.select_all(
             query=query,
             tags=tags,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            cursor=cursor,
         )
 
         if not expand:
@@ -137,6 +141,23 @@ class ProductServices:
             await offer_repo.update(offer=offer)
         return product_in_db
 
+    async def search_version(self, id: str = None, expand: List[str] = []) -> str | None:
+        """Versão do produto (ou dos produtos, sem `id`) e das expansões, para a ETag."""
+        dependencies = []
+
+        if "file" in expand:
+            dependencies.append(self.__file_repository.select_version())
+
+        if "tags" in expand:
+            dependencies.append(self.__tag_repository.select_version())
+
+        if "additionals" in expand:
+            dependencies.append(self.__additional_services.search_version())
+
+        return await combine_versions(
+            self.__product_repository.select_version(id=id), *dependencies
+        )
+
     async def __build_complete_product(self, products: List[ProductInDB], expand: List[str]) -> List[CompleteProduct]:
         complete_products = []
         tags = {}
@@ -12,7 +12,12 @@ class SectionItemModel(BaseDocument):
     position = IntField(required=True)
     is_visible = BooleanField(default=True)
 
-    meta = {"collection": "section_items"}
+    meta = {
+        "collection": "section_items",
+        "indexes": [
+            ("organization_id", "updated_at"),
+        ],
+    }
 
     def update(self, **kwargs):
         self.base_update()
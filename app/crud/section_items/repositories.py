@@ -14,6 +14,8 @@ _logger = get_logger(__name__)
 
 
 class SectionItemRepository(Repository):
+    document = SectionItemModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -36,13 +38,15 @@ class SectionItemRepository(Repository):
 
     async def update(self, section_item: SectionItemInDB) -> SectionItemInDB:
         try:
-            model: SectionItemModel = SectionItemModel.objects(
-                id=section_item.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            model = SectionItemModel(id=section_item.id)
 
-            model.update(**section_item.model_dump())
+            if not model.update(
+                query={"is_active": True, "organization_id": self.organization_id},
+                **section_item.model_dump(),
+            ):
+                raise NotFoundError(message="Section item not found")
 
-            return await self.select_by_id(id=section_item.id)
+            return SectionItemInDB.model_validate(model)
 
         except ValidationError:
             raise NotFoundError(message="Section item not found")
@@ -4,6 +4,8 @@ from app.crud.sections.repositories import SectionRepository
 from app.crud.offers.services import OfferServices
 from app.crud.products.services import ProductServices
 from app.core.exceptions import UnprocessableEntity
+from app.core.models.base_schema import construct_from
+from app.core.utils.document_version import combine_versions
 
 from .repositories import SectionItemRepository
 from .schemas import SectionItem, SectionItemInDB, UpdateSectionItem, CompleteSectionItem, ItemType
@@ -62,7 +64,7 @@ class SectionItemServices:
         complete_section_items: List[CompleteSectionItem] = []
 
         for section_item in section_items:
-            complete = CompleteSectionItem.model_validate(section_item)
+            complete = construct_from(CompleteSectionItem, section_item)
 
             if "items" in expand:
                 if section_item.item_type == ItemType.OFFER:
@@ -81,5 +83,17 @@ class SectionItemServices:
 
         return complete_section_items
 
+    async def search_version(self, expand: List[str] = []) -> str | None:
+        """Versão dos itens de seção e das expansões, para a ETag."""
+        dependencies = []
+
+        if "items" in expand:
+            dependencies.append(self.__offer_service.search_version(expand=expand))
+            dependencies.append(self.__product_service.search_version(expand=expand))
+
+        return await combine_versions(
+            self.__section_item_repository.select_version(), *dependencies
+        )
+
     async def delete_by_id(self, id: str) -> SectionItemInDB:
         return await self.__section_item_repository.delete_by_id(id=id)
@@ -14,7 +14,10 @@ class SectionModel(BaseDocument):
     is_visible = BooleanField(default=True, required=False)
 
     meta = {
-        "collection": "sections"
+        "collection": "sections",
+        "indexes": [
+            ("organization_id", "updated_at"),
+        ],
     }
 
     def update(self, **kwargs):
@@ -14,6 +14,8 @@ _logger = get_logger(__name__)
 
 
 class SectionRepository(Repository):
+    document = SectionModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -42,15 +44,17 @@ class SectionRepository(Repository):
 
     async def update(self, section: SectionInDB) -> SectionInDB:
         try:
-            section_model: SectionModel = SectionModel.objects(
-                id=section.id, is_active=True, organization_id=self.organization_id
-            ).first()
+            section_model = SectionModel(id=section.id)
             section.name = section.name.strip().title()
             section.description = section.description.strip()
 
-            section_model.update(**section.model_dump())
+            if not section_model.update(
+                query={"is_active": True, "organization_id": self.organization_id},
+                **section.model_dump(),
+            ):
+                raise NotFoundError(message=f"Section #{section.id} not found")
 
-            return await self.select_by_id(id=section.id)
+            return SectionInDB.model_validate(section_model)
 
         except Exception as error:
             _logger.error(f"Error on update_section: {str(error)}")
@@ -1,4 +1,6 @@
 from typing import List
+
+from app.core.utils.document_version import combine_versions
 from app.crud.offers.services import OfferServices
 from app.crud.menus.repositories import MenuRepository
 from .repositories import SectionRepository
@@ -60,6 +62,17 @@ class SectionServices:
         section_in_db = await self.__section_repository.delete_by_id(id=id)
         return section_in_db
 
+    async def search_version(self, id: str = None, expand: List[str] = []) -> str | None:
+        """Versão da seção (ou das seções, sem `id`) e das expansões, para a ETag."""
+        dependencies = []
+
+        if "offers" in expand:
+            dependencies.append(self.__offer_service.search_version(expand=expand))
+
+        return await combine_versions(
+            self.__section_repository.select_version(id=id), *dependencies
+        )
+
     async def __build_complete_section(self, sections: List[SectionInDB], is_visible: bool, expand: List[str]) -> CompleteSection:
         complete_sections = []
 
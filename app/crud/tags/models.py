@@ -1,18 +1,26 @@
 from mongoengine import DictField, StringField
 
 from app.core.configs import get_logger
-from app.core.models.base_document import BaseDocument
+from app.core.models.searchable_document import SearchableDocument
 from app.core.utils.utc_datetime import UTCDateTime
 
 logger = get_logger(__name__)
 
 
-class TagModel(BaseDocument):
+class TagModel(SearchableDocument):
     name = StringField(max_length=100, required=True)
     styling = DictField(required=False)
     organization_id = StringField(required=True)
 
-    meta = {"collection": "tags"}
+    meta = {
+        "collection": "tags",
+        "indexes": [
+            ("organization_id", "is_active", "name"),
+            # filtro `query` (prefixo das palavras do nome normalizado)
+            ("organization_id", "is_active", "search_tokens"),
+            ("organization_id", "updated_at"),
+        ],
+    }
 
     def update(self, **kwargs):
         self.base_update()
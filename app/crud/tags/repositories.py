@@ -5,6 +5,8 @@ from mongoengine.errors import NotUniqueError
 from app.core.configs import get_logger
 from app.core.exceptions import NotFoundError, UnprocessableEntity
 from app.core.repositories.base_repository import Repository
+from app.core.repositories.entity_cache import tag_cache
+from app.core.utils.page_cursor import PageCursor
 from app.core.utils.utc_datetime import UTCDateTime
 
 from .models import TagModel
@@ -15,6 +17,8 @@ _logger = get_logger(__name__)
 
 
 class TagRepository(Repository):
+    document = TagModel
+
     def __init__(self, organization_id: str) -> None:
         super().__init__()
         self.organization_id = organization_id
@@ -59,8 +63,9 @@ class TagRepository(Repository):
                 tag.name = tag.name.strip().title()
 
                 tag_model.update(**tag.model_dump())
+                tag_cache.invalidate(organization_id=self.organization_id, id=tag.id)
 
-                return await self.select_by_id(id=tag_model.id)
+                return self.__build_tag(tag_model=tag_model)
 
         except NotUniqueError:
             _logger.warning(f"Tag with name {tag.name} is not unique")
@@ -78,7 +83,7 @@ class TagRepository(Repository):
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
+                objects = objects.filter(self.search_filter(query=query))
 
             return max(objects.count(), 0)
 
@@ -87,18 +92,48 @@ class TagRepository(Repository):
             return 0
 
     async def select_by_id(self, id: str, raise_404: bool = True) -> TagInDB:
+        tag_in_db = tag_cache.get(organization_id=self.organization_id, id=id)
+
+        if tag_in_db:
+            return tag_in_db
+
         try:
             tag_model: TagModel = TagModel.objects(
                 id=id, is_active=True, organization_id=self.organization_id
             ).first()
 
-            return self.__build_tag(tag_model=tag_model)
+            tag_in_db = self.__build_tag(tag_model=tag_model)
+            tag_cache.set(organization_id=self.organization_id, entity=tag_in_db)
+
+            return tag_in_db
 
         except Exception as error:
             _logger.error(f"Error on select_by_id: {str(error)}")
             if raise_404:
                 raise NotFoundError(message=f"Tag #{id} not found")
 
+    async def select_by_ids(self, ids: List[str]) -> List[TagInDB]:
+        tags, missing_ids = tag_cache.get_many(organization_id=self.organization_id, ids=ids)
+
+        if not missing_ids:
+            return tags
+
+        try:
+            objects = TagModel.objects(
+                id__in=missing_ids, is_active=True, organization_id=self.organization_id
+            )
+
+            for tag_model in objects:
+                tag_in_db = self.__build_tag(tag_model=tag_model)
+                tag_cache.set(organization_id=self.organization_id, entity=tag_in_db)
+                tags.append(tag_in_db)
+
+            return tags
+
+        except Exception as error:
+            _logger.error(f"Error on select_by_ids: {str(error)}")
+            raise NotFoundError(message="Tags not found")
+
     async def select_by_name(self, name: str) -> TagInDB:
         try:
             name = name.strip().title()
@@ -113,7 +148,9 @@ class TagRepository(Repository):
             _logger.error(f"Error on select_by_name: {str(error)}")
             raise NotFoundError(message=f"Tag with name {name} not found")
 
-    async def select_all(self, query: str, page: int, page_size: int) -> List[TagInDB]:
+    async def select_all(
+        self, query: str, page: int, page_size: int, cursor: PageCursor = None
+    ) -> List[TagInDB]:
         try:
             tags = []
 
@@ -122,17 +159,32 @@ class TagRepository(Repository):
             )
 
             if query:
-                objects = objects.filter(name__iregex=query)
-
-            skip = (page - 1) * page_size
-            objects = objects.order_by("name").skip(skip).limit(page_size)
+                objects = objects.filter(self.search_filter(query=query))
+
+            if cursor:
+                objects = self.apply_page_cursor(
+                    objects=objects,
+                    cursor=cursor,
+                    sort_field="name",
+                    descending=False,
+                    page_size=page_size,
+                )
+
+            elif query:
+                objects = await self.select_ranked(
+                    objects=objects, query=query, page=page, page_size=page_size
+                )
+
+            else:
+                skip = (page - 1) * page_size
+                objects = objects.order_by("name").skip(skip).limit(page_size)
 
             for tag_model in objects:
                 tag_in_db = self.__build_tag(tag_model)
 
                 tags.append(tag_in_db)
 
-            return tags
+            return self.sort_page_rows(rows=tags, cursor=cursor)
 
         except Exception as error:
             _logger.error(f"Error on select_all: {str(error)}")
@@ -146,6 +198,7 @@ class TagRepository(Repository):
 
             if tag_model:
                 tag_model.delete()
+                tag_cache.invalidate(organization_id=self.organization_id, id=id)
 
                 return self.__build_tag(tag_model=tag_model)
 
@@ -3,6 +3,7 @@ from typing import List
 from app.api.dependencies.get_plan_feature import get_plan_feature
 from app.api.exceptions.authentication_exceptions import UnauthorizedException
 from app.core.utils.features import Feature
+from app.core.utils.page_cursor import PageCursor
 
 from .repositories import TagRepository
 from .schemas import Tag, TagInDB, UpdateTag
@@ -45,8 +46,12 @@ class TagServices:
         tag_in_db = await self.__repository.select_by_id(id=id)
         return tag_in_db
 
-    async def search_all(self, query: str, page: int, page_size: int) -> List[TagInDB]:
-        tags = await self.__repository.select_all(query=query, page=page, page_size=page_size)
+    async def search_all(
+        self, query: str, page: int, page_size: int, cursor: PageCursor = None
+    ) -> List[TagInDB]:
+        tags = await self.__repository.select_all(
+            query=query, page=page, page_size=page_size, cursor=cursor
+        )
         return tags
 
     async def count_all(self, query: str) -> int:
@@ -30,11 +30,12 @@ class TermOfUseServices:
         self,
         term_of_use_repository: TermOfUseRepository,
         acceptance_repository: TermOfUseAcceptanceRepository,
+        redis_manager: RedisManager | None = None,
     ) -> None:
         self.__term_of_use_repository = term_of_use_repository
         self.__acceptance_repository = acceptance_repository
         self.__bucket = S3BucketManager(mode="public")
-        self.redis_manager = RedisManager()
+        self.redis_manager = redis_manager or RedisManager()
 
     async def create_term_of_use(self, version: str, file: UploadFile) -> TermOfUseInDB:
         file_content = await file.read()
@@ -49,7 +50,7 @@ class TermOfUseServices:
 
         term_id = str(uuid4())
 
-        file_url = self.__bucket.upload_file(
+        file_url = await self.__bucket.upload_file(
             local_path=buffer.name, bucket_path=f"documents/terms_of_use_{term_id}.pdf"
         )
 
@@ -102,7 +103,7 @@ class TermOfUseServices:
         )
 
         key = f"user:{acceptance.user_id}"
-        self.redis_manager.delete_value(key=key)
+        await self.redis_manager.delete_value(key=key)
 
         return acceptance_in_db
 
@@ -134,6 +135,6 @@ class TermOfUseServices:
         )
 
         key = f"user:{user_id}"
-        self.redis_manager.delete_value(key=key)
+        await self.redis_manager.delete_value(key=key)
 
         return acceptance_in_db
@@ -1,5 +1,5 @@
 import traceback
-from typing import Dict, List
+from typing import List, MutableMapping
 from fastapi.encoders import jsonable_encoder
 from pydantic_core import ValidationError
 from app.core.configs import get_logger, get_environment
@@ -13,7 +13,7 @@ _env = get_environment()
 
 
 class UserRepository:
-    def __init__(self, access_token: str, cache_users: Dict[str, UserInDB]) -> None:
+    def __init__(self, access_token: str, cache_users: MutableMapping[str, UserInDB]) -> None:
         self.access_token = access_token
         self.headers = {
             "authorization": self.access_token,
@@ -56,6 +56,8 @@ class UserRepository:
             if status_code == 200:
                 _logger.debug("User updated successfully")
                 updated_user = self.__mount_user(response)
+                # o `pop` invalida o usuário antigo nos outros workers
+                self.__cache_users.pop(user_id, None)
                 self.__cache_users[user_id] = updated_user
 
                 return updated_user
@@ -70,9 +72,11 @@ class UserRepository:
 
     async def select_by_id(self, id: str, raise_404: bool = True) -> UserInDB:
         try:
-            if self.__cache_users.get(id):
+            cached_user = self.__cache_users.get(id)
+
+            if cached_user:
                 _logger.debug("Getting cached user by ID")
-                return self.__cache_users.get(id)
+                return cached_user
 
             _logger.debug("Getting user by ID on Management API")
             status_code, response = self.http_client.get(
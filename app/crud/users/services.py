@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import List, MutableMapping
 from app.core.utils.utc_datetime import UTCDateTime
 from .repositories import UserRepository
 from .schemas import UpdateUser, User, UserInDB
@@ -11,7 +11,7 @@ class UserServices:
     def __init__(
         self,
         user_repository: UserRepository,
-        cached_complete_users: Dict[str, UserInDB],
+        cached_complete_users: MutableMapping[str, UserInDB],
     ) -> None:
         self.__repository = user_repository
         self.__cached_complete_users = cached_complete_users
@@ -39,8 +39,7 @@ class UserServices:
         return users
 
     async def delete_by_id(self, id: int) -> UserInDB:
-        if self.__cached_complete_users.get(id):
-            self.__cached_complete_users.pop(id)
+        self.__cached_complete_users.pop(id, None)
 
         user_in_db = await self.__repository.delete_by_id(id=id)
         return user_in_db
@@ -0,0 +1,33 @@
+from mongoengine import connect
+
+from app.core.configs import get_environment
+from app.core.db.indexes import audit_indexes
+
+
+def main() -> None:
+    """Lista os indexes faltando, não declarados e sem uso nas collections principais."""
+    env = get_environment()
+    connect(host=env.DATABASE_HOST)
+
+    has_issues = False
+
+    for report in audit_indexes():
+        print(f"[{report.collection}]")
+
+        for key in report.missing:
+            has_issues = True
+            fields = ", ".join(f"{field}:{direction}" for field, direction in key)
+            print(f"  missing: {fields}")
+
+        for name in report.undeclared:
+            print(f"  undeclared: {name}")
+
+        for name in report.unused:
+            print(f"  unused: {name}")
+
+    if has_issues:
+        print("Run the API startup (or ensure_indexes) to create the missing indexes")
+
+
+if __name__ == "__main__":
+    main()
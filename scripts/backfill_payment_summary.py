@@ -0,0 +1,81 @@
+import argparse
+from typing import Dict
+
+from mongoengine import connect
+from pymongo import UpdateOne
+
+from app.core.configs import get_environment
+from app.crud.orders.models import OrderModel
+from app.crud.payments.models import PaymentModel
+
+
+def build_summaries() -> Dict[str, dict]:
+    """Agrupa os pagamentos ativos por pedido e método em uma única agregação."""
+    summaries: Dict[str, dict] = {}
+
+    pipeline = [
+        {"$match": {"is_active": True}},
+        {
+            "$group": {
+                "_id": {"order_id": "$order_id", "method": "$method"},
+                "amount": {"$sum": "$amount"},
+                "count": {"$sum": 1},
+            }
+        },
+    ]
+
+    for row in PaymentModel._get_collection().aggregate(pipeline):
+        order_id = row["_id"]["order_id"]
+        summary = summaries.setdefault(
+            order_id, {"total_paid": 0, "count": 0, "methods": {}}
+        )
+
+        summary["total_paid"] += row["amount"]
+        summary["count"] += row["count"]
+        summary["methods"][row["_id"]["method"]] = round(row["amount"], 2)
+
+    for summary in summaries.values():
+        summary["total_paid"] = round(summary["total_paid"], 2)
+
+    return summaries
+
+
+def main() -> None:
+    """Preenche o `payment_summary` dos pedidos existentes a partir de `payments`."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    env = get_environment()
+    connect(host=env.DATABASE_HOST)
+
+    summaries = build_summaries()
+    empty_summary = {"total_paid": 0, "count": 0, "methods": {}}
+
+    collection = OrderModel._get_collection()
+    operations = []
+    updated = 0
+
+    for order in collection.find({}, {"_id": 1}):
+        summary = summaries.get(order["_id"], empty_summary)
+        operations.append(
+            UpdateOne({"_id": order["_id"]}, {"$set": {"payment_summary": summary}})
+        )
+
+        if len(operations) >= args.batch_size:
+            updated += len(operations)
+            if not args.dry_run:
+                collection.bulk_write(operations, ordered=False)
+            operations = []
+
+    if operations:
+        updated += len(operations)
+        if not args.dry_run:
+            collection.bulk_write(operations, ordered=False)
+
+    print(f"{updated} orders {'would be ' if args.dry_run else ''}updated")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+import argparse
+
+from mongoengine import connect
+from pymongo import UpdateOne
+
+from app.core.configs import get_environment
+from app.core.utils.search import build_search_tokens, normalize_search_text
+from app.crud.customers.models import CustomerModel
+from app.crud.expenses.models import ExpenseModel
+from app.crud.menus.models import MenuModel
+from app.crud.offers.models import OfferModel
+from app.crud.products.models import ProductModel
+from app.crud.tags.models import TagModel
+
+SEARCHABLE_DOCUMENTS = [
+    CustomerModel,
+    ProductModel,
+    TagModel,
+    ExpenseModel,
+    OfferModel,
+    MenuModel,
+]
+
+
+def main() -> None:
+    """Preenche `search_name` e `search_tokens` dos documentos existentes a partir do `name`."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+
+    env = get_environment()
+    connect(host=env.DATABASE_HOST)
+
+    for document in SEARCHABLE_DOCUMENTS:
+        collection = document._get_collection()
+        operations = []
+        updated = 0
+
+        for row in collection.find({}, {"_id": 1, "name": 1}):
+            name = row.get("name") or ""
+            operations.append(
+                UpdateOne(
+                    {"_id": row["_id"]},
+                    {
+                        "$set": {
+                            "search_name": normalize_search_text(name),
+                            "search_tokens": build_search_tokens(name),
+                        }
+                    },
+                )
+            )
+
+            if len(operations) >= args.batch_size:
+                updated += len(operations)
+                if not args.dry_run:
+                    collection.bulk_write(operations, ordered=False)
+                operations = []
+
+        if operations:
+            updated += len(operations)
+            if not args.dry_run:
+                collection.bulk_write(operations, ordered=False)
+
+        print(
+            f"{collection.name}: {updated} documents "
+            f"{'would be ' if args.dry_run else ''}updated"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Compara a vazão de requisições concorrentes com o MongoEngine síncrono e com o driver async.
+
+Uso:
+    python -m scripts.benchmark_async_repositories --organization-id org_123 --concurrency 50 --requests 500
+"""
+
+import argparse
+import asyncio
+from time import perf_counter
+
+from mongoengine import connect
+
+from app.core.configs import get_environment
+from app.core.db.async_connection import close_async_database, start_async_database
+from app.core.repositories.base_repository import Repository
+from app.crud.orders.models import OrderModel
+
+
+async def run_sync_count(organization_id: str) -> int:
+    # Mesmo padrão dos repositórios antigos: chamada síncrona dentro de um `async def`
+    return OrderModel.objects(is_active=True, organization_id=organization_id).count()
+
+
+async def run_async_count(repository: Repository, organization_id: str) -> int:
+    objects = OrderModel.objects(is_active=True, organization_id=organization_id)
+    return await repository.count_documents(OrderModel, objects._query)
+
+
+async def measure(label: str, factory, total_requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def worker():
+        async with semaphore:
+            await factory()
+
+    start = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(total_requests)))
+    elapsed = perf_counter() - start
+
+    throughput = total_requests / elapsed
+    print(f"{label}: {total_requests} requests in {elapsed:.2f}s -> {throughput:.1f} req/s")
+    return throughput
+
+
+async def main(organization_id: str, total_requests: int, concurrency: int) -> None:
+    env = get_environment()
+    connect(host=env.DATABASE_HOST)
+
+    sync_throughput = await measure(
+        "sync mongoengine",
+        lambda: run_sync_count(organization_id=organization_id),
+        total_requests=total_requests,
+        concurrency=concurrency,
+    )
+
+    await start_async_database()
+    repository = Repository()
+
+    try:
+        async_throughput = await measure(
+            "async driver",
+            lambda: run_async_count(repository=repository, organization_id=organization_id),
+            total_requests=total_requests,
+            concurrency=concurrency,
+        )
+
+    finally:
+        await close_async_database()
+
+    print(f"Speedup: {async_throughput / sync_throughput:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--organization-id", required=True)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    asyncio.run(
+        main(
+            organization_id=args.organization_id,
+            total_requests=args.requests,
+            concurrency=args.concurrency,
+        )
+    )
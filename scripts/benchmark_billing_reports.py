@@ -0,0 +1,160 @@
+"""Compara os relatórios de faturamento em Python (referência) com as agregações no MongoDB.
+
+Cria pedidos sintéticos para uma organização temporária, mede os dois caminhos e
+remove os pedidos no final.
+
+Uso:
+    python -m scripts.benchmark_billing_reports --orders 10000 100000
+"""
+
+import argparse
+import asyncio
+import random
+import tracemalloc
+from datetime import timedelta
+from time import perf_counter
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from mongoengine import connect
+
+from app.builder.order_calculator import OrderCalculator
+from app.core.configs import get_environment
+from app.core.db.async_connection import close_async_database, start_async_database
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.billing import reference
+from app.crud.orders.models import OrderModel
+from app.crud.orders.repositories import OrderRepository
+from app.crud.shared_schemas.payment import PaymentMethod
+
+START_DATE = UTCDateTime(2024, 5, 1)
+END_DATE = UTCDateTime(2024, 6, 1) - timedelta(minutes=1)
+
+
+def build_order(organization_id: str, generator: random.Random) -> dict:
+    products = [
+        {
+            "product_id": f"pro_{generator.randint(1, 40)}",
+            "name": "Produto",
+            "unit_price": round(generator.uniform(2, 20), 2),
+            "unit_cost": round(generator.uniform(1, 8), 2),
+            "quantity": generator.randint(1, 4),
+            "additionals": [
+                {
+                    "item_id": "add_1",
+                    "label": "Extra",
+                    "quantity": 1,
+                    "unit_price": 1.5,
+                    "unit_cost": 0.5,
+                    "consumption_factor": 1.0,
+                }
+            ] if generator.random() < 0.3 else [],
+        }
+        for _ in range(generator.randint(1, 4))
+    ]
+    total_amount = round(sum(p["unit_price"] * p["quantity"] for p in products), 2)
+    method = generator.choice(list(PaymentMethod)).value
+    order_date = START_DATE + timedelta(minutes=generator.randint(0, 29 * 24 * 60))
+
+    return {
+        "_id": f"ord_{uuid4().hex[:12]}",
+        "organization_id": organization_id,
+        "status": "DONE",
+        "payment_status": "PAID",
+        "products": products,
+        "tags": [],
+        "delivery": {"delivery_type": "WITHDRAWAL"},
+        "preparation_date": order_date,
+        "order_date": order_date,
+        "total_amount": total_amount,
+        "additional": 0,
+        "discount": 0,
+        "tax": 0,
+        "is_fast_order": False,
+        "is_active": True,
+        "payment_summary": {
+            "total_paid": total_amount,
+            "count": 1,
+            "methods": {method: total_amount},
+        },
+        "created_at": order_date,
+        "updated_at": order_date,
+    }
+
+
+async def measure(label: str, coroutine_factory) -> None:
+    tracemalloc.start()
+    start = perf_counter()
+    await coroutine_factory()
+    elapsed = perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  {label}: {elapsed:.2f}s, peak {peak / 1024 / 1024:.1f} MiB")
+
+
+async def run_reference(repository: OrderRepository, calculator: OrderCalculator) -> None:
+    orders = await repository.select_all_without_filters(
+        start_date=START_DATE, end_date=END_DATE
+    )
+    reference.monthly_billing(month=5, year=2024, orders=orders, expenses=[])
+    reference.best_selling_products(orders=orders)
+    await reference.products_profit(orders=orders, order_calculator=calculator)
+    await reference.daily_sales(
+        orders=orders, last_day=END_DATE.day, order_calculator=calculator
+    )
+
+
+async def run_aggregations(repository: OrderRepository) -> None:
+    await repository.select_billing_summary(start_date=START_DATE, end_date=END_DATE)
+    await repository.select_best_selling_products(
+        start_date=START_DATE, end_date=END_DATE, limit=5
+    )
+    await repository.select_products_profit(
+        start_date=START_DATE, end_date=END_DATE, limit=10
+    )
+    await repository.select_daily_sales(start_date=START_DATE, end_date=END_DATE)
+
+
+async def main(sizes, batch_size: int) -> None:
+    env = get_environment()
+    connect(host=env.DATABASE_HOST)
+    await start_async_database()
+
+    collection = OrderModel._get_collection()
+    calculator = OrderCalculator(product_repository=AsyncMock())
+    generator = random.Random(42)
+
+    try:
+        for size in sizes:
+            organization_id = f"org_bench_{uuid4().hex[:8]}"
+            repository = OrderRepository(organization_id=organization_id)
+
+            for offset in range(0, size, batch_size):
+                collection.insert_many(
+                    [
+                        build_order(organization_id=organization_id, generator=generator)
+                        for _ in range(min(batch_size, size - offset))
+                    ]
+                )
+
+            print(f"{size} orders:")
+
+            try:
+                await measure("python reference", lambda: run_reference(repository, calculator))
+                await measure("mongo aggregations", lambda: run_aggregations(repository))
+
+            finally:
+                collection.delete_many({"organization_id": organization_id})
+
+    finally:
+        await close_async_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    args = parser.parse_args()
+
+    asyncio.run(main(sizes=args.orders, batch_size=args.batch_size))
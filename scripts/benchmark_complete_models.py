@@ -0,0 +1,187 @@
+"""Compara a montagem dos schemas `Complete*` validando de novo com a cópia via `construct_from`.
+
+Gera pedidos sintéticos (com produtos e adicionais), ofertas, itens de seção e
+organizações já validados, como chegam do repositório, e mede quanto tempo cada
+caminho leva para montar os `Complete*`. Não acessa o banco.
+
+Uso:
+    python -m scripts.benchmark_complete_models --orders 1000
+    python -m scripts.benchmark_complete_models --orders 1000 10000 --repeat 10
+"""
+
+import argparse
+import random
+from time import perf_counter
+from uuid import uuid4
+
+from app.core.models.base_schema import construct_from
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.offers.schemas import CompleteOffer, CompleteOfferProduct, OfferInDB
+from app.crud.orders.schemas import CompleteOrder, OrderInDB
+from app.crud.organizations.schemas import (
+    CompleteOrganization,
+    CompleteUserOrganization,
+    OrganizationInDB,
+)
+from app.crud.section_items.schemas import CompleteSectionItem, SectionItemInDB
+
+from .benchmark_billing_reports import build_order
+
+
+def build_offer(generator: random.Random) -> dict:
+    now = UTCDateTime.now()
+
+    return {
+        "id": f"off_{uuid4().hex[:12]}",
+        "organization_id": "org_bench",
+        "name": "Combo",
+        "description": "Combo de doces",
+        "products": [
+            {
+                "product_id": f"pro_{generator.randint(1, 40)}",
+                "name": "Produto",
+                "description": "Doce",
+                "unit_cost": round(generator.uniform(1, 5), 2),
+                "unit_price": round(generator.uniform(5, 20), 2),
+                "quantity": generator.randint(1, 4),
+            }
+            for _ in range(generator.randint(1, 5))
+        ],
+        "unit_cost": 10,
+        "unit_price": 30,
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def build_section_item(generator: random.Random) -> dict:
+    now = UTCDateTime.now()
+
+    return {
+        "id": f"sit_{uuid4().hex[:12]}",
+        "organization_id": "org_bench",
+        "section_id": "sec_1",
+        "item_id": f"pro_{generator.randint(1, 40)}",
+        "item_type": "PRODUCT",
+        "position": generator.randint(1, 20),
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def build_organization(generator: random.Random) -> dict:
+    now = UTCDateTime.now()
+
+    return {
+        "id": f"org_{uuid4().hex[:12]}",
+        "name": "Doces",
+        "slug": f"doces-{generator.randint(1, 10_000)}",
+        "users": [
+            {"user_id": f"usr_{index}", "role": "MEMBER"}
+            for index in range(generator.randint(1, 6))
+        ],
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def validate_order(order: OrderInDB) -> CompleteOrder:
+    return CompleteOrder.model_validate(order)
+
+
+def construct_order(order: OrderInDB) -> CompleteOrder:
+    return construct_from(CompleteOrder, order)
+
+
+def validate_offer(offer: OfferInDB) -> CompleteOffer:
+    complete_offer = CompleteOffer.model_validate(offer)
+    complete_offer.products = [
+        CompleteOfferProduct(**product.model_dump()) for product in offer.products
+    ]
+    return complete_offer
+
+
+def construct_offer(offer: OfferInDB) -> CompleteOffer:
+    return construct_from(
+        CompleteOffer,
+        offer,
+        products=[construct_from(CompleteOfferProduct, product) for product in offer.products],
+    )
+
+
+def validate_section_item(section_item: SectionItemInDB) -> CompleteSectionItem:
+    return CompleteSectionItem.model_validate(section_item)
+
+
+def construct_section_item(section_item: SectionItemInDB) -> CompleteSectionItem:
+    return construct_from(CompleteSectionItem, section_item)
+
+
+def validate_organization(organization: OrganizationInDB) -> CompleteOrganization:
+    return CompleteOrganization.model_validate(organization)
+
+
+def construct_organization(organization: OrganizationInDB) -> CompleteOrganization:
+    return construct_from(
+        CompleteOrganization,
+        organization,
+        users=[construct_from(CompleteUserOrganization, user) for user in organization.users],
+    )
+
+
+def build_orders(generator: random.Random) -> dict:
+    row = build_order("org_bench", generator)
+    row["id"] = row.pop("_id")
+    return row
+
+
+SCHEMAS = (
+    ("orders", OrderInDB, build_orders, validate_order, construct_order),
+    ("offers", OfferInDB, build_offer, validate_offer, construct_offer),
+    ("section_items", SectionItemInDB, build_section_item, validate_section_item, construct_section_item),
+    ("organizations", OrganizationInDB, build_organization, validate_organization, construct_organization),
+)
+
+
+def best_of(repeat: int, build, models: list) -> float:
+    elapsed = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+
+        for model in models:
+            build(model)
+
+        elapsed.append(perf_counter() - start)
+
+    return min(elapsed)
+
+
+def main(sizes, repeat: int) -> None:
+    generator = random.Random(42)
+
+    for size in sizes:
+        print(f"{size} rows:")
+
+        for label, schema, build_row, validate, construct in SCHEMAS:
+            models = [schema.model_validate(build_row(generator)) for _ in range(size)]
+
+            validated = best_of(repeat, validate, models)
+            constructed = best_of(repeat, construct, models)
+
+            print(
+                f"  {label}: model_validate {validated * 1000:.1f} ms, "
+                f"construct_from {constructed * 1000:.1f} ms ({validated / constructed:.1f}x)"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, nargs="+", default=[1_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    main(sizes=args.orders, repeat=args.repeat)
@@ -0,0 +1,152 @@
+"""Compara o processamento de uploads de imagem antigo com o pipeline em processo separado.
+
+Gera uma foto JPEG sintética (20 MP por padrão) e processa `--uploads` cópias dela:
+
+- `legacy`: o fluxo antigo do `FileServices.create`, no event loop: decode completo
+  para validar, novo decode para redimensionar, JPEG temporário reaberto e copiado
+  para outro arquivo temporário antes do upload (uma única variante).
+- `pipeline`: `process_image_upload`, com um decode por upload no pool de processos
+  gerando todas as variantes (`IMAGE_VARIANTS`) em memória.
+
+Cada modo roda em um subprocesso próprio para que o pico de memória (RSS) de um não
+contamine o outro; o pico dos processos do pool aparece separado.
+
+Uso:
+    python -m scripts.benchmark_image_pipeline --uploads 20
+    python -m scripts.benchmark_image_pipeline --uploads 20 --concurrency 4 --megapixels 20
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import shutil
+import subprocess
+import sys
+from io import BytesIO
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from time import perf_counter
+
+from PIL import Image, ImageFile, ImageOps
+
+from app.core.utils.image_pipeline import process_image_upload, shutdown_image_pool
+
+MODES = ("legacy", "pipeline")
+
+
+def build_photo(megapixels: float) -> bytes:
+    width = int((megapixels * 1_000_000 * 3 / 2) ** 0.5)
+    size = (width, int(width * 2 / 3))
+
+    base = Image.linear_gradient("L").resize(size)
+    noise = Image.effect_noise(size, 24)
+    photo = Image.merge("RGB", [base, noise, Image.blend(base, noise, 0.5)])
+
+    buffer = BytesIO()
+    photo.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def legacy_process(content: bytes, size=(640, 480)) -> int:
+    # validate_image_file: decode completo só para validar a integridade
+    with Image.open(BytesIO(content)) as image:
+        ImageFile.LOAD_TRUNCATED_IMAGES = False
+        image.load()
+
+    # resize_image: decodifica de novo e grava um JPEG temporário
+    with Image.open(BytesIO(content)) as image:
+        image = ImageOps.exif_transpose(image)
+
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+
+        image = ImageOps.contain(image, size)
+        image = ImageOps.pad(image, size, color="white")
+
+        with NamedTemporaryFile(delete=False, suffix=".jpeg") as resized:
+            image.save(resized, format="JPEG", quality=85, optimize=True)
+
+    # FileServices.create: copia o JPEG para outro temporário antes do upload
+    try:
+        with open(resized.name, "rb") as source, NamedTemporaryFile(delete=False, suffix=".jpeg") as upload:
+            shutil.copyfileobj(source, upload, length=1024 * 1024)
+
+        uploaded = Path(upload.name).stat().st_size
+        os.remove(upload.name)
+        return uploaded
+
+    finally:
+        os.remove(resized.name)
+
+
+async def legacy_upload(content: bytes) -> int:
+    return legacy_process(content)
+
+
+async def pipeline_upload(content: bytes) -> int:
+    processed_image = await process_image_upload(content=content)
+    return sum(len(image.content) for image in processed_image.images)
+
+
+def peak_rss_mb(who: int) -> float:
+    # no Linux `ru_maxrss` é em KB
+    return resource.getrusage(who).ru_maxrss / 1024
+
+
+async def run_mode(mode: str, content: bytes, uploads: int, concurrency: int) -> None:
+    upload = legacy_upload if mode == "legacy" else pipeline_upload
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited() -> int:
+        async with semaphore:
+            return await upload(content)
+
+    if mode == "pipeline":
+        # sobe os processos do pool fora da medição
+        await asyncio.gather(*[pipeline_upload(content) for _ in range(concurrency)])
+
+    start = perf_counter()
+    stored = await asyncio.gather(*[limited() for _ in range(uploads)])
+    elapsed = perf_counter() - start
+
+    shutdown_image_pool()
+
+    print(
+        f"  {mode}: {uploads / elapsed:.2f} uploads/s, "
+        f"{sum(stored) / uploads / 1024:,.0f} KB stored per upload, "
+        f"peak RSS {peak_rss_mb(resource.RUSAGE_SELF):,.0f} MB (api) "
+        f"+ {peak_rss_mb(resource.RUSAGE_CHILDREN):,.0f} MB (pool worker)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--uploads", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--megapixels", type=float, default=20)
+    parser.add_argument("--mode", choices=MODES)
+    args = parser.parse_args()
+
+    if args.mode:
+        content = build_photo(megapixels=args.megapixels)
+        asyncio.run(run_mode(args.mode, content, uploads=args.uploads, concurrency=args.concurrency))
+        return
+
+    print(f"{args.uploads} uploads of a {args.megapixels:g} MP JPEG, concurrency {args.concurrency}:")
+
+    for mode in MODES:
+        subprocess.run(
+            [
+                sys.executable, "-m", "scripts.benchmark_image_pipeline",
+                "--uploads", str(args.uploads),
+                "--concurrency", str(args.concurrency),
+                "--megapixels", str(args.megapixels),
+                "--mode", mode,
+            ],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
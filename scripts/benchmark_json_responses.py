@@ -0,0 +1,103 @@
+"""Compara a montagem das respostas de listagem com `jsonable_encoder` + `json` com o `FastJSONResponse` (orjson).
+
+Gera pedidos completos sintéticos (como saem de `GET /orders`) e mede o tempo de
+`build_list_response` pelos dois caminhos, conferindo que os bytes são iguais.
+Não acessa o banco.
+
+Uso:
+    python -m scripts.benchmark_json_responses --orders 100 1000 5000
+"""
+
+import argparse
+import random
+from time import perf_counter
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.dependencies.response import build_list_response
+from app.api.shared_schemas.responses import ListResponseSchema
+from app.crud.orders.schemas import CompleteOrder
+
+from .benchmark_billing_reports import build_order
+
+
+def build_orders(size: int, generator: random.Random) -> list:
+    orders = []
+
+    for _ in range(size):
+        row = build_order("org_bench", generator)
+        row["id"] = row.pop("_id")
+        row["description"] = "Entregar na portaria, sem açúcar"
+        orders.append(CompleteOrder.model_validate(row))
+
+    return orders
+
+
+def pagination(size: int) -> dict:
+    return {
+        "total": size,
+        "page_size": size,
+        "pages": 1,
+        "page": 1,
+        "links": {"self": f"/orders?page=1&pageSize={size}"},
+    }
+
+
+def stdlib_list_response(orders: list) -> JSONResponse:
+    # caminho anterior do build_list_response
+    raw_response = ListResponseSchema(
+        message="Orders found with success", pagination=pagination(len(orders)), data=orders
+    )
+    return JSONResponse(
+        content=jsonable_encoder(raw_response.model_dump(by_alias=True, exclude_none=True)),
+        status_code=200,
+    )
+
+
+def fast_list_response(orders: list):
+    return build_list_response(
+        status_code=200,
+        message="Orders found with success",
+        pagination=pagination(len(orders)),
+        data=orders,
+    )
+
+
+def best_of(repeat: int, build, orders: list) -> float:
+    elapsed = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        build(orders)
+        elapsed.append(perf_counter() - start)
+
+    return min(elapsed)
+
+
+def main(sizes, repeat: int) -> None:
+    generator = random.Random(42)
+
+    for size in sizes:
+        orders = build_orders(size, generator)
+        body = fast_list_response(orders).body
+
+        if body != stdlib_list_response(orders).body:
+            raise SystemExit(f"{size} orders: os corpos das respostas são diferentes")
+
+        stdlib = best_of(repeat, stdlib_list_response, orders)
+        fast = best_of(repeat, fast_list_response, orders)
+
+        print(
+            f"{size} orders ({len(body) / 1024:,.0f} KiB): jsonable_encoder {stdlib * 1000:.1f} ms, "
+            f"orjson {fast * 1000:.1f} ms ({stdlib / fast:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, nargs="+", default=[100, 1_000, 5_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    main(sizes=args.orders, repeat=args.repeat)
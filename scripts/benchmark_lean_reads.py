@@ -0,0 +1,188 @@
+"""Compara a leitura das listagens montando `Document`s com a leitura enxuta (`select_lean`).
+
+Para cada coleção (pedidos, clientes, produtos, despesas e pré-pedidos) cria
+documentos sintéticos para uma organização temporária, lê a página inteira dos
+dois jeitos e mostra as linhas por segundo. Os documentos são removidos no final.
+
+Uso:
+    python -m scripts.benchmark_lean_reads --rows 500 5000
+    python -m scripts.benchmark_lean_reads --rows 500 --mongomock
+"""
+
+import argparse
+import asyncio
+import random
+from time import perf_counter
+from uuid import uuid4
+
+from mongoengine import connect
+
+from app.core.configs import get_environment
+from app.core.repositories.base_repository import Repository
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.customers.models import CustomerModel
+from app.crud.customers.schemas import CustomerInDB
+from app.crud.expenses.models import ExpenseModel
+from app.crud.expenses.schemas import ExpenseInDB
+from app.crud.orders.models import OrderModel
+from app.crud.orders.schemas import OrderInDB
+from app.crud.pre_orders.models import PreOrderModel
+from app.crud.pre_orders.schemas import PreOrderInDB
+from app.crud.products.models import ProductModel
+from app.crud.products.schemas import ProductInDB
+
+from .benchmark_billing_reports import build_order
+
+
+def _base(organization_id: str, prefix: str) -> dict:
+    now = UTCDateTime.now()
+
+    return {
+        "_id": f"{prefix}_{uuid4().hex[:12]}",
+        "organization_id": organization_id,
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def build_customer(organization_id: str, generator: random.Random) -> dict:
+    return {
+        **_base(organization_id=organization_id, prefix="cus"),
+        "name": f"Cliente {generator.randint(1, 10_000)}",
+        "ddd": "047",
+        "phone_number": str(generator.randint(900000000, 999999999)),
+        "addresses": [
+            {
+                "zip_code": "89000-000",
+                "city": "Blumenau",
+                "neighborhood": "Centro",
+                "line_1": "Rua A",
+                "number": "10",
+            }
+        ],
+        "tags": [f"tag_{generator.randint(1, 5)}"],
+    }
+
+
+def build_product(organization_id: str, generator: random.Random) -> dict:
+    return {
+        **_base(organization_id=organization_id, prefix="pro"),
+        "name": f"Produto {generator.randint(1, 10_000)}",
+        "description": "Descrição do produto",
+        "unit_price": round(generator.uniform(5, 50), 2),
+        "unit_cost": round(generator.uniform(1, 5), 2),
+        "kind": "REGULAR",
+        "tags": [],
+    }
+
+
+def build_expense(organization_id: str, generator: random.Random) -> dict:
+    amount = round(generator.uniform(10, 300), 2)
+
+    return {
+        **_base(organization_id=organization_id, prefix="exp"),
+        "name": f"Despesa {generator.randint(1, 10_000)}",
+        "expense_date": UTCDateTime.now(),
+        "total_paid": amount,
+        "payment_details": [
+            {"method": "CASH", "payment_date": UTCDateTime.now(), "amount": amount}
+        ],
+        "tags": [],
+    }
+
+
+def build_pre_order(organization_id: str, generator: random.Random) -> dict:
+    return {
+        **_base(organization_id=organization_id, prefix="pre"),
+        "code": str(generator.randint(100, 999)),
+        "menu_id": "men_1",
+        "payment_method": "CASH",
+        "customer": {"name": "Ted", "ddd": "047", "phone_number": "999999999"},
+        "delivery": {"delivery_type": "WITHDRAWAL"},
+        "items": [],
+        "status": "PENDING",
+        "tax": 0,
+        "total_amount": 10,
+        "total_cost": 4,
+    }
+
+
+COLLECTIONS = (
+    ("orders", OrderModel, OrderInDB, build_order),
+    ("customers", CustomerModel, CustomerInDB, build_customer),
+    ("products", ProductModel, ProductInDB, build_product),
+    ("expenses", ExpenseModel, ExpenseInDB, build_expense),
+    ("pre_orders", PreOrderModel, PreOrderInDB, build_pre_order),
+)
+
+
+async def best_of(repeat: int, coroutine_factory) -> float:
+    elapsed = []
+
+    for _ in range(repeat):
+        start = perf_counter()
+        await coroutine_factory()
+        elapsed.append(perf_counter() - start)
+
+    return min(elapsed)
+
+
+async def read_documents(document, schema, organization_id: str) -> list:
+    return [
+        schema.model_validate(model)
+        for model in document.objects(organization_id=organization_id)
+    ]
+
+
+async def main(sizes, repeat: int, use_mongomock: bool) -> None:
+    if use_mongomock:
+        import mongomock
+
+        connect("benchmark", host="mongodb://localhost", mongo_client_class=mongomock.MongoClient)
+
+    else:
+        connect(host=get_environment().DATABASE_HOST)
+
+    repository = Repository()
+    generator = random.Random(42)
+
+    for size in sizes:
+        print(f"{size} rows:")
+
+        for label, document, schema, build_row in COLLECTIONS:
+            organization_id = f"org_bench_{uuid4().hex[:8]}"
+            collection = document._get_collection()
+            collection.insert_many(
+                [build_row(organization_id, generator) for _ in range(size)]
+            )
+
+            try:
+                documents = await best_of(
+                    repeat, lambda: read_documents(document, schema, organization_id)
+                )
+                lean = await best_of(
+                    repeat,
+                    lambda: repository.select_lean(
+                        objects=document.objects(organization_id=organization_id),
+                        schema=schema,
+                    ),
+                )
+
+                print(
+                    f"  {label}: documents {size / documents:,.0f} rows/s, "
+                    f"lean {size / lean:,.0f} rows/s ({documents / lean:.1f}x)"
+                )
+
+            finally:
+                collection.delete_many({"organization_id": organization_id})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, nargs="+", default=[500, 5_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--mongomock", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(main(sizes=args.rows, repeat=args.repeat, use_mongomock=args.mongomock))
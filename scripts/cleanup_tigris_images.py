@@ -24,8 +24,10 @@ def collect_referenced_files() -> set[str]:
     referenced: set[str] = set()
 
     for file in FileModel.objects(purpose__in=purposes):
-        parsed = urlparse(file.url)
-        referenced.add(parsed.path.lstrip("/"))
+        # as variantes (thumbnail, webp) são objetos do mesmo arquivo
+        for url in [file.url, *(file.variants or {}).values()]:
+            parsed = urlparse(url)
+            referenced.add(parsed.path.lstrip("/"))
 
     return referenced
 
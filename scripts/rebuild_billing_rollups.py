@@ -0,0 +1,90 @@
+"""Recalcula os rollups de faturamento (`billing_rollups`) a partir dos pedidos e despesas.
+
+Uso:
+    python -m scripts.rebuild_billing_rollups --months 12
+    python -m scripts.rebuild_billing_rollups --organization-id org_123 --months 24
+"""
+
+import argparse
+import asyncio
+
+from mongoengine import connect
+
+from app.core.configs import get_environment
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.billing.schemas import Billing
+from app.crud.billing_rollups import BillingRollupRepository
+from app.crud.expenses.models import ExpenseModel
+from app.crud.expenses.repositories import ExpenseRepository
+from app.crud.orders.models import OrderModel
+from app.crud.orders.repositories import OrderRepository
+
+
+def last_periods(months: int):
+    now = UTCDateTime.now()
+    year, month = now.year, now.month
+
+    for _ in range(months):
+        yield year, month
+
+        month -= 1
+        if month == 0:
+            month = 12
+            year -= 1
+
+
+async def rebuild(organization_id: str, months: int) -> None:
+    order_repository = OrderRepository(organization_id=organization_id)
+    expense_repository = ExpenseRepository(organization_id=organization_id)
+    rollup_repository = BillingRollupRepository(organization_id=organization_id)
+
+    periods = set(last_periods(months=months))
+    periods.update(await rollup_repository.select_periods())
+
+    for year, month in sorted(periods):
+        start_date = UTCDateTime(year, month, 1)
+        end_date = UTCDateTime(year + month // 12, month % 12 + 1, 1)
+
+        async def build_values() -> dict:
+            summary = await order_repository.select_billing_summary(
+                start_date=start_date, end_date=end_date
+            )
+            total_expanses = await expense_repository.select_total_paid(
+                start_date=start_date, end_date=end_date
+            )
+
+            return Billing(
+                month=month, year=year, total_expanses=total_expanses, **summary
+            ).model_dump()
+
+        billing = Billing(
+            **await rollup_repository.rebuild(month=month, year=year, build_values=build_values)
+        )
+
+        print(f"{organization_id} {month:02d}/{year}: total {round(billing.total_amount, 2)}")
+
+
+async def main(organization_id: str | None, months: int) -> None:
+    env = get_environment()
+    connect(host=env.DATABASE_HOST)
+
+    if organization_id:
+        organization_ids = [organization_id]
+
+    else:
+        organization_ids = sorted(
+            set(OrderModel.objects.distinct("organization_id"))
+            | set(ExpenseModel.objects.distinct("organization_id"))
+        )
+
+    for organization_id in organization_ids:
+        await rebuild(organization_id=organization_id, months=months)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--organization-id", default=None)
+    parser.add_argument("--months", type=int, default=12)
+    args = parser.parse_args()
+
+    asyncio.run(main(organization_id=args.organization_id, months=args.months))
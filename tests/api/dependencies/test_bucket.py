@@ -1,8 +1,13 @@
+import asyncio
+import os
+import tempfile
+import threading
 import time
 import unittest
 from unittest.mock import MagicMock, patch
 
 from app.api.dependencies.bucket import S3BucketManager
+from tests.local_s3 import LocalS3Client
 
 
 class TestS3BucketManagerCaching(unittest.TestCase):
@@ -37,3 +42,157 @@ class TestS3BucketManagerCaching(unittest.TestCase):
         self.assertEqual(url1, "url1")
         self.assertEqual(url2, "url2")
         self.assertEqual(mock_client.return_value.generate_presigned_url.call_count, 2)
+
+
+class TestS3BucketManagerBatchPresign(unittest.TestCase):
+    def setUp(self):
+        self.default_cache = S3BucketManager._presigned_cache
+        S3BucketManager.set_cache({})
+
+    def tearDown(self):
+        S3BucketManager.set_cache(self.default_cache)
+
+    @patch("app.api.dependencies.bucket.boto3.client")
+    def test_generate_presigned_urls_signs_each_url_once_with_one_client(self, mock_client):
+        mock_client.return_value.generate_presigned_url.side_effect = lambda *_, Params, **__: f"signed:{Params['Key']}"
+        manager = S3BucketManager(mode="private")
+        manager.bucket_name = "bucket"
+
+        urls = manager.generate_presigned_urls(
+            [
+                "http://example.com/bucket/a.png",
+                "http://example.com/bucket/b.png",
+                "http://example.com/bucket/a.png",
+            ],
+            expiration=60,
+        )
+
+        self.assertEqual(
+            urls,
+            {
+                "http://example.com/bucket/a.png": "signed:a.png",
+                "http://example.com/bucket/b.png": "signed:b.png",
+            },
+        )
+        mock_client.assert_called_once()
+        self.assertEqual(mock_client.return_value.generate_presigned_url.call_count, 2)
+
+    @patch("app.api.dependencies.bucket.boto3.client")
+    def test_generate_presigned_urls_served_from_cache_does_not_create_client(self, mock_client):
+        S3BucketManager.set_cache(
+            {"http://example.com/bucket/a.png": ("cached", time.time() + 60)}
+        )
+        manager = S3BucketManager(mode="private")
+        manager.bucket_name = "bucket"
+
+        urls = manager.generate_presigned_urls(["http://example.com/bucket/a.png"], expiration=60)
+
+        self.assertEqual(urls, {"http://example.com/bucket/a.png": "cached"})
+        mock_client.assert_not_called()
+
+    @patch("app.api.dependencies.bucket.boto3.client")
+    def test_generate_presigned_urls_refreshes_ahead_of_expiry(self, mock_client):
+        mock_client.return_value.generate_presigned_url.return_value = "fresh"
+        # restam 10s de 100s pedidos: abaixo de REFRESH_AHEAD_RATIO, então é renovada
+        S3BucketManager.set_cache(
+            {"http://example.com/bucket/a.png": ("stale", time.time() + 10)}
+        )
+        manager = S3BucketManager(mode="private")
+        manager.bucket_name = "bucket"
+
+        urls = manager.generate_presigned_urls(["http://example.com/bucket/a.png"], expiration=100)
+
+        self.assertEqual(urls, {"http://example.com/bucket/a.png": "fresh"})
+
+    @patch("app.api.dependencies.bucket.boto3.client")
+    def test_generate_presigned_urls_skips_urls_that_cannot_be_signed(self, mock_client):
+        mock_client.return_value.generate_presigned_url.return_value = "signed"
+        manager = S3BucketManager(mode="private")
+        manager.bucket_name = "bucket"
+
+        urls = manager.generate_presigned_urls(
+            ["http://example.com/bucket/", "http://example.com/bucket/a.png"], expiration=60
+        )
+
+        self.assertEqual(urls, {"http://example.com/bucket/a.png": "signed"})
+
+        with self.assertRaises(Exception):
+            manager.generate_presigned_url("http://example.com/bucket/", expiration=60)
+
+
+
+class TestS3BucketManagerSharedClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = LocalS3Client()
+        S3BucketManager.set_client(client=self.client)
+        self.addCleanup(S3BucketManager.set_client, None)
+
+    @patch("app.api.dependencies.bucket.boto3.client")
+    async def test_instances_use_the_shared_client(self, mock_client):
+        first = S3BucketManager(mode="private")
+        second = S3BucketManager(mode="public")
+
+        self.assertIs(first.client, self.client)
+        self.assertIs(second.client, self.client)
+        mock_client.assert_not_called()
+
+    @patch("app.api.dependencies.bucket._env.BUCKET_BASE_URL", "http://local-s3")
+    async def test_upload_download_list_and_delete_round_trip(self):
+        manager = S3BucketManager(mode="private")
+        manager.bucket_name = "bucket"
+
+        with tempfile.TemporaryDirectory() as directory:
+            local_path = os.path.join(directory, "photo.png")
+            with open(local_path, "wb") as file:
+                file.write(b"image-bytes")
+
+            file_url = await manager.upload_file(local_path=local_path, bucket_path="org/files/photo.png")
+            self.assertEqual(file_url, "http://local-s3/bucket/org/files/photo.png")
+            self.assertEqual(self.client.objects[("bucket", "org/files/photo.png")], (b"image-bytes", "image/png"))
+
+            self.assertEqual(await manager.list_files(prefix="org/"), ["org/files/photo.png"])
+
+            downloaded_path = os.path.join(directory, "downloaded.png")
+            await manager.download_file(bucket_path="org/files/photo.png", local_path=downloaded_path)
+            with open(downloaded_path, "rb") as file:
+                self.assertEqual(file.read(), b"image-bytes")
+
+        await manager.delete_file_by_url(file_url=file_url)
+        self.assertEqual(await manager.list_files(prefix="org/"), [])
+
+    async def test_operations_run_off_the_event_loop_with_bounded_concurrency(self):
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+        loop_thread = threading.get_ident()
+        threads = set()
+
+        def slow_delete(Bucket, Key):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+                threads.add(threading.get_ident())
+            time.sleep(0.01)
+            with lock:
+                running -= 1
+
+        self.client.delete_object = slow_delete
+        manager = S3BucketManager(mode="private")
+
+        with patch("app.api.dependencies.bucket._env.BUCKET_MAX_CONCURRENCY", 2):
+            S3BucketManager.disconnect()
+            S3BucketManager.set_client(client=self.client)
+            await asyncio.gather(*[manager.delete_file(bucket_path=f"file-{index}") for index in range(8)])
+            S3BucketManager.disconnect()
+
+        self.assertNotIn(loop_thread, threads)
+        self.assertLessEqual(peak, 2)
+
+    async def test_errors_are_wrapped(self):
+        manager = S3BucketManager(mode="private")
+
+        with self.assertRaises(Exception) as error:
+            await manager.download_file(bucket_path="missing.png", local_path=os.devnull)
+
+        self.assertEqual(str(error.exception), "Error downloading file")
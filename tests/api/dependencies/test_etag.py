@@ -0,0 +1,111 @@
+from unittest.mock import patch
+
+from fastapi import Response
+from starlette.requests import Request
+
+from app.api.dependencies.bucket import PRIVATE_FILE_URL_EXPIRATION_SECONDS, S3BucketManager
+from app.api.dependencies.etag import URL_WINDOW_SECONDS, ConditionalRequest
+
+
+def _request(path: str = "/api/menus", query: str = "", if_none_match: str = None) -> Request:
+    headers = []
+
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query.encode(),
+            "headers": headers,
+        }
+    )
+
+
+def _etag(version: str, **request_fields) -> str:
+    conditional = ConditionalRequest(request=_request(**request_fields), organization_id="org_1")
+    conditional.is_not_modified(version=version)
+    return conditional.etag
+
+
+def test_etag_is_strong_and_stable():
+    etag = _etag(version="1@2025-01-10T12:00:00")
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == _etag(version="1@2025-01-10T12:00:00")
+
+
+def test_etag_changes_with_version_query_and_organization():
+    etag = _etag(version="1@a", query="expand=file&page=1")
+
+    assert etag == _etag(version="1@a", query="page=1&expand=file")
+    assert etag != _etag(version="2@a", query="expand=file&page=1")
+    assert etag != _etag(version="1@a", query="page=2&expand=file")
+
+    other_organization = ConditionalRequest(
+        request=_request(query="expand=file&page=1"), organization_id="org_2"
+    )
+    other_organization.is_not_modified(version="1@a")
+    assert other_organization.etag != etag
+
+
+def test_etag_changes_with_the_signed_url_window():
+    with patch("app.api.dependencies.etag.time", return_value=0):
+        before = _etag(version="1@a")
+
+    with patch("app.api.dependencies.etag.time", return_value=10**9):
+        after = _etag(version="1@a")
+
+    assert before != after
+
+
+def test_url_window_ends_before_the_signed_urls_expire():
+    guaranteed = S3BucketManager.guaranteed_url_lifetime(
+        expiration=PRIVATE_FILE_URL_EXPIRATION_SECONDS
+    )
+    assert 0 < URL_WINDOW_SECONDS <= guaranteed
+
+    with patch("app.api.dependencies.etag.time", return_value=0):
+        start = _etag(version="1@a")
+
+    with patch("app.api.dependencies.etag.time", return_value=URL_WINDOW_SECONDS - 1):
+        assert _etag(version="1@a") == start
+
+    with patch("app.api.dependencies.etag.time", return_value=URL_WINDOW_SECONDS):
+        assert _etag(version="1@a") != start
+
+
+def test_if_none_match_uses_weak_comparison_and_lists():
+    etag = _etag(version="1@a")
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        conditional = ConditionalRequest(
+            request=_request(if_none_match=header), organization_id="org_1"
+        )
+        assert conditional.is_not_modified(version="1@a"), header
+
+    conditional = ConditionalRequest(
+        request=_request(if_none_match='"other"'), organization_id="org_1"
+    )
+    assert not conditional.is_not_modified(version="1@a")
+
+
+def test_missing_version_never_matches_and_sets_no_header():
+    conditional = ConditionalRequest(request=_request(if_none_match="*"), organization_id="org_1")
+
+    assert not conditional.is_not_modified(version=None)
+    assert "etag" not in conditional.apply(Response(status_code=200)).headers
+
+
+def test_not_modified_and_apply_set_the_headers():
+    conditional = ConditionalRequest(request=_request(), organization_id="org_1")
+    conditional.is_not_modified(version="1@a")
+
+    not_modified = conditional.not_modified()
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == conditional.etag
+
+    assert conditional.apply(Response(status_code=200)).headers["etag"] == conditional.etag
+    assert "etag" not in conditional.apply(Response(status_code=404)).headers
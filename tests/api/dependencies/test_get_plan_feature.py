@@ -0,0 +1,164 @@
+import asyncio
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+from app.api.dependencies import get_plan_feature as module
+from app.api.dependencies.plan_feature_cache import (
+    invalidate_plan_features,
+    plan_features_cache,
+    plan_features_key,
+)
+from app.api.exceptions.authentication_exceptions import PaymentRequiredException
+from app.core.exceptions import NotFoundError
+from app.core.utils.features import Feature
+from app.crud.plan_features.schemas import PlanFeatureInDB
+
+
+class FakeRedisManager:
+    def __init__(self):
+        self.values = {}
+        self.tags = {}
+        self.gets = 0
+
+    async def get_value(self, key):
+        self.gets += 1
+        return self.values.get(key)
+
+    async def set_value(self, key, value, expiration=None, tags=()):
+        self.values[key] = value
+
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(key)
+
+        return True
+
+    async def invalidate_tag(self, tag):
+        keys = self.tags.pop(tag, set())
+        return sum(self.values.pop(key, None) is not None for key in keys)
+
+    async def delete_value(self, key):
+        return self.values.pop(key, None) is not None
+
+
+def _plan_feature(name: Feature, value: str) -> PlanFeatureInDB:
+    now = datetime(2025, 1, 10)
+
+    return PlanFeatureInDB(
+        id=f"feat_{name.value.lower()}",
+        plan_id="plan_1",
+        name=name,
+        value=value,
+        additional_price=0,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class _ActivePlan:
+    plan_id = "plan_1"
+    has_paid_invoice = True
+
+
+class TestGetPlanFeature(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        plan_features_cache.drop()
+        self.redis = FakeRedisManager()
+        self.select_active_plan = AsyncMock(return_value=_ActivePlan())
+        self.select_all = AsyncMock(
+            return_value=[
+                _plan_feature(Feature.MAX_USERS, "3"),
+                _plan_feature(Feature.MAX_PRODUCTS, "10"),
+            ]
+        )
+
+        patches = [
+            patch.object(module, "redis_manager", self.redis),
+            patch(
+                "app.api.dependencies.plan_feature_cache.redis_manager", self.redis
+            ),
+            patch.object(
+                module.OrganizationPlanRepository,
+                "select_active_plan",
+                self.select_active_plan,
+            ),
+            patch.object(module.PlanFeatureRepository, "select_all", self.select_all),
+        ]
+
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        plan_features_cache.drop()
+
+    async def test_whole_feature_set_is_loaded_once(self):
+        users = await module.get_plan_feature("org_1", Feature.MAX_USERS)
+        products = await module.get_plan_feature("org_1", Feature.MAX_PRODUCTS)
+
+        self.assertEqual(users.value, "3")
+        self.assertEqual(products.value, "10")
+        self.select_active_plan.assert_awaited_once()
+        self.select_all.assert_awaited_once()
+        self.assertEqual(self.redis.gets, 1)
+
+    async def test_concurrent_misses_share_one_load(self):
+        async def slow_select_all(plan_id):
+            await asyncio.sleep(0.01)
+            return [_plan_feature(Feature.MAX_USERS, "3")]
+
+        self.select_all.side_effect = slow_select_all
+
+        results = await asyncio.gather(
+            *[module.get_plan_feature("org_1", Feature.MAX_USERS) for _ in range(20)]
+        )
+
+        self.assertTrue(all(result.value == "3" for result in results))
+        self.select_all.assert_awaited_once()
+        self.assertEqual(module._loading, {})
+
+    async def test_redis_hit_skips_mongo(self):
+        await module.get_plan_feature("org_1", Feature.MAX_USERS)
+        plan_features_cache.drop()
+
+        plan_feature = await module.get_plan_feature("org_1", Feature.MAX_PRODUCTS)
+
+        self.assertEqual(plan_feature.value, "10")
+        self.assertEqual(plan_feature.name, Feature.MAX_PRODUCTS)
+        self.select_all.assert_awaited_once()
+        self.assertEqual(self.redis.gets, 2)
+
+    async def test_missing_feature_raises_not_found(self):
+        with self.assertRaises(NotFoundError):
+            await module.get_plan_feature("org_1", Feature.MAX_TAGS)
+
+    async def test_unpaid_plan_raises_and_is_not_cached(self):
+        self.select_active_plan.return_value = None
+
+        with self.assertRaises(PaymentRequiredException):
+            await module.get_plan_feature("org_1", Feature.MAX_USERS)
+
+        self.assertNotIn("org_1", plan_features_cache)
+        self.assertEqual(self.redis.values, {})
+        self.assertEqual(module._loading, {})
+
+    async def test_invalidation_reloads_the_organization(self):
+        await module.get_plan_feature("org_1", Feature.MAX_USERS)
+
+        await invalidate_plan_features(organization_id="org_1")
+
+        self.assertNotIn("org_1", plan_features_cache)
+        self.assertNotIn(plan_features_key("org_1"), self.redis.values)
+
+        await module.get_plan_feature("org_1", Feature.MAX_USERS)
+
+        self.assertEqual(self.select_all.await_count, 2)
+
+    async def test_invalidation_without_organization_clears_every_organization(self):
+        await module.get_plan_feature("org_1", Feature.MAX_USERS)
+        await module.get_plan_feature("org_2", Feature.MAX_USERS)
+
+        await invalidate_plan_features()
+
+        self.assertEqual(len(plan_features_cache), 0)
+        self.assertEqual(self.redis.values, {})
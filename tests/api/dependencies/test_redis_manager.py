@@ -0,0 +1,227 @@
+import fnmatch
+import unittest
+from time import monotonic
+from unittest.mock import AsyncMock, patch
+
+from redis.exceptions import ConnectionError
+
+from app.api.dependencies.redis_manager import RedisManager
+from app.core.configs import get_environment
+
+_env = get_environment()
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def set(self, key, value, ex=None):
+        self.commands.append(("set", key, value))
+        return self
+
+    def sadd(self, key, member):
+        self.commands.append(("sadd", key, member))
+        return self
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+        return self
+
+    def delete(self, *keys):
+        self.commands.append(("delete", keys, None))
+        return self
+
+    async def execute(self):
+        self.client.round_trips += 1
+        results = []
+
+        for command, key, value in self.commands:
+            if command == "set":
+                self.client.values[key] = value
+                results.append(True)
+
+            elif command == "sadd":
+                self.client.sets.setdefault(key, set()).add(value)
+                results.append(1)
+
+            elif command == "expire":
+                results.append(True)
+
+            else:
+                results.append(self.client.delete_now(*key))
+
+        self.commands = []
+        return results
+
+
+class FakeAsyncRedis:
+    def __init__(self):
+        self.values = {}
+        self.sets = {}
+        self.round_trips = 0
+        self.scanned_batches = []
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.values.get(key)
+
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.values.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None):
+        self.round_trips += 1
+        self.values[key] = value
+
+    async def delete(self, *keys):
+        self.round_trips += 1
+        return self.delete_now(*keys)
+
+    def delete_now(self, *keys):
+        return sum(
+            (self.values.pop(key, None) or self.sets.pop(key, None)) is not None
+            for key in keys
+        )
+
+    async def keys(self, pattern):
+        raise AssertionError("KEYS blocks Redis")
+
+    async def scan_iter(self, match=None, count=None):
+        self.round_trips += 1
+
+        for key in list(self.values):
+            if fnmatch.fnmatch(key, match):
+                yield key
+
+    async def sscan_iter(self, name, count=None):
+        self.round_trips += 1
+
+        for member in list(self.sets.get(name, ())):
+            yield member
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(client=self)
+
+
+class BrokenRedis(FakeAsyncRedis):
+    async def get(self, key):
+        self.round_trips += 1
+        raise ConnectionError("connection refused")
+
+
+class TestRedisManager(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = FakeAsyncRedis()
+        RedisManager.set_client(client=self.client)
+        self.addCleanup(RedisManager.set_client, None)
+
+    async def test_instances_share_the_lifespan_client(self):
+        await RedisManager().set_value(key="a", value="1")
+
+        self.assertEqual(await RedisManager().get_value(key="a"), "1")
+        self.assertEqual(self.client.values, {f"{_env.ENVIRONMENT}:a": "1"})
+
+    async def test_get_values_uses_a_single_mget(self):
+        await RedisManager().set_values(values={"a": "1", "b": "2"}, expiration=60)
+        self.client.round_trips = 0
+
+        values = await RedisManager().get_values(keys=["a", "missing", "b"])
+
+        self.assertEqual(values, ["1", None, "2"])
+        self.assertEqual(self.client.round_trips, 1)
+
+    async def test_delete_values_in_one_command(self):
+        await RedisManager().set_values(values={"a": "1", "b": "2"})
+
+        self.assertEqual(await RedisManager().delete_values(keys=["a", "b", "c"]), 2)
+        self.assertFalse(await RedisManager().delete_value(key="a"))
+
+    async def test_without_redis_reads_are_empty_and_writes_are_skipped(self):
+        RedisManager.set_client(client=None)
+        redis_manager = RedisManager()
+
+        self.assertIsNone(await redis_manager.get_value(key="a"))
+        self.assertEqual(await redis_manager.get_values(keys=["a", "b"]), [None, None])
+        self.assertFalse(await redis_manager.set_value(key="a", value="1"))
+        self.assertEqual(await redis_manager.delete_values(keys=["a"]), 0)
+
+    async def test_connection_failure_skips_redis_during_cooldown(self):
+        broken = BrokenRedis()
+        RedisManager.set_client(client=broken)
+
+        self.assertIsNone(await RedisManager().get_value(key="a"))
+        self.assertIsNone(await RedisManager().get_value(key="a"))
+
+        self.assertEqual(broken.round_trips, 1)
+
+    async def test_connect_without_redis_url_returns_none(self):
+        if _env.REDIS_URL:
+            self.skipTest("REDIS_URL configured")
+
+        self.assertIsNone(await RedisManager.connect())
+
+    async def test_connect_keeps_the_pool_when_redis_is_down_at_startup(self):
+        with patch("app.api.dependencies.redis_manager._env.REDIS_URL", "127.0.0.1"), \
+                patch("app.api.dependencies.redis_manager._env.REDIS_PORT", 1):
+            client = await RedisManager.connect()
+
+        self.addCleanup(RedisManager.disconnect)
+        self.assertIs(RedisManager().client, client)
+
+        with patch.object(client, "get", AsyncMock(return_value="1")) as get:
+            # durante o cooldown o Redis nem é tentado
+            self.assertIsNone(await RedisManager().get_value(key="a"))
+            get.assert_not_awaited()
+
+            # passado o cooldown, o mesmo pool volta a ser usado
+            later = monotonic() + RedisManager.FAILURE_COOLDOWN_SECONDS + 1
+
+            with patch("app.api.dependencies.redis_manager.monotonic", return_value=later):
+                self.assertEqual(await RedisManager().get_value(key="a"), "1")
+
+    async def test_invalidate_tags_deletes_every_tagged_key(self):
+        redis_manager = RedisManager()
+        await redis_manager.set_value(key="a", value="1", tags=["org_1:2025-01"])
+        await redis_manager.set_value(key="b", value="2", tags=["org_1:2025-01", "other"])
+        await redis_manager.set_value(key="c", value="3", tags=["org_2:2025-01"])
+
+        deleted = await redis_manager.invalidate_tags(tags=["org_1:2025-01"])
+
+        self.assertEqual(deleted, 2)
+        self.assertEqual(self.client.values, {f"{_env.ENVIRONMENT}:c": "3"})
+        self.assertNotIn(f"{_env.ENVIRONMENT}:tag:org_1:2025-01", self.client.sets)
+
+    async def test_invalidate_tags_deletes_in_batches(self):
+        redis_manager = RedisManager()
+        redis_manager.SCAN_BATCH_SIZE = 2
+
+        for index in range(5):
+            await redis_manager.set_value(key=f"k{index}", value="1", tags=["big"])
+
+        self.client.round_trips = 0
+        deleted = await redis_manager.invalidate_tag(tag="big")
+
+        self.assertEqual(deleted, 5)
+        self.assertEqual(self.client.values, {})
+        # um SSCAN e um único pipeline com os lotes
+        self.assertEqual(self.client.round_trips, 2)
+
+    async def test_list_keys_uses_scan_with_environment_prefix(self):
+        await RedisManager().set_values(values={"metrics:1": "1", "metrics:2": "2", "user:1": "3"})
+
+        keys = await RedisManager().list_keys(pattern="metrics:*")
+
+        self.assertEqual(sorted(keys), ["metrics:1", "metrics:2"])
+
+    async def test_delete_pattern(self):
+        await RedisManager().set_values(values={"metrics:1": "1", "metrics:2": "2", "user:1": "3"})
+
+        self.assertEqual(await RedisManager().delete_pattern(pattern="metrics:*"), 2)
+        self.assertEqual(list(self.client.values), [f"{_env.ENVIRONMENT}:user:1"])
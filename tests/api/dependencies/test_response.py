@@ -0,0 +1,114 @@
+import json
+from decimal import Decimal
+
+from fastapi import status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.api.dependencies.response import FastJSONResponse, build_list_response, build_response
+from app.api.shared_schemas.responses import ListResponseSchema, Response
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.orders.schemas import (
+    CompleteOrder,
+    Delivery,
+    DeliveryType,
+    OrderStatus,
+    PaymentSummary,
+    StoredProduct,
+)
+from app.crud.shared_schemas.payment import PaymentMethod, PaymentStatus
+
+
+def _order(index: int) -> CompleteOrder:
+    now = UTCDateTime.now()
+
+    return CompleteOrder(
+        id=f"ord{index}",
+        organization_id="org1",
+        status=OrderStatus.PENDING,
+        payment_status=PaymentStatus.PARTIALLY_PAID,
+        products=[
+            StoredProduct(
+                product_id="p1",
+                name="Pão de mel",
+                unit_price=2.35,
+                unit_cost=1.1,
+                quantity=3,
+            )
+        ],
+        tags=["tag1"],
+        delivery=Delivery(delivery_type=DeliveryType.WITHDRAWAL),
+        preparation_date=now,
+        order_date=now,
+        description="Sem açúcar",
+        total_amount=7.05,
+        payment_summary=PaymentSummary(
+            total_paid=5.0, count=1, methods={PaymentMethod.PIX: 5.0}
+        ),
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def _stdlib_body(raw_response: BaseModel) -> bytes:
+    # o caminho antigo: model_dump -> jsonable_encoder -> json da biblioteca padrão
+    return json.dumps(
+        jsonable_encoder(raw_response.model_dump(by_alias=True, exclude_none=True)),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _pagination() -> dict:
+    return {
+        "total": 2,
+        "page_size": 15,
+        "pages": 1,
+        "page": 1,
+        "links": {"self": "/orders?page=1"},
+    }
+
+
+def test_build_response_is_byte_compatible():
+    order = _order(1)
+
+    response = build_response(status_code=status.HTTP_200_OK, message="Order found", data=order)
+
+    assert isinstance(response, FastJSONResponse)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    assert response.body == _stdlib_body(Response(message="Order found", data=order))
+
+
+def test_build_list_response_is_byte_compatible():
+    orders = [_order(1), _order(2)]
+
+    response = build_list_response(
+        status_code=status.HTTP_200_OK,
+        message="Orders found",
+        pagination=_pagination(),
+        data=orders,
+    )
+
+    expected = _stdlib_body(
+        ListResponseSchema(message="Orders found", pagination=_pagination(), data=orders)
+    )
+    assert response.body == expected
+    assert json.loads(response.body)["data"][0]["paymentSummary"]["methods"] == {"PIX": 5.0}
+
+
+def test_build_response_without_data_and_with_int():
+    assert build_response(status_code=200, message="Deleted").body == b'{"message":"Deleted"}'
+    assert build_response(status_code=200, message="Count", data=3).body == (
+        b'{"message":"Count","data":3}'
+    )
+
+
+def test_fast_json_response_falls_back_for_unknown_types():
+    response = FastJSONResponse(
+        content={"amount": Decimal("1.50"), "ids": {"a"}, "big": 2**70}
+    )
+
+    assert json.loads(response.body) == {"amount": 1.5, "ids": ["a"], "big": 2**70}
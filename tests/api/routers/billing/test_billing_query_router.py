@@ -43,11 +43,9 @@ class TestBillingQueryRouter(unittest.TestCase):
         disconnect()
         app.dependency_overrides = {}
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature")
-    def test_get_dashboard_billings_success(self, mock_plan, mock_redis):
+    def test_get_dashboard_billings_success(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         now = UTCDateTime.now()
 
@@ -58,10 +56,10 @@ class TestBillingQueryRouter(unittest.TestCase):
         mock_expense_services.search_all.return_value = []
 
         service = BillingServices(
-            product_repository=AsyncMock(),
             order_services=mock_order_services,
             fast_order_services=mock_fast_order_services,
             expenses_services=mock_expense_services,
+            billing_rollup_repository=AsyncMock(),
         )
 
         # Patch methods to return a Billing instance with known values
@@ -93,17 +91,15 @@ class TestBillingQueryRouter(unittest.TestCase):
         )
         self.assertEqual(json["data"]["totalAmount"], 10)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature")
-    def test_get_monthly_billings_success(self, mock_plan, mock_redis):
+    def test_get_monthly_billings_success(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         service = BillingServices(
-            product_repository=AsyncMock(),
             order_services=AsyncMock(),
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
+            billing_rollup_repository=AsyncMock(),
         )
 
         service.get_monthly_billings = AsyncMock(
@@ -122,17 +118,15 @@ class TestBillingQueryRouter(unittest.TestCase):
         self.assertEqual(json["message"], "Monthly Billings found with success")
         self.assertEqual(len(json["data"]), 1)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature")
-    def test_get_best_selling_products_success(self, mock_plan, mock_redis):
+    def test_get_best_selling_products_success(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         service = BillingServices(
-            product_repository=AsyncMock(),
             order_services=AsyncMock(),
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
+            billing_rollup_repository=AsyncMock(),
         )
 
         service.get_best_selling_products = AsyncMock(
@@ -151,17 +145,15 @@ class TestBillingQueryRouter(unittest.TestCase):
         self.assertEqual(json["message"], "Best selling products found with success")
         self.assertEqual(json["data"][0]["productId"], "p1")
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature")
-    def test_get_expanses_categories_success(self, mock_plan, mock_redis):
+    def test_get_expanses_categories_success(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         service = BillingServices(
-            product_repository=AsyncMock(),
             order_services=AsyncMock(),
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
+            billing_rollup_repository=AsyncMock(),
         )
 
         service.get_expanses_categories = AsyncMock(
@@ -180,17 +172,15 @@ class TestBillingQueryRouter(unittest.TestCase):
         self.assertEqual(json["message"], "Expanses categories found with success")
         self.assertEqual(json["data"][0]["totalPaid"], 30)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature")
-    def test_get_products_profit_success(self, mock_plan, mock_redis):
+    def test_get_products_profit_success(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         service = BillingServices(
-            product_repository=AsyncMock(),
             order_services=AsyncMock(),
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
+            billing_rollup_repository=AsyncMock(),
         )
 
         service.get_products_profit = AsyncMock(
@@ -217,17 +207,15 @@ class TestBillingQueryRouter(unittest.TestCase):
         self.assertEqual(json["message"], "Products profit found with success")
         self.assertEqual(json["data"][0]["totalProfit"], 20)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature")
-    def test_get_daily_sales_success(self, mock_plan, mock_redis):
+    def test_get_daily_sales_success(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         service = BillingServices(
-            product_repository=AsyncMock(),
             order_services=AsyncMock(),
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
+            billing_rollup_repository=AsyncMock(),
         )
 
         service.get_daily_sales = AsyncMock(
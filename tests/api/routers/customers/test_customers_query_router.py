@@ -112,3 +112,38 @@ class TestCustomersQueryRouter(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["message"], "Contagem de clientes feita com sucesso")
         self.assertEqual(response.json()["data"], 1)
+
+    def test_get_customers_follows_cursor_links(self):
+        for name in ["A", "B", "C"]:
+            self.insert_mock_customer(name=name)
+
+        first_page = self.test_client.get(
+            "/api/customers?page=1&pageSize=2",
+            headers={"organization-id": "org_123"},
+        )
+        links = first_page.json()["pagination"]["links"]
+        self.assertNotIn("previousCursor", links)
+
+        second_page = self.test_client.get(
+            links["nextCursor"],
+            headers={"organization-id": "org_123"},
+        )
+        self.assertEqual(second_page.status_code, 200)
+        self.assertEqual([c["name"] for c in second_page.json()["data"]], ["C"])
+
+        previous_links = second_page.json()["pagination"]["links"]
+        self.assertNotIn("nextCursor", previous_links)
+
+        back = self.test_client.get(
+            previous_links["previousCursor"],
+            headers={"organization-id": "org_123"},
+        )
+        self.assertEqual([c["name"] for c in back.json()["data"]], ["A", "B"])
+
+    def test_get_customers_with_invalid_cursor_returns_400(self):
+        self.insert_mock_customer(name="A")
+        response = self.test_client.get(
+            "/api/customers?cursor=invalid",
+            headers={"organization-id": "org_123"},
+        )
+        self.assertEqual(response.status_code, 400)
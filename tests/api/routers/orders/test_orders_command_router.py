@@ -11,10 +11,14 @@ from app.api.dependencies.get_current_organization import check_current_organiza
 from app.application import app
 from app.core.utils.utc_datetime import UTCDateTime
 from app.crud.orders.schemas import (
+    BulkOrderStatusReport,
     Delivery,
     DeliveryType,
+    OrderImportFormat,
+    OrderImportReport,
     OrderInDB,
     OrderStatus,
+    OrderStatusChange,
 )
 from app.crud.pre_orders.schemas import PreOrderStatus
 from app.crud.shared_schemas.payment import PaymentStatus
@@ -104,3 +108,54 @@ class TestOrdersCommandRouter(unittest.TestCase):
         self.assertEqual(response.json()["data"]["status"], "IN_PREPARATION")
         pre_order_services.search_by_order_id.assert_not_awaited()
         pre_order_services.update_status.assert_not_awaited()
+
+    def test_import_orders_detects_format_from_filename(self):
+        order_services = AsyncMock()
+        order_services.import_orders.return_value = OrderImportReport(
+            total_rows=1, imported=1, order_ids=["ord_123"]
+        )
+        app.dependency_overrides[order_composer] = lambda: order_services
+
+        response = self.test_client.post(
+            "/api/orders/import",
+            files={"file": ("orders.ndjson", b"{}\n", "application/octet-stream")},
+            headers={"organization-id": "org_123"},
+        )
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["data"]["orderIds"], ["ord_123"])
+        self.assertEqual(
+            order_services.import_orders.await_args.kwargs["file_format"],
+            OrderImportFormat.NDJSON,
+        )
+
+    def test_patch_orders_status_syncs_pre_orders_and_schedules_notifications(self):
+        order_services = AsyncMock()
+        pre_order_services = AsyncMock()
+        order_services.update_status_many.return_value = BulkOrderStatusReport(
+            changed=[
+                OrderStatusChange(
+                    id="ord_123",
+                    customer_id="cus_123",
+                    previous_status=OrderStatus.PREPARED,
+                    status=OrderStatus.DONE,
+                )
+            ],
+            unchanged=["ord_456"],
+        )
+
+        app.dependency_overrides[order_composer] = lambda: order_services
+        app.dependency_overrides[pre_order_composer] = lambda: pre_order_services
+
+        response = self.test_client.patch(
+            "/api/orders/status",
+            json={"orderIds": ["ord_123", "ord_456"], "status": "DONE"},
+            headers={"organization-id": "org_123"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["unchanged"], ["ord_456"])
+        pre_order_services.update_status_by_order_ids.assert_awaited_once_with(
+            order_ids=["ord_123"], new_status=PreOrderStatus.DONE
+        )
+        order_services.send_status_notifications.assert_awaited_once()
@@ -55,10 +55,10 @@ class TestOrdersQueryRouter(unittest.TestCase):
 
     def test_get_orders_accepts_prepared_status_filter(self):
         order_services = AsyncMock()
-        order_services.search_count.return_value = 1
-        order_services.search_all.return_value = [
-            self._order_in_db(OrderStatus.PREPARED)
-        ]
+        order_services.search_page.return_value = (
+            1,
+            [self._order_in_db(OrderStatus.PREPARED)],
+        )
 
         app.dependency_overrides[order_composer] = lambda: order_services
 
@@ -70,10 +70,8 @@ class TestOrdersQueryRouter(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()["data"][0]["status"], "PREPARED")
         self.assertEqual(
-            order_services.search_count.await_args.kwargs["status"],
-            OrderStatus.PREPARED,
-        )
-        self.assertEqual(
-            order_services.search_all.await_args.kwargs["status"],
+            order_services.search_page.await_args.kwargs["status"],
             OrderStatus.PREPARED,
         )
+        order_services.search_count.assert_not_awaited()
+        order_services.search_all.assert_not_awaited()
@@ -6,6 +6,7 @@ import mongomock
 from app.api.dependencies.auth import decode_jwt
 from app.api.dependencies.get_current_organization import check_current_organization
 from app.application import app
+from app.core.repositories.entity_cache import clear_entity_caches
 from app.crud.products.models import ProductModel
 from app.crud.tags.models import TagModel
 from app.core.utils.utc_datetime import UTCDateTime
@@ -61,6 +62,52 @@ class TestProductsQueryRouter(unittest.TestCase):
         self.assertEqual(response.status_code, 404)
         self.assertEqual(response.json()["message"], "Product #000000000000000000000000 not found")
 
+    def test_get_product_by_id_returns_etag_and_304_until_it_changes(self):
+        prod_id = self.insert_mock_product(name="Cached")
+
+        first = self.test_client.get(f"/api/products/{prod_id}")
+        etag = first.headers["etag"]
+
+        not_modified = self.test_client.get(
+            f"/api/products/{prod_id}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.headers["etag"], etag)
+        self.assertEqual(not_modified.content, b"")
+
+        ProductModel._get_collection().update_one(
+            {"_id": prod_id},
+            {"$set": {"name": "Changed", "updated_at": UTCDateTime(2100, 1, 1)}},
+        )
+        clear_entity_caches()
+
+        changed = self.test_client.get(
+            f"/api/products/{prod_id}", headers={"If-None-Match": etag}
+        )
+        self.assertEqual(changed.status_code, 200)
+        self.assertEqual(changed.json()["data"]["name"], "Changed")
+        self.assertNotEqual(changed.headers["etag"], etag)
+
+    def test_get_products_etag_depends_on_expand_and_new_products(self):
+        self.insert_mock_product(name="A")
+
+        etag = self.test_client.get("/api/products").headers["etag"]
+        expanded = self.test_client.get("/api/products?expand=tags").headers["etag"]
+        self.assertNotEqual(etag, expanded)
+
+        self.insert_mock_product(name="B")
+
+        response = self.test_client.get("/api/products", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["data"]), 2)
+
+    def test_get_product_by_id_not_found_has_no_etag(self):
+        response = self.test_client.get(
+            "/api/products/pro_missing", headers={"If-None-Match": "*"}
+        )
+        self.assertEqual(response.status_code, 404)
+        self.assertNotIn("etag", response.headers)
+
     def test_get_products_with_results(self):
         self.insert_mock_product(name="A")
         self.insert_mock_product(name="B")
@@ -0,0 +1,40 @@
+import numbers
+
+import mongomock.aggregate
+import pytest
+
+from app.api.dependencies.plan_feature_cache import plan_features_cache
+from app.core.repositories.entity_cache import clear_entity_caches
+
+
+def _install_mongomock_round():
+    # o mongomock 4.3 não implementa `$round`; arredonda como o Mongo (meio para o par)
+    handle_arithmetic_operator = mongomock.aggregate._Parser._handle_arithmetic_operator
+
+    def _handle_arithmetic_operator(self, operator, values):
+        if operator != "$round":
+            return handle_arithmetic_operator(self, operator, values)
+
+        number, places = (self.parse_many(values) if isinstance(values, list) else (self.parse(values), 0))
+        if number is None:
+            return None
+        if not isinstance(number, numbers.Number):
+            raise mongomock.OperationFailure(f"$round only supports numeric types, not {type(number)}")
+
+        return round(number, places)
+
+    mongomock.aggregate.arithmetic_operators.add("$round")
+    mongomock.aggregate._Parser._handle_arithmetic_operator = _handle_arithmetic_operator
+
+
+_install_mongomock_round()
+
+
+@pytest.fixture(autouse=True)
+def _clear_entity_caches():
+    # os testes gravam direto nos models, sem passar pela invalidação dos repositórios
+    clear_entity_caches()
+    plan_features_cache.drop()
+    yield
+    clear_entity_caches()
+    plan_features_cache.drop()
@@ -0,0 +1,64 @@
+import unittest
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.db.indexes import INDEXED_DOCUMENTS, audit_indexes, ensure_indexes
+from app.crud.orders.models import OrderModel
+from app.crud.tags.models import TagModel
+
+
+class TestIndexes(unittest.TestCase):
+    def setUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+
+    def tearDown(self):
+        disconnect()
+
+    def test_orders_hot_path_index_is_declared(self):
+        keys = [spec["fields"] for spec in OrderModel._meta["index_specs"]]
+
+        self.assertIn(
+            [
+                ("organization_id", 1),
+                ("is_active", 1),
+                ("is_fast_order", 1),
+                ("order_date", -1),
+            ],
+            keys,
+        )
+
+    def test_ensure_indexes_is_idempotent(self):
+        ensure_indexes()
+        ensure_indexes()
+
+        for report in audit_indexes():
+            self.assertEqual(report.missing, [], report.collection)
+            self.assertEqual(report.undeclared, [], report.collection)
+
+    def test_audit_reports_missing_and_undeclared_indexes(self):
+        collection = TagModel._get_collection()
+        collection.drop_indexes()
+        collection.create_index([("name", 1)], name="name_1")
+
+        report = audit_indexes(documents=[TagModel])[0]
+
+        self.assertEqual(report.collection, "tags")
+        self.assertEqual(
+            report.missing,
+            [
+                (("organization_id", 1), ("is_active", 1), ("name", 1)),
+                (("organization_id", 1), ("is_active", 1), ("search_tokens", 1)),
+                (("organization_id", 1), ("updated_at", 1)),
+            ],
+        )
+        self.assertEqual(report.undeclared, ["name_1"])
+
+    def test_all_documents_declare_indexes(self):
+        for document in INDEXED_DOCUMENTS:
+            self.assertTrue(document._meta["index_specs"], document.__name__)
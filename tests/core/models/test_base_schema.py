@@ -0,0 +1,121 @@
+from app.core.models.base_schema import construct_from
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.offers.schemas import CompleteOffer, CompleteOfferProduct, OfferInDB, OfferProduct
+from app.crud.orders.schemas import (
+    CompleteOrder,
+    Delivery,
+    DeliveryType,
+    OrderInDB,
+    OrderStatus,
+    StoredProduct,
+)
+from app.crud.organizations.schemas import (
+    CompleteOrganization,
+    CompleteUserOrganization,
+    OrganizationInDB,
+    RoleEnum,
+    UserOrganization,
+)
+from app.crud.shared_schemas.payment import PaymentStatus
+
+
+def _order_in_db() -> OrderInDB:
+    now = UTCDateTime.now()
+
+    return OrderInDB(
+        id="ord1",
+        organization_id="org1",
+        customer_id="cus1",
+        status=OrderStatus.PENDING,
+        payment_status=PaymentStatus.PENDING,
+        products=[
+            StoredProduct(
+                product_id="p1",
+                name="Prod1",
+                unit_price=2.0,
+                unit_cost=1.0,
+                quantity=2,
+            )
+        ],
+        tags=["tag1"],
+        delivery=Delivery(delivery_type=DeliveryType.WITHDRAWAL),
+        preparation_date=now,
+        order_date=now,
+        description="Sem açúcar",
+        additional=1,
+        discount=0.5,
+        total_amount=4.5,
+        tax=0,
+        is_active=True,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+def test_construct_from_matches_model_validate():
+    order_in_db = _order_in_db()
+
+    complete_order = construct_from(CompleteOrder, order_in_db)
+
+    assert isinstance(complete_order, CompleteOrder)
+    assert complete_order.model_dump() == CompleteOrder.model_validate(order_in_db).model_dump()
+    assert complete_order.products[0] is order_in_db.products[0]
+    assert complete_order.customer is None
+
+
+def test_construct_from_applies_fields_over_the_source():
+    offer = OfferInDB(
+        id="off1",
+        organization_id="org1",
+        name="Combo",
+        description="Combo de doces",
+        products=[
+            OfferProduct(
+                product_id="p1",
+                name="Prod1",
+                description="Doce",
+                unit_cost=1,
+                unit_price=2,
+                quantity=3,
+            )
+        ],
+        unit_cost=3,
+        unit_price=6,
+        is_active=True,
+        created_at=UTCDateTime.now(),
+        updated_at=UTCDateTime.now(),
+    )
+    products = [construct_from(CompleteOfferProduct, product) for product in offer.products]
+
+    complete_offer = construct_from(CompleteOffer, offer, products=products)
+
+    assert complete_offer.name == "Combo"
+    assert isinstance(complete_offer.products[0], CompleteOfferProduct)
+    assert complete_offer.products[0].quantity == 3
+    assert complete_offer.products[0].file is None
+    assert complete_offer.file is None
+
+
+def test_construct_from_nested_users():
+    organization = OrganizationInDB(
+        id="org1",
+        name="Doces",
+        slug="doces",
+        users=[UserOrganization(user_id="usr1", role=RoleEnum.OWNER)],
+        is_active=True,
+        created_at=UTCDateTime.now(),
+        updated_at=UTCDateTime.now(),
+    )
+
+    complete_organization = construct_from(
+        CompleteOrganization,
+        organization,
+        users=[construct_from(CompleteUserOrganization, user) for user in organization.users],
+    )
+
+    (user,) = complete_organization.users
+    assert isinstance(user, CompleteUserOrganization)
+    assert user.user_id == "usr1"
+    assert user.role == RoleEnum.OWNER
+    assert user.user is None
+    assert complete_organization.model_dump()["users"] == [{"user": None, "role": RoleEnum.OWNER}]
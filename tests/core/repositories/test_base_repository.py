@@ -0,0 +1,185 @@
+import unittest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.core.repositories.base_repository import Repository
+from app.crud.tags.models import TagModel
+from app.crud.tags.repositories import TagRepository
+from app.crud.tags.schemas import TagInDB
+
+
+class TestRepository(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+        self.repo = Repository()
+
+        for name in ["Bolo", "Doce", "Torta"]:
+            TagModel(name=name, organization_id="org1").save()
+
+        TagModel(name="Outra", organization_id="org2").save()
+
+    def tearDown(self):
+        disconnect()
+
+    async def test_count_documents_without_async_client(self):
+        objects = TagModel.objects(organization_id="org1", is_active=True)
+
+        count = await self.repo.count_documents(TagModel, objects._query)
+
+        self.assertEqual(count, 3)
+
+    async def test_find_applies_sort_skip_and_limit(self):
+        rows = await self.repo.find(
+            TagModel,
+            {"organization_id": "org1"},
+            sort=[("name", -1)],
+            skip=1,
+            limit=1,
+        )
+
+        self.assertEqual([row["name"] for row in rows], ["Doce"])
+
+    async def test_find_one_returns_none_when_missing(self):
+        row = await self.repo.find_one(TagModel, {"organization_id": "org3"})
+
+        self.assertIsNone(row)
+
+    async def test_select_documents_version_changes_on_write_and_delete(self):
+        query = {"organization_id": "org1"}
+        version = await self.repo.select_documents_version(TagModel, query)
+
+        self.assertTrue(version.startswith("3@"))
+
+        tag = TagModel.objects(organization_id="org1", name="Bolo").first()
+        TagModel._get_collection().update_one(
+            {"_id": tag.id}, {"$set": {"updated_at": datetime(2100, 1, 1)}}
+        )
+        updated = await self.repo.select_documents_version(TagModel, query)
+
+        self.assertEqual(updated, "3@2100-01-01T00:00:00")
+
+        TagModel._get_collection().delete_one({"_id": tag.id})
+        deleted = await self.repo.select_documents_version(TagModel, query)
+
+        self.assertTrue(deleted.startswith("2@"))
+        self.assertIsNone(
+            await self.repo.select_documents_version(TagModel, {"organization_id": "org3"})
+        )
+
+    async def test_select_version_uses_the_repository_document(self):
+        repository = TagRepository(organization_id="org1")
+        tag = TagModel.objects(organization_id="org1", name="Bolo").first()
+
+        self.assertTrue((await repository.select_version()).startswith("3@"))
+        self.assertTrue((await repository.select_version(id=tag.id)).startswith("1@"))
+        self.assertIsNone(await repository.select_version(id="tag_missing"))
+
+    async def test_aggregate_queryset_keeps_queryset_filters(self):
+        objects = TagModel.objects(organization_id="org1").order_by("name").skip(1).limit(2)
+
+        rows = await self.repo.aggregate_queryset(
+            objects=objects, pipeline=[{"$project": {"name": 1}}]
+        )
+
+        self.assertEqual([row["name"] for row in rows], ["Doce", "Torta"])
+
+    async def test_aggregate_page_counts_the_filter_and_pipes_only_the_page(self):
+        objects = TagModel.objects(organization_id="org1")
+        paged_objects = objects.order_by("name").skip(1).limit(1)
+
+        with patch.object(self.repo, "aggregate", wraps=self.repo.aggregate) as aggregate:
+            total, rows = await self.repo.aggregate_page(
+                objects=objects,
+                paged_objects=paged_objects,
+                pipeline=[{"$project": {"name": 1}}],
+            )
+
+        self.assertEqual(total, 3)
+        self.assertEqual([row["name"] for row in rows], ["Doce"])
+
+        # filtro, ordenação e página antes do resto do pipeline, sem `$facet`
+        self.assertEqual(
+            aggregate.call_args.kwargs["pipeline"],
+            Repository.build_initial_pipeline(objects=paged_objects)
+            + [{"$project": {"name": 1}}],
+        )
+
+    async def test_aggregate_page_with_none_returns_empty(self):
+        objects = TagModel.objects.none()
+
+        self.assertEqual(
+            await self.repo.aggregate_page(objects=objects, paged_objects=objects, pipeline=[]),
+            (0, []),
+        )
+
+    async def test_find_queryset_keeps_queryset_filters(self):
+        objects = TagModel.objects(organization_id="org1").order_by("-name").skip(1).limit(1)
+
+        rows = await self.repo.find_queryset(objects=objects, projection={"name": 1})
+
+        self.assertEqual(rows, [{"_id": rows[0]["_id"], "name": "Doce"}])
+
+    async def test_find_queryset_with_none_returns_empty(self):
+        rows = await self.repo.find_queryset(objects=TagModel.objects.none())
+
+        self.assertEqual(rows, [])
+
+    async def test_select_lean_validates_only_schema_fields(self):
+        objects = TagModel.objects(organization_id="org1").order_by("name")
+
+        tags = await self.repo.select_lean(objects=objects, schema=TagInDB)
+
+        self.assertEqual([tag.name for tag in tags], ["Bolo", "Doce", "Torta"])
+        self.assertIsInstance(tags[0], TagInDB)
+        self.assertTrue(tags[0].id.startswith("tag_"))
+        self.assertNotIn("search_tokens", tags[0].model_dump())
+
+    async def test_select_ranked_lean_orders_by_relevance(self):
+        TagModel(name="Bolo de Pote", organization_id="org1").save()
+        objects = TagModel.objects(organization_id="org1").filter(
+            Repository.search_filter(query="bolo")
+        )
+
+        tags = await self.repo.select_ranked_lean(objects=objects, schema=TagInDB, query="bolo")
+
+        self.assertEqual([tag.name for tag in tags], ["Bolo", "Bolo de Pote"])
+        self.assertNotIn("search_rank", tags[0].model_dump())
+
+    def test_build_initial_pipeline(self):
+        objects = TagModel.objects(organization_id="org1").order_by("-name").skip(2).limit(5)
+
+        pipeline = Repository.build_initial_pipeline(objects=objects)
+
+        self.assertEqual(
+            pipeline,
+            [
+                {"$match": {"organization_id": "org1"}},
+                {"$sort": {"name": -1}},
+                {"$limit": 7},
+                {"$skip": 2},
+            ],
+        )
+
+    async def test_count_documents_uses_async_client_when_started(self):
+        collection = MagicMock()
+        collection.count_documents = AsyncMock(return_value=42)
+        database = MagicMock()
+        database.__getitem__.return_value = collection
+
+        with patch(
+            "app.core.repositories.base_repository.get_async_database",
+            return_value=database,
+        ):
+            count = await self.repo.count_documents(TagModel, {"organization_id": "org1"})
+
+        self.assertEqual(count, 42)
+        database.__getitem__.assert_called_with("tags")
+        collection.count_documents.assert_awaited_once_with({"organization_id": "org1"})
@@ -0,0 +1,85 @@
+import time
+
+from app.core.repositories.entity_cache import (
+    ENTITY_CACHES,
+    EntityCache,
+    clear_entity_caches,
+    entity_cache_stats,
+    tag_cache,
+)
+from app.crud.tags.schemas import TagInDB
+
+
+def _tag(id: str = "tag1", name: str = "Doces") -> TagInDB:
+    return TagInDB(id=id, name=name, organization_id="org1")
+
+
+def test_get_counts_hits_and_misses():
+    cache = EntityCache(name="tags", maxsize=10, ttl=60)
+
+    assert cache.get(organization_id="org1", id="tag1") is None
+
+    cache.set(organization_id="org1", entity=_tag())
+
+    assert cache.get(organization_id="org1", id="tag1").name == "Doces"
+    assert cache.get(organization_id="org2", id="tag1") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.size) == (1, 2, 1)
+
+
+def test_get_returns_a_copy():
+    cache = EntityCache(name="tags", maxsize=10, ttl=60)
+    cache.set(organization_id="org1", entity=_tag())
+
+    cache.get(organization_id="org1", id="tag1").name = "Alterado"
+
+    assert cache.get(organization_id="org1", id="tag1").name == "Doces"
+
+
+def test_get_many_splits_cached_and_missing_ids():
+    cache = EntityCache(name="tags", maxsize=10, ttl=60)
+    cache.set(organization_id="org1", entity=_tag())
+
+    found, missing = cache.get_many(organization_id="org1", ids=["tag1", "tag2", "tag2"])
+
+    assert [tag.id for tag in found] == ["tag1"]
+    assert missing == ["tag2"]
+
+
+def test_invalidate_one_entity_or_the_whole_organization():
+    cache = EntityCache(name="tags", maxsize=10, ttl=60)
+    cache.set_many(organization_id="org1", entities=[_tag("tag1"), _tag("tag2")])
+    cache.set(organization_id="org2", entity=_tag("tag3"))
+
+    cache.invalidate(organization_id="org1", id="tag1")
+    assert cache.get(organization_id="org1", id="tag1") is None
+    assert cache.get(organization_id="org1", id="tag2") is not None
+
+    cache.invalidate(organization_id="org1")
+    assert cache.get(organization_id="org1", id="tag2") is None
+    assert cache.get(organization_id="org2", id="tag3") is not None
+
+
+def test_cache_is_bounded_and_expires():
+    cache = EntityCache(name="tags", maxsize=2, ttl=0.05)
+    cache.set_many(organization_id="org1", entities=[_tag("tag1"), _tag("tag2"), _tag("tag3")])
+
+    assert cache.stats().size == 2
+    assert cache.get(organization_id="org1", id="tag1") is None
+
+    time.sleep(0.06)
+
+    assert cache.get(organization_id="org1", id="tag3") is None
+
+
+def test_clear_entity_caches_resets_every_cache():
+    tag_cache.set(organization_id="org1", entity=_tag())
+    tag_cache.get(organization_id="org1", id="tag1")
+
+    clear_entity_caches()
+
+    assert [stats.name for stats in entity_cache_stats()] == [
+        cache.name for cache in ENTITY_CACHES
+    ]
+    assert all(stats.size == stats.hits == stats.misses == 0 for stats in entity_cache_stats())
@@ -0,0 +1,161 @@
+import asyncio
+import time
+import unittest
+
+from app.core.utils.bounded_cache import BoundedCache, CacheInvalidationBus
+
+
+class FakeBroker:
+    """Redis pub/sub em memória: cada `publish` chega a todas as inscrições."""
+
+    def __init__(self) -> None:
+        self.queues = []
+        self.published = []
+
+    def client(self) -> "FakeRedis":
+        return FakeRedis(broker=self)
+
+
+class FakePubSub:
+    def __init__(self, broker: FakeBroker) -> None:
+        self.queue = asyncio.Queue()
+        broker.queues.append(self.queue)
+
+    async def subscribe(self, channel: str) -> None:
+        self.channel = channel
+
+    async def listen(self):
+        while True:
+            yield await self.queue.get()
+
+    async def aclose(self) -> None:
+        pass
+
+
+class FakeRedis:
+    def __init__(self, broker: FakeBroker) -> None:
+        self.broker = broker
+
+    def pubsub(self, ignore_subscribe_messages: bool = False) -> FakePubSub:
+        return FakePubSub(broker=self.broker)
+
+    async def publish(self, channel: str, message: str) -> int:
+        self.broker.published.append(message)
+
+        for queue in self.broker.queues:
+            queue.put_nowait({"type": "message", "channel": channel, "data": message})
+
+        return len(self.broker.queues)
+
+
+def _cache(maxsize: int = 10, ttl: float = 60, bus: CacheInvalidationBus = None) -> BoundedCache:
+    return BoundedCache(name="plans", maxsize=maxsize, ttl=ttl, bus=bus or CacheInvalidationBus())
+
+
+class TestBoundedCache(unittest.TestCase):
+    def test_behaves_like_a_dict(self):
+        cache = _cache()
+        cache["org1"] = "plan1"
+
+        self.assertEqual(cache.get("org1"), "plan1")
+        self.assertIsNone(cache.get("org2"))
+        self.assertIn("org1", cache)
+        self.assertEqual(list(cache), ["org1"])
+        self.assertEqual(cache.pop("org1"), "plan1")
+        self.assertIsNone(cache.pop("org1", None))
+
+        with self.assertRaises(KeyError):
+            del cache["org1"]
+
+    def test_stats_count_hits_misses_evictions_and_invalidations(self):
+        cache = _cache(maxsize=2)
+        cache["a"], cache["b"] = 1, 2
+        cache.get("a")
+        cache["c"] = 3
+        cache.get("b")
+        cache.invalidate("a")
+
+        stats = cache.stats()
+
+        self.assertEqual((stats.hits, stats.misses), (1, 1))
+        self.assertEqual(stats.evictions, 1)
+        self.assertEqual(stats.invalidations, 1)
+        self.assertEqual((stats.size, stats.max_size), (1, 2))
+
+    def test_entries_expire(self):
+        cache = _cache(ttl=0.05)
+        cache["a"] = 1
+
+        time.sleep(0.06)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.stats().expirations, 1)
+        self.assertEqual(len(cache), 0)
+
+    def test_clear_invalidates_everything(self):
+        cache = _cache()
+        cache["a"], cache["b"] = 1, 2
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertFalse(cache.invalidate())
+
+
+class TestCacheInvalidationBus(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.broker = FakeBroker()
+        self.worker_a, self.worker_b = CacheInvalidationBus(), CacheInvalidationBus()
+        self.cache_a = _cache(bus=self.worker_a)
+        self.cache_b = _cache(bus=self.worker_b)
+
+        await self.worker_a.start(client=self.broker.client())
+        await self.worker_b.start(client=self.broker.client())
+
+    async def asyncTearDown(self):
+        await self.worker_a.stop()
+        await self.worker_b.stop()
+
+    async def _flush(self):
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def test_pop_invalidates_the_key_on_other_workers(self):
+        self.cache_a["org1"] = "plan_a"
+        self.cache_b["org1"] = "plan_b"
+        self.cache_b["org2"] = "plan_b"
+
+        # o worker A não tinha a chave, mas a invalidação é publicada mesmo assim
+        self.cache_a.pop("org1")
+        self.cache_a.pop("org3", None)
+        await self._flush()
+
+        self.assertNotIn("org1", self.cache_b)
+        self.assertIn("org2", self.cache_b)
+        self.assertEqual(len(self.broker.published), 2)
+
+    async def test_clear_invalidates_everything_on_other_workers(self):
+        self.cache_b["org1"] = "plan"
+
+        self.cache_a.clear()
+        await self._flush()
+
+        self.assertEqual(len(self.cache_b), 0)
+
+    async def test_writes_and_local_drops_are_not_published(self):
+        self.cache_a["org1"] = "plan"
+        self.cache_a.drop("org1")
+        await self._flush()
+
+        self.assertEqual(self.broker.published, [])
+
+    def test_apply_ignores_own_messages_and_restores_tuple_keys(self):
+        self.cache_a[("org1", "tag1")] = "tag"
+
+        own = f'{{"origin": "{self.worker_a.worker_id}", "cache": "plans", "key": ["org1", "tag1"]}}'
+        other = '{"origin": "other", "cache": "plans", "key": ["org1", "tag1"]}'
+
+        self.assertFalse(self.worker_a.apply(own))
+        self.assertIn(("org1", "tag1"), self.cache_a)
+        self.assertTrue(self.worker_a.apply(other))
+        self.assertNotIn(("org1", "tag1"), self.cache_a)
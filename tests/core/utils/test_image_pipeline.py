@@ -0,0 +1,130 @@
+import os
+import signal
+import unittest
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from PIL import Image
+
+from app.core.utils.image_pipeline import (
+    IMAGE_VARIANTS,
+    ImagePoolUnavailableError,
+    InvalidImageError,
+    get_image_pool,
+    process_image,
+    process_image_upload,
+    shutdown_image_pool,
+)
+
+
+def build_image(size=(1600, 1200), format="JPEG", mode="RGB", orientation=None) -> bytes:
+    image = Image.new(mode, size, "red")
+    buffer = BytesIO()
+    options = {}
+
+    if orientation:
+        exif = image.getexif()
+        exif[0x0112] = orientation
+        options["exif"] = exif
+
+    image.save(buffer, format=format, **options)
+    return buffer.getvalue()
+
+
+class TestProcessImage(unittest.TestCase):
+    def test_generates_every_variant_from_one_upload(self):
+        images = process_image(build_image()).images
+
+        self.assertEqual([image.variant for image in images], ["catalog", "thumbnail", "webp"])
+
+        for image, variant in zip(images, IMAGE_VARIANTS):
+            with Image.open(BytesIO(image.content)) as encoded:
+                self.assertEqual(encoded.format, variant.format)
+                self.assertEqual(encoded.size, (variant.width, variant.height))
+
+            self.assertEqual(image.content_type, variant.content_type)
+
+    def test_applies_exif_orientation_before_padding(self):
+        # foto retrato salva deitada com orientação 6: depois do pad as bordas brancas ficam nas laterais
+        images = process_image(build_image(size=(1600, 1200), orientation=6)).images
+
+        with Image.open(BytesIO(images[0].content)) as catalog:
+            self.assertEqual(catalog.size, (640, 480))
+            left = catalog.convert("RGB").getpixel((5, 240))
+            center = catalog.convert("RGB").getpixel((320, 240))
+
+        self.assertTrue(all(channel > 240 for channel in left))
+        self.assertGreater(center[0], 200)
+        self.assertLess(center[1], 60)
+
+    def test_content_hash_identifies_the_normalized_image(self):
+        content = build_image()
+        # mesma imagem com outro EXIF: bytes diferentes, imagem normalizada igual
+        resaved = build_image(orientation=1)
+
+        self.assertNotEqual(content, resaved)
+        self.assertEqual(process_image(content).content_hash, process_image(resaved).content_hash)
+        self.assertNotEqual(
+            process_image(content).content_hash,
+            process_image(build_image(orientation=6)).content_hash,
+        )
+
+    def test_converts_images_with_alpha(self):
+        images = process_image(build_image(format="PNG", mode="RGBA")).images
+
+        with Image.open(BytesIO(images[0].content)) as catalog:
+            self.assertEqual(catalog.mode, "RGB")
+
+    def test_rejects_invalid_content(self):
+        with self.assertRaises(InvalidImageError) as error:
+            process_image(b"not an image")
+
+        self.assertEqual(str(error.exception), "Invalid image format")
+
+    def test_rejects_disallowed_format(self):
+        with self.assertRaises(InvalidImageError):
+            process_image(build_image(format="GIF", mode="P"))
+
+    def test_rejects_truncated_image(self):
+        content = build_image()
+
+        with self.assertRaises(InvalidImageError):
+            process_image(content[: len(content) // 2])
+
+
+class TestProcessImageUpload(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        shutdown_image_pool()
+
+    async def test_runs_in_the_process_pool(self):
+        processed_image = await process_image_upload(content=build_image())
+
+        self.assertEqual(len(processed_image.images), len(IMAGE_VARIANTS))
+
+        with self.assertRaises(InvalidImageError):
+            await process_image_upload(content=b"not an image")
+
+    async def test_recreates_the_pool_when_a_worker_dies(self):
+        await process_image_upload(content=build_image())
+        broken_pool = get_image_pool()
+
+        # simula o OOM killer derrubando um processo do pool
+        for process in list(broken_pool._processes.values()):
+            os.kill(process.pid, signal.SIGKILL)
+            process.join()
+
+        processed_image = await process_image_upload(content=build_image())
+
+        self.assertEqual(len(processed_image.images), len(IMAGE_VARIANTS))
+        self.assertIsNot(get_image_pool(), broken_pool)
+
+    async def test_gives_up_when_the_new_pool_breaks_too(self):
+        pool = MagicMock()
+        pool.submit.side_effect = BrokenProcessPool("worker died")
+
+        with patch("app.core.utils.image_pipeline.get_image_pool", return_value=pool):
+            with self.assertRaises(ImagePoolUnavailableError):
+                await process_image_upload(content=build_image())
+
+        self.assertEqual(pool.submit.call_count, 2)
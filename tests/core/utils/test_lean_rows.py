@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from app.core.utils.lean_rows import list_adapter, schema_projection, validate_rows
+from app.crud.customers.models import CustomerModel
+from app.crud.customers.schemas import CustomerInDB
+
+
+def _row(**fields):
+    now = datetime(2025, 1, 10, 12, 30)
+
+    return {
+        "_id": "cus_1",
+        "organization_id": "org1",
+        "name": "Ana",
+        "is_active": True,
+        "created_at": now,
+        "updated_at": now,
+        **fields,
+    }
+
+
+def test_list_adapter_is_built_once_per_schema():
+    assert list_adapter(CustomerInDB) is list_adapter(CustomerInDB)
+
+
+def test_schema_projection_has_only_schema_fields():
+    projection = schema_projection(CustomerInDB)
+
+    assert projection["name"] == 1
+    assert projection["organization_id"] == 1
+    assert "id" not in projection
+    assert "search_tokens" not in projection
+
+
+def test_validate_rows_renames_id_and_validates_the_page():
+    customers = validate_rows(
+        document=CustomerModel,
+        schema=CustomerInDB,
+        rows=[_row(), _row(_id="cus_2", name="Bia", tags=["tag_1"])],
+    )
+
+    assert [customer.id for customer in customers] == ["cus_1", "cus_2"]
+    assert customers[1].tags == ["tag_1"]
+    assert customers[0].created_at.year == 2025
+
+
+def test_validate_rows_fills_document_defaults_missing_in_old_documents():
+    row = _row()
+    del row["is_active"]
+
+    (customer,) = validate_rows(document=CustomerModel, schema=CustomerInDB, rows=[row])
+
+    assert customer.is_active is True
+    assert customer.tags == []
+    assert customer.addresses == []
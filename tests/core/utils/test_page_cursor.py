@@ -0,0 +1,34 @@
+import pytest
+
+from app.core.utils.page_cursor import CursorDirection, PageCursor
+from app.core.utils.utc_datetime import UTCDateTime
+
+
+def test_page_cursor_round_trip_keeps_datetime_type() -> None:
+    value = UTCDateTime(2024, 5, 10, 12, 30, 0, 123000)
+    cursor = PageCursor(
+        sort_field="order_date",
+        value=value,
+        id="ord_123",
+        direction=CursorDirection.PREVIOUS,
+    )
+
+    decoded = PageCursor.decode(cursor.encode())
+
+    assert decoded.sort_field == "order_date"
+    assert decoded.value == value
+    assert isinstance(decoded.value, UTCDateTime)
+    assert decoded.id == "ord_123"
+    assert decoded.direction == CursorDirection.PREVIOUS
+
+
+def test_page_cursor_token_is_url_safe() -> None:
+    token = PageCursor(sort_field="name", value="Açaí ?&=", id="cus_1").encode()
+
+    assert all(char.isalnum() or char in "-_" for char in token)
+
+
+@pytest.mark.parametrize("token", ["", "invalid", "eyJmIjoxfQ"])
+def test_page_cursor_decode_rejects_invalid_tokens(token: str) -> None:
+    with pytest.raises(ValueError):
+        PageCursor.decode(token)
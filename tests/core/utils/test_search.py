@@ -0,0 +1,27 @@
+import pytest
+
+from app.core.utils.search import build_search_tokens, normalize_search_text
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    (
+        ("  Pão de Queijo ", "pao de queijo"),
+        ("CAFÉ-com.leite", "cafe com leite"),
+        ("Brigadeiro (50g)", "brigadeiro 50g"),
+        ("a.*b", "a b"),
+        ("", ""),
+        (None, ""),
+    ),
+)
+def test_normalize_search_text(raw, expected):
+    assert normalize_search_text(raw) == expected
+
+
+def test_build_search_tokens_keeps_distinct_words_in_order():
+    assert build_search_tokens("Bolo de Chocolate com bolo") == [
+        "bolo",
+        "de",
+        "chocolate",
+        "com",
+    ]
@@ -80,3 +80,12 @@ class TestAdditionalItemRepository(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(mapping[gid1]), 1)
         self.assertEqual(mapping[gid1][0].label, "A")
         self.assertEqual(len(mapping), 2)
+
+    async def test_select_by_ids(self):
+        gid = await self._group_id()
+        item1 = AdditionalItem(position=1, product_id="p1", label="A", unit_price=0.0, unit_cost=0.0, consumption_factor=1.0)
+        item2 = AdditionalItem(position=2, product_id="p1", label="B", unit_price=0.0, unit_cost=0.0, consumption_factor=1.0)
+        created1 = await self.additional_repo.create(additional_id=gid, item=item1)
+        await self.additional_repo.create(additional_id=gid, item=item2)
+        items = await self.additional_repo.select_by_ids(ids=[created1.id, "missing"])
+        self.assertEqual([i.label for i in items], ["A"])
@@ -0,0 +1,228 @@
+import random
+import unittest
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from mongoengine import connect, disconnect
+import mongomock
+
+from app.builder.order_calculator import OrderCalculator
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.billing import reference
+from app.crud.orders.repositories import OrderRepository
+from app.crud.orders.schemas import (
+    Delivery,
+    DeliveryType,
+    OrderInDB,
+    OrderStatus,
+    PaymentSummary,
+    StoredAdditionalItem,
+    StoredProduct,
+)
+from app.crud.shared_schemas.payment import PaymentMethod, PaymentStatus
+
+from .utils import save_order
+
+START_DATE = UTCDateTime(2024, 5, 1)
+END_DATE = UTCDateTime(2024, 6, 1) - timedelta(minutes=1)
+
+
+def build_orders(total: int, seed: int = 7):
+    generator = random.Random(seed)
+    orders = []
+
+    for index in range(total):
+        products = []
+
+        for _ in range(generator.randint(1, 3)):
+            product_number = generator.randint(1, 8)
+            additionals = [
+                StoredAdditionalItem(
+                    item_id=f"add_{generator.randint(1, 3)}",
+                    quantity=generator.randint(1, 2),
+                    label="Extra",
+                    unit_price=round(generator.uniform(0.5, 3), 2),
+                    unit_cost=round(generator.uniform(0.1, 1), 2),
+                    consumption_factor=generator.choice([0.5, 1.0]),
+                )
+                for _ in range(generator.randint(0, 2))
+            ]
+            products.append(
+                StoredProduct(
+                    product_id=f"pro_{product_number}",
+                    name=f"Product {product_number}",
+                    unit_price=round(generator.uniform(2, 20), 2),
+                    unit_cost=round(generator.uniform(1, 8), 2),
+                    quantity=generator.randint(1, 4),
+                    additionals=additionals,
+                )
+            )
+
+        total_amount = round(generator.uniform(10, 120), 2)
+        methods = {}
+
+        for _ in range(generator.randint(0, 2)):
+            method = generator.choice(list(PaymentMethod))
+            methods[method] = round(
+                methods.get(method, 0) + generator.uniform(1, total_amount / 2), 2
+            )
+
+        order_date = START_DATE + timedelta(
+            days=generator.randint(0, 29), hours=generator.randint(0, 23)
+        )
+
+        orders.append(
+            OrderInDB(
+                id=f"ord_{index}",
+                organization_id="org1",
+                customer_id=None,
+                status=OrderStatus.DONE,
+                payment_status=PaymentStatus.PENDING,
+                products=products,
+                tags=[],
+                delivery=Delivery(delivery_type=DeliveryType.WITHDRAWAL),
+                preparation_date=order_date,
+                order_date=order_date,
+                description=None,
+                additional=generator.choice([0, 0, 2.5]),
+                discount=generator.choice([0, 0, 1, 5]),
+                total_amount=total_amount,
+                tax=0,
+                payment_summary=PaymentSummary(
+                    total_paid=round(sum(methods.values()), 2),
+                    count=len(methods),
+                    methods=methods,
+                ),
+                is_active=True,
+                created_at=order_date,
+                updated_at=order_date,
+            )
+        )
+
+    return orders
+
+
+class TestBillingAggregations(unittest.IsolatedAsyncioTestCase):
+    """Compara as agregações do MongoDB com a implementação de referência em Python."""
+
+    def setUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+        self.repository = OrderRepository(organization_id="org1")
+        self.order_calculator = OrderCalculator(product_repository=AsyncMock())
+
+        for order in build_orders(total=60):
+            save_order(order=order)
+
+    def tearDown(self):
+        disconnect()
+
+    async def _orders(self):
+        return await self.repository.select_all_without_filters(
+            start_date=START_DATE, end_date=END_DATE
+        )
+
+    async def test_billing_summary_matches_reference(self):
+        expected = reference.monthly_billing(
+            month=5, year=2024, orders=await self._orders(), expenses=[]
+        )
+
+        summary = await self.repository.select_billing_summary(
+            start_date=START_DATE, end_date=END_DATE
+        )
+
+        for field, value in summary.items():
+            self.assertAlmostEqual(value, getattr(expected, field), places=2, msg=field)
+
+    async def test_daily_sales_match_reference(self):
+        expected = await reference.daily_sales(
+            orders=await self._orders(),
+            last_day=END_DATE.day,
+            order_calculator=self.order_calculator,
+        )
+        expected = {sale.day: sale.total_amount for sale in expected if sale.total_amount}
+
+        rows = await self.repository.select_daily_sales(
+            start_date=START_DATE, end_date=END_DATE
+        )
+
+        self.assertEqual(sorted(expected), [row["day"] for row in rows])
+        for row in rows:
+            self.assertAlmostEqual(row["total_amount"], expected[row["day"]], places=2)
+
+    async def test_orders_without_products_match_reference(self):
+        # só `additional - discount`: precisa aparecer no dia 31, que nenhum outro pedido usa
+        order = build_orders(total=1)[0].model_copy(
+            update={
+                "id": "ord_empty",
+                "products": [],
+                "additional": 7,
+                "discount": 2,
+                "order_date": UTCDateTime(2024, 5, 31, 12),
+            }
+        )
+        save_order(order=order)
+        orders = await self._orders()
+
+        expected = await reference.daily_sales(
+            orders=orders, last_day=END_DATE.day, order_calculator=self.order_calculator
+        )
+        rows = await self.repository.select_daily_sales(
+            start_date=START_DATE, end_date=END_DATE
+        )
+
+        self.assertEqual(rows[-1], {"day": 31, "total_amount": 5})
+        self.assertAlmostEqual(
+            sum(row["total_amount"] for row in rows),
+            sum(sale.total_amount for sale in expected),
+            places=2,
+        )
+
+        expected_profit = await reference.products_profit(
+            orders=orders, order_calculator=self.order_calculator, limit=100
+        )
+        profit = await self.repository.select_products_profit(
+            start_date=START_DATE, end_date=END_DATE, limit=100
+        )
+
+        self.assertEqual(
+            [row["product_id"] for row in profit],
+            [product.product_id for product in expected_profit],
+        )
+
+    async def test_products_profit_matches_reference(self):
+        expected = await reference.products_profit(
+            orders=await self._orders(),
+            order_calculator=self.order_calculator,
+            limit=100,
+        )
+
+        rows = await self.repository.select_products_profit(
+            start_date=START_DATE, end_date=END_DATE, limit=100
+        )
+
+        self.assertEqual(
+            [product.product_id for product in expected],
+            [row["product_id"] for row in rows],
+        )
+        for product, row in zip(expected, rows):
+            self.assertEqual(product.product_name, row["product_name"])
+            self.assertEqual(product.quantity, row["quantity"])
+            self.assertAlmostEqual(product.total_amount, row["total_amount"], places=6)
+            self.assertAlmostEqual(product.total_profit, row["total_profit"], places=6)
+
+    async def test_best_selling_products_match_reference(self):
+        expected = reference.best_selling_products(orders=await self._orders(), limit=100)
+
+        rows = await self.repository.select_best_selling_products(
+            start_date=START_DATE, end_date=END_DATE, limit=100
+        )
+
+        self.assertEqual(
+            sorted((-product.quantity, product.product_id) for product in expected),
+            [(-row["quantity"], row["product_id"]) for row in rows],
+        )
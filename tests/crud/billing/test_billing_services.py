@@ -3,7 +3,11 @@ from types import SimpleNamespace
 from typing import List
 from unittest.mock import AsyncMock, patch
 
+from mongoengine import connect, disconnect
+import mongomock
+
 from app.crud.billing.services import BillingServices
+from app.crud.billing_rollups import BillingRollupRepository
 from app.crud.billing.schemas import (
     Billing,
     DailySale,
@@ -20,14 +24,67 @@ from app.crud.orders.schemas import (
     StoredProduct,
     StoredAdditionalItem,
 )
+from app.crud.expenses.models import ExpenseModel
+from app.crud.expenses.repositories import ExpenseRepository
 from app.crud.expenses.schemas import CompleteExpense
-from app.crud.products.schemas import ProductInDB, ProductKind
+from app.crud.expenses.services import ExpenseServices
+from app.crud.orders.repositories import OrderRepository
+from app.crud.orders.services import OrderServices
 from app.crud.tags.schemas import TagInDB
 from app.crud.shared_schemas.payment import Payment, PaymentMethod, PaymentStatus
 from app.core.utils.utc_datetime import UTCDateTime
 
+from .utils import save_order
+
 
 class TestBillingServices(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+
+    def tearDown(self):
+        disconnect()
+
+    def _order_services(self) -> OrderServices:
+        return OrderServices(
+            order_repository=OrderRepository(organization_id="org1"),
+            product_repository=AsyncMock(),
+            tag_repository=AsyncMock(),
+            customer_repository=AsyncMock(),
+            organization_repository=AsyncMock(),
+            additional_item_repository=AsyncMock(),
+            product_additional_repository=AsyncMock(),
+            message_services=AsyncMock(),
+        )
+
+    def _expense_services(self) -> ExpenseServices:
+        return ExpenseServices(
+            expense_repository=ExpenseRepository(organization_id="org1"),
+            tag_repository=AsyncMock(),
+        )
+
+    def _save_orders(self, orders: List[OrderInDB]) -> None:
+        for order in orders:
+            save_order(order=order)
+
+    def _save_expenses(self, expenses: List[CompleteExpense]) -> None:
+        for expense in expenses:
+            ExpenseModel(
+                id=expense.id,
+                name=expense.name,
+                expense_date=expense.expense_date,
+                total_paid=expense.total_paid,
+                payment_details=[
+                    payment.model_dump() for payment in expense.payment_details
+                ],
+                tags=[],
+                organization_id=expense.organization_id,
+            ).save()
+
     async def _order(
         self,
         order_id: str,
@@ -114,16 +171,14 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
             updated_at=order_date,
         )
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
     async def test_get_billing_for_dashboard_calculates_totals(
-        self, mock_plan, mock_redis
+        self, mock_plan
     ):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
-        mock_order_services = AsyncMock()
-        mock_expense_services = AsyncMock()
+        order_services = self._order_services()
+        expense_services = self._expense_services()
         mock_fast_order_services = AsyncMock()
 
         now = UTCDateTime.now()
@@ -170,17 +225,17 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
 
         order1 = await self._order("o1", 30, order1_payments)
         order2 = await self._order("o2", 20, order2_payments)
-        mock_order_services.search_all_without_filters.return_value = [order1, order2]
+        self._save_orders([order1, order2])
 
         expense1 = await self._expense("e1", 5)
         expense2 = await self._expense("e2", 7.5)
-        mock_expense_services.search_all.return_value = [expense1, expense2]
+        self._save_expenses([expense1, expense2])
 
         service = BillingServices(
-            product_repository=AsyncMock(),
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=mock_fast_order_services,
-            expenses_services=mock_expense_services,
+            expenses_services=expense_services,
         )
 
         billing = await service.get_billing_for_dashboard(month=now.month, year=now.year)
@@ -195,14 +250,12 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(billing.pending_payments, 5)
         self.assertEqual(billing.total_expanses, 12.5)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
-    async def test_get_monthly_billings_returns_list(self, mock_plan, mock_redis):
+    async def test_get_monthly_billings_returns_list(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         service = BillingServices(
-            product_repository=AsyncMock(),
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
             order_services=AsyncMock(),
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
@@ -221,14 +274,12 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(billings[0].month, 5)
         self.assertEqual(billings[1].month, 4)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
-    async def test_get_best_selling_products_returns_top(self, mock_plan, mock_redis):
+    async def test_get_best_selling_products_returns_top(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
-        mock_order_services = AsyncMock()
-        mock_order_services.search_all_without_filters.return_value = [
+        order_services = self._order_services()
+        self._save_orders([
             await self._order_with_products(
                 "o1",
                 [
@@ -262,11 +313,11 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
                 ],
                 UTCDateTime(2024, 5, 2),
             ),
-        ]
+        ])
 
         service = BillingServices(
-            product_repository=AsyncMock(),
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
         )
@@ -279,11 +330,9 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(selling_products[1].product_id, "p2")
         self.assertEqual(selling_products[1].quantity, 1)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
-    async def test_get_expanses_categories_sums_by_tag(self, mock_plan, mock_redis):
+    async def test_get_expanses_categories_sums_by_tag(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         tag1 = TagInDB(id="t1", name="Food", organization_id="org1")
         tag2 = TagInDB(id="t2", name="Rent", organization_id="org1")
@@ -296,7 +345,7 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         ]
 
         service = BillingServices(
-            product_repository=AsyncMock(),
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
             order_services=AsyncMock(),
             fast_order_services=AsyncMock(),
             expenses_services=mock_expense_services,
@@ -310,43 +359,12 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(categories[1].tag_id, "t2")
         self.assertEqual(categories[1].total_paid, 5)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
-    async def test_get_products_profit_calculates_profit(self, mock_plan, mock_redis):
+    async def test_get_products_profit_calculates_profit(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
-
-        product_repository = AsyncMock()
-        now = UTCDateTime.now()
-        product_repository.select_by_id.side_effect = [
-            ProductInDB(
-                id="p1",
-                name="Prod1",
-                description="desc",
-                unit_price=10,
-                unit_cost=6,
-                kind=ProductKind.REGULAR,
-                tags=[],
-                organization_id="org1",
-                created_at=now,
-                updated_at=now,
-            ),
-            ProductInDB(
-                id="p2",
-                name="Prod2",
-                description="desc",
-                unit_price=5,
-                unit_cost=2,
-                kind=ProductKind.REGULAR,
-                tags=[],
-                organization_id="org1",
-                created_at=now,
-                updated_at=now,
-            ),
-        ]
 
-        mock_order_services = AsyncMock()
-        mock_order_services.search_all_without_filters.return_value = [
+        order_services = self._order_services()
+        self._save_orders([
             await self._order_with_products(
                 "o1",
                 [
@@ -380,11 +398,11 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
                 ],
                 UTCDateTime(2024, 5, 2),
             ),
-        ]
+        ])
 
         service = BillingServices(
-            product_repository=product_repository,
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
         )
@@ -399,14 +417,12 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(products_profit[1].total_profit, 3)
         self.assertEqual(products_profit[1].quantity, 1)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
-    async def test_get_daily_sales_sums_orders_by_day(self, mock_plan, mock_redis):
+    async def test_get_daily_sales_sums_orders_by_day(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
-        mock_order_services = AsyncMock()
-        mock_order_services.search_all_without_filters.return_value = [
+        order_services = self._order_services()
+        self._save_orders([
             await self._order_with_products(
                 "o1",
                 [
@@ -435,11 +451,11 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
                 ],
                 UTCDateTime(2024, 5, 2),
             ),
-        ]
+        ])
 
         service = BillingServices(
-            product_repository=AsyncMock(),
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
         )
@@ -452,14 +468,12 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(daily_sales[1].total_amount, 15)
         self.assertEqual(next(ds.total_amount for ds in daily_sales if ds.day == 3), 0)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
-    async def test_get_billing_for_dashboard_includes_additionals(self, mock_plan, mock_redis):
+    async def test_get_billing_for_dashboard_includes_additionals(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
-        mock_order_services = AsyncMock()
-        mock_expense_services = AsyncMock()
+        order_services = self._order_services()
+        expense_services = self._expense_services()
         mock_fast_order_services = AsyncMock()
 
         now = UTCDateTime.now()
@@ -480,32 +494,29 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
             additionals=[additional],
         )
 
-        mock_order_services.search_all_without_filters.return_value = [
+        self._save_orders([
             await self._order_with_products("o1", [product], now)
-        ]
-        mock_expense_services.search_all.return_value = []
+        ])
 
         service = BillingServices(
-            product_repository=AsyncMock(),
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=mock_fast_order_services,
-            expenses_services=mock_expense_services,
+            expenses_services=expense_services,
         )
 
         billing = await service.get_billing_for_dashboard(month=now.month, year=now.year)
 
         self.assertEqual(billing.total_amount, 16.0)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
     async def test_get_monthly_billings_includes_additionals(
-        self, mock_plan, mock_redis
+        self, mock_plan
     ):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
-        mock_order_services = AsyncMock()
-        mock_expense_services = AsyncMock()
+        order_services = self._order_services()
+        expense_services = self._expense_services()
         mock_fast_order_services = AsyncMock()
 
         now = UTCDateTime.now()
@@ -526,16 +537,15 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
             additionals=[additional],
         )
 
-        mock_order_services.search_all_without_filters.return_value = [
+        self._save_orders([
             await self._order_with_products("o1", [product], now)
-        ]
-        mock_expense_services.search_all.return_value = []
+        ])
 
         service = BillingServices(
-            product_repository=AsyncMock(),
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=mock_fast_order_services,
-            expenses_services=mock_expense_services,
+            expenses_services=expense_services,
         )
 
         billings = await service.get_monthly_billings(last_months=1)
@@ -543,15 +553,13 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(billings), 1)
         self.assertEqual(billings[0].total_amount, 16.0)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
     async def test_get_best_selling_products_includes_additionals(
-        self, mock_plan, mock_redis
+        self, mock_plan
     ):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
-        mock_order_services = AsyncMock()
+        order_services = self._order_services()
         additional = StoredAdditionalItem(
             item_id="a1",
             quantity=1,
@@ -569,17 +577,17 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
             additionals=[additional],
         )
 
-        mock_order_services.search_all_without_filters.return_value = [
+        self._save_orders([
             await self._order_with_products(
                 "o1",
                 [product],
                 UTCDateTime(2024, 5, 1),
             )
-        ]
+        ])
 
         service = BillingServices(
-            product_repository=AsyncMock(),
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
         )
@@ -590,13 +598,11 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(selling_products[0].product_id, "p1")
         self.assertEqual(selling_products[0].quantity, 1)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
-    async def test_get_products_profit_includes_additionals(self, mock_plan, mock_redis):
+    async def test_get_products_profit_includes_additionals(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
-        mock_order_services = AsyncMock()
+        order_services = self._order_services()
         additional = StoredAdditionalItem(
             item_id="a1",
             quantity=1,
@@ -614,13 +620,13 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
             additionals=[additional],
         )
 
-        mock_order_services.search_all_without_filters.return_value = [
+        self._save_orders([
             await self._order_with_products("o1", [product], UTCDateTime(2024, 5, 1))
-        ]
+        ])
 
         service = BillingServices(
-            product_repository=AsyncMock(),
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
         )
@@ -631,11 +637,9 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(products_profit[0].total_amount, 32.0)
         self.assertEqual(products_profit[0].total_profit, 18.0)
 
-    @patch("app.crud.billing.services.RedisManager")
     @patch("app.crud.billing.services.get_plan_feature", new_callable=AsyncMock)
-    async def test_get_daily_sales_includes_additionals(self, mock_plan, mock_redis):
+    async def test_get_daily_sales_includes_additionals(self, mock_plan):
         mock_plan.return_value = SimpleNamespace(value="true")
-        mock_redis.return_value.get_value.return_value = None
 
         additional = StoredAdditionalItem(
             item_id="a1",
@@ -646,8 +650,8 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
             consumption_factor=1.0,
         )
 
-        mock_order_services = AsyncMock()
-        mock_order_services.search_all_without_filters.return_value = [
+        order_services = self._order_services()
+        self._save_orders([
             await self._order_with_products(
                 "o1",
                 [
@@ -662,11 +666,11 @@ class TestBillingServices(unittest.IsolatedAsyncioTestCase):
                 ],
                 UTCDateTime(2024, 5, 1),
             )
-        ]
+        ])
 
         service = BillingServices(
-            product_repository=AsyncMock(),
-            order_services=mock_order_services,
+            billing_rollup_repository=BillingRollupRepository(organization_id="org1"),
+            order_services=order_services,
             fast_order_services=AsyncMock(),
             expenses_services=AsyncMock(),
         )
@@ -0,0 +1,8 @@
+from app.crud.orders.models import OrderModel
+from app.crud.orders.schemas import OrderInDB
+
+
+def save_order(order: OrderInDB) -> None:
+    data = order.model_dump(exclude={"payments", "payment_summary"})
+    data["payment_summary"] = order.payment_summary.model_dump(mode="json")
+    OrderModel(**data).save(validate=False)
@@ -0,0 +1,240 @@
+import unittest
+from unittest.mock import patch
+
+from mongoengine import connect, disconnect
+import mongomock
+from pymongo.errors import DuplicateKeyError
+
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.billing_rollups import BillingContribution, BillingRollupRepository
+from app.crud.billing_rollups.models import BillingRollupModel
+from app.crud.expenses.repositories import ExpenseRepository
+from app.crud.expenses.schemas import Expense
+from app.crud.orders.repositories import OrderRepository
+from app.crud.orders.schemas import (
+    Delivery,
+    DeliveryType,
+    Order,
+    OrderStatus,
+    StoredProduct,
+)
+from app.crud.payments.repositories import PaymentRepository
+from app.crud.payments.schemas import Payment
+from app.crud.payments.services import PaymentServices
+from app.crud.shared_schemas.payment import Payment as PaymentDetail, PaymentMethod
+
+
+class TestBillingRollupRepository(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+        pipeline = [{"$addFields": {"id": "$_id", "payments": []}}, {"$project": {"_id": 0}}]
+        patcher = patch("app.crud.orders.models.OrderModel.get_payments", return_value=pipeline)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+        self.repo = BillingRollupRepository(organization_id="org1")
+
+    def tearDown(self):
+        disconnect()
+
+    def _rollup(self, month: int, year: int = 2024) -> dict:
+        return BillingRollupModel._get_collection().find_one(
+            {"organization_id": "org1", "year": year, "month": month}
+        )
+
+    def _order(self, order_date: UTCDateTime) -> Order:
+        return Order(
+            customer_id=None,
+            status=OrderStatus.PENDING,
+            products=[
+                StoredProduct(
+                    product_id="p1",
+                    name="Prod1",
+                    unit_price=20.0,
+                    unit_cost=5.0,
+                    quantity=1,
+                )
+            ],
+            tags=[],
+            delivery=Delivery(delivery_type=DeliveryType.WITHDRAWAL),
+            preparation_date=order_date,
+            order_date=order_date,
+            description=None,
+            additional=0,
+            discount=0,
+        )
+
+    async def test_select_by_period_ignores_rollups_that_were_not_built(self):
+        await self.repo.apply(
+            after=BillingContribution(month=5, year=2024, values={"total_amount": 10})
+        )
+
+        self.assertEqual(self._rollup(month=5)["total_amount"], 10)
+        self.assertIsNone(await self.repo.select_by_period(month=5, year=2024))
+
+        await self.repo.save(month=5, year=2024, values={"total_amount": 10})
+        await self.repo.apply(
+            after=BillingContribution(month=5, year=2024, values={"total_amount": 2.5})
+        )
+
+        rollup = await self.repo.select_by_period(month=5, year=2024)
+        self.assertEqual(rollup["total_amount"], 12.5)
+        self.assertEqual(BillingRollupModel._get_collection().count_documents({}), 1)
+
+    async def test_apply_moves_contribution_between_months(self):
+        before = BillingContribution(month=5, year=2024, values={"total_amount": 10})
+        after = BillingContribution(month=6, year=2024, values={"total_amount": 12})
+
+        await self.repo.apply(after=before)
+        await self.repo.apply(before=before, after=after)
+
+        self.assertEqual(self._rollup(month=5)["total_amount"], 0)
+        self.assertEqual(self._rollup(month=6)["total_amount"], 12)
+
+    async def test_apply_invalidates_cached_values_of_changed_months(self):
+        before = BillingContribution(month=5, year=2024, values={"total_amount": 10})
+        after = BillingContribution(month=6, year=2024, values={"total_amount": 12})
+
+        with patch(
+            "app.crud.billing_rollups.repositories.invalidate_billing_periods"
+        ) as invalidate:
+            await self.repo.apply(before=before, after=after)
+
+        invalidate.assert_awaited_once()
+        self.assertEqual(invalidate.await_args.kwargs["organization_id"], "org1")
+        self.assertEqual(
+            set(invalidate.await_args.kwargs["periods"]), {(2024, 5), (2024, 6)}
+        )
+
+    async def test_rebuild_recalculates_when_an_increment_lands_during_the_rebuild(self):
+        await self.repo.apply(
+            after=BillingContribution(month=5, year=2024, values={"total_amount": 10})
+        )
+        builds = []
+
+        async def build_values() -> dict:
+            builds.append(len(builds))
+
+            if len(builds) == 1:
+                # um pedido novo chega entre a leitura dos pedidos e a gravação
+                await self.repo.apply(
+                    after=BillingContribution(month=5, year=2024, values={"total_amount": 5})
+                )
+                return {"total_amount": 10}
+
+            return {"total_amount": 15}
+
+        values = await self.repo.rebuild(month=5, year=2024, build_values=build_values)
+
+        self.assertEqual(values, {"total_amount": 15})
+        self.assertEqual(len(builds), 2)
+        self.assertEqual((await self.repo.select_by_period(month=5, year=2024))["total_amount"], 15)
+
+    async def test_rebuild_creates_the_month_and_accepts_rollups_without_revision(self):
+        async def build_values() -> dict:
+            return {"total_amount": 7}
+
+        await self.repo.rebuild(month=5, year=2024, build_values=build_values)
+        self.assertEqual(self._rollup(month=5)["total_amount"], 7)
+
+        BillingRollupModel._get_collection().update_one(
+            {"organization_id": "org1", "month": 5}, {"$unset": {"revision": "", "built_at": ""}}
+        )
+        await self.repo.rebuild(month=5, year=2024, build_values=build_values)
+
+        self.assertEqual((await self.repo.select_by_period(month=5, year=2024))["total_amount"], 7)
+
+    async def test_apply_retries_when_a_concurrent_write_creates_the_month(self):
+        update_one = self.repo.update_one
+        calls = []
+
+        async def create_month_first(*args, **kwargs):
+            calls.append(kwargs.get("upsert", False))
+
+            if len(calls) == 1:
+                # a outra escrita inseriu o mês entre a busca e o insert do upsert
+                BillingRollupModel._get_collection().insert_one(
+                    {"organization_id": "org1", "year": 2024, "month": 5, "total_amount": 3, "revision": 1}
+                )
+                raise DuplicateKeyError("E11000 duplicate key error")
+
+            return await update_one(*args, **kwargs)
+
+        with patch.object(self.repo, "update_one", side_effect=create_month_first):
+            await self.repo.apply(
+                after=BillingContribution(month=5, year=2024, values={"total_amount": 10})
+            )
+
+        self.assertEqual(calls, [True, False])
+        self.assertEqual(self._rollup(month=5)["total_amount"], 13)
+        self.assertEqual(self._rollup(month=5)["revision"], 2)
+
+    async def test_failed_increment_marks_the_month_for_rebuild(self):
+        await self.repo.save(month=5, year=2024, values={"total_amount": 10})
+        update_one = self.repo.update_one
+
+        async def fail_increment(*args, **kwargs):
+            if "$inc" in kwargs["update"] and "total_amount" in kwargs["update"]["$inc"]:
+                raise TimeoutError("write timed out")
+
+            return await update_one(*args, **kwargs)
+
+        with patch.object(self.repo, "update_one", side_effect=fail_increment):
+            await self.repo.apply(
+                after=BillingContribution(month=5, year=2024, values={"total_amount": 5})
+            )
+
+        self.assertIsNone(await self.repo.select_by_period(month=5, year=2024))
+        self.assertEqual(self._rollup(month=5)["revision"], 1)
+
+    async def test_order_payment_and_expense_writes_update_rollup(self):
+        order_date = UTCDateTime(2024, 5, 10)
+        order_repository = OrderRepository(organization_id="org1")
+        payment_services = PaymentServices(
+            payment_repository=PaymentRepository(organization_id="org1"),
+            order_repository=order_repository,
+        )
+
+        order = await order_repository.create(self._order(order_date), total_amount=20)
+        payment = await payment_services.create(
+            Payment(
+                order_id=order.id,
+                method=PaymentMethod.PIX,
+                payment_date=order_date,
+                amount=15,
+            )
+        )
+
+        await ExpenseRepository(organization_id="org1").create(
+            Expense(
+                name="Flour",
+                expense_date=order_date,
+                payment_details=[
+                    PaymentDetail(
+                        method=PaymentMethod.CASH, payment_date=order_date, amount=4
+                    )
+                ],
+                tags=[],
+            ),
+            total_paid=4,
+        )
+
+        rollup = self._rollup(month=5)
+        self.assertEqual(rollup["total_amount"], 20)
+        self.assertEqual(rollup["payment_received"], 15)
+        self.assertEqual(rollup["pix_received"], 15)
+        self.assertEqual(rollup["pending_payments"], 5)
+        self.assertEqual(rollup["total_expanses"], 4)
+
+        await payment_services.delete_by_id(id=payment.id)
+        await order_repository.delete_by_id(id=order.id)
+
+        rollup = self._rollup(month=5)
+        self.assertEqual(rollup["total_amount"], 0)
+        self.assertEqual(rollup["payment_received"], 0)
+        self.assertEqual(rollup["pix_received"], 0)
+        self.assertEqual(rollup["pending_payments"], 0)
@@ -6,6 +6,7 @@ from app.crud.customers.repositories import CustomerRepository
 from app.crud.customers.schemas import Customer
 from app.crud.customers.models import CustomerModel
 from app.core.exceptions import NotFoundError, UnprocessableEntity
+from app.core.utils.page_cursor import CursorDirection, PageCursor
 from app.core.utils.utc_datetime import UTCDateTime
 
 
@@ -86,6 +87,18 @@ class TestCustomerRepository(unittest.IsolatedAsyncioTestCase):
         names = {r.name for r in results + results_p2}
         self.assertEqual(names, {"A", "B", "C"})
 
+    async def test_select_all_pages_with_equal_names_do_not_overlap(self):
+        created = [await self.repo.create(await self._customer(name="Ana")) for _ in range(5)]
+
+        pages = [
+            await self.repo.select_all(query=None, page=page, page_size=2)
+            for page in (1, 2, 3)
+        ]
+        ids = [customer.id for page in pages for customer in page]
+
+        # empate no nome: a ordem segue o `_id`, igual à do cursor
+        self.assertEqual(ids, sorted(customer.id for customer in created))
+
     async def test_delete_by_id_success(self):
         created = await self.repo.create(await self._customer(name="Del"))
         result = await self.repo.delete_by_id(id=created.id)
@@ -112,6 +125,44 @@ class TestCustomerRepository(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].name, "Taggeda")
 
+    async def test_select_all_query_ignores_accents_case_and_ranks_matches(self):
+        for name in ["Maria José", "José Silva", "Ana Josefa", "Pedro"]:
+            await self.repo.create(await self._customer(name=name))
+
+        results = await self.repo.select_all(query="jose", page=1, page_size=10)
+
+        self.assertEqual(
+            [customer.name for customer in results],
+            ["José Silva", "Ana Josefa", "Maria José"],
+        )
+        self.assertEqual(await self.repo.select_count(query="JOSÉ"), 3)
+
+    async def test_select_all_query_matches_every_word_prefix(self):
+        for name in ["Maria José", "Maria Clara", "José Maria"]:
+            await self.repo.create(await self._customer(name=name))
+
+        results = await self.repo.select_all(query="mar jo", page=1, page_size=10)
+
+        self.assertEqual([c.name for c in results], ["José Maria", "Maria José"])
+
+    async def test_select_all_query_does_not_interpret_regex(self):
+        await self.repo.create(await self._customer(name="Ana"))
+        await self.repo.create(await self._customer(name="Bruno"))
+
+        results = await self.repo.select_all(query="an[", page=1, page_size=10)
+
+        self.assertEqual([c.name for c in results], ["Ana"])
+
+    async def test_update_name_refreshes_search_fields(self):
+        created = await self.repo.create(await self._customer(name="Old"))
+        created.name = "Júlia"
+        await self.repo.update(created)
+
+        customer_model = CustomerModel.objects(id=created.id).first()
+
+        self.assertEqual(customer_model.search_name, "julia")
+        self.assertEqual(customer_model.search_tokens, ["julia"])
+
     async def test_select_count_returns_zero_when_no_results(self):
         count = await self.repo.select_count(query="Nothing")
         self.assertEqual(count, 0)
@@ -142,3 +193,25 @@ class TestCustomerRepository(unittest.IsolatedAsyncioTestCase):
         )
         with self.assertRaises(UnprocessableEntity):
             await self.repo.update(missing)
+
+    async def test_select_all_with_cursor_uses_keyset(self):
+        for name in ["Ana", "Bia", "Caio", "Davi"]:
+            await self.repo.create(await self._customer(name=name))
+
+        first_page = await self.repo.select_all(query=None, page=1, page_size=2)
+        cursor = PageCursor.from_item(
+            item=first_page[-1], sort_field="name", direction=CursorDirection.NEXT
+        )
+
+        second_page = await self.repo.select_all(
+            query=None, page=1, page_size=2, cursor=cursor
+        )
+        self.assertEqual([c.name for c in second_page], ["Caio", "Davi"])
+
+        cursor = PageCursor.from_item(
+            item=second_page[0], sort_field="name", direction=CursorDirection.PREVIOUS
+        )
+        previous_page = await self.repo.select_all(
+            query=None, page=1, page_size=2, cursor=cursor
+        )
+        self.assertEqual([c.name for c in previous_page], ["Ana", "Bia"])
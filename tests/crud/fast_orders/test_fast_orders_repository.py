@@ -10,6 +10,7 @@ from app.core.exceptions import NotFoundError
 from app.crud.fast_orders.repositories import FastOrderRepository
 from app.crud.fast_orders.schemas import FastOrder, StoredProduct
 from app.crud.orders.models import OrderModel
+from tests.mongo_commands import count_mongo_commands
 
 
 class TestFastOrderRepository(unittest.IsolatedAsyncioTestCase):
@@ -56,6 +57,32 @@ class TestFastOrderRepository(unittest.IsolatedAsyncioTestCase):
         updated = await self.repo.update(created.id, {"description": "Updated"})
         self.assertEqual(updated.description, "Updated")
 
+    async def test_update_missing_or_other_organization_fast_order_raises_not_found(self):
+        created = await self.repo.create(self._fast_order(), total_amount=2.0)
+        other_organization = FastOrderRepository(organization_id="org_other")
+
+        with self.assertRaises(NotFoundError):
+            await self.repo.update("ord_missing", {"description": "Updated"})
+
+        with self.assertRaises(NotFoundError):
+            await other_organization.update(created.id, {"description": "Updated"})
+
+    async def test_create_and_update_are_single_order_commands(self):
+        with count_mongo_commands() as commands:
+            created = await self.repo.create(self._fast_order(), total_amount=2.0)
+
+        self.assertEqual(commands.count("orders"), 1)
+
+        with count_mongo_commands() as commands:
+            updated = await self.repo.update(
+                created.id, {"total_amount": 4.444, "discount": 1}
+            )
+
+        self.assertEqual(commands.names("orders"), ["find_one_and_update"])
+        self.assertEqual(updated.total_amount, 4.44)
+        self.assertEqual(updated.discount, 1)
+        self.assertEqual(updated.description, "Fast")
+
     async def test_delete_by_id(self):
         created = await self.repo.create(self._fast_order(), total_amount=2.0)
         await self.repo.delete_by_id(id=created.id)
@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import patch
+
+import mongomock
+from mongoengine import connect, disconnect
+from mongoengine.queryset import QuerySet
+
+from app.api.dependencies.bucket import S3BucketManager
+from app.core.exceptions import NotFoundError
+from app.crud.files.models import FileModel
+from app.crud.files.repositories import FileRepository
+from app.crud.files.schemas import File, FilePurpose
+from tests.local_s3 import LocalS3Client
+
+
+class TestFileRepository(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+        FileModel.objects.delete()
+
+        for patcher in (
+            patch("app.api.dependencies.bucket._env.BUCKET_BASE_URL", "http://local-s3"),
+            patch("app.api.dependencies.bucket._env.PRIVATE_BUCKET_NAME", "private"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        S3BucketManager.set_client(client=LocalS3Client())
+        self.addCleanup(S3BucketManager.set_client, None)
+        self.default_cache = S3BucketManager._presigned_cache
+        S3BucketManager.set_cache({})
+        self.addCleanup(S3BucketManager.set_cache, self.default_cache)
+
+        self.repo = FileRepository(organization_id="org1")
+
+    def tearDown(self):
+        disconnect()
+
+    async def _file(self):
+        return await self.repo.create(
+            File(
+                purpose=FilePurpose.PRODUCT,
+                type="jpeg",
+                url="http://local-s3/org1/photo.jpeg",
+                content_hash="hash1",
+            )
+        )
+
+    async def test_delete_last_reference_removes_the_file(self):
+        file_in_db = await self._file()
+
+        deleted = await self.repo.delete_by_id(id=file_in_db.id)
+
+        self.assertEqual(deleted.id, file_in_db.id)
+        self.assertEqual(FileModel.objects(id=file_in_db.id).count(), 0)
+
+        with self.assertRaises(NotFoundError):
+            await self.repo.delete_by_id(id=file_in_db.id)
+
+    async def test_delete_keeps_file_referenced_during_the_delete(self):
+        file_in_db = await self._file()
+        modify = QuerySet.modify
+
+        def add_reference_before_remove(queryset, *args, **kwargs):
+            # outro upload soma uma referência entre a devolução e a remoção
+            if kwargs.get("remove") and not add_reference_before_remove.called:
+                add_reference_before_remove.called = True
+                FileModel.objects(id=file_in_db.id).update_one(inc__reference_count=1)
+
+            return modify(queryset, *args, **kwargs)
+
+        add_reference_before_remove.called = False
+
+        with patch.object(QuerySet, "modify", add_reference_before_remove):
+            released = await self.repo.delete_by_id(id=file_in_db.id)
+
+        self.assertEqual(released.reference_count, 1)
+        self.assertEqual(FileModel.objects(id=file_in_db.id).first().reference_count, 1)
+
+    async def test_delete_does_not_touch_other_organizations(self):
+        file_in_db = await self._file()
+
+        with self.assertRaises(NotFoundError):
+            await FileRepository(organization_id="org2").delete_by_id(id=file_in_db.id)
+
+        self.assertEqual(FileModel.objects(id=file_in_db.id).count(), 1)
@@ -0,0 +1,155 @@
+import unittest
+from io import BytesIO
+from unittest.mock import patch
+
+import mongomock
+from fastapi import UploadFile
+from mongoengine import connect, disconnect
+from PIL import Image
+
+from app.api.dependencies.bucket import S3BucketManager
+from app.api.exceptions.authentication_exceptions import (
+    BadRequestException,
+    ServiceUnavailableException,
+)
+from app.core.utils.image_pipeline import ImagePoolUnavailableError, process_image
+from app.crud.files.models import FileModel
+from app.crud.files.repositories import FileRepository
+from app.crud.files.schemas import FilePurpose
+from app.crud.files.services import FileServices
+from tests.local_s3 import LocalS3Client
+
+
+async def process_inline(content: bytes):
+    return process_image(content)
+
+
+def build_upload(content: bytes = None, filename: str = "photo.png") -> UploadFile:
+    if content is None:
+        buffer = BytesIO()
+        Image.new("RGB", (1200, 900), "blue").save(buffer, format="PNG")
+        content = buffer.getvalue()
+
+    return UploadFile(file=BytesIO(content), filename=filename)
+
+
+class TestFileServices(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+        FileModel.objects.delete()
+
+        for patcher in (
+            patch("app.crud.files.services.process_image_upload", new=process_inline),
+            patch("app.api.dependencies.bucket._env.BUCKET_BASE_URL", "http://local-s3"),
+            patch("app.api.dependencies.bucket._env.PRIVATE_BUCKET_NAME", "private"),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.client = LocalS3Client()
+        S3BucketManager.set_client(client=self.client)
+        self.addCleanup(S3BucketManager.set_client, None)
+        self.default_cache = S3BucketManager._presigned_cache
+        S3BucketManager.set_cache({})
+        self.addCleanup(S3BucketManager.set_cache, self.default_cache)
+
+        self.service = FileServices(file_repository=FileRepository(organization_id="org1"))
+
+    def tearDown(self):
+        disconnect()
+
+    async def test_create_uploads_every_variant_without_temp_files(self):
+        file_in_db = await self.service.create(purpose=FilePurpose.PRODUCT, file=build_upload())
+
+        keys = self.client.keys(Bucket="private", Prefix="organization/org1/files/")
+        file_id = keys[0].split("/")[-1].split(".")[0]
+        self.assertEqual(
+            keys,
+            [
+                f"organization/org1/files/{file_id}.jpeg",
+                f"organization/org1/files/{file_id}_thumbnail.jpeg",
+                f"organization/org1/files/{file_id}_webp.webp",
+            ],
+        )
+        self.assertEqual(self.client.objects[("private", keys[2])][1], "image/webp")
+
+        self.assertEqual(file_in_db.type, "jpeg")
+        self.assertTrue(file_in_db.url.startswith(f"http://local-s3/private/organization/org1/files/{file_id}.jpeg?"))
+        self.assertEqual(set(file_in_db.variants), {"thumbnail", "webp"})
+        self.assertIn("expires_in=", file_in_db.variants["thumbnail"])
+
+        stored = FileModel.objects(id=file_in_db.id).first()
+        self.assertEqual(stored.url, f"http://local-s3/private/organization/org1/files/{file_id}.jpeg")
+        self.assertEqual(stored.variants["webp"], f"http://local-s3/private/organization/org1/files/{file_id}_webp.webp")
+
+    async def test_select_by_ids_presigns_variants_in_the_same_batch(self):
+        file_in_db = await self.service.create(purpose=FilePurpose.OFFER, file=build_upload())
+        S3BucketManager.set_cache({})
+        self.client.calls.clear()
+
+        files = await FileRepository(organization_id="org1").select_by_ids([file_in_db.id])
+
+        self.assertEqual(set(files[file_in_db.id].variants), {"thumbnail", "webp"})
+        self.assertEqual(self.client.calls["generate_presigned_url"], 3)
+
+    async def test_create_rejects_invalid_image(self):
+        with self.assertRaises(BadRequestException) as error:
+            await self.service.create(purpose=FilePurpose.PRODUCT, file=build_upload(content=b"nope"))
+
+        self.assertEqual(error.exception.detail, "Invalid image format")
+        self.assertEqual(self.client.objects, {})
+        self.assertEqual(FileModel.objects.count(), 0)
+
+    async def test_create_returns_503_when_the_image_pool_is_broken(self):
+        unavailable = ImagePoolUnavailableError("Image processing is temporarily unavailable")
+
+        with patch("app.crud.files.services.process_image_upload", side_effect=unavailable):
+            with self.assertRaises(ServiceUnavailableException) as error:
+                await self.service.create(purpose=FilePurpose.PRODUCT, file=build_upload())
+
+        self.assertEqual(error.exception.status_code, 503)
+        self.assertEqual(self.client.objects, {})
+
+    async def test_create_rejects_unknown_purpose(self):
+        with self.assertRaises(BadRequestException):
+            await self.service.create(purpose="DOCUMENTS", file=build_upload())
+
+    async def test_create_reuses_file_with_the_same_image(self):
+        first = await self.service.create(purpose=FilePurpose.PRODUCT, file=build_upload())
+        self.client.calls.clear()
+
+        second = await self.service.create(purpose=FilePurpose.PRODUCT, file=build_upload())
+
+        self.assertEqual(second.id, first.id)
+        self.assertEqual(second.reference_count, 2)
+        self.assertNotIn("put_object", self.client.calls)
+        self.assertEqual(FileModel.objects.count(), 1)
+        self.assertEqual(len(self.client.objects), 3)
+
+    async def test_create_does_not_reuse_across_purposes_or_organizations(self):
+        first = await self.service.create(purpose=FilePurpose.PRODUCT, file=build_upload())
+        offer_file = await self.service.create(purpose=FilePurpose.OFFER, file=build_upload())
+        other_organization = await FileServices(
+            file_repository=FileRepository(organization_id="org2")
+        ).create(purpose=FilePurpose.PRODUCT, file=build_upload())
+
+        self.assertEqual(len({first.id, offer_file.id, other_organization.id}), 3)
+        self.assertEqual(FileModel.objects(content_hash=first.content_hash).count(), 3)
+
+    async def test_delete_releases_references_before_deleting(self):
+        file_in_db = await self.service.create(purpose=FilePurpose.PRODUCT, file=build_upload())
+        await self.service.create(purpose=FilePurpose.PRODUCT, file=build_upload())
+
+        released = await self.service.delete_by_id(id=file_in_db.id)
+
+        self.assertEqual(released.reference_count, 1)
+        self.assertEqual(FileModel.objects(id=file_in_db.id).first().reference_count, 1)
+
+        await self.service.delete_by_id(id=file_in_db.id)
+
+        self.assertIsNone(FileModel.objects(id=file_in_db.id).first())
@@ -0,0 +1,191 @@
+import io
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import mongomock
+from mongoengine import connect, disconnect
+
+from app.api.exceptions.authentication_exceptions import UnauthorizedException
+from app.crud.additional_items.repositories import AdditionalItemRepository
+from app.crud.billing_rollups.models import BillingRollupModel
+from app.crud.customers.repositories import CustomerRepository
+from app.crud.messages.services import MessageServices
+from app.crud.orders.importer import iter_order_rows
+from app.crud.orders.models import OrderModel
+from app.crud.orders.repositories import OrderRepository
+from app.crud.orders.schemas import OrderImportFormat
+from app.crud.orders.services import OrderServices
+from app.crud.product_additionals.repositories import ProductAdditionalRepository
+from app.crud.products.repositories import ProductRepository
+from app.crud.products.schemas import Product
+from app.crud.tags.repositories import TagRepository
+from app.crud.tags.schemas import Tag
+
+CSV_HEADER = "order_date,preparation_date,status,products,tags,discount\n"
+ORDER_DATE = "2024-05-10T12:00:00Z"
+
+
+def plan_feature(value: str):
+    return patch(
+        "app.crud.orders.services.get_plan_feature",
+        AsyncMock(return_value=SimpleNamespace(value=value)),
+    )
+
+
+class TestOrderImporter(unittest.TestCase):
+    def test_csv_rows_are_parsed_into_request_orders(self):
+        stream = io.BytesIO(
+            (
+                CSV_HEADER
+                + f'{ORDER_DATE},{ORDER_DATE},DONE,pro_1:2;pro_2,tag_1;tag_2,\n'
+                + f'{ORDER_DATE},{ORDER_DATE},,"[{{""product_id"": ""pro_1"", ""quantity"": 1}}]",,1.5\n'
+            ).encode()
+        )
+
+        rows = list(iter_order_rows(stream=stream, file_format=OrderImportFormat.CSV))
+
+        self.assertEqual([line for line, _ in rows], [2, 3])
+        self.assertEqual(
+            rows[0][1]["products"],
+            [{"product_id": "pro_1", "quantity": "2"}, {"product_id": "pro_2", "quantity": 1}],
+        )
+        self.assertEqual(rows[0][1]["tags"], ["tag_1", "tag_2"])
+        self.assertEqual(rows[0][1]["delivery"], {})
+        self.assertNotIn("status", rows[1][1])
+        self.assertEqual(rows[1][1]["products"], [{"product_id": "pro_1", "quantity": 1}])
+
+    def test_ndjson_reports_invalid_lines(self):
+        stream = io.BytesIO(b'{"discount": 1}\n\nnot json\n[1]\n')
+
+        rows = list(iter_order_rows(stream=stream, file_format=OrderImportFormat.NDJSON))
+
+        self.assertEqual(rows[0], (1, {"discount": 1}))
+        self.assertEqual([line for line, _ in rows[1:]], [3, 4])
+        self.assertTrue(all(isinstance(row, ValueError) for _, row in rows[1:]))
+
+
+class TestOrderImport(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+        self.product_repository = ProductRepository(organization_id="org1")
+        self.tag_repository = TagRepository(organization_id="org1")
+
+        organization_repository = AsyncMock()
+        organization_repository.select_by_id.return_value = SimpleNamespace(tax=10)
+
+        self.services = OrderServices(
+            order_repository=OrderRepository(organization_id="org1"),
+            product_repository=self.product_repository,
+            tag_repository=self.tag_repository,
+            customer_repository=CustomerRepository(organization_id="org1"),
+            organization_repository=organization_repository,
+            additional_item_repository=AdditionalItemRepository(organization_id="org1"),
+            product_additional_repository=ProductAdditionalRepository(organization_id="org1"),
+            message_services=AsyncMock(spec=MessageServices),
+        )
+
+        self.product = await self.product_repository.create(
+            Product(name="Bolo", description="desc", unit_price=10.0, unit_cost=4.0)
+        )
+        self.tag = await self.tag_repository.create(Tag(name="Feira"))
+
+    def tearDown(self):
+        disconnect()
+
+    def _csv(self, *lines: str) -> io.BytesIO:
+        return io.BytesIO((CSV_HEADER + "".join(f"{line}\n" for line in lines)).encode())
+
+    async def test_import_csv_inserts_valid_rows_and_reports_errors(self):
+        stream = self._csv(
+            f"{ORDER_DATE},{ORDER_DATE},DONE,{self.product.id}:2,{self.tag.id},5",
+            f"{ORDER_DATE},{ORDER_DATE},DONE,pro_missing,,",
+            f"{ORDER_DATE},{ORDER_DATE},DONE,{self.product.id},tag_missing,",
+            f"{ORDER_DATE},,DONE,{self.product.id},,",
+            f"{ORDER_DATE},{ORDER_DATE},PENDING,{self.product.id},,",
+        )
+
+        with plan_feature("-"):
+            report = await self.services.import_orders(
+                stream=stream, file_format=OrderImportFormat.CSV
+            )
+
+        self.assertEqual(report.total_rows, 5)
+        self.assertEqual(report.imported, 2)
+        self.assertEqual(report.failed, 3)
+        self.assertEqual(
+            [(error.row, error.message) for error in report.errors],
+            [
+                (3, "Product #pro_missing not found"),
+                (4, "Tag #tag_missing not found"),
+                (5, "preparationDate: Field required"),
+            ],
+        )
+
+        orders = {order.id: order for order in OrderModel.objects(organization_id="org1")}
+        self.assertEqual(sorted(orders), sorted(report.order_ids))
+
+        first = orders[report.order_ids[0]]
+        # (10 * 2 - 5) + 10% de taxa
+        self.assertEqual(first.total_amount, 16.5)
+        self.assertEqual(first.tax, 1.5)
+        self.assertEqual(first.products[0]["name"], "Bolo")
+        self.assertEqual(first.payment_status, "PENDING")
+
+        rollup = BillingRollupModel.objects(organization_id="org1", year=2024, month=5).first()
+        self.assertAlmostEqual(
+            rollup.total_amount, sum(order.total_amount for order in orders.values())
+        )
+
+    async def test_import_ndjson_loads_catalog_once_per_chunk(self):
+        order = {
+            "order_date": ORDER_DATE,
+            "preparation_date": ORDER_DATE,
+            "delivery": {"delivery_type": "WITHDRAWAL"},
+            "products": [{"product_id": self.product.id, "quantity": 1}],
+        }
+        stream = io.BytesIO(
+            "\n".join([json.dumps(order)] * 5 + ["{broken"]).encode()
+        )
+
+        with plan_feature("-"), patch.object(
+            self.product_repository,
+            "select_by_ids",
+            wraps=self.product_repository.select_by_ids,
+        ) as select_by_ids:
+            report = await self.services.import_orders(
+                stream=stream, file_format=OrderImportFormat.NDJSON, chunk_size=2
+            )
+
+        self.assertEqual(report.imported, 5)
+        self.assertEqual([(error.row, error.message) for error in report.errors], [(6, "Invalid JSON")])
+        self.assertEqual(select_by_ids.await_count, 3)
+
+    async def test_import_stops_at_plan_limit(self):
+        stream = self._csv(
+            *[f"{ORDER_DATE},{ORDER_DATE},DONE,{self.product.id},," for _ in range(4)]
+        )
+
+        with plan_feature("3"):
+            report = await self.services.import_orders(
+                stream=stream, file_format=OrderImportFormat.CSV, chunk_size=3
+            )
+
+        self.assertEqual(report.imported, 2)
+        self.assertEqual(
+            [(error.row, error.message) for error in report.errors],
+            [(4, "Maximum number of orders reached"), (5, "Maximum number of orders reached")],
+        )
+        self.assertEqual(OrderModel.objects.count(), 2)
+
+    async def test_import_is_refused_when_plan_limit_was_reached(self):
+        with plan_feature("1"), self.assertRaises(UnauthorizedException):
+            await self.services.import_orders(
+                stream=self._csv(), file_format=OrderImportFormat.CSV
+            )
@@ -4,6 +4,7 @@ from unittest.mock import patch
 from mongoengine import connect, disconnect
 import mongomock
 
+from app.core.utils.page_cursor import CursorDirection, PageCursor
 from app.core.utils.utc_datetime import UTCDateTime
 from app.core.exceptions import NotFoundError
 from app.crud.orders.repositories import OrderRepository
@@ -16,7 +17,9 @@ from app.crud.orders.schemas import (
     StoredAdditionalItem,
 )
 from app.crud.orders.models import OrderModel
+from app.crud.payments.models import PaymentModel
 from app.crud.shared_schemas.payment import PaymentStatus
+from tests.mongo_commands import count_mongo_commands
 
 
 class TestOrderRepository(unittest.IsolatedAsyncioTestCase):
@@ -73,11 +76,117 @@ class TestOrderRepository(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(created.total_amount, 2.0)
         self.assertEqual(OrderModel.objects.count(), 1)
 
+    async def test_update_status_many_changes_only_pending_transitions(self):
+        first = await self.repo.create(self._order(), total_amount=2.0)
+        second = await self.repo.create(self._order(), total_amount=2.0)
+        done = await self._create_order_with_statuses(
+            status=OrderStatus.DONE,
+            payment_status=PaymentStatus.PENDING,
+            order_date=UTCDateTime.now(),
+        )
+        other_organization = await OrderRepository(organization_id="org2").create(
+            self._order(), total_amount=2.0
+        )
+
+        changes = await self.repo.update_status_many(
+            order_ids=[first.id, second.id, done.id, other_organization.id, "missing"],
+            status=OrderStatus.DONE,
+        )
+
+        self.assertEqual({change.id for change in changes}, {first.id, second.id})
+        self.assertTrue(
+            all(change.previous_status == OrderStatus.PENDING for change in changes)
+        )
+        self.assertEqual(
+            OrderModel.objects(status=OrderStatus.DONE.value, organization_id="org1").count(),
+            3,
+        )
+        self.assertEqual(
+            OrderModel.objects(id=other_organization.id).first().status,
+            OrderStatus.PENDING.value,
+        )
+
+    async def test_update_status_many_keeps_payment_status(self):
+        created = await self.repo.create(self._order(), total_amount=2.0)
+
+        changes = await self.repo.update_status_many(
+            order_ids=[created.id], status=OrderStatus.DONE
+        )
+
+        self.assertEqual(changes[0].status, OrderStatus.DONE)
+        # o status de pagamento segue os pagamentos, não a mudança em lote
+        self.assertEqual(
+            OrderModel.objects(id=created.id).first().payment_status,
+            PaymentStatus.PENDING.value,
+        )
+
     async def test_update_order(self):
         created = await self.repo.create(self._order(), total_amount=2.0)
         updated = await self.repo.update(created.id, {"status": OrderStatus.DONE.value})
         self.assertEqual(updated.status, OrderStatus.DONE)
 
+    async def test_create_order_writes_without_reading_back(self):
+        with count_mongo_commands() as commands:
+            created = await self.repo.create(self._order(), total_amount=2.0)
+
+        # id gerado antes do save: o mongoengine grava com upsert
+        self.assertEqual(commands.count("orders"), 1)
+        self.assertEqual(commands.count("billing_rollups"), 1)
+        self.assertEqual(created.payments, [])
+        self.assertEqual(created.description, "desc")
+
+    async def test_update_order_is_a_single_find_and_modify(self):
+        created = await self.repo.create(self._order(), total_amount=2.0)
+
+        with count_mongo_commands() as commands:
+            updated = await self.repo.update(
+                created.id, {"description": "  new  ", "total_amount": 3.456}
+            )
+
+        self.assertEqual(commands.names("orders"), ["find_one_and_update"])
+        self.assertEqual(commands.count("payments"), 0)
+        self.assertEqual(updated.description, "new")
+        self.assertEqual(updated.total_amount, 3.46)
+        self.assertEqual(updated.status, OrderStatus.PENDING)
+
+        stored = OrderModel.objects(id=created.id).first()
+        self.assertEqual(stored.description, "new")
+        self.assertEqual(stored.total_amount, 3.46)
+        self.assertEqual(updated.created_at.replace(tzinfo=None), stored.created_at)
+
+    async def test_update_order_with_payments_reads_only_the_payments(self):
+        created = await self.repo.create(self._order(), total_amount=2.0)
+        PaymentModel(
+            order_id=created.id,
+            organization_id="org1",
+            method="CASH",
+            payment_date=UTCDateTime.now(),
+            amount=2.0,
+        ).save()
+
+        with count_mongo_commands() as commands:
+            updated = await self.repo.update(
+                created.id,
+                {
+                    "payment_status": PaymentStatus.PAID.value,
+                    "payment_summary": {
+                        "total_paid": 2.0,
+                        "count": 1,
+                        "methods": {"CASH": 2.0},
+                    },
+                },
+            )
+
+        self.assertEqual(commands.names("orders"), ["find_one_and_update"])
+        self.assertEqual(commands.names("payments"), ["find"])
+        self.assertEqual(len(updated.payments), 1)
+        self.assertEqual(updated.payment_summary.total_paid, 2.0)
+        self.assertEqual(updated.payment_status, PaymentStatus.PAID)
+
+    async def test_update_missing_order_raises_not_found(self):
+        with self.assertRaises(NotFoundError):
+            await self.repo.update("ord_missing", {"status": OrderStatus.DONE.value})
+
     async def test_select_count(self):
         await self.repo.create(self._order(), total_amount=2.0)
         count = await self.repo.select_count(
@@ -114,6 +223,69 @@ class TestOrderRepository(unittest.IsolatedAsyncioTestCase):
         )
         self.assertEqual(len(results), 1)
 
+    async def test_select_all_with_cursor_continues_after_last_order(self):
+        day = UTCDateTime.now()
+        newest = await self.repo.create(self._order(order_date=day), total_amount=2.0)
+        middle = await self.repo.create(
+            self._order(order_date=day - timedelta(days=1)), total_amount=2.0
+        )
+        oldest = await self.repo.create(
+            self._order(order_date=day - timedelta(days=2)), total_amount=2.0
+        )
+        filters = dict(
+            customer_id=None,
+            status=None,
+            payment_status=[],
+            delivery_type=None,
+            tags=None,
+            start_date=None,
+            end_date=None,
+            min_total_amount=None,
+            max_total_amount=None,
+            order_by="order_date",
+            ignore_default_filters=True,
+            page=1,
+            page_size=2,
+        )
+
+        cursor = PageCursor.from_item(
+            item=newest, sort_field="order_date", direction=CursorDirection.NEXT
+        )
+        results = await self.repo.select_all(**filters, cursor=cursor)
+        self.assertEqual([o.id for o in results], [middle.id, oldest.id])
+
+        cursor = PageCursor.from_item(
+            item=oldest, sort_field="order_date", direction=CursorDirection.PREVIOUS
+        )
+        results = await self.repo.select_all(**filters, cursor=cursor)
+        self.assertEqual([o.id for o in results], [newest.id, middle.id])
+
+    async def test_select_page_returns_total_and_items(self):
+        day = UTCDateTime.now()
+        for offset in range(3):
+            await self.repo.create(
+                self._order(order_date=day - timedelta(days=offset)), total_amount=2.0
+            )
+
+        total, results = await self.repo.select_page(
+            customer_id=None,
+            status=None,
+            payment_status=[],
+            delivery_type=None,
+            tags=None,
+            start_date=None,
+            end_date=None,
+            min_total_amount=None,
+            max_total_amount=None,
+            order_by="order_date",
+            ignore_default_filters=True,
+            page=2,
+            page_size=2,
+        )
+
+        self.assertEqual(total, 3)
+        self.assertEqual(len(results), 1)
+
     async def test_delete_by_id(self):
         created = await self.repo.create(self._order(), total_amount=2.0)
         await self.repo.delete_by_id(id=created.id)
@@ -4,15 +4,18 @@ from unittest.mock import AsyncMock, patch
 
 from app.api.exceptions.authentication_exceptions import BadRequestException
 from app.builder.order_calculator import OrderCalculator
+from app.core.exceptions import NotFoundError
 from app.core.utils.utc_datetime import UTCDateTime
 from app.crud.additional_items.schemas import AdditionalItemInDB
 from app.crud.customers.schemas import CustomerInDB
 from app.crud.messages.services import MessageServices
 from app.crud.orders.schemas import (
+    BulkUpdateOrderStatus,
     Delivery,
     DeliveryType,
     OrderInDB,
     OrderStatus,
+    OrderStatusChange,
     RequestedAdditionalItem,
     RequestedProduct,
     RequestOrder,
@@ -268,51 +271,155 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
         customer_repo.select_by_ids.assert_awaited_once()
         customer_repo.select_by_id.assert_not_called()
 
+    async def test_update_status_many_reports_unchanged_orders(self):
+        order_repo = AsyncMock()
+        order_repo.update_status_many.return_value = [
+            OrderStatusChange(
+                id="ord1",
+                previous_status=OrderStatus.PREPARED,
+                status=OrderStatus.DONE,
+            )
+        ]
+        service = OrderServices(
+            order_repository=order_repo,
+            product_repository=AsyncMock(),
+            tag_repository=AsyncMock(),
+            customer_repository=AsyncMock(),
+            organization_repository=AsyncMock(),
+            additional_item_repository=AsyncMock(),
+            product_additional_repository=AsyncMock(),
+            message_services=self._message_services(),
+        )
+
+        report = await service.update_status_many(
+            bulk_update=BulkUpdateOrderStatus(
+                order_ids=["ord1", "ord2", "ord1"], status=OrderStatus.DONE
+            )
+        )
+
+        self.assertEqual([change.id for change in report.changed], ["ord1"])
+        self.assertEqual(report.unchanged, ["ord2"])
+        order_repo.update_status_many.assert_awaited_once_with(
+            order_ids=["ord1", "ord2"], status=OrderStatus.DONE
+        )
+
+    async def test_send_status_notifications_batches_customer_lookups(self):
+        customer_repo = AsyncMock()
+        customer_repo.select_by_ids.return_value = [
+            CustomerInDB(
+                id=customer_id,
+                name=customer_id,
+                international_code="55",
+                ddd="047",
+                phone_number="111111111",
+                addresses=[],
+                tags=[],
+                organization_id="org1",
+                is_active=True,
+                created_at=UTCDateTime.now(),
+                updated_at=UTCDateTime.now(),
+            )
+            for customer_id in ["c1", "c2"]
+        ]
+        organization_repo = AsyncMock()
+        organization_repo.select_by_id.return_value = SimpleNamespace(
+            enable_order_notifications=True,
+            international_code="55",
+            ddd="047",
+            phone_number="999999999",
+        )
+        message_services = self._message_services()
+        order_repo = AsyncMock()
+        order_repo.organization_id = "org1"
+
+        service = OrderServices(
+            order_repository=order_repo,
+            product_repository=AsyncMock(),
+            tag_repository=AsyncMock(),
+            customer_repository=customer_repo,
+            organization_repository=organization_repo,
+            additional_item_repository=AsyncMock(),
+            product_additional_repository=AsyncMock(),
+            message_services=message_services,
+        )
+
+        def change(id, customer_id, previous_status, status=OrderStatus.DONE):
+            return OrderStatusChange(
+                id=id,
+                customer_id=customer_id,
+                previous_status=previous_status,
+                status=status,
+            )
+
+        await service.send_status_notifications(
+            changes=[
+                change("ord1", "c1", OrderStatus.PREPARED),
+                change("ord2", "c2", OrderStatus.PENDING),
+                change("ord3", "c1", OrderStatus.PENDING),
+                change("ord4", None, OrderStatus.PENDING),
+                change("ord5", "c2", OrderStatus.DONE),
+                change("ord6", "c2", OrderStatus.PENDING, OrderStatus.CANCELED),
+            ]
+        )
+
+        self.assertEqual(message_services.create.await_count, 3)
+        customer_repo.select_by_ids.assert_awaited_once()
+        self.assertEqual(
+            sorted(customer_repo.select_by_ids.await_args.kwargs["ids"]), ["c1", "c2"]
+        )
+        organization_repo.select_by_id.assert_awaited_once_with(id="org1")
+
     async def test_validate_products_with_additionals(self):
         product_repo = AsyncMock()
-        product_repo.select_by_id.return_value = ProductInDB(
-            id="p1",
-            organization_id="org1",
-            name="Prod1",
-            description="desc",
-            unit_price=2.0,
-            unit_cost=1.0,
-            kind=ProductKind.REGULAR,
-            tags=[],
-            file_id=None,
-            created_at=UTCDateTime.now(),
-            updated_at=UTCDateTime.now(),
-        )
+        product_repo.select_by_ids.return_value = [
+            ProductInDB(
+                id="p1",
+                organization_id="org1",
+                name="Prod1",
+                description="desc",
+                unit_price=2.0,
+                unit_cost=1.0,
+                kind=ProductKind.REGULAR,
+                tags=[],
+                file_id=None,
+                created_at=UTCDateTime.now(),
+                updated_at=UTCDateTime.now(),
+            )
+        ]
         additional_repo = AsyncMock()
-        additional_repo.select_by_id.return_value = AdditionalItemInDB(
-            id="a1",
-            organization_id="org1",
-            additional_id="add1",
-            position=1,
-            product_id="p1",
-            label="Extra",
-            unit_price=1.0,
-            unit_cost=0.5,
-            consumption_factor=1.0,
-            created_at=UTCDateTime.now(),
-            updated_at=UTCDateTime.now(),
-        )
-        product_additional_repo = AsyncMock()
-        product_additional_repo.select_by_product_id.return_value = [
-            ProductAdditionalInDB(
-                id="add1",
+        additional_repo.select_by_ids.return_value = [
+            AdditionalItemInDB(
+                id="a1",
                 organization_id="org1",
-                product_id="p1",
-                name="Group",
-                selection_type=OptionKind.CHECKBOX,
-                min_quantity=0,
-                max_quantity=1,
+                additional_id="add1",
                 position=1,
-                items=[],
+                product_id="p1",
+                label="Extra",
+                unit_price=1.0,
+                unit_cost=0.5,
+                consumption_factor=1.0,
                 created_at=UTCDateTime.now(),
                 updated_at=UTCDateTime.now(),
             )
         ]
+        product_additional_repo = AsyncMock()
+        product_additional_repo.select_by_product_ids.return_value = {
+            "p1": [
+                ProductAdditionalInDB(
+                    id="add1",
+                    organization_id="org1",
+                    product_id="p1",
+                    name="Group",
+                    selection_type=OptionKind.CHECKBOX,
+                    min_quantity=0,
+                    max_quantity=1,
+                    position=1,
+                    items=[],
+                    created_at=UTCDateTime.now(),
+                    updated_at=UTCDateTime.now(),
+                )
+            ]
+        }
 
         service = OrderServices(
             order_repository=AsyncMock(),
@@ -338,56 +445,63 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(products[0].additionals[0].label, "Extra")
         self.assertEqual(products[0].unit_price, 2.0)
         self.assertEqual(products[0].unit_cost, 1.0)
-        additional_repo.select_by_id.assert_awaited_with(id="a1")
-        product_additional_repo.select_by_product_id.assert_awaited_with(
-            product_id="p1"
+        product_repo.select_by_ids.assert_awaited_once_with(ids=["p1"])
+        additional_repo.select_by_ids.assert_awaited_once_with(ids=["a1"])
+        product_additional_repo.select_by_product_ids.assert_awaited_once_with(
+            product_ids=["p1"]
         )
 
     async def test_validate_products_max_quantity(self):
         product_repo = AsyncMock()
-        product_repo.select_by_id.return_value = ProductInDB(
-            id="p1",
-            organization_id="org1",
-            name="Prod1",
-            description="desc",
-            unit_price=2.0,
-            unit_cost=1.0,
-            kind=ProductKind.REGULAR,
-            tags=[],
-            file_id=None,
-            created_at=UTCDateTime.now(),
-            updated_at=UTCDateTime.now(),
-        )
+        product_repo.select_by_ids.return_value = [
+            ProductInDB(
+                id="p1",
+                organization_id="org1",
+                name="Prod1",
+                description="desc",
+                unit_price=2.0,
+                unit_cost=1.0,
+                kind=ProductKind.REGULAR,
+                tags=[],
+                file_id=None,
+                created_at=UTCDateTime.now(),
+                updated_at=UTCDateTime.now(),
+            )
+        ]
         additional_repo = AsyncMock()
-        additional_repo.select_by_id.return_value = AdditionalItemInDB(
-            id="a1",
-            organization_id="org1",
-            additional_id="add1",
-            position=1,
-            product_id="p1",
-            label="Extra",
-            unit_price=1.0,
-            unit_cost=0.5,
-            consumption_factor=1.0,
-            created_at=UTCDateTime.now(),
-            updated_at=UTCDateTime.now(),
-        )
-        product_additional_repo = AsyncMock()
-        product_additional_repo.select_by_product_id.return_value = [
-            ProductAdditionalInDB(
-                id="add1",
+        additional_repo.select_by_ids.return_value = [
+            AdditionalItemInDB(
+                id="a1",
                 organization_id="org1",
-                product_id="p1",
-                name="Group",
-                selection_type=OptionKind.CHECKBOX,
-                min_quantity=0,
-                max_quantity=1,
+                additional_id="add1",
                 position=1,
-                items=[],
+                product_id="p1",
+                label="Extra",
+                unit_price=1.0,
+                unit_cost=0.5,
+                consumption_factor=1.0,
                 created_at=UTCDateTime.now(),
                 updated_at=UTCDateTime.now(),
             )
         ]
+        product_additional_repo = AsyncMock()
+        product_additional_repo.select_by_product_ids.return_value = {
+            "p1": [
+                ProductAdditionalInDB(
+                    id="add1",
+                    organization_id="org1",
+                    product_id="p1",
+                    name="Group",
+                    selection_type=OptionKind.CHECKBOX,
+                    min_quantity=0,
+                    max_quantity=1,
+                    position=1,
+                    items=[],
+                    created_at=UTCDateTime.now(),
+                    updated_at=UTCDateTime.now(),
+                )
+            ]
+        }
 
         service = OrderServices(
             order_repository=AsyncMock(),
@@ -409,6 +523,123 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
         with self.assertRaises(BadRequestException):
             await service._OrderServices__validate_products(raw_products=[raw_product])
 
+    async def test_validate_products_loads_every_line_in_three_queries(self):
+        now = UTCDateTime.now()
+        product_repo = AsyncMock()
+        product_repo.select_by_ids.return_value = [
+            ProductInDB(
+                id=f"p{index}",
+                organization_id="org1",
+                name=f"Prod{index}",
+                description="desc",
+                unit_price=2.0,
+                unit_cost=1.0,
+                kind=ProductKind.REGULAR,
+                tags=[],
+                file_id=None,
+                created_at=now,
+                updated_at=now,
+            )
+            for index in range(5)
+        ]
+        additional_repo = AsyncMock()
+        additional_repo.select_by_ids.return_value = [
+            AdditionalItemInDB(
+                id="a1",
+                organization_id="org1",
+                additional_id="add1",
+                position=1,
+                product_id="p0",
+                label="Extra",
+                unit_price=1.0,
+                unit_cost=0.5,
+                consumption_factor=1.0,
+                created_at=now,
+                updated_at=now,
+            )
+        ]
+        product_additional_repo = AsyncMock()
+        product_additional_repo.select_by_product_ids.return_value = {
+            "p0": [
+                ProductAdditionalInDB(
+                    id="add1",
+                    organization_id="org1",
+                    product_id="p0",
+                    name="Group",
+                    selection_type=OptionKind.CHECKBOX,
+                    min_quantity=0,
+                    max_quantity=5,
+                    position=1,
+                    items=[],
+                    created_at=now,
+                    updated_at=now,
+                )
+            ]
+        }
+
+        service = OrderServices(
+            order_repository=AsyncMock(),
+            product_repository=product_repo,
+            tag_repository=AsyncMock(),
+            customer_repository=AsyncMock(),
+            organization_repository=AsyncMock(),
+            additional_item_repository=additional_repo,
+            product_additional_repository=product_additional_repo,
+            message_services=self._message_services(),
+        )
+
+        raw_products = [
+            RequestedProduct(
+                product_id=f"p{index % 5}",
+                quantity=1,
+                additionals=(
+                    [RequestedAdditionalItem(item_id="a1", quantity=1)]
+                    if index % 5 == 0
+                    else []
+                ),
+            )
+            for index in range(15)
+        ]
+
+        products = await service._OrderServices__validate_products(
+            raw_products=raw_products
+        )
+
+        self.assertEqual(
+            [product.product_id for product in products],
+            [product.product_id for product in raw_products],
+        )
+        product_repo.select_by_ids.assert_awaited_once_with(
+            ids=["p0", "p1", "p2", "p3", "p4"]
+        )
+        product_additional_repo.select_by_product_ids.assert_awaited_once_with(
+            product_ids=["p0"]
+        )
+        additional_repo.select_by_ids.assert_awaited_once_with(ids=["a1"])
+        product_repo.select_by_id.assert_not_called()
+
+    async def test_validate_products_missing_product_raises_not_found(self):
+        product_repo = AsyncMock()
+        product_repo.select_by_ids.return_value = []
+
+        service = OrderServices(
+            order_repository=AsyncMock(),
+            product_repository=product_repo,
+            tag_repository=AsyncMock(),
+            customer_repository=AsyncMock(),
+            organization_repository=AsyncMock(),
+            additional_item_repository=AsyncMock(),
+            product_additional_repository=AsyncMock(),
+            message_services=self._message_services(),
+        )
+
+        with self.assertRaises(NotFoundError) as context:
+            await service._OrderServices__validate_products(
+                raw_products=[RequestedProduct(product_id="p9", quantity=1)]
+            )
+
+        self.assertEqual(context.exception.message, "Product #p9 not found")
+
     async def test_order_calculator_with_additionals(self):
         product_repo = AsyncMock()
         calc = OrderCalculator(product_repository=product_repo)
@@ -436,52 +667,58 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
 
     async def test_create_stores_additionals_separately(self):
         product_repo = AsyncMock()
-        product_repo.select_by_id.return_value = ProductInDB(
-            id="p1",
-            organization_id="org1",
-            name="Prod1",
-            description="desc",
-            unit_price=2.0,
-            unit_cost=1.0,
-            kind=ProductKind.REGULAR,
-            tags=[],
-            file_id=None,
-            created_at=UTCDateTime.now(),
-            updated_at=UTCDateTime.now(),
-        )
+        product_repo.select_by_ids.return_value = [
+            ProductInDB(
+                id="p1",
+                organization_id="org1",
+                name="Prod1",
+                description="desc",
+                unit_price=2.0,
+                unit_cost=1.0,
+                kind=ProductKind.REGULAR,
+                tags=[],
+                file_id=None,
+                created_at=UTCDateTime.now(),
+                updated_at=UTCDateTime.now(),
+            )
+        ]
 
         additional_repo = AsyncMock()
-        additional_repo.select_by_id.return_value = AdditionalItemInDB(
-            id="a1",
-            organization_id="org1",
-            additional_id="add1",
-            position=1,
-            product_id="p1",
-            label="Extra",
-            unit_price=1.0,
-            unit_cost=0.5,
-            consumption_factor=1.0,
-            created_at=UTCDateTime.now(),
-            updated_at=UTCDateTime.now(),
-        )
-
-        product_additional_repo = AsyncMock()
-        product_additional_repo.select_by_product_id.return_value = [
-            ProductAdditionalInDB(
-                id="add1",
+        additional_repo.select_by_ids.return_value = [
+            AdditionalItemInDB(
+                id="a1",
                 organization_id="org1",
-                product_id="p1",
-                name="Group",
-                selection_type=OptionKind.CHECKBOX,
-                min_quantity=0,
-                max_quantity=2,
+                additional_id="add1",
                 position=1,
-                items=[],
+                product_id="p1",
+                label="Extra",
+                unit_price=1.0,
+                unit_cost=0.5,
+                consumption_factor=1.0,
                 created_at=UTCDateTime.now(),
                 updated_at=UTCDateTime.now(),
             )
         ]
 
+        product_additional_repo = AsyncMock()
+        product_additional_repo.select_by_product_ids.return_value = {
+            "p1": [
+                ProductAdditionalInDB(
+                    id="add1",
+                    organization_id="org1",
+                    product_id="p1",
+                    name="Group",
+                    selection_type=OptionKind.CHECKBOX,
+                    min_quantity=0,
+                    max_quantity=2,
+                    position=1,
+                    items=[],
+                    created_at=UTCDateTime.now(),
+                    updated_at=UTCDateTime.now(),
+                )
+            ]
+        }
+
         order_repo = AsyncMock()
         stored_additional = StoredAdditionalItem(
             item_id="a1",
@@ -575,7 +812,10 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
 
         product_repo = AsyncMock()
 
-        async def product_side_effect(id: str):
+        async def product_side_effect(ids: list):
+            return [product_by_id(id) for id in ids]
+
+        def product_by_id(id: str):
             if id == "p1":
                 return ProductInDB(
                     id="p1",
@@ -604,11 +844,14 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
                 updated_at=UTCDateTime.now(),
             )
 
-        product_repo.select_by_id.side_effect = product_side_effect
+        product_repo.select_by_ids.side_effect = product_side_effect
 
         additional_repo = AsyncMock()
 
-        async def additional_side_effect(id: str):
+        async def additional_side_effect(ids: list):
+            return [additional_by_id(id) for id in ids]
+
+        def additional_by_id(id: str):
             if id == "a1":
                 return AdditionalItemInDB(
                     id="a1",
@@ -637,11 +880,14 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
                 updated_at=UTCDateTime.now(),
             )
 
-        additional_repo.select_by_id.side_effect = additional_side_effect
+        additional_repo.select_by_ids.side_effect = additional_side_effect
 
         product_additional_repo = AsyncMock()
 
-        async def prod_add_side_effect(product_id: str):
+        async def prod_add_side_effect(product_ids: list):
+            return {product_id: groups_by_id(product_id) for product_id in product_ids}
+
+        def groups_by_id(product_id: str):
             return [
                 ProductAdditionalInDB(
                     id=f"add{1 if product_id == 'p1' else 2}",
@@ -658,7 +904,7 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
                 )
             ]
 
-        product_additional_repo.select_by_product_id.side_effect = prod_add_side_effect
+        product_additional_repo.select_by_product_ids.side_effect = prod_add_side_effect
 
         order_repo = AsyncMock()
         now = UTCDateTime.now()
@@ -739,7 +985,10 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
 
         product_repo = AsyncMock()
 
-        async def product_side_effect(id: str):
+        async def product_side_effect(ids: list):
+            return [product_by_id(id) for id in ids]
+
+        def product_by_id(id: str):
             if id == "p1":
                 return ProductInDB(
                     id="p1",
@@ -768,11 +1017,14 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
                 updated_at=UTCDateTime.now(),
             )
 
-        product_repo.select_by_id.side_effect = product_side_effect
+        product_repo.select_by_ids.side_effect = product_side_effect
 
         additional_repo = AsyncMock()
 
-        async def additional_side_effect(id: str):
+        async def additional_side_effect(ids: list):
+            return [additional_by_id(id) for id in ids]
+
+        def additional_by_id(id: str):
             if id == "a1":
                 return AdditionalItemInDB(
                     id="a1",
@@ -801,11 +1053,14 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
                 updated_at=UTCDateTime.now(),
             )
 
-        additional_repo.select_by_id.side_effect = additional_side_effect
+        additional_repo.select_by_ids.side_effect = additional_side_effect
 
         product_additional_repo = AsyncMock()
 
-        async def prod_add_side_effect(product_id: str):
+        async def prod_add_side_effect(product_ids: list):
+            return {product_id: groups_by_id(product_id) for product_id in product_ids}
+
+        def groups_by_id(product_id: str):
             return [
                 ProductAdditionalInDB(
                     id=f"add{1 if product_id == 'p1' else 2}",
@@ -822,7 +1077,7 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
                 )
             ]
 
-        product_additional_repo.select_by_product_id.side_effect = prod_add_side_effect
+        product_additional_repo.select_by_product_ids.side_effect = prod_add_side_effect
 
         order_repo = AsyncMock()
         now = UTCDateTime.now()
@@ -919,19 +1174,21 @@ class TestOrderServices(unittest.IsolatedAsyncioTestCase):
 
     async def test_create_includes_product_observation(self):
         product_repo = AsyncMock()
-        product_repo.select_by_id.return_value = ProductInDB(
-            id="p1",
-            organization_id="org1",
-            name="Prod1",
-            description="desc",
-            unit_price=2.0,
-            unit_cost=1.0,
-            kind=ProductKind.REGULAR,
-            tags=[],
-            file_id=None,
-            created_at=UTCDateTime.now(),
-            updated_at=UTCDateTime.now(),
-        )
+        product_repo.select_by_ids.return_value = [
+            ProductInDB(
+                id="p1",
+                organization_id="org1",
+                name="Prod1",
+                description="desc",
+                unit_price=2.0,
+                unit_cost=1.0,
+                kind=ProductKind.REGULAR,
+                tags=[],
+                file_id=None,
+                created_at=UTCDateTime.now(),
+                updated_at=UTCDateTime.now(),
+            )
+        ]
 
         order_repo = AsyncMock()
         stored_product = StoredProduct(
@@ -7,6 +7,7 @@ from app.crud.organizations.repositories import OrganizationRepository
 from app.crud.organizations.schemas import Organization, SocialLinks
 from app.crud.shared_schemas.styling import Styling
 from app.core.exceptions import NotFoundError, UnprocessableEntity
+from tests.mongo_commands import count_mongo_commands
 
 
 class TestOrganizationRepository(unittest.IsolatedAsyncioTestCase):
@@ -93,6 +94,20 @@ class TestOrganizationRepository(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(result.id, org.id)
 
+    async def test_select_by_id_is_cached_until_update(self):
+        org = await self.repo.create(await self._build_org(name="Org"))
+        await self.repo.select_by_id(id=org.id)
+
+        with count_mongo_commands() as commands:
+            cached = await self.repo.select_by_id(id=org.id)
+
+        self.assertEqual(commands.count(), 0)
+        self.assertEqual(cached.tax, 0)
+
+        await self.repo.update(org.id, {"tax": 10})
+
+        self.assertEqual((await self.repo.select_by_id(id=org.id)).tax, 10)
+
     async def test_select_by_id_not_found(self):
         with self.assertRaises(NotFoundError):
             await self.repo.select_by_id(id="missing")
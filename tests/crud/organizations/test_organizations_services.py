@@ -479,6 +479,22 @@ class TestOrganizationServices(unittest.IsolatedAsyncioTestCase):
 
         self.assertEqual(len(result), 1)
 
+    async def test_search_all_with_file_expand_loads_files_in_one_batch(self):
+        first = await self.repo.create(Organization(name="Org 1", file_id="file-1"))
+        second = await self.repo.create(Organization(name="Org 2", file_id="file-2"))
+        files = {first.id: MagicMock(id="file-1"), second.id: MagicMock(id="file-2")}
+        select_by_organizations = AsyncMock(return_value=files)
+
+        with patch("app.crud.organizations.services.FileRepository.select_by_organizations", new=select_by_organizations), \
+             patch("app.crud.organizations.services.FileRepository.select_by_id", new=AsyncMock()) as select_by_id:
+            result = await self.service.search_all(expand=["file"])
+
+        select_by_organizations.assert_awaited_once_with(
+            file_ids={first.id: "file-1", second.id: "file-2"}
+        )
+        select_by_id.assert_not_awaited()
+        self.assertEqual({organization.file.id for organization in result}, {"file-1", "file-2"})
+
     async def test_check_if_can_add_more_users_raises_when_limit_reached(self):
         org = await self.repo.create(Organization(name="Org"))
         await self.repo.update(
@@ -0,0 +1,167 @@
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from mongoengine import connect, disconnect
+import mongomock
+
+from app.core.exceptions import UnprocessableEntity
+from app.core.utils.utc_datetime import UTCDateTime
+from app.crud.orders.repositories import OrderRepository
+from app.crud.orders.schemas import (
+    Delivery,
+    DeliveryType,
+    Order,
+    OrderStatus,
+    StoredProduct,
+)
+from app.crud.payments.repositories import PaymentRepository
+from app.crud.payments.schemas import Payment, UpdatePayment
+from app.crud.payments.services import PaymentServices
+from app.crud.shared_schemas.payment import PaymentMethod, PaymentStatus
+
+
+class TestPaymentServices(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        connect(
+            "mongoenginetest",
+            host="mongodb://localhost",
+            mongo_client_class=mongomock.MongoClient,
+            alias="default",
+        )
+        pipeline = [{"$addFields": {"id": "$_id", "payments": []}}, {"$project": {"_id": 0}}]
+        patcher = patch("app.crud.orders.models.OrderModel.get_payments", return_value=pipeline)
+        self.addCleanup(patcher.stop)
+        patcher.start()
+
+        self.order_repository = OrderRepository(organization_id="org1")
+        self.services = PaymentServices(
+            payment_repository=PaymentRepository(organization_id="org1"),
+            order_repository=self.order_repository,
+        )
+
+    def tearDown(self):
+        disconnect()
+
+    async def _create_order(self, total_amount: float = 20.0):
+        now = UTCDateTime.now()
+        order = Order(
+            customer_id=None,
+            status=OrderStatus.PENDING,
+            products=[
+                StoredProduct(
+                    product_id="p1",
+                    name="Prod1",
+                    unit_price=total_amount,
+                    unit_cost=1.0,
+                    quantity=1,
+                )
+            ],
+            tags=[],
+            delivery=Delivery(delivery_type=DeliveryType.WITHDRAWAL),
+            preparation_date=now,
+            order_date=now,
+            description=None,
+            additional=0,
+            discount=0,
+        )
+        return await self.order_repository.create(order=order, total_amount=total_amount)
+
+    def _payment(self, order_id: str, method: PaymentMethod, amount: float) -> Payment:
+        return Payment(
+            order_id=order_id,
+            method=method,
+            payment_date=UTCDateTime.now(),
+            amount=amount,
+        )
+
+    async def _listed_order(self):
+        orders = await self.order_repository.select_all_without_filters(
+            start_date=None, end_date=None
+        )
+        return orders[0]
+
+    async def test_create_payment_updates_summary(self):
+        order = await self._create_order()
+
+        await self.services.create(self._payment(order.id, PaymentMethod.PIX, 5))
+        await self.services.create(self._payment(order.id, PaymentMethod.CASH, 7.5))
+        await self.services.create(self._payment(order.id, PaymentMethod.PIX, 2.5))
+
+        listed = await self._listed_order()
+
+        self.assertEqual(listed.payment_status, PaymentStatus.PARTIALLY_PAID)
+        self.assertEqual(listed.payment_summary.total_paid, 15)
+        self.assertEqual(listed.payment_summary.count, 3)
+        self.assertEqual(
+            listed.payment_summary.methods,
+            {PaymentMethod.PIX: 7.5, PaymentMethod.CASH: 7.5},
+        )
+
+    async def test_update_and_delete_payment_refresh_summary(self):
+        order = await self._create_order()
+        first = await self.services.create(self._payment(order.id, PaymentMethod.PIX, 5))
+        second = await self.services.create(self._payment(order.id, PaymentMethod.CASH, 5))
+
+        await self.services.update(id=first.id, updated_payment=UpdatePayment(amount=15))
+
+        listed = await self._listed_order()
+        self.assertEqual(listed.payment_status, PaymentStatus.PAID)
+        self.assertEqual(listed.payment_summary.total_paid, 20)
+
+        await self.services.delete_by_id(id=second.id)
+
+        listed = await self._listed_order()
+        self.assertEqual(listed.payment_status, PaymentStatus.PARTIALLY_PAID)
+        self.assertEqual(listed.payment_summary.count, 1)
+        self.assertEqual(listed.payment_summary.methods, {PaymentMethod.PIX: 15})
+
+    async def test_payment_written_between_increment_and_status_is_kept(self):
+        order = await self._create_order()
+        update_one = self.order_repository.update_one
+        interleaved = []
+
+        async def create_before_status_write(*args, **kwargs):
+            # outro pagamento soma no resumo antes do status deste ser gravado
+            if not interleaved:
+                interleaved.append(True)
+                await self.services.create(self._payment(order.id, PaymentMethod.CASH, 15))
+
+            return await update_one(*args, **kwargs)
+
+        with patch.object(self.order_repository, "update_one", create_before_status_write):
+            await self.services.create(self._payment(order.id, PaymentMethod.PIX, 5))
+
+        listed = await self._listed_order()
+
+        self.assertEqual(listed.payment_status, PaymentStatus.PAID)
+        self.assertEqual(listed.payment_summary.total_paid, 20)
+        self.assertEqual(listed.payment_summary.count, 2)
+        self.assertEqual(
+            listed.payment_summary.methods,
+            {PaymentMethod.PIX: 5, PaymentMethod.CASH: 15},
+        )
+
+    async def test_summary_increments_are_rounded(self):
+        order = await self._create_order(total_amount=0.3)
+
+        await self.services.create(self._payment(order.id, PaymentMethod.PIX, 0.1))
+        await self.services.create(self._payment(order.id, PaymentMethod.PIX, 0.2))
+
+        listed = await self._listed_order()
+
+        self.assertEqual(listed.payment_status, PaymentStatus.PAID)
+        self.assertEqual(listed.payment_summary.total_paid, 0.3)
+        self.assertEqual(listed.payment_summary.methods, {PaymentMethod.PIX: 0.3})
+
+    async def test_summary_failure_is_logged_and_keeps_the_payment(self):
+        order = await self._create_order()
+
+        with patch.object(
+            self.order_repository,
+            "apply_payment",
+            AsyncMock(side_effect=UnprocessableEntity(message="Error on apply payment to order")),
+        ), self.assertLogs("app.crud.payments.services", level="ERROR") as logs:
+            payment = await self.services.create(self._payment(order.id, PaymentMethod.PIX, 5))
+
+        self.assertEqual((await self.services.search_by_id(id=payment.id)).amount, 5)
+        self.assertIn(f"Payment summary of order #{order.id} not updated", logs.output[0])
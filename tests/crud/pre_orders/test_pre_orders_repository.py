@@ -6,6 +6,7 @@ from app.core.exceptions import NotFoundError
 from app.crud.pre_orders.repositories import PreOrderRepository
 from app.crud.pre_orders.models import PreOrderModel
 from app.crud.pre_orders.schemas import PreOrderStatus
+from tests.mongo_commands import count_mongo_commands
 
 
 class TestPreOrderRepository(unittest.IsolatedAsyncioTestCase):
@@ -45,6 +46,24 @@ class TestPreOrderRepository(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(updated.status, PreOrderStatus.ACCEPTED)
         self.assertEqual(updated.order_id, "ord1")
 
+    async def test_update_status_is_a_single_find_and_modify(self):
+        model = self._pre_order_model()
+        model.save()
+
+        with count_mongo_commands() as commands:
+            updated = await self.repo.update_status(model.id, PreOrderStatus.REJECTED)
+
+        self.assertEqual(commands.names(), ["find_one_and_update"])
+        self.assertEqual(updated.status, PreOrderStatus.REJECTED)
+        self.assertEqual(updated.id, model.id)
+        self.assertEqual(
+            PreOrderModel.objects(id=model.id).first().status, PreOrderStatus.REJECTED.value
+        )
+
+    async def test_update_status_of_missing_pre_order_raises_not_found(self):
+        with self.assertRaises(NotFoundError):
+            await self.repo.update_status("pre_missing", PreOrderStatus.ACCEPTED)
+
     async def test_select_count_and_all(self):
         self._pre_order_model(code="A").save()
         self._pre_order_model(code="B", status=PreOrderStatus.ACCEPTED).save()
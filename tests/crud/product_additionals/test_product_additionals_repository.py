@@ -71,3 +71,12 @@ class TestProductAdditionalRepository(unittest.IsolatedAsyncioTestCase):
         results = await self.repo.select_by_product_id("p1")
         self.assertEqual(len(results), 1)
         self.assertEqual(results[0].id, g1.id)
+
+    async def test_select_by_product_ids_groups_by_product(self):
+        g1 = await self.repo.create(await self._group(name="G1"), product_id="p1")
+        g2 = await self.repo.create(await self._group(name="G2"), product_id="p2")
+        await self.repo.create(await self._group(name="G3"), product_id="p3")
+        results = await self.repo.select_by_product_ids(product_ids=["p1", "p2"])
+        self.assertEqual(set(results), {"p1", "p2"})
+        self.assertEqual(results["p1"][0].id, g1.id)
+        self.assertEqual(results["p2"][0].id, g2.id)
@@ -7,6 +7,7 @@ from app.crud.products.models import ProductModel
 from app.crud.products.repositories import ProductRepository
 from app.crud.products.schemas import Product
 from app.core.exceptions import NotFoundError, UnprocessableEntity
+from tests.mongo_commands import count_mongo_commands
 
 
 class TestProductRepository(unittest.IsolatedAsyncioTestCase):
@@ -48,6 +49,55 @@ class TestProductRepository(unittest.IsolatedAsyncioTestCase):
         updated = await self.repo.update(created)
         self.assertEqual(updated.name, "New")
 
+    async def test_create_and_update_product_are_single_commands(self):
+        with count_mongo_commands() as commands:
+            created = await self.repo.create(await self._product(name="Old"))
+
+        self.assertEqual(commands.count(), 1)
+
+        created.name = "new cake"
+        with count_mongo_commands() as commands:
+            updated = await self.repo.update(created)
+
+        self.assertEqual(commands.names(), ["find_one_and_update"])
+        self.assertEqual(updated.name, "New Cake")
+        self.assertEqual(updated.unit_price, 10.0)
+        self.assertEqual(
+            ProductModel.objects(id=created.id).first().search_tokens, ["new", "cake"]
+        )
+
+    async def test_select_by_id_is_cached_until_the_product_is_written(self):
+        created = await self.repo.create(await self._product(name="Cake"))
+        await self.repo.select_by_id(id=created.id)
+
+        with count_mongo_commands() as commands:
+            cached = await self.repo.select_by_id(id=created.id)
+            products = await self.repo.select_by_ids(ids=[created.id])
+
+        self.assertEqual(commands.count(), 0)
+        self.assertEqual(cached.name, "Cake")
+        self.assertEqual([product.id for product in products], [created.id])
+
+        created.name = "Pie"
+        await self.repo.update(created)
+
+        self.assertEqual((await self.repo.select_by_id(id=created.id)).name, "Pie")
+
+        await self.repo.delete_by_id(id=created.id)
+
+        self.assertIsNone(await self.repo.select_by_id(id=created.id, raise_404=False))
+
+    async def test_select_by_ids_only_reads_uncached_products(self):
+        first = await self.repo.create(await self._product(name="First"))
+        second = await self.repo.create(await self._product(name="Second"))
+        await self.repo.select_by_id(id=first.id)
+
+        with count_mongo_commands() as commands:
+            products = await self.repo.select_by_ids(ids=[first.id, second.id])
+
+        self.assertEqual(commands.names(), ["find"])
+        self.assertEqual({product.id for product in products}, {first.id, second.id})
+
     async def test_select_by_id_success(self):
         created = await self.repo.create(await self._product())
         result = await self.repo.select_by_id(id=created.id)
@@ -61,6 +111,12 @@ class TestProductRepository(unittest.IsolatedAsyncioTestCase):
         result = await self.repo.select_by_id(id="missing", raise_404=False)
         self.assertIsNone(result)
 
+    async def test_select_by_ids_ignores_missing_ids(self):
+        p1 = await self.repo.create(await self._product(name="Choco"))
+        p2 = await self.repo.create(await self._product(name="Vanilla"))
+        results = await self.repo.select_by_ids(ids=[p1.id, p2.id, "missing"])
+        self.assertEqual({r.id for r in results}, {p1.id, p2.id})
+
     async def test_select_count_with_query(self):
         await self.repo.create(await self._product(name="Apple"))
         await self.repo.create(await self._product(name="Banana"))
@@ -0,0 +1,96 @@
+"""
+Substituto local do cliente S3 do boto3 para os testes, guardando os objetos em
+memória. Implementa só as operações usadas pelo `S3BucketManager`:
+
+    client = LocalS3Client()
+    S3BucketManager.set_client(client=client)
+    ...
+    S3BucketManager.set_client(client=None)
+"""
+
+import shutil
+from io import BytesIO
+from threading import Lock
+from typing import BinaryIO, Dict, Iterator, Tuple
+
+
+class LocalS3Client:
+    def __init__(self) -> None:
+        self.objects: Dict[Tuple[str, str], Tuple[bytes, str]] = {}
+        self.calls: Dict[str, int] = {}
+        self.__lock = Lock()
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str, ExtraArgs: dict = None) -> None:
+        with open(Filename, "rb") as file:
+            self.upload_fileobj(file, Bucket, Key, ExtraArgs=ExtraArgs)
+
+    def upload_fileobj(self, Fileobj: BinaryIO, Bucket: str, Key: str, ExtraArgs: dict = None) -> None:
+        self.put_object(
+            Bucket=Bucket,
+            Key=Key,
+            Body=Fileobj.read(),
+            ContentType=(ExtraArgs or {}).get("ContentType", "binary/octet-stream"),
+        )
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, ContentType: str = "binary/octet-stream") -> dict:
+        with self.__lock:
+            self.__count("put_object")
+            self.objects[(Bucket, Key)] = (bytes(Body), ContentType)
+
+        return {}
+
+    def get_object(self, Bucket: str, Key: str) -> dict:
+        with self.__lock:
+            self.__count("get_object")
+            body, content_type = self.__get(Bucket=Bucket, Key=Key)
+
+        return {"Body": BytesIO(body), "ContentType": content_type, "ContentLength": len(body)}
+
+    def download_file(self, Bucket: str, Key: str, Filename: str) -> None:
+        with open(Filename, "wb") as file:
+            shutil.copyfileobj(self.get_object(Bucket=Bucket, Key=Key)["Body"], file)
+
+    def delete_object(self, Bucket: str, Key: str) -> dict:
+        with self.__lock:
+            self.__count("delete_object")
+            self.objects.pop((Bucket, Key), None)
+
+        return {}
+
+    def get_paginator(self, operation_name: str) -> "LocalS3Paginator":
+        assert operation_name == "list_objects_v2"
+        return LocalS3Paginator(client=self)
+
+    def generate_presigned_url(self, ClientMethod: str, Params: dict, ExpiresIn: int = 3600) -> str:
+        with self.__lock:
+            self.__count("generate_presigned_url")
+
+        return f"http://local-s3/{Params['Bucket']}/{Params['Key']}?expires_in={ExpiresIn}"
+
+    def keys(self, Bucket: str, Prefix: str = "") -> list:
+        with self.__lock:
+            return sorted(
+                key for bucket, key in self.objects if bucket == Bucket and key.startswith(Prefix)
+            )
+
+    def __get(self, Bucket: str, Key: str) -> Tuple[bytes, str]:
+        if (Bucket, Key) not in self.objects:
+            raise KeyError(f"NoSuchKey: {Bucket}/{Key}")
+
+        return self.objects[(Bucket, Key)]
+
+    def __count(self, operation: str) -> None:
+        self.calls[operation] = self.calls.get(operation, 0) + 1
+
+
+class LocalS3Paginator:
+    PAGE_SIZE = 1000
+
+    def __init__(self, client: LocalS3Client) -> None:
+        self.client = client
+
+    def paginate(self, Bucket: str, Prefix: str = "") -> Iterator[dict]:
+        keys = self.client.keys(Bucket=Bucket, Prefix=Prefix)
+
+        for start in range(0, len(keys), self.PAGE_SIZE):
+            yield {"Contents": [{"Key": key} for key in keys[start:start + self.PAGE_SIZE]]}
@@ -0,0 +1,75 @@
+import threading
+from contextlib import ExitStack, contextmanager
+from typing import Iterator, List, Tuple
+from unittest.mock import patch
+
+from mongomock.collection import Collection
+
+_COMMANDS = (
+    "find",
+    "find_one",
+    "insert_one",
+    "insert_many",
+    "update_one",
+    "update_many",
+    "replace_one",
+    "find_one_and_update",
+    "find_one_and_replace",
+    "find_one_and_delete",
+    "delete_one",
+    "delete_many",
+    "aggregate",
+    "count_documents",
+    "bulk_write",
+)
+
+
+class MongoCommands:
+    """Comandos enviados ao mongomock, como `(coleção, comando)`."""
+
+    def __init__(self) -> None:
+        self.calls: List[Tuple[str, str]] = []
+
+    def names(self, collection: str = None) -> List[str]:
+        return [
+            command
+            for name, command in self.calls
+            if collection is None or name == collection
+        ]
+
+    def count(self, collection: str = None) -> int:
+        return len(self.names(collection=collection))
+
+
+@contextmanager
+def count_mongo_commands() -> Iterator[MongoCommands]:
+    """
+    Conta os comandos de cada coleção durante o bloco. Só as chamadas externas
+    contam: o mongomock implementa `find_one_and_update` com `find`, por exemplo.
+    """
+    commands = MongoCommands()
+    state = threading.local()
+
+    def wrap(command: str, original):
+        def wrapper(collection: Collection, *args, **kwargs):
+            depth = getattr(state, "depth", 0)
+
+            if not depth:
+                commands.calls.append((collection.name, command))
+
+            state.depth = depth + 1
+
+            try:
+                return original(collection, *args, **kwargs)
+
+            finally:
+                state.depth = depth
+
+        return wrapper
+
+    with ExitStack() as stack:
+        for command in _COMMANDS:
+            original = getattr(Collection, command)
+            stack.enter_context(patch.object(Collection, command, wrap(command, original)))
+
+        yield commands
@@ -7,12 +7,16 @@ from scripts import cleanup_tigris_images
 
 def test_collect_referenced_files(monkeypatch):
     class FakeFile:
-        def __init__(self, url):
+        def __init__(self, url, variants=None):
             self.url = url
+            self.variants = variants or {}
 
     fake_files = [
         FakeFile("https://cdn.local/organization/file1.png"),
-        FakeFile("https://cdn.local/organization/file2.jpg"),
+        FakeFile(
+            "https://cdn.local/organization/file2.jpg",
+            variants={"thumbnail": "https://cdn.local/organization/file2_thumbnail.jpg"},
+        ),
     ]
 
     monkeypatch.setattr(
@@ -26,6 +30,7 @@ def test_collect_referenced_files(monkeypatch):
     assert referenced == {
         "organization/file1.png",
         "organization/file2.jpg",
+        "organization/file2_thumbnail.jpg",
     }
 
 